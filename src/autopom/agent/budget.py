@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from autopom.stats import max_stats, sum_stats
+
+if TYPE_CHECKING:
+    from autopom.config import CrawlConfig
+
+# Degradation levels, each including the ones before it.
+LEVEL_REDUCE_NODES = 1
+LEVEL_SKIP_HEALING = 2
+LEVEL_SKIP_DEEP_LINKS = 3
+# Depth from which frontier items are dropped at LEVEL_SKIP_DEEP_LINKS.
+DEEP_LINK_DEPTH = 2
+LATENCY_EMA_ALPHA = 0.3
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600}
+
+
+def parse_duration(value: str) -> float:
+    """Seconds from `"90"`, `"90s"`, `"20m"` or `"1.5h"`."""
+    text = value.strip().lower()
+    unit = DURATION_UNITS.get(text[-1:], None)
+    number = text[:-1] if unit else text
+    try:
+        seconds = float(number) * (unit or 1)
+    except ValueError:
+        raise ValueError(
+            f"Unsupported duration '{value}'. Use seconds or a s/m/h suffix, e.g. 20m."
+        ) from None
+    if seconds <= 0:
+        raise ValueError(f"Unsupported duration '{value}'. Must be positive.")
+    return seconds
+
+
+def _lag_level(ratio: float) -> int:
+    """Map how far behind target we are (1.0 = on target) to a level."""
+    if ratio <= 1.0:
+        return 0
+    if ratio <= 1.5:
+        return LEVEL_REDUCE_NODES
+    if ratio <= 2.0:
+        return LEVEL_SKIP_HEALING
+    return LEVEL_SKIP_DEEP_LINKS
+
+
+@dataclass(slots=True)
+class CrawlBudget:
+    """
+    Wall-clock deadline and per-page latency target for one crawl.
+    When the projected time for the remaining pages overruns the deadline, or
+    pages take longer than the target, the crawl degrades step by step:
+    fewer extracted nodes, then no selector healing, then no deep links.
+    Without a deadline or target it never degrades.
+    """
+
+    time_budget_s: float | None = None
+    page_latency_target_ms: float | None = None
+    max_nodes: int = 500
+    reduced_max_nodes: int = 120
+    concurrency: int = 1
+    started: float = field(init=False, default_factory=time.perf_counter)
+    latency_ema_ms: float | None = field(init=False, default=None)
+    degradations: Counter[str] = field(init=False, default_factory=Counter)
+    deadline_hit: bool = field(init=False, default=False)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    @classmethod
+    def from_config(cls, config: CrawlConfig) -> CrawlBudget:
+        return cls(
+            time_budget_s=config.time_budget_s,
+            page_latency_target_ms=config.page_latency_target_ms,
+            max_nodes=config.max_nodes,
+            reduced_max_nodes=min(config.max_nodes, 120),
+            # Shards drain one shared frontier, so they pace as one crawl.
+            concurrency=config.concurrency * config.processes,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.time_budget_s is not None or self.page_latency_target_ms is not None
+
+    def elapsed_s(self) -> float:
+        return time.perf_counter() - self.started
+
+    def expired(self) -> bool:
+        """True once the deadline passed; no new page should be started."""
+        if self.time_budget_s is None or self.elapsed_s() < self.time_budget_s:
+            return False
+        with self._lock:
+            self.deadline_hit = True
+        return True
+
+    def record_page(self, latency_ms: float) -> None:
+        with self._lock:
+            if self.latency_ema_ms is None:
+                self.latency_ema_ms = latency_ms
+            else:
+                self.latency_ema_ms += LATENCY_EMA_ALPHA * (
+                    latency_ms - self.latency_ema_ms
+                )
+
+    def level(self, pages_remaining: int) -> int:
+        """Current degradation level given how many pages may still be modeled."""
+        with self._lock:
+            latency_ms = self.latency_ema_ms
+        if latency_ms is None:
+            return 0
+        level = 0
+        if self.page_latency_target_ms:
+            level = _lag_level(latency_ms / self.page_latency_target_ms)
+        if self.time_budget_s is not None:
+            remaining_s = max(1e-3, self.time_budget_s - self.elapsed_s())
+            projected_s = (
+                latency_ms / 1000 * max(0, pages_remaining) / max(1, self.concurrency)
+            )
+            level = max(level, _lag_level(projected_s / remaining_s))
+        return level
+
+    def node_limit(self, level: int) -> int:
+        if level >= LEVEL_REDUCE_NODES:
+            self._count("reduced_nodes_pages")
+            return self.reduced_max_nodes
+        return self.max_nodes
+
+    def skip_healing(self, level: int) -> bool:
+        if level >= LEVEL_SKIP_HEALING:
+            self._count("skipped_healing_pages")
+            return True
+        return False
+
+    def skip_exploration(self, level: int) -> bool:
+        if level >= LEVEL_SKIP_HEALING:
+            self._count("skipped_exploration_pages")
+            return True
+        return False
+
+    def skip_deep_link(self, level: int, depth: int) -> bool:
+        if level >= LEVEL_SKIP_DEEP_LINKS and depth >= DEEP_LINK_DEPTH:
+            self._count("skipped_deep_links")
+            return True
+        return False
+
+    def stats(self) -> dict:
+        if not self.enabled:
+            return {}
+        with self._lock:
+            return {
+                "budget_elapsed_s": round(self.elapsed_s(), 2),
+                "budget_deadline_hit": self.deadline_hit,
+                "budget_latency_ema_ms": round(self.latency_ema_ms or 0.0, 1),
+                "budget_reduced_nodes_pages": self.degradations["reduced_nodes_pages"],
+                "budget_skipped_healing_pages": self.degradations[
+                    "skipped_healing_pages"
+                ],
+                "budget_skipped_deep_links": self.degradations["skipped_deep_links"],
+                "budget_skipped_exploration_pages": self.degradations[
+                    "skipped_exploration_pages"
+                ],
+            }
+
+    @classmethod
+    def merge(cls, stats_list: list[dict]) -> dict:
+        """Combine the `stats()` of crawl shards; empty without a budget."""
+        if not any("budget_elapsed_s" in stats for stats in stats_list):
+            return {}
+        return {
+            **max_stats(stats_list, ["budget_elapsed_s", "budget_latency_ema_ms"]),
+            "budget_deadline_hit": any(
+                stats.get("budget_deadline_hit") for stats in stats_list
+            ),
+            **sum_stats(
+                stats_list,
+                [
+                    "budget_reduced_nodes_pages",
+                    "budget_skipped_healing_pages",
+                    "budget_skipped_deep_links",
+                    "budget_skipped_exploration_pages",
+                ],
+            ),
+        }
+
+    def _count(self, degradation: str) -> None:
+        with self._lock:
+            self.degradations[degradation] += 1
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import re
+
+# Roles whose click usually reveals a new state (dialog, tab panel, wizard step).
+EXPLORABLE_ROLES = ("button", "tab")
+# Labels of clicks that may change server-side data or end the session.
+UNSAFE_ACTION_PATTERN = re.compile(
+    r"\b(delete|remove|log ?out|sign ?out|pay|purchase|buy|checkout|unsubscribe"
+    r"|save|submit|send|create|update|confirm)\b",
+    re.IGNORECASE,
+)
+CLICK_PREFIX = "click:"
+
+
+def action_key(selector: str) -> str:
+    """Edge label of a click, as stored in `CrawlState.edge_history`."""
+    return f"{CLICK_PREFIX}{selector}"
+
+
+def action_selector(action: str) -> str:
+    return action.removeprefix(CLICK_PREFIX)
+
+
+def candidate_actions(dom_summary: dict, limit: int) -> list[dict]:
+    """
+    First `limit` safe button/tab elements of a DOM summary, one per selector.
+    Submit buttons of forms are skipped whatever their label.
+    """
+    candidates: list[dict] = []
+    selectors: set[str] = set()
+    for element in dom_summary.get("elements", []):
+        selector = element.get("selector", "")
+        if (
+            element.get("role") not in EXPLORABLE_ROLES
+            or not selector
+            or selector in selectors
+            or element.get("submits_form")
+            or UNSAFE_ACTION_PATTERN.search(element.get("label", ""))
+        ):
+            continue
+        selectors.add(selector)
+        candidates.append(element)
+        if len(candidates) >= limit:
+            break
+    return candidates
+
+
+def state_label(label: str) -> str:
+    """`"billing details"` -> `BillingDetails`."""
+    return "".join(ch for ch in label.title() if ch.isalnum()) or "Action"
+
+
+def state_page_name(page_name: str, label: str) -> str:
+    """`SettingsPage` + `Billing` -> `SettingsBillingViewPage`."""
+    base = page_name.removesuffix("Page").removesuffix("View")
+    return f"{base}{state_label(label)}ViewPage"
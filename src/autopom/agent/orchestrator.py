@@ -1,13 +1,37 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import contextlib
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable
 from urllib.parse import urljoin, urlparse
 
-from autopom.agent.policies import is_denied_domain, normalize_url, same_origin
+from autopom.agent.budget import CrawlBudget
+from autopom.agent.explorer import (
+    action_key,
+    action_selector,
+    candidate_actions,
+    state_label,
+    state_page_name,
+)
+from autopom.agent.policies import (
+    is_allowed_url,
+    normalize_url,
+    route_template,
+)
+from autopom.agent.stage_timer import StageTimer
 from autopom.agent.state_store import CrawlState, FrontierItem
+from autopom.browser.async_adapter import AsyncBrowserAdapter
 from autopom.browser.browseruse_adapter import BrowserAdapter
+from autopom.browser.errors import browser_errors
+from autopom.browser.pool import BrowserPool
+from autopom.browser.rate_limit import HostRateLimiter
+from autopom.browser.settle import settle_stats
 from autopom.config import CrawlConfig
 from autopom.extraction.schema import (
     ActionModel,
@@ -20,8 +44,17 @@ from autopom.generation.java_generator import (
     PlaywrightPomGenerator,
 )
 from autopom.healing.selector_verifier import SelectorVerifier
+from autopom.io.checkpoint import CheckpointStore
+from autopom.io.fingerprints import (
+    FingerprintManifest,
+    diff_page_fingerprints,
+    merge_page_fingerprints,
+    page_content_hash,
+)
+from autopom.io.output_pipeline import OutputPipeline
 from autopom.io.persistence import Persistence
 from autopom.io.report_writer import ReportWriter
+from autopom.io.seeds import load_seed_urls
 
 
 @dataclass(slots=True)
@@ -30,6 +63,15 @@ class CrawlResult:
     model_paths: list[Path]
     pom_paths: list[Path]
     report_path: Path
+    stats: dict = field(default_factory=dict)
+    # Pages loaded from `models_json` on --resume; they lead `pages`/`model_paths`.
+    resumed_pages: int = 0
+    # Normalized URL -> {"content_hash", "page_name"} for every page this run saw.
+    fingerprints: dict[str, dict] = field(default_factory=dict)
+    # `--incremental` only: pages per change kind against the previous run.
+    changes: dict[str, list[dict]] | None = None
+    # URL -> milliseconds the browser waited for the page to settle.
+    settle_ms: dict[str, float] = field(default_factory=dict)
 
     @property
     def java_paths(self) -> list[Path]:
@@ -37,125 +79,1137 @@ class CrawlResult:
         return self.pom_paths
 
 
+def initial_crawl_state(config: CrawlConfig) -> CrawlState:
+    """Fresh state seeded with `base_url`, or the last checkpoint on --resume."""
+    if config.resume:
+        snapshot = CheckpointStore(config.output_dir).load(config.base_url)
+        if snapshot is not None:
+            return CrawlState.from_checkpoint(snapshot, config)
+    state = CrawlState.from_config(config)
+    state.enqueue(FrontierItem(config.base_url, 0))
+    seed_frontier(
+        state,
+        config,
+        [
+            url
+            for source in config.seed_sources
+            for url in load_seed_urls(source, config.base_url)
+        ],
+    )
+    return state
+
+
+def seed_frontier(state: CrawlState, config: CrawlConfig, urls: list[str]) -> None:
+    """
+    Queue listed URLs as depth-0 seeds, so no navigation is spent on
+    discovering them. The crawl policy and the per-template cap apply here,
+    before any URL reaches the frontier.
+    """
+    templates = Counter([state.route_template(config.base_url)])
+    limit = config.max_pages_per_template
+    for url in urls:
+        # Sitemaps and URL lists may hold mailto: or ftp: entries.
+        if urlparse(url).scheme not in ("http", "https") or not is_allowed_url(
+            url,
+            config.base_url,
+            same_origin_only=config.same_origin_only,
+            denied_domains=config.denied_domains,
+        ):
+            state.seed_filtered_urls += 1
+            continue
+        template = state.route_template(url)
+        if limit is not None and templates[template] >= limit:
+            state.seed_filtered_urls += 1
+            continue
+        if state.enqueue(FrontierItem(url, 0, via_action="seed_source")):
+            templates[template] += 1
+            state.seeded_urls += 1
+
+
+def create_pom_generator(config: CrawlConfig) -> PlaywrightPomGenerator:
+    template_dir = Path(__file__).resolve().parents[1] / "generation" / "java_templates"
+    return PlaywrightPomGenerator(
+        output_dir=config.output_dir,
+        language=config.pom_language,
+        locator_storage=config.locator_storage,
+        template_dir=template_dir,
+        java_config=JavaGeneratorConfig(),
+    )
+
+
+def load_resumed_pages(
+    persistence: Persistence, pom_generator: PlaywrightPomGenerator
+) -> tuple[list[PageModel], list[Path], list[Path]]:
+    """Models an interrupted run left on disk, their paths and regenerated POMs."""
+    pages: list[PageModel] = []
+    model_paths: list[Path] = []
+    pom_paths: list[Path] = []
+    for page_model, model_path in persistence.load_page_models():
+        pages.append(page_model)
+        model_paths.append(model_path)
+        pom_paths.append(pom_generator.generate_page(page_model))
+    return pages, model_paths, pom_paths
+
+
 class AutoPomOrchestrator:
     def __init__(
         self,
         config: CrawlConfig,
-        browser: BrowserAdapter,
+        browser: BrowserAdapter | AsyncBrowserAdapter,
         progress_hook: Callable[[str, dict], None] | None = None,
+        state: CrawlState | None = None,
+        resumed_pages: list[PageModel] | None = None,
     ) -> None:
         self.config = config
         self.browser = browser
         self.progress_hook = progress_hook
-        self.state = CrawlState()
-        self.state.enqueue(FrontierItem(config.base_url, 0))
+        # Only the state owner sees the whole crawl, so only it may rewrite
+        # the fingerprint manifest.
+        self._owns_state = state is None
+        # A shard cannot vouch that other shards' pages are on disk yet, so
+        # shards never checkpoint; run_sharded() does once they have stopped.
+        self._checkpoint_interval = (
+            config.checkpoint_interval if self._owns_state else 0
+        )
+        # On --resume, run_sharded() loads the models and regenerates their
+        # POMs once; shards only replay those models' links.
+        self._shared_resumed_pages = resumed_pages
+        if state is None:
+            self.state = initial_crawl_state(config)
+            self._claim_poll_s = None
+        else:
+            # An injected state may be shared with other processes, which can
+            # add work without notifying our condition, so waiters poll.
+            self.state = state
+            self._claim_poll_s = 0.05
 
         self.persistence = Persistence(config.output_dir)
+        self.checkpoints = CheckpointStore(config.output_dir)
+        self.fingerprint_manifest = FingerprintManifest(config.output_dir)
         self.reporter = ReportWriter(config.output_dir)
-        template_dir = (
-            Path(__file__).resolve().parents[1] / "generation" / "java_templates"
+        self.pom_generator = create_pom_generator(config)
+        self.verifier = SelectorVerifier(browser)
+        # Shared by every worker tab, so per-host limits hold crawl-wide.
+        self.rate_limiter = (
+            HostRateLimiter.from_config(config)
+            if config.rate_limit or config.host_concurrency
+            else None
         )
-        self.pom_generator = PlaywrightPomGenerator(
-            output_dir=config.output_dir,
-            language=config.pom_language,
-            locator_storage=config.locator_storage,
-            template_dir=template_dir,
-            java_config=JavaGeneratorConfig(),
+        # Warm tabs leased page by page; `browser` then only opens them.
+        self.browser_pool = (
+            BrowserPool.from_config(config, browser.new_tab)
+            if config.browser_pool_size
+            else None
         )
-        self.verifier = SelectorVerifier(browser)
+        # Guards the shared frontier/signatures; workers wait on it for new work.
+        self._state_lock = threading.Condition()
+        # Guards the output path lists and the per-page-name file locks.
+        self._output_lock = threading.Lock()
+        self._file_locks: dict[str, threading.Lock] = {}
+        self._progress_lock = threading.Lock()
 
     def run(self) -> CrawlResult:
-        pages: list[PageModel] = []
-        model_paths: list[Path] = []
-        pom_paths: list[Path] = [self.pom_generator.generate_base_page()]
+        self._start_run()
+
+        # The primary adapter is bound to the calling thread (Playwright's sync
+        # API is thread-affine), so worker 0 always runs here and every extra
+        # worker opens its own tab from inside its own thread. Futures keep
+        # the errors the workers re-raise; the first one fails the run below.
+        pooled = self.browser_pool is not None
+        extra_worker = self._pooled_worker if pooled else self._tab_worker
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max(1, self.config.concurrency - 1),
+                thread_name_prefix="autopom-tab",
+            ) as executor:
+                for _ in range(1, self.config.concurrency):
+                    executor.submit(self._run_worker, extra_worker)
+                if pooled:
+                    self._run_worker(self._pooled_worker)
+                else:
+                    self._run_worker(self._crawl_worker, self.browser, self.verifier)
+        finally:
+            self._close_pipeline()
+            if self._worker_errors:
+                self._checkpoint_on_failure()
+        if self._worker_errors:
+            raise self._worker_errors[0]
+
+        return self._finish_run(self._write_summary())
+
+    async def arun(self) -> CrawlResult:
+        """
+        Asyncio-native crawl; `browser` must be an `AsyncBrowserAdapter`.
+        Workers share one event loop, so navigation and verification of
+        different tabs overlap; file writes go to the output pipeline threads.
+        """
+        self._start_run()
+        self._async_state_lock = asyncio.Condition()
+
+        if self.browser_pool is not None:
+            workers = [self._apooled_worker() for _ in range(self.config.concurrency)]
+        else:
+            workers = [self._acrawl_worker(self.browser, self.verifier)]
+            workers.extend(
+                self._atab_worker() for _ in range(1, self.config.concurrency)
+            )
+        # Workers re-raise their errors; gather keeps them, and the first one
+        # recorded fails the run below.
+        await asyncio.gather(
+            *(self._arun_worker(worker) for worker in workers),
+            return_exceptions=True,
+        )
+        if self.browser_pool is not None:
+            await self.browser_pool.aclose()
+        await asyncio.to_thread(self._close_pipeline)
+        if self._worker_errors:
+            self._checkpoint_on_failure()
+            raise self._worker_errors[0]
+
+        report_path = await asyncio.to_thread(self._write_summary)
+        return self._finish_run(report_path)
+
+    def _start_run(self) -> None:
+        self._pages: list[PageModel] = []
+        self._model_paths: list[Path] = []
+        self._pom_paths: list[Path] = [self.pom_generator.generate_base_page()]
+        self._worker_errors: list[BaseException] = []
+        self._modeled_since_checkpoint = 0
+        self._pipeline = OutputPipeline(
+            workers=self.config.output_workers,
+            max_pending=self.config.output_queue_size,
+        )
+        self._pipeline_stats: dict = {}
+        self._baseline = self.fingerprint_manifest.load()
+        self._fingerprints: dict[str, dict] = {}
+        self._settle_ms: dict[str, float] = {}
+        self._budget = CrawlBudget.from_config(self.config)
+        self._explore_stats: Counter[str] = Counter()
+        self._stages = StageTimer()
+        # Models left by the interrupted run, keyed by URL: a page and its
+        # click-revealed states share one. Claiming one of those URLs replays
+        # their links instead of navigating again.
+        self._resumed: dict[str, list[PageModel]] = {}
+        resumed_pages = self._shared_resumed_pages
+        if self.config.resume and resumed_pages is None:
+            resumed_pages, model_paths, pom_paths = load_resumed_pages(
+                self.persistence, self.pom_generator
+            )
+            self._pages.extend(resumed_pages)
+            self._model_paths.extend(model_paths)
+            self._pom_paths.extend(pom_paths)
+        for page_model in resumed_pages or []:
+            key = normalize_url(page_model.url)
+            self._resumed.setdefault(key, []).append(page_model)
+        self._resumed_pages = len(self._pages)
+        # Membership for the ordered path lists, which pages sharing a name
+        # would otherwise scan once per write.
+        self._known_model_paths: set[Path] = set(self._model_paths)
+        self._known_pom_paths: set[Path] = set(self._pom_paths)
+
+    def _write_summary(self) -> Path:
+        # A shard sees only its own pages; run_sharded() writes the report.
+        if not self._owns_state:
+            return self.reporter.summary_path
+        return self.reporter.write_summary(self._pages, self._page_changes())
+
+    def _finish_run(self, report_path: Path) -> CrawlResult:
+        if self._checkpoint_interval:
+            self._write_checkpoint()
+        complete = self.state.frontier_size() == 0
+        if self._owns_state:
+            self.fingerprint_manifest.write(
+                merge_page_fingerprints(
+                    self._baseline, self._fingerprints, complete=complete
+                )
+            )
+        stats = {
+            **self.state.stats(),
+            **self._pipeline_stats,
+            **settle_stats(self._settle_ms),
+            **self._budget.stats(),
+            **self._explore_stats,
+            **self._stages.stats(len(self._pages) - self._resumed_pages),
+        }
+        resource_blocker = getattr(self.browser, "resource_blocker", None)
+        if resource_blocker is not None:
+            stats.update(resource_blocker.stats())
+        extraction_timer = getattr(self.browser, "extraction_timer", None)
+        if extraction_timer is not None:
+            stats.update(extraction_timer.stats())
+        fetcher = getattr(self.browser, "fetcher", None)
+        if fetcher is not None:
+            stats.update(fetcher.stats())
+        replay_archive = getattr(self.browser, "replay_archive", None)
+        if replay_archive is not None:
+            stats.update(replay_archive.stats())
+        if self.rate_limiter is not None:
+            stats.update(self.rate_limiter.stats())
+        if self.browser_pool is not None:
+            stats.update(self.browser_pool.stats())
+        if self.config.resume:
+            stats["resumed_pages"] = self._resumed_pages
+        changes = self._page_changes()
+        if changes is not None:
+            stats.update(
+                {f"{kind}_pages": len(entries) for kind, entries in changes.items()}
+            )
+        return CrawlResult(
+            pages=self._pages,
+            model_paths=self._model_paths,
+            pom_paths=self._pom_paths,
+            report_path=report_path,
+            stats=stats,
+            resumed_pages=self._resumed_pages,
+            fingerprints=self._fingerprints,
+            changes=changes,
+            settle_ms=self._settle_ms,
+        )
+
+    def _close_pipeline(self) -> None:
+        """Flush pending model/POM writes; a failed write fails the run."""
+        self._pipeline_stats = self._pipeline.close()
+        if self._pipeline.error is not None:
+            self._worker_errors.append(self._pipeline.error)
+
+    def _write_outputs(self, page_model: PageModel) -> None:
+        """Persist one page model and its POM; runs on an output pipeline thread."""
+        with self._output_lock:
+            file_lock = self._file_locks.setdefault(
+                page_model.page_name, threading.Lock()
+            )
+        # Samples of one route template share a page name, hence one file.
+        with file_lock:
+            model_path = self.persistence.write_page_model(page_model)
+            pom_path = self.pom_generator.generate_page(page_model)
+        with self._output_lock:
+            if model_path not in self._known_model_paths:
+                self._known_model_paths.add(model_path)
+                self._model_paths.append(model_path)
+            if pom_path not in self._known_pom_paths:
+                self._known_pom_paths.add(pom_path)
+                self._pom_paths.append(pom_path)
+
+    def _page_changes(self) -> dict[str, list[dict]] | None:
+        if not self.config.incremental:
+            return None
+        return diff_page_fingerprints(
+            self._baseline,
+            self._fingerprints,
+            complete=self.state.frontier_size() == 0,
+        )
+
+    def _release(self, current: FrontierItem, counted: bool) -> None:
+        """Finish a claimed item; the caller holds the state lock."""
+        self.state.release(current, modeled=counted)
+        if not counted or not self._checkpoint_interval:
+            return
+        self._modeled_since_checkpoint += 1
+        if self._modeled_since_checkpoint >= self._checkpoint_interval:
+            self._write_checkpoint()
+
+    def _write_checkpoint(self) -> None:
+        self._modeled_since_checkpoint = 0
+        # Pages the checkpoint marks as visited must have their models on disk.
+        self._pipeline.wait_idle()
+        path = self.checkpoints.write(self.config.base_url, self.state.snapshot())
+        self._emit_progress(
+            "checkpoint", {"path": str(path), "modeled_pages": len(self._pages)}
+        )
+
+    def _checkpoint_on_failure(self) -> None:
+        if not self._checkpoint_interval:
+            return
+        with contextlib.suppress(Exception):
+            self._write_checkpoint()
 
-        while self.state.frontier and self.state.page_count < self.config.max_pages:
-            current = self.state.dequeue()
+    def _run_worker(self, worker: Callable[..., None], *args: object) -> None:
+        try:
+            worker(*args)
+        except BaseException as exc:
+            # Stop the other workers before this one's error unwinds.
+            self._fail(exc)
+            raise
+
+    def _tab_worker(self) -> None:
+        tab = self.browser.new_tab()
+        try:
+            self._crawl_worker(tab, SelectorVerifier(tab))
+        finally:
+            tab.close()
+
+    def _pooled_worker(self) -> None:
+        pool = self.browser_pool
+        try:
+            # Opened on this thread, before the first claim, for this worker.
+            pool.warm()
+            while (current := self._claim_next()) is not None:
+                try:
+                    counted = self._visit_pooled(current)
+                except BaseException:
+                    with self._state_lock:
+                        self.state.release(modeled=False)
+                        self._state_lock.notify_all()
+                    raise
+                with self._state_lock:
+                    self._release(current, counted)
+                    self._state_lock.notify_all()
+        finally:
+            pool.close()
+
+    def _visit_pooled(self, current: FrontierItem) -> bool:
+        """
+        `_visit()` on a leased tab. A tab that fails mid-page (crashed,
+        stuck past its timeouts) is recycled and the page skipped, rather
+        than failing the whole run; other errors still fail it. The tab goes
+        back to the pool however the page ends.
+        """
+        browser = self.browser_pool.acquire()
+        failed = True
+        try:
+            counted = self._visit(browser, SelectorVerifier(browser), current)
+            failed = False
+        except browser_errors() as exc:
+            return self._skip_browser_failure(current, exc)
+        finally:
+            self.browser_pool.release(browser, failed=failed)
+        return counted
+
+    def _skip_browser_failure(self, current: FrontierItem, exc: Exception) -> bool:
+        self._emit_progress(
+            "skip",
+            {"url": current.url, "reason": "browser_failed", "error": repr(exc)},
+        )
+        return False
+
+    def _fail(self, exc: BaseException) -> None:
+        with self._state_lock:
+            self._worker_errors.append(exc)
+            self._state_lock.notify_all()
+
+    def _crawl_worker(
+        self, browser: BrowserAdapter, verifier: SelectorVerifier
+    ) -> None:
+        while True:
+            current = self._claim_next()
             if current is None:
-                break
+                return
+            try:
+                counted = self._visit(browser, verifier, current)
+            except BaseException:
+                # Leave the item claimed so the checkpoint retries it on --resume.
+                with self._state_lock:
+                    self.state.release(modeled=False)
+                    self._state_lock.notify_all()
+                raise
+            with self._state_lock:
+                self._release(current, counted)
+                self._state_lock.notify_all()
+
+    def _claim_next(self) -> FrontierItem | None:
+        with self._state_lock:
+            while True:
+                current, done = self._try_claim()
+                if done:
+                    self._state_lock.notify_all()
+                    return None
+                if current is not None:
+                    return current
+                self._state_lock.wait(self._claim_poll_s)
+
+    def _try_claim(self) -> tuple[FrontierItem | None, bool]:
+        """Return `(item, done)`; `(None, False)` means wait for in-flight work."""
+        if (
+            self._worker_errors
+            or self._pipeline.error is not None
+            or self.state.is_exhausted(self.config.max_pages)
+        ):
+            return None, True
+        if self._budget.expired():
+            # Out of time: leave the rest of the frontier for --resume.
+            return None, True
+        current = self.state.claim(self.config.max_pages)
+        if current is not None:
             self._emit_progress(
                 "dequeue",
                 {
                     "url": current.url,
                     "depth": current.depth,
-                    "frontier_remaining": len(self.state.frontier),
-                    "modeled_pages": len(pages),
+                    "frontier_remaining": self.state.frontier_size(),
+                    "modeled_pages": len(self._pages),
                 },
             )
-            if current.depth > self.config.max_depth:
-                self._emit_progress(
-                    "skip",
-                    {
-                        "url": current.url,
-                        "reason": "depth_limit",
-                        "depth": current.depth,
-                    },
+        return current, False
+
+    def _visit(
+        self,
+        browser: BrowserAdapter,
+        verifier: SelectorVerifier,
+        current: FrontierItem,
+    ) -> bool:
+        """Visit one frontier item; True if it counts against `max_pages`."""
+        if self._take_resumed(current):
+            return True
+        level = self._degradation_level()
+        if not self._should_visit(current, level):
+            return False
+
+        started = time.perf_counter()
+        max_nodes = self._budget.node_limit(level)
+        with self._stages.stage("navigate"):
+            navigated = self._navigate(browser, current.url)
+        if not navigated:
+            return False
+        # URL, summary and selector visibility in a single browser round trip.
+        with self._stages.stage("snapshot"):
+            dom_summary = browser.snapshot(max_nodes=max_nodes)
+        page_url = dom_summary["url"]
+        signature = self._page_signature(browser, current, dom_summary)
+        if signature is None:
+            return False
+        if self._skip_unchanged(current, page_url, dom_summary):
+            return True
+
+        with self._stages.stage("model"):
+            page_model = self._build_page_model(dom_summary, page_url)
+        if not self._budget.skip_healing(level):
+            with self._stages.stage("heal"):
+                verifier.verify_and_heal(page_model, dom_summary.get("visibility"))
+        explored: list[tuple[PageModel, dict]] = []
+        if self.config.explore_actions and not self._budget.skip_exploration(level):
+            with self._stages.stage("explore"):
+                explored = self._explore(
+                    browser,
+                    verifier,
+                    current,
+                    page_model,
+                    dom_summary,
+                    signature,
+                    max_nodes,
                 )
-                continue
-            if not self._is_allowed(current.url):
-                self._emit_progress(
-                    "skip", {"url": current.url, "reason": "policy_blocked"}
+
+        with self._stages.stage("submit"):
+            self._submit_outputs(page_model, explored)
+        self._finish_visit(
+            current, started, page_model, dom_summary, signature, explored
+        )
+        return True
+
+    def _page_signature(
+        self,
+        browser: BrowserAdapter | AsyncBrowserAdapter,
+        current: FrontierItem,
+        dom_summary: dict,
+    ) -> str | None:
+        """Record the settle time and signature of a loaded page; None if seen."""
+        with self._state_lock:
+            self._record_settle(browser, current)
+            return self._record_signature(current, dom_summary["url"], dom_summary)
+
+    def _submit_outputs(
+        self, page_model: PageModel, explored: list[tuple[PageModel, dict]]
+    ) -> None:
+        """Queue the page's and its states' files; blocks only when the pipeline is full."""
+        self._pipeline.submit(self._write_outputs, page_model)
+        for state_model, _ in explored:
+            self._pipeline.submit(self._write_outputs, state_model)
+
+    def _finish_visit(
+        self,
+        current: FrontierItem,
+        started: float,
+        page_model: PageModel,
+        dom_summary: dict,
+        signature: str,
+        explored: list[tuple[PageModel, dict]],
+    ) -> None:
+        self._budget.record_page((time.perf_counter() - started) * 1000)
+        with self._state_lock:
+            self._record_page(page_model, dom_summary, current, signature)
+            for state_model, state_summary in explored:
+                self._record_page(state_model, state_summary, current)
+
+    async def _arun_worker(self, worker: Awaitable[None]) -> None:
+        try:
+            await worker
+        except BaseException as exc:
+            # Stop the other workers before this one's error unwinds.
+            await self._afail(exc)
+            raise
+
+    async def _atab_worker(self) -> None:
+        tab = await self.browser.new_tab()
+        try:
+            await self._acrawl_worker(tab, SelectorVerifier(tab))
+        finally:
+            await tab.close()
+
+    async def _apooled_worker(self) -> None:
+        # Tasks share one thread, so the tabs each one warms serve all of them.
+        await self.browser_pool.awarm()
+        while (current := await self._aclaim_next()) is not None:
+            try:
+                counted = await self._avisit_pooled(current)
+            except BaseException:
+                async with self._async_state_lock:
+                    self.state.release(modeled=False)
+                    self._async_state_lock.notify_all()
+                raise
+            async with self._async_state_lock:
+                self._release(current, counted)
+                self._async_state_lock.notify_all()
+
+    async def _avisit_pooled(self, current: FrontierItem) -> bool:
+        browser = await self.browser_pool.aacquire()
+        failed = True
+        try:
+            counted = await self._avisit(browser, SelectorVerifier(browser), current)
+            failed = False
+        except browser_errors() as exc:
+            return self._skip_browser_failure(current, exc)
+        finally:
+            await self.browser_pool.arelease(browser, failed=failed)
+        return counted
+
+    async def _afail(self, exc: BaseException) -> None:
+        async with self._async_state_lock:
+            self._worker_errors.append(exc)
+            self._async_state_lock.notify_all()
+
+    async def _acrawl_worker(
+        self, browser: AsyncBrowserAdapter, verifier: SelectorVerifier
+    ) -> None:
+        while True:
+            current = await self._aclaim_next()
+            if current is None:
+                return
+            try:
+                counted = await self._avisit(browser, verifier, current)
+            except BaseException:
+                # Leave the item claimed so the checkpoint retries it on --resume.
+                async with self._async_state_lock:
+                    self.state.release(modeled=False)
+                    self._async_state_lock.notify_all()
+                raise
+            async with self._async_state_lock:
+                self._release(current, counted)
+                self._async_state_lock.notify_all()
+
+    async def _aclaim_next(self) -> FrontierItem | None:
+        async with self._async_state_lock:
+            while True:
+                current, done = self._try_claim()
+                if done:
+                    self._async_state_lock.notify_all()
+                    return None
+                if current is not None:
+                    return current
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._async_state_lock.wait(), self._claim_poll_s
+                    )
+
+    async def _avisit(
+        self,
+        browser: AsyncBrowserAdapter,
+        verifier: SelectorVerifier,
+        current: FrontierItem,
+    ) -> bool:
+        if self._take_resumed(current):
+            return True
+        level = self._degradation_level()
+        if not self._should_visit(current, level):
+            return False
+
+        started = time.perf_counter()
+        max_nodes = self._budget.node_limit(level)
+        with self._stages.stage("navigate"):
+            navigated = await self._anavigate(browser, current.url)
+        if not navigated:
+            return False
+        with self._stages.stage("snapshot"):
+            dom_summary = await browser.snapshot(max_nodes=max_nodes)
+        page_url = dom_summary["url"]
+        signature = self._page_signature(browser, current, dom_summary)
+        if signature is None:
+            return False
+        if self._skip_unchanged(current, page_url, dom_summary):
+            return True
+
+        with self._stages.stage("model"):
+            page_model = self._build_page_model(dom_summary, page_url)
+        if not self._budget.skip_healing(level):
+            with self._stages.stage("heal"):
+                await verifier.averify_and_heal(
+                    page_model, dom_summary.get("visibility")
+                )
+        explored: list[tuple[PageModel, dict]] = []
+        if self.config.explore_actions and not self._budget.skip_exploration(level):
+            with self._stages.stage("explore"):
+                explored = await self._aexplore(
+                    browser,
+                    verifier,
+                    current,
+                    page_model,
+                    dom_summary,
+                    signature,
+                    max_nodes,
                 )
-                continue
 
-            self.browser.goto(current.url)
-            # Increased max_nodes to 500 to ensure full coverage of complex pages
-            dom_summary = self.browser.extract_interactive_dom_summary(max_nodes=500)
-            signature = self.state.make_signature(
-                normalized_url=normalize_url(self.browser.url()),
-                dom_fingerprint=dom_summary.get("fingerprint", ""),
-                landmarks=dom_summary.get("landmarks", []),
-            )
-            if signature in self.state.visited_signatures:
-                self.state.duplicate_hits += 1
-                self._emit_progress(
-                    "skip", {"url": current.url, "reason": "duplicate_signature"}
+        with self._stages.stage("submit"):
+            await asyncio.to_thread(self._submit_outputs, page_model, explored)
+        self._finish_visit(
+            current, started, page_model, dom_summary, signature, explored
+        )
+        return True
+
+    def _navigate(self, browser: BrowserAdapter, url: str) -> bool:
+        """
+        `goto()` under the per-host rate limit, retrying after a 429/503.
+        False if the host was still throttling after `throttle_retries`.
+        """
+        limiter = self.rate_limiter
+        if limiter is None:
+            browser.goto(url)
+            return True
+        for _ in range(self.config.throttle_retries + 1):
+            limiter.acquire(url)
+            try:
+                browser.goto(url)
+            finally:
+                throttled = self._release_host(browser, url)
+            if not throttled:
+                return True
+        return self._give_up_throttled(url)
+
+    async def _anavigate(self, browser: AsyncBrowserAdapter, url: str) -> bool:
+        limiter = self.rate_limiter
+        if limiter is None:
+            await browser.goto(url)
+            return True
+        for _ in range(self.config.throttle_retries + 1):
+            await limiter.aacquire(url)
+            try:
+                await browser.goto(url)
+            finally:
+                throttled = self._release_host(browser, url)
+            if not throttled:
+                return True
+        return self._give_up_throttled(url)
+
+    def _release_host(
+        self, browser: BrowserAdapter | AsyncBrowserAdapter, url: str
+    ) -> bool:
+        """Report a navigation to the rate limiter; True if it was throttled."""
+        throttled = self.rate_limiter.release(
+            url,
+            getattr(browser, "last_status", None),
+            getattr(browser, "last_retry_after_s", None),
+        )
+        # An HTTP fetch that escalated to the browser hit the host twice.
+        if (extra := getattr(browser, "last_requests", 1) - 1) > 0:
+            self.rate_limiter.charge(url, extra)
+        return throttled
+
+    def _give_up_throttled(self, url: str) -> bool:
+        self.rate_limiter.give_up()
+        self._emit_progress("skip", {"url": url, "reason": "throttled"})
+        return False
+
+    def _explore(
+        self,
+        browser: BrowserAdapter,
+        verifier: SelectorVerifier,
+        current: FrontierItem,
+        page_model: PageModel,
+        dom_summary: dict,
+        signature: str,
+        max_nodes: int,
+    ) -> list[tuple[PageModel, dict]]:
+        """
+        Click buttons and tabs breadth-first from the loaded page and model
+        every state not seen before. A click reaching a known signature is
+        pruned; an earlier state is restored by replaying its shortest path.
+        Each new state counts against `max_pages`; exploring stops once the
+        budget is spent.
+        """
+        explored: list[tuple[PageModel, dict]] = []
+        pending = deque([(signature, dom_summary, page_model, 1)])
+        showing: str | None = signature
+        while pending:
+            from_signature, summary, source_model, depth = pending.popleft()
+            for element in candidate_actions(summary, self.config.explore_actions):
+                action = action_key(element["selector"])
+                if self._action_known(from_signature, action):
+                    continue
+                if showing != from_signature and not self._replay(
+                    browser, page_model.url, signature, from_signature
+                ):
+                    return explored
+                clicked = browser.click(element["selector"])
+                self._count_explore("explore_clicks")
+                if not clicked:
+                    showing = from_signature
+                    continue
+                state_summary = browser.snapshot(max_nodes=max_nodes)
+                showing, is_new, charged = self._record_click(
+                    current, page_model.url, from_signature, action, state_summary
                 )
-                continue
-            self.state.visited_signatures.add(signature)
+                if not is_new:
+                    continue
+                if not charged:
+                    return explored
+                state_model = self._state_model(
+                    source_model, element, state_summary, state_summary["url"]
+                )
+                verifier.verify_and_heal(state_model, state_summary.get("visibility"))
+                explored.append((state_model, state_summary))
+                if depth < self.config.explore_depth:
+                    pending.append((showing, state_summary, state_model, depth + 1))
+        return explored
+
+    def _replay(
+        self,
+        browser: BrowserAdapter,
+        page_url: str,
+        root_signature: str,
+        target_signature: str,
+    ) -> bool:
+        """
+        Restore a page state: reload the page, then replay its shortest click
+        path. False if the reload was throttled, which ends the exploration.
+        """
+        path = self._replay_path(root_signature, target_signature)
+        if not self._navigate(browser, page_url):
+            return False
+        for action in path:
+            browser.click(action_selector(action))
+        return True
+
+    async def _aexplore(
+        self,
+        browser: AsyncBrowserAdapter,
+        verifier: SelectorVerifier,
+        current: FrontierItem,
+        page_model: PageModel,
+        dom_summary: dict,
+        signature: str,
+        max_nodes: int,
+    ) -> list[tuple[PageModel, dict]]:
+        explored: list[tuple[PageModel, dict]] = []
+        pending = deque([(signature, dom_summary, page_model, 1)])
+        showing: str | None = signature
+        while pending:
+            from_signature, summary, source_model, depth = pending.popleft()
+            for element in candidate_actions(summary, self.config.explore_actions):
+                action = action_key(element["selector"])
+                if self._action_known(from_signature, action):
+                    continue
+                if showing != from_signature and not await self._areplay(
+                    browser, page_model.url, signature, from_signature
+                ):
+                    return explored
+                clicked = await browser.click(element["selector"])
+                self._count_explore("explore_clicks")
+                if not clicked:
+                    showing = from_signature
+                    continue
+                state_summary = await browser.snapshot(max_nodes=max_nodes)
+                showing, is_new, charged = self._record_click(
+                    current, page_model.url, from_signature, action, state_summary
+                )
+                if not is_new:
+                    continue
+                if not charged:
+                    return explored
+                state_model = self._state_model(
+                    source_model, element, state_summary, state_summary["url"]
+                )
+                await verifier.averify_and_heal(
+                    state_model, state_summary.get("visibility")
+                )
+                explored.append((state_model, state_summary))
+                if depth < self.config.explore_depth:
+                    pending.append((showing, state_summary, state_model, depth + 1))
+        return explored
+
+    async def _areplay(
+        self,
+        browser: AsyncBrowserAdapter,
+        page_url: str,
+        root_signature: str,
+        target_signature: str,
+    ) -> bool:
+        path = self._replay_path(root_signature, target_signature)
+        if not await self._anavigate(browser, page_url):
+            return False
+        for action in path:
+            await browser.click(action_selector(action))
+        return True
+
+    def _action_known(self, from_signature: str, action: str) -> bool:
+        """True if `action` was already tried from this state."""
+        with self._state_lock:
+            return self.state.transition(from_signature, action) is not None
+
+    def _count_explore(self, stat: str) -> None:
+        with self._state_lock:
+            self._explore_stats[stat] += 1
+
+    def _replay_path(self, root_signature: str, target_signature: str) -> list[str]:
+        """Shortest click path from a page's loaded state to `target_signature`."""
+        with self._state_lock:
+            path = self.state.shortest_path(root_signature, target_signature) or []
+            self._explore_stats["explore_restores"] += 1
+            self._explore_stats["explore_replayed_clicks"] += len(path)
+        return path
 
-            page_model = self._build_page_model(dom_summary)
-            self.verifier.verify_and_heal(page_model)
+    def _record_click(
+        self,
+        current: FrontierItem,
+        page_url: str,
+        from_signature: str,
+        action: str,
+        state_summary: dict,
+    ) -> tuple[str | None, bool, bool]:
+        """
+        Record where a click led; returns `(signature, is_new, charged)`, where
+        `charged` means a new state still fit in the page budget.
+        """
+        with self._state_lock:
+            showing, is_new = self._record_transition(
+                current,
+                page_url,
+                from_signature,
+                action,
+                state_summary["url"],
+                state_summary,
+            )
+            charged = is_new and self.state.charge_page(self.config.max_pages, current)
+        return showing, is_new, charged
 
-            pages.append(page_model)
-            model_paths.append(self.persistence.write_page_model(page_model))
-            pom_paths.append(self.pom_generator.generate_page(page_model))
+    def _record_transition(
+        self,
+        current: FrontierItem,
+        page_url: str,
+        from_signature: str,
+        action: str,
+        state_url: str,
+        state_summary: dict,
+    ) -> tuple[str | None, bool]:
+        """
+        Record where a click led; returns `(signature, is_new)`.
+        A click that left the page queues the new URL like a link and
+        returns no signature, so the page is reloaded before the next click.
+        """
+        if normalize_url(state_url) != normalize_url(page_url):
+            self._explore_stats["explore_navigations"] += 1
+            self._enqueue_links([state_url], current.depth + 1)
+            return None, False
+        to_signature = self.state.make_signature(
+            normalized_url=normalize_url(state_url),
+            dom_fingerprint=state_summary.get("fingerprint", ""),
+            landmarks=state_summary.get("landmarks", []),
+        )
+        is_new = self.state.record_edge(from_signature, action, to_signature)
+        if is_new:
+            self._explore_stats["explore_states"] += 1
+        return to_signature, is_new
 
-            self.state.page_count += 1
-            element_count = sum(
-                len(section.elements) for section in page_model.sections
+    def _state_model(
+        self,
+        source_model: PageModel,
+        element: dict,
+        state_summary: dict,
+        state_url: str,
+    ) -> PageModel:
+        """Model a click-revealed state and add the click to its source page."""
+        label = element.get("label", "")
+        state_model = self._build_page_model(
+            state_summary,
+            state_url,
+            page_name=state_page_name(source_model.page_name, label),
+        )
+        element_id = self._semantic_name_from_label(label, element.get("role", ""))
+        source_model.actions.append(
+            ActionModel(
+                name=f"open{state_label(label)}",
+                steps=[f"click({element_id})"],
+                post_condition=state_model.page_name,
             )
+        )
+        return state_model
+
+    def _take_resumed(self, current: FrontierItem) -> bool:
+        """
+        Replay a page modeled before --resume: queue the links of the page and
+        its states, skip the browser. Only URLs still pending in the checkpoint
+        are claimed again, and those left their states out of `page_count`, so
+        the states are charged here and the page by the caller's release.
+        """
+        with self._state_lock:
+            page_models = self._resumed.pop(normalize_url(current.url), None)
+            if page_models is None:
+                return False
+            for page_model in page_models:
+                self._enqueue_links(page_model.discovered_links, current.depth + 1)
+            for _ in page_models[1:]:
+                self.state.charge_page(self.config.max_pages, current)
+        self._emit_progress("skip", {"url": current.url, "reason": "already_modeled"})
+        return True
+
+    def _skip_unchanged(
+        self, current: FrontierItem, page_url: str, dom_summary: dict
+    ) -> bool:
+        """
+        With --incremental, a page whose content hash matches the previous run
+        keeps its existing model and POM: only its links are queued.
+        """
+        if not self.config.incremental:
+            return False
+        key = normalize_url(page_url)
+        previous = self._baseline.get(key)
+        if previous is None or previous.get("content_hash") != page_content_hash(
+            dom_summary
+        ):
+            return False
+        with self._state_lock:
+            self._fingerprints[key] = previous
+            self._enqueue_links(dom_summary.get("links", []), current.depth + 1)
+        self._emit_progress(
+            "skip",
+            {
+                "url": current.url,
+                "reason": "unchanged",
+                "page_name": previous["page_name"],
+            },
+        )
+        return True
+
+    def _degradation_level(self) -> int:
+        """How far to degrade the next page to stay within the time budget."""
+        if not self._budget.enabled:
+            return 0
+        with self._state_lock:
+            remaining = self.state.pages_remaining(self.config.max_pages)
+        return self._budget.level(remaining)
+
+    def _should_visit(self, current: FrontierItem, level: int = 0) -> bool:
+        if current.depth > self.config.max_depth:
             self._emit_progress(
-                "modeled",
+                "skip",
                 {
-                    "url": page_model.url,
-                    "page_name": page_model.page_name,
-                    "modeled_pages": len(pages),
-                    "elements": element_count,
-                    "actions": len(page_model.actions),
-                    "models_saved": len(model_paths),
-                    "poms_generated": len(pom_paths),
+                    "url": current.url,
+                    "reason": "depth_limit",
+                    "depth": current.depth,
                 },
             )
-            self._enqueue_links(dom_summary.get("links", []), current.depth + 1)
+            return False
+        if not self._is_allowed(current.url):
+            self._emit_progress(
+                "skip", {"url": current.url, "reason": "policy_blocked"}
+            )
+            return False
+        if self._budget.skip_deep_link(level, current.depth):
+            self._emit_progress(
+                "skip",
+                {"url": current.url, "reason": "time_budget", "depth": current.depth},
+            )
+            return False
+        with self._state_lock:
+            admitted = self.state.admit_template(
+                current.url, self.config.max_pages_per_template
+            )
+        if not admitted:
+            self._emit_progress(
+                "skip",
+                {
+                    "url": current.url,
+                    "reason": "template_limit",
+                    "route_template": self.state.route_template(current.url),
+                },
+            )
+            return False
+        return True
 
-        report_path = self.reporter.write_summary(pages)
-        return CrawlResult(
-            pages=pages,
-            model_paths=model_paths,
-            pom_paths=pom_paths,
-            report_path=report_path,
+    def _record_settle(
+        self, browser: BrowserAdapter | AsyncBrowserAdapter, current: FrontierItem
+    ) -> None:
+        # Adapters that do not wait after navigation (e.g. the mock) skip this.
+        settle_ms = getattr(browser, "last_settle_ms", None)
+        if settle_ms is not None:
+            self._settle_ms[current.url] = settle_ms
+
+    def _record_signature(
+        self, current: FrontierItem, page_url: str, dom_summary: dict
+    ) -> str | None:
+        """Return the page signature if it is new, else None."""
+        signature = self.state.make_signature(
+            normalized_url=normalize_url(page_url),
+            dom_fingerprint=dom_summary.get("fingerprint", ""),
+            landmarks=dom_summary.get("landmarks", []),
+        )
+        if self.state.record_signature(signature):
+            # Redirect targets count as visited for enqueue-time dedupe too.
+            self.state.mark_url_seen(page_url)
+            return signature
+        self._emit_progress(
+            "skip", {"url": current.url, "reason": "duplicate_signature"}
+        )
+        return None
+
+    def _record_page(
+        self,
+        page_model: PageModel,
+        dom_summary: dict,
+        current: FrontierItem,
+        signature: str | None = None,
+    ) -> None:
+        """Record a modeled page; click-revealed states (no signature) share their page's URL."""
+        self._pages.append(page_model)
+        if signature is not None:
+            self._fingerprints[normalize_url(page_model.url)] = {
+                "content_hash": page_content_hash(dom_summary),
+                "page_name": page_model.page_name,
+            }
+        element_count = sum(len(section.elements) for section in page_model.sections)
+        links_enqueued, links_deduped = self._enqueue_links(
+            dom_summary.get("links", []),
+            current.depth + 1,
+            source_has_forms=any(
+                element.type == "input"
+                for section in page_model.sections
+                for element in section.elements
+            ),
+        )
+        self._emit_progress(
+            "modeled",
+            {
+                "url": page_model.url,
+                "page_name": page_model.page_name,
+                "modeled_pages": len(self._pages),
+                "elements": element_count,
+                "actions": len(page_model.actions),
+                "models_saved": len(self._model_paths),
+                "poms_generated": len(self._pom_paths),
+                "links_enqueued": links_enqueued,
+                "links_deduped": links_deduped,
+            },
         )
 
     def _emit_progress(self, event: str, payload: dict) -> None:
         if self.progress_hook is None:
             return
-        self.progress_hook(event, payload)
+        with self._progress_lock:
+            self.progress_hook(event, payload)
 
-    def _build_page_model(self, dom_summary: dict) -> PageModel:
-        url = self.browser.url()
+    def _build_page_model(
+        self, dom_summary: dict, url: str, page_name: str | None = None
+    ) -> PageModel:
         path = urlparse(url).path or "/"
-        page_name = self._to_page_name(path)
+        page_name = page_name or self._to_page_name(
+            path, by_template=self.config.max_pages_per_template is not None
+        )
 
         elements = []
         for e in dom_summary.get("elements", []):
@@ -199,11 +1253,24 @@ class AutoPomOrchestrator:
         )
 
     @staticmethod
-    def _to_page_name(path: str) -> str:
+    def _to_page_name(path: str, *, by_template: bool = False) -> str:
+        """
+        `/settings/billing` -> `SettingsBillingPage`. With `by_template`, one
+        name per route template: `/product/123` -> `ProductDetailPage`.
+        """
         if path in ("", "/"):
             return "HomePage"
-        parts = [p for p in path.split("/") if p]
-        return "".join(part.capitalize() for part in parts) + "Page"
+        if not by_template:
+            parts = [p for p in path.split("/") if p]
+            return "".join(part.capitalize() for part in parts) + "Page"
+        parts = [p for p in route_template(path).split("/") if p]
+        return (
+            "".join(
+                "Detail" if part in ("{id}", "{slug}") else part.capitalize()
+                for part in parts
+            )
+            + "Page"
+        )
 
     @staticmethod
     def _semantic_name_from_label(label: str, role: str) -> str:
@@ -247,18 +1314,38 @@ class AutoPomOrchestrator:
             ]
         return []
 
-    def _enqueue_links(self, links: list[str], depth: int) -> None:
+    def _enqueue_links(
+        self, links: list[str], depth: int, source_has_forms: bool = False
+    ) -> tuple[int, int]:
+        """
+        Queue allowed links; return `(enqueued, skipped_as_already_seen)`.
+        Links past `max_depth` are not queued or marked seen, so a shallower
+        route to the same URL found later still reaches the frontier.
+        """
+        enqueued = deduped = 0
+        if depth > self.config.max_depth:
+            return enqueued, deduped
         for link in links:
             absolute = urljoin(self.config.base_url, link)
             if not self._is_allowed(absolute):
                 continue
-            self.state.enqueue(
-                FrontierItem(url=absolute, depth=depth, via_action="discover_link")
-            )
+            if self.state.enqueue(
+                FrontierItem(
+                    url=absolute,
+                    depth=depth,
+                    via_action="discover_link",
+                    source_has_forms=source_has_forms,
+                )
+            ):
+                enqueued += 1
+            else:
+                deduped += 1
+        return enqueued, deduped
 
     def _is_allowed(self, url: str) -> bool:
-        if is_denied_domain(url, self.config.denied_domains):
-            return False
-        if self.config.same_origin_only and not same_origin(self.config.base_url, url):
-            return False
-        return True
+        return is_allowed_url(
+            url,
+            self.config.base_url,
+            same_origin_only=self.config.same_origin_only,
+            denied_domains=self.config.denied_domains,
+        )
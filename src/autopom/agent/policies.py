@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import re
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 TRACKING_QUERY_PREFIXES = ("utm_", "gclid", "fbclid")
+ID_SEGMENT_PATTERN = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{16,})$",
+    re.IGNORECASE,
+)
+# Content slugs: four or more hyphenated words, or words mixed with a number
+# (`blue-widget-42`). Short static routes like `forgot-password` stay literal.
+SLUG_SEGMENT_PATTERN = re.compile(
+    r"^(?=.*[a-z])([a-z0-9]+(-[a-z0-9]+){3,}|(?=.*-\d+(-|$))[a-z0-9]+(-[a-z0-9]+)+)$",
+    re.IGNORECASE,
+)
 
 
 def normalize_url(url: str) -> str:
@@ -23,3 +34,33 @@ def same_origin(base_url: str, candidate_url: str) -> bool:
 def is_denied_domain(candidate_url: str, denied_domains: list[str]) -> bool:
     host = urlparse(candidate_url).netloc.lower()
     return any(domain in host for domain in denied_domains)
+
+
+def is_allowed_url(
+    url: str, base_url: str, *, same_origin_only: bool, denied_domains: list[str]
+) -> bool:
+    """Crawl policy shared by discovered links and seeded URLs."""
+    if is_denied_domain(url, denied_domains):
+        return False
+    return not same_origin_only or same_origin(base_url, url)
+
+
+def route_template(url: str, *, with_host: bool = False) -> str:
+    """
+    Collapse data-driven path segments into placeholders:
+    `/product/123` -> `/product/{id}`, `/blog/my-first-post-2024` -> `/blog/{slug}`.
+    Slugs are only recognised below the first segment, where collections live.
+    `with_host` keeps same-path routes of different hosts apart:
+    `shop.example.com/product/{id}`.
+    """
+    parsed = urlparse(url)
+    segments = (parsed.path or "/").split("/")
+    host = parsed.netloc.lower() if with_host else ""
+    return host + "/".join(
+        "{id}"
+        if ID_SEGMENT_PATTERN.match(segment)
+        else "{slug}"
+        if index > 1 and SLUG_SEGMENT_PATTERN.match(segment)
+        else segment
+        for index, segment in enumerate(segments)
+    )
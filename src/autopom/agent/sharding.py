@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.managers import BaseManager
+from pathlib import Path
+
+from autopom.agent.budget import CrawlBudget
+from autopom.agent.orchestrator import (
+    AutoPomOrchestrator,
+    CrawlResult,
+    create_pom_generator,
+    initial_crawl_state,
+    load_resumed_pages,
+)
+from autopom.agent.stage_timer import StageTimer
+from autopom.agent.state_store import CrawlState, FrontierItem
+from autopom.browser.browseruse_adapter import create_browser_adapter
+from autopom.browser.dom_snapshot import ExtractionTimer
+from autopom.browser.http_adapter import HttpFetcher
+from autopom.browser.pool import BrowserPool
+from autopom.browser.rate_limit import HostRateLimiter
+from autopom.browser.replay_adapter import ReplayArchive
+from autopom.browser.resource_blocking import ResourceBlocker
+from autopom.browser.settle import SettlePolicy, settle_stats
+from autopom.config import CrawlConfig
+from autopom.extraction.schema import PageModel
+from autopom.io.checkpoint import CheckpointStore
+from autopom.io.fingerprints import (
+    FingerprintManifest,
+    diff_page_fingerprints,
+    merge_page_fingerprints,
+)
+from autopom.io.output_pipeline import OutputPipeline
+from autopom.io.persistence import Persistence
+from autopom.io.report_writer import ReportWriter
+from autopom.stats import keys_with_prefix, sum_stats
+
+# Stats providers whose `merge()` combines the stats of crawl shards.
+SHARD_STATS_PROVIDERS = (
+    OutputPipeline,
+    ResourceBlocker,
+    ExtractionTimer,
+    HttpFetcher,
+    ReplayArchive,
+    HostRateLimiter,
+    BrowserPool,
+    CrawlBudget,
+    StageTimer,
+)
+
+
+class SharedCrawlState:
+    """
+    `CrawlState` hosted in a manager process and shared by every shard.
+    The manager serves each shard connection on its own thread, so every
+    call takes the lock to stay atomic.
+    """
+
+    def __init__(self, state: CrawlState) -> None:
+        self._state = state
+        self._lock = threading.Lock()
+        self._aborted = False
+
+    def enqueue(self, item: FrontierItem) -> bool:
+        with self._lock:
+            return self._state.enqueue(item)
+
+    def mark_url_seen(self, url: str) -> bool:
+        with self._lock:
+            return self._state.mark_url_seen(url)
+
+    def claim(self, max_pages: int) -> FrontierItem | None:
+        with self._lock:
+            if self._aborted:
+                return None
+            return self._state.claim(max_pages)
+
+    def charge_page(self, max_pages: int, item: FrontierItem | None = None) -> bool:
+        with self._lock:
+            return self._state.charge_page(max_pages, item)
+
+    def release(self, item: FrontierItem | None = None, *, modeled: bool) -> None:
+        with self._lock:
+            self._state.release(item, modeled=modeled)
+
+    def frontier_size(self) -> int:
+        with self._lock:
+            return self._state.frontier_size()
+
+    def is_exhausted(self, max_pages: int) -> bool:
+        with self._lock:
+            return self._aborted or self._state.is_exhausted(max_pages)
+
+    def pages_remaining(self, max_pages: int) -> int:
+        with self._lock:
+            return self._state.pages_remaining(max_pages)
+
+    def transition(self, from_signature: str, action: str) -> str | None:
+        with self._lock:
+            return self._state.transition(from_signature, action)
+
+    def record_edge(self, from_signature: str, action: str, to_signature: str) -> bool:
+        with self._lock:
+            return self._state.record_edge(from_signature, action, to_signature)
+
+    def shortest_path(self, from_signature: str, to_signature: str) -> list[str] | None:
+        with self._lock:
+            return self._state.shortest_path(from_signature, to_signature)
+
+    def admit_template(self, url: str, limit: int | None) -> bool:
+        with self._lock:
+            return self._state.admit_template(url, limit)
+
+    def route_template(self, url: str) -> str:
+        return self._state.route_template(url)
+
+    def record_signature(self, signature: str) -> bool:
+        with self._lock:
+            return self._state.record_signature(signature)
+
+    def make_signature(self, **kwargs) -> str:
+        return self._state.make_signature(**kwargs)
+
+    def abort(self) -> None:
+        """Stop every shard, e.g. after one of them crashed mid-page."""
+        with self._lock:
+            self._aborted = True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return self._state.stats()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return self._state.snapshot()
+
+
+class CrawlStateManager(BaseManager):
+    pass
+
+
+CrawlStateManager.register("SharedCrawlState", SharedCrawlState)
+
+
+def run_sharded(
+    config: CrawlConfig,
+    progress_hook: Callable[[str, dict], None] | None = None,
+) -> CrawlResult:
+    """
+    Crawl with `config.processes` worker processes, each driving its own
+    browser, against one shared frontier and signature set.
+    `progress_hook` runs inside the workers, so it must be picklable.
+    """
+    # Browsers do not survive fork(); spawn gives every shard a clean runtime.
+    mp_context = multiprocessing.get_context("spawn")
+    manifest = FingerprintManifest(config.output_dir)
+    baseline = manifest.load()
+    # Load and regenerate the resumed pages here, once, rather than per shard.
+    resumed_pages: list[PageModel] = []
+    resumed_model_paths: list[Path] = []
+    resumed_pom_paths: list[Path] = []
+    if config.resume:
+        resumed_pages, resumed_model_paths, resumed_pom_paths = load_resumed_pages(
+            Persistence(config.output_dir), create_pom_generator(config)
+        )
+    with CrawlStateManager(ctx=mp_context) as manager:
+        shared_state = manager.SharedCrawlState(initial_crawl_state(config))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=config.processes, mp_context=mp_context
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        _crawl_shard,
+                        config,
+                        shared_state,
+                        progress_hook,
+                        resumed_pages,
+                    )
+                    for _ in range(config.processes)
+                ]
+                shard_results = [future.result() for future in futures]
+        finally:
+            # Every shard has stopped and flushed its outputs by now, so one
+            # checkpoint of the shared state covers them all.
+            if config.checkpoint_interval:
+                CheckpointStore(config.output_dir).write(
+                    config.base_url, shared_state.snapshot()
+                )
+        stats = shared_state.stats()
+        complete = shared_state.frontier_size() == 0
+    # Each shard ran its own pipeline, browser and timers; report the totals.
+    shard_stats = [shard.stats for shard in shard_results]
+    for provider in SHARD_STATS_PROVIDERS:
+        stats.update(provider.merge(shard_stats))
+    stats.update(sum_stats(shard_stats, keys_with_prefix(shard_stats, ("explore_",))))
+
+    # Every shard regenerates the same base page; keep a single copy of it.
+    resumed = len(resumed_pages)
+    if config.resume:
+        stats["resumed_pages"] = resumed
+    pages = resumed_pages + [page for shard in shard_results for page in shard.pages]
+    model_paths = resumed_model_paths + [
+        path for shard in shard_results for path in shard.model_paths
+    ]
+    pom_paths = (
+        shard_results[0].pom_paths[:1]
+        + resumed_pom_paths
+        + [path for shard in shard_results for path in shard.pom_paths[1:]]
+    )
+    fingerprints = {
+        url: entry
+        for shard in shard_results
+        for url, entry in shard.fingerprints.items()
+    }
+    settle_ms = {
+        url: ms for shard in shard_results for url, ms in shard.settle_ms.items()
+    }
+    stats.update(settle_stats(settle_ms))
+    manifest.write(merge_page_fingerprints(baseline, fingerprints, complete=complete))
+    changes = None
+    if config.incremental:
+        changes = diff_page_fingerprints(baseline, fingerprints, complete=complete)
+        stats.update(
+            {f"{kind}_pages": len(entries) for kind, entries in changes.items()}
+        )
+    # Shards see only their own pages, so the report is written here.
+    report_path = ReportWriter(config.output_dir).write_summary(pages, changes)
+    return CrawlResult(
+        pages=pages,
+        model_paths=model_paths,
+        pom_paths=pom_paths,
+        report_path=report_path,
+        stats=stats,
+        resumed_pages=resumed,
+        fingerprints=fingerprints,
+        changes=changes,
+        settle_ms=settle_ms,
+    )
+
+
+def _crawl_shard(
+    config: CrawlConfig,
+    shared_state: SharedCrawlState,
+    progress_hook: Callable[[str, dict], None] | None,
+    resumed_pages: list[PageModel],
+) -> CrawlResult:
+    browser = create_browser_adapter(
+        adapter_name=config.browser_adapter,
+        base_url=config.base_url,
+        playwright_headless=config.playwright_headless,
+        concurrency=config.concurrency,
+        browser_pool_size=config.browser_pool_size,
+        extraction_engine=config.extraction_engine,
+        incremental_extraction=config.incremental_extraction,
+        replay_archive=config.replay_archive,
+        synthetic_site=config.synthetic_site,
+        settle=SettlePolicy.from_config(config),
+        resource_blocker=ResourceBlocker.from_config(config)
+        if config.block_resources
+        else None,
+    )
+    try:
+        orchestrator = AutoPomOrchestrator(
+            config=config,
+            browser=browser,
+            progress_hook=progress_hook,
+            state=shared_state,
+            resumed_pages=resumed_pages,
+        )
+        return orchestrator.run()
+    except BaseException:
+        shared_state.abort()
+        raise
+    finally:
+        browser.close()
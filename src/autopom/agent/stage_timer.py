@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from autopom.stats import avg_ms, keys_with_prefix, max_stats, sum_stats
+
+# Per-page pipeline stages, in crawl order.
+CRAWL_STAGES = ("navigate", "snapshot", "model", "heal", "explore", "submit")
+
+
+@dataclass(slots=True)
+class StageTimer:
+    """
+    Wall-clock time per crawl stage, summed over workers, plus crawl
+    throughput. `navigate` includes settling and rate-limit waits, `submit`
+    includes output-pipeline backpressure.
+    """
+
+    started: float = field(default_factory=time.perf_counter)
+    _calls: Counter[str] = field(init=False, default_factory=Counter)
+    _seconds: Counter[str] = field(init=False, default_factory=Counter)
+    _max_s: dict[str, float] = field(init=False, default_factory=dict)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._calls[name] += 1
+            self._seconds[name] += seconds
+            self._max_s[name] = max(self._max_s.get(name, 0.0), seconds)
+
+    def stats(self, pages: int) -> dict:
+        """`pages` modeled since `started` give `pages_per_second`."""
+        elapsed = time.perf_counter() - self.started
+        stats: dict = {
+            "crawl_pages": pages,
+            "crawl_seconds": round(elapsed, 3),
+            "pages_per_second": round(pages / elapsed, 2) if elapsed else 0.0,
+        }
+        with self._lock:
+            for name in CRAWL_STAGES:
+                calls = self._calls[name]
+                if not calls:
+                    continue
+                seconds = self._seconds[name]
+                stats[f"stage_{name}_calls"] = calls
+                stats[f"stage_{name}_seconds"] = round(seconds, 4)
+                stats[f"stage_{name}_avg_ms"] = round(seconds * 1000 / calls, 2)
+                stats[f"stage_{name}_max_ms"] = round(self._max_s[name] * 1000, 2)
+        return stats
+
+    @classmethod
+    def merge(cls, stats_list: list[dict]) -> dict:
+        """
+        Combine the `stats()` of crawl shards. Shards crawl side by side, so
+        throughput is over the slowest one.
+        """
+        keys = keys_with_prefix(stats_list, ("stage_",))
+        stats = {
+            **sum_stats(stats_list, ["crawl_pages"], digits=0),
+            **max_stats(stats_list, ["crawl_seconds"]),
+            **sum_stats(
+                stats_list, [k for k in keys if k.endswith(("_calls", "_seconds"))], 4
+            ),
+            **max_stats(stats_list, [k for k in keys if k.endswith("_max_ms")]),
+        }
+        seconds = stats.get("crawl_seconds", 0.0)
+        stats["pages_per_second"] = (
+            round(stats["crawl_pages"] / seconds, 2) if seconds else 0.0
+        )
+        for name in CRAWL_STAGES:
+            if calls := stats.get(f"stage_{name}_calls"):
+                stats[f"stage_{name}_avg_ms"] = avg_ms(
+                    stats[f"stage_{name}_seconds"], calls, digits=2
+                )
+        return stats
@@ -1,9 +1,157 @@
 from __future__ import annotations
 
-from collections import deque
-from dataclasses import dataclass, field
-from hashlib import sha256
+import base64
+import heapq
+import itertools
 import json
+import math
+import sys
+from collections import Counter, deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from hashlib import blake2b, sha256
+from typing import TYPE_CHECKING
+
+from autopom.agent.policies import normalize_url, route_template
+
+if TYPE_CHECKING:
+    from autopom.config import CrawlConfig
+
+SUPPORTED_SEEN_SETS = ("exact", "bloom")
+SUPPORTED_FRONTIER_STRATEGIES = ("fifo", "priority")
+
+
+def normalize_frontier_strategy(strategy: str) -> str:
+    normalized = strategy.strip().lower()
+    aliases = {"bfs": "fifo", "heap": "priority"}
+    normalized = aliases.get(normalized, normalized)
+    if normalized not in SUPPORTED_FRONTIER_STRATEGIES:
+        allowed = ", ".join(SUPPORTED_FRONTIER_STRATEGIES)
+        raise ValueError(
+            f"Unsupported frontier strategy '{strategy}'. Allowed: {allowed}."
+        )
+    return normalized
+
+
+def normalize_seen_set(seen_set: str) -> str:
+    normalized = seen_set.strip().lower()
+    aliases = {"set": "exact", "bloom-filter": "bloom"}
+    normalized = aliases.get(normalized, normalized)
+    if normalized not in SUPPORTED_SEEN_SETS:
+        allowed = ", ".join(SUPPORTED_SEEN_SETS)
+        raise ValueError(f"Unsupported seen set '{seen_set}'. Allowed: {allowed}.")
+    return normalized
+
+
+class BloomSeenSet:
+    """
+    Set-like membership filter with a fixed memory footprint.
+    Never reports a seen item as new; may report a new item as seen with
+    probability `false_positive_rate` once `capacity` items were added.
+    """
+
+    __slots__ = (
+        "_added",
+        "_bit_count",
+        "_bits",
+        "_hash_count",
+        "capacity",
+        "false_positive_rate",
+    )
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001) -> None:
+        if capacity < 1:
+            raise ValueError(
+                f"Bloom filter capacity must be at least 1, got {capacity}."
+            )
+        if not 0 < false_positive_rate < 1:
+            raise ValueError(
+                f"Bloom filter false positive rate must be in (0, 1), got {false_positive_rate}."
+            )
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self._bit_count = max(
+            8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        )
+        self._hash_count = max(1, round(self._bit_count / capacity * math.log(2)))
+        self._bits = bytearray((self._bit_count + 7) // 8)
+        self._added = 0
+
+    def _positions(self, item: str) -> list[int]:
+        # Kirsch-Mitzenmacher double hashing: k probes from one 128-bit digest.
+        digest = blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [
+            (first + index * second) % self._bit_count
+            for index in range(self._hash_count)
+        ]
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+    def add(self, item: str) -> None:
+        is_new = False
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not self._bits[pos >> 3] & mask:
+                self._bits[pos >> 3] |= mask
+                is_new = True
+        if is_new:
+            self._added += 1
+
+    def __len__(self) -> int:
+        # Items that set at least one new bit: a slight undercount of distinct adds.
+        return self._added
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+    def to_dict(self) -> dict:
+        return {
+            "capacity": self.capacity,
+            "false_positive_rate": self.false_positive_rate,
+            "added": self._added,
+            "bits": base64.b64encode(self._bits).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> BloomSeenSet:
+        seen = cls(data["capacity"], data["false_positive_rate"])
+        seen._bits = bytearray(base64.b64decode(data["bits"]))
+        seen._added = data["added"]
+        return seen
+
+
+def make_seen_set(
+    seen_set: str = "exact",
+    capacity: int = 1_000_000,
+    false_positive_rate: float = 0.001,
+) -> set[str] | BloomSeenSet:
+    if normalize_seen_set(seen_set) == "bloom":
+        return BloomSeenSet(capacity, false_positive_rate)
+    return set()
+
+
+def dump_seen_set(seen: set[str] | BloomSeenSet) -> dict:
+    if isinstance(seen, BloomSeenSet):
+        return {"kind": "bloom", **seen.to_dict()}
+    return {"kind": "exact", "items": sorted(seen)}
+
+
+def load_seen_set(data: dict) -> set[str] | BloomSeenSet:
+    if data["kind"] == "bloom":
+        return BloomSeenSet.from_dict(data)
+    return set(data["items"])
+
+
+def estimate_seen_set_bytes(seen: set[str] | BloomSeenSet) -> int:
+    if isinstance(seen, BloomSeenSet):
+        return seen.size_bytes
+    return sys.getsizeof(seen) + sum(sys.getsizeof(item) for item in seen)
 
 
 @dataclass(slots=True)
@@ -11,24 +159,383 @@ class FrontierItem:
     url: str
     depth: int
     via_action: str = "seed"
+    source_has_forms: bool = False
+
+
+@dataclass(slots=True)
+class FrontierSignals:
+    """Crawl-wide context handed to a frontier scorer alongside the item."""
+
+    route_template: str
+    template_visits: int
+    inlinks: int
+
+
+FrontierScorer = Callable[[FrontierItem, FrontierSignals], float]
+
+
+def default_frontier_score(item: FrontierItem, signals: FrontierSignals) -> float:
+    """Favor shallow, novel routes that many pages link to or that sit near forms."""
+    score = -float(item.depth)
+    score += 3.0 / (1 + signals.template_visits)
+    score += math.log1p(signals.inlinks)
+    if item.source_has_forms:
+        score += 1.0
+    return score
+
+
+class PriorityFrontier:
+    """
+    Max-heap frontier ordered by a pluggable scorer (higher pops first).
+    Scores depend on crawl progress, so entries are re-scored lazily on pop
+    and pushed back when they fall behind the next candidate.
+    """
+
+    def __init__(
+        self, scorer: FrontierScorer | None = None, *, template_hosts: bool = False
+    ) -> None:
+        self.scorer = scorer or default_frontier_score
+        self.template_hosts = template_hosts
+        self._heap: list[tuple[float, int, str]] = []
+        self._pending: dict[str, FrontierItem] = {}
+        self._inlinks: Counter[str] = Counter()
+        self._template_visits: Counter[str] = Counter()
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def items(self) -> list[FrontierItem]:
+        """Queued items in no particular order (they are re-scored on push)."""
+        return list(self._pending.values())
+
+    def push(self, item: FrontierItem) -> None:
+        key = normalize_url(item.url)
+        self._pending[key] = item
+        self._inlinks[key] += 1
+        self._push_entry(key, item)
+
+    def add_inlink(self, url: str) -> None:
+        """Another page links to `url`; raise its priority if still queued."""
+        key = normalize_url(url)
+        item = self._pending.get(key)
+        if item is None:
+            return
+        self._inlinks[key] += 1
+        # The old heap entry goes stale and is skipped when popped.
+        self._push_entry(key, item)
+
+    def pop(self) -> FrontierItem | None:
+        while self._heap:
+            _, _, key = heapq.heappop(self._heap)
+            item = self._pending.get(key)
+            if item is None:
+                continue
+            score = self._score(key, item)
+            if self._heap and score < -self._heap[0][0]:
+                heapq.heappush(self._heap, (-score, next(self._sequence), key))
+                continue
+            del self._pending[key]
+            self._inlinks.pop(key, None)
+            self._template_visits[
+                route_template(item.url, with_host=self.template_hosts)
+            ] += 1
+            return item
+        return None
+
+    def _push_entry(self, key: str, item: FrontierItem) -> None:
+        score = self._score(key, item)
+        heapq.heappush(self._heap, (-score, next(self._sequence), key))
+
+    def _score(self, key: str, item: FrontierItem) -> float:
+        template = route_template(item.url, with_host=self.template_hosts)
+        return self.scorer(
+            item,
+            FrontierSignals(
+                route_template=template,
+                template_visits=self._template_visits[template],
+                inlinks=self._inlinks[key],
+            ),
+        )
 
 
 @dataclass(slots=True)
 class CrawlState:
-    frontier: deque[FrontierItem] = field(default_factory=deque)
-    visited_signatures: set[str] = field(default_factory=set)
+    frontier: deque[FrontierItem] | PriorityFrontier = field(default_factory=deque)
+    visited_signatures: set[str] | BloomSeenSet = field(default_factory=set)
     edge_history: set[tuple[str, str, str]] = field(default_factory=set)
     page_count: int = 0
     duplicate_hits: int = 0
+    in_flight: int = 0
+    seen_urls: set[str] | BloomSeenSet = field(default_factory=set)
+    url_dedupe_hits: int = 0
+    template_samples: Counter[str] = field(default_factory=Counter)
+    template_limit_hits: int = 0
+    claimed: dict[str, FrontierItem] = field(default_factory=dict)
+    # Click-revealed states charged by claimed items that are not released yet.
+    charged_states: Counter[str] = field(default_factory=Counter)
+    # `edge_history` indexed as from_signature -> {action: to_signature}.
+    transitions: dict[str, dict[str, str]] = field(default_factory=dict)
+    pruned_actions: int = 0
+    # URLs queued from sitemaps/URL lists, and those the crawl policy rejected.
+    seeded_urls: int = 0
+    seed_filtered_urls: int = 0
+    # Key route templates by host too, for crawls that may leave the origin.
+    template_hosts: bool = False
+
+    @classmethod
+    def create(
+        cls,
+        seen_set: str = "exact",
+        seen_set_capacity: int = 1_000_000,
+        seen_set_fp_rate: float = 0.001,
+        frontier_strategy: str = "fifo",
+        frontier_scorer: FrontierScorer | None = None,
+        template_hosts: bool = False,
+    ) -> CrawlState:
+        """Build a state with the given seen-set backend and frontier ordering."""
+        if normalize_frontier_strategy(frontier_strategy) == "priority":
+            frontier = PriorityFrontier(frontier_scorer, template_hosts=template_hosts)
+        else:
+            frontier = deque()
+        return cls(
+            frontier=frontier,
+            template_hosts=template_hosts,
+            visited_signatures=make_seen_set(
+                seen_set, seen_set_capacity, seen_set_fp_rate
+            ),
+            seen_urls=make_seen_set(seen_set, seen_set_capacity, seen_set_fp_rate),
+        )
+
+    @classmethod
+    def from_config(cls, config: CrawlConfig) -> CrawlState:
+        return cls.create(
+            seen_set=config.seen_set,
+            seen_set_capacity=config.seen_set_capacity,
+            seen_set_fp_rate=config.seen_set_fp_rate,
+            frontier_strategy=config.frontier_strategy,
+            frontier_scorer=config.frontier_scorer,
+            template_hosts=not config.same_origin_only,
+        )
+
+    @classmethod
+    def from_checkpoint(
+        cls, data: dict, config: CrawlConfig | None = None
+    ) -> CrawlState:
+        """
+        Rebuild a state from `snapshot()` output. The frontier ordering comes
+        from `config`; the seen-set backend is the one the snapshot was taken with.
+        """
+        state = cls.from_config(config) if config is not None else cls()
+        state.seen_urls = load_seen_set(data["seen_urls"])
+        state.visited_signatures = load_seen_set(data["visited_signatures"])
+        for from_signature, action, to_signature in data["edge_history"]:
+            state._add_edge(from_signature, action, to_signature)
+        state.pruned_actions = data.get("pruned_actions", 0)
+        state.seeded_urls = data.get("seeded_urls", 0)
+        state.seed_filtered_urls = data.get("seed_filtered_urls", 0)
+        state.page_count = data["page_count"]
+        state.duplicate_hits = data["duplicate_hits"]
+        state.url_dedupe_hits = data["url_dedupe_hits"]
+        state.template_samples = Counter(data["template_samples"])
+        state.template_limit_hits = data["template_limit_hits"]
+        if isinstance(state.frontier, PriorityFrontier):
+            state.frontier._template_visits.update(state.template_samples)
+        # Frontier URLs are already in `seen_urls`, so bypass enqueue's dedupe.
+        for raw_item in data["frontier"]:
+            state._push(FrontierItem(**raw_item))
+        return state
+
+    def snapshot(self) -> dict:
+        """
+        JSON-ready copy of the crawl progress for checkpointing.
+        Claimed but unfinished items go back to the front of the frontier, and
+        the states they already charged are left out of `page_count`: resuming
+        replays such an item and counts its page and states once.
+        """
+        if isinstance(self.frontier, PriorityFrontier):
+            queued = self.frontier.items()
+        else:
+            queued = list(self.frontier)
+        return {
+            "frontier": [asdict(item) for item in [*self.claimed.values(), *queued]],
+            "seen_urls": dump_seen_set(self.seen_urls),
+            "visited_signatures": dump_seen_set(self.visited_signatures),
+            "edge_history": sorted(list(edge) for edge in self.edge_history),
+            "page_count": self.page_count - sum(self.charged_states.values()),
+            "duplicate_hits": self.duplicate_hits,
+            "url_dedupe_hits": self.url_dedupe_hits,
+            "template_samples": dict(self.template_samples),
+            "template_limit_hits": self.template_limit_hits,
+            "pruned_actions": self.pruned_actions,
+            "seeded_urls": self.seeded_urls,
+            "seed_filtered_urls": self.seed_filtered_urls,
+        }
 
-    def enqueue(self, item: FrontierItem) -> None:
-        self.frontier.append(item)
+    def enqueue(self, item: FrontierItem) -> bool:
+        """
+        Queue `item` unless its normalized URL is already queued or visited.
+        Revisits then cost a set lookup instead of a navigation.
+        """
+        if not self.mark_url_seen(item.url):
+            self.url_dedupe_hits += 1
+            if isinstance(self.frontier, PriorityFrontier):
+                self.frontier.add_inlink(item.url)
+            return False
+        self._push(item)
+        return True
+
+    def _push(self, item: FrontierItem) -> None:
+        if isinstance(self.frontier, PriorityFrontier):
+            self.frontier.push(item)
+        else:
+            self.frontier.append(item)
+
+    def mark_url_seen(self, url: str) -> bool:
+        """Record a URL (e.g. a redirect target); False if it was already seen."""
+        key = normalize_url(url)
+        if key in self.seen_urls:
+            return False
+        self.seen_urls.add(key)
+        return True
 
     def dequeue(self) -> FrontierItem | None:
         if not self.frontier:
             return None
+        if isinstance(self.frontier, PriorityFrontier):
+            return self.frontier.pop()
         return self.frontier.popleft()
 
+    def claim(self, max_pages: int) -> FrontierItem | None:
+        """
+        Hand the next frontier item to a worker.
+        Items already in flight count against the page budget, so concurrent
+        workers never model more than `max_pages` pages.
+        """
+        if self.page_count + self.in_flight >= max_pages:
+            return None
+        item = self.dequeue()
+        if item is not None:
+            self.in_flight += 1
+            self.claimed[item.url] = item
+        return item
+
+    def charge_page(self, max_pages: int, item: FrontierItem | None = None) -> bool:
+        """
+        Count a page modeled without a frontier item, like a click-revealed
+        state, against the page budget; False once no budget is left.
+        `item` is the claimed item the state was found from.
+        """
+        if self.page_count + self.in_flight >= max_pages:
+            return False
+        self.page_count += 1
+        if item is not None:
+            self.charged_states[item.url] += 1
+        return True
+
+    def release(self, item: FrontierItem | None = None, *, modeled: bool) -> None:
+        self.in_flight -= 1
+        if item is not None:
+            self.claimed.pop(item.url, None)
+            self.charged_states.pop(item.url, None)
+        if modeled:
+            self.page_count += 1
+
+    def frontier_size(self) -> int:
+        return len(self.frontier)
+
+    def is_exhausted(self, max_pages: int) -> bool:
+        if self.page_count >= max_pages:
+            return True
+        return not self.frontier and self.in_flight == 0
+
+    def admit_template(self, url: str, limit: int | None) -> bool:
+        """
+        Count a navigation against the URL's route template.
+        False once `limit` samples of that template were taken (None: no cap).
+        """
+        template = self.route_template(url)
+        if limit is not None and self.template_samples[template] >= limit:
+            self.template_limit_hits += 1
+            return False
+        self.template_samples[template] += 1
+        return True
+
+    def route_template(self, url: str) -> str:
+        """The key `url` is sampled under by `admit_template()`."""
+        return route_template(url, with_host=self.template_hosts)
+
+    def record_signature(self, signature: str) -> bool:
+        """Mark a signature as visited; False means it was already seen."""
+        if signature in self.visited_signatures:
+            self.duplicate_hits += 1
+            return False
+        self.visited_signatures.add(signature)
+        return True
+
+    def transition(self, from_signature: str, action: str) -> str | None:
+        """Signature an action is known to lead to, or None if never tried."""
+        return self.transitions.get(from_signature, {}).get(action)
+
+    def record_edge(self, from_signature: str, action: str, to_signature: str) -> bool:
+        """
+        Record that `action` leads from one page state to another.
+        True if `to_signature` is a new state; False prunes the action.
+        """
+        self._add_edge(from_signature, action, to_signature)
+        if to_signature in self.visited_signatures:
+            self.pruned_actions += 1
+            return False
+        self.visited_signatures.add(to_signature)
+        return True
+
+    def _add_edge(self, from_signature: str, action: str, to_signature: str) -> None:
+        self.edge_history.add((from_signature, action, to_signature))
+        self.transitions.setdefault(from_signature, {})[action] = to_signature
+
+    def shortest_path(self, from_signature: str, to_signature: str) -> list[str] | None:
+        """Fewest recorded actions leading between two states (breadth-first)."""
+        paths: dict[str, list[str]] = {from_signature: []}
+        pending = deque([from_signature])
+        while pending:
+            signature = pending.popleft()
+            if signature == to_signature:
+                return paths[signature]
+            for action, target in self.transitions.get(signature, {}).items():
+                if target not in paths:
+                    paths[target] = [*paths[signature], action]
+                    pending.append(target)
+        return None
+
+    def pages_remaining(self, max_pages: int) -> int:
+        """
+        Pages the crawl can still model: the page budget left, capped by the
+        work actually queued or in flight. A small site under a large
+        `max_pages` must not look like it is about to miss its deadline.
+        """
+        return max(
+            0, min(max_pages - self.page_count, len(self.frontier) + self.in_flight)
+        )
+
+    def stats(self) -> dict:
+        return {
+            "seen_set": "bloom"
+            if isinstance(self.seen_urls, BloomSeenSet)
+            else "exact",
+            "seen_urls": len(self.seen_urls),
+            "visited_signatures": len(self.visited_signatures),
+            "seen_set_bytes": estimate_seen_set_bytes(self.seen_urls)
+            + estimate_seen_set_bytes(self.visited_signatures),
+            "url_dedupe_hits": self.url_dedupe_hits,
+            "duplicate_hits": self.duplicate_hits,
+            "route_templates": len(self.template_samples),
+            "template_limit_hits": self.template_limit_hits,
+            "action_edges": len(self.edge_history),
+            "pruned_actions": self.pruned_actions,
+            "seeded_urls": self.seeded_urls,
+            "seed_filtered_urls": self.seed_filtered_urls,
+        }
+
     def make_signature(
         self,
         *,
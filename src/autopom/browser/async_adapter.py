@@ -0,0 +1,426 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from autopom.browser.browseruse_adapter import (
+    CLIENT_NAVIGATION_SCRIPT,
+    INCREMENTAL_DOM_SCRIPT,
+    INTERACTIVE_DOM_SCRIPT,
+    VISIBILITY_SCRIPT,
+    MockBrowserUseAdapter,
+    empty_dom_summary,
+    normalize_browser_adapter,
+    parse_dom_summary,
+)
+from autopom.browser.dom_snapshot import (
+    CAPTURE_SNAPSHOT_PARAMS,
+    ExtractionTimer,
+    normalize_extraction_engine,
+    summarize_dom_snapshot,
+    validate_incremental_extraction,
+)
+from autopom.browser.errors import browser_errors
+from autopom.browser.rate_limit import parse_retry_after
+from autopom.browser.resource_blocking import ResourceBlocker
+from autopom.browser.settle import (
+    SETTLE_INIT_SCRIPT,
+    NetworkTracker,
+    SettlePolicy,
+    asettle_page,
+)
+from autopom.browser.synthetic_site import SiteSpec, SyntheticSite
+
+
+async def acompose_snapshot(browser: AsyncBrowserAdapter, max_nodes: int = 120) -> dict:
+    """Async twin of `compose_snapshot()`."""
+    summary = await browser.extract_interactive_dom_summary(max_nodes=max_nodes)
+    return {
+        **summary,
+        "url": await browser.url(),
+        "title": await browser.title(),
+        "visibility": {},
+    }
+
+
+class AsyncBrowserAdapter(Protocol):
+    async def goto(self, url: str) -> None: ...
+    async def url(self) -> str: ...
+    async def title(self) -> str: ...
+    async def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict: ...
+    async def snapshot(self, max_nodes: int = 120) -> dict: ...
+    async def capture_screenshot(self, scale: float = 0.4) -> str | None: ...
+    async def is_visible(self, selector: str, timeout_ms: int = 1500) -> bool: ...
+    async def are_visible(self, selectors: list[str]) -> list[bool]: ...
+    async def click(self, selector: str) -> bool: ...
+    async def new_tab(self) -> AsyncBrowserAdapter: ...
+    async def close(self) -> None: ...
+
+
+@dataclass(slots=True)
+class AsyncMockBrowserUseAdapter:
+    """Asyncio twin of `MockBrowserUseAdapter` with optional simulated latency."""
+
+    base_url: str
+    navigation_latency_s: float = 0.0
+    site: SyntheticSite | None = None
+    _mock: MockBrowserUseAdapter = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._mock = MockBrowserUseAdapter(base_url=self.base_url, site=self.site)
+
+    async def goto(self, url: str) -> None:
+        if self.navigation_latency_s:
+            await asyncio.sleep(self.navigation_latency_s)
+        self._mock.goto(url)
+
+    async def url(self) -> str:
+        return self._mock.url()
+
+    async def title(self) -> str:
+        return self._mock.title()
+
+    async def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+        return self._mock.extract_interactive_dom_summary(max_nodes=max_nodes)
+
+    async def snapshot(self, max_nodes: int = 120) -> dict:
+        return await acompose_snapshot(self, max_nodes)
+
+    async def capture_screenshot(self, scale: float = 0.4) -> str | None:
+        return None
+
+    async def is_visible(self, selector: str, timeout_ms: int = 1500) -> bool:
+        return self._mock.is_visible(selector, timeout_ms=timeout_ms)
+
+    async def are_visible(self, selectors: list[str]) -> list[bool]:
+        return self._mock.are_visible(selectors)
+
+    async def click(self, selector: str) -> bool:
+        return self._mock.click(selector)
+
+    async def new_tab(self) -> AsyncMockBrowserUseAdapter:
+        return type(self)(
+            base_url=self.base_url,
+            navigation_latency_s=self.navigation_latency_s,
+            site=self.site,
+        )
+
+    async def close(self) -> None:
+        return None
+
+
+@dataclass(slots=True)
+class AsyncPlaywrightBrowserAdapter:
+    """
+    Live browser adapter backed by Playwright (async API).
+    Build it with `await AsyncPlaywrightBrowserAdapter.launch(...)`; extra tabs
+    from `new_tab()` share the same context and event loop.
+    """
+
+    base_url: str
+    headless: bool = True
+    cdp_url: str | None = None
+    navigation_timeout_ms: int = 15000
+    click_timeout_ms: int = 3000
+    settle: SettlePolicy = field(default_factory=SettlePolicy)
+    resource_blocker: ResourceBlocker | None = None
+    extraction_engine: str = "js"
+    extraction_timer: ExtractionTimer = field(default_factory=ExtractionTimer)
+    incremental_extraction: bool = False
+    # How long the last goto() waited for the page to settle.
+    last_settle_ms: float = field(init=False, default=0.0)
+    # HTTP status and Retry-After of the last goto(), for the rate limiter.
+    last_status: int | None = field(init=False, default=None)
+    last_retry_after_s: float | None = field(init=False, default=None)
+    _cdp_session: object = field(default=None, repr=False)
+    _playwright: object = field(default=None, repr=False)
+    _browser: object = field(default=None, repr=False)
+    _context: object = field(default=None, repr=False)
+    _page: object = field(default=None, repr=False)
+    _current_url: str = field(default="", repr=False)
+    _owns_browser: bool = field(default=True, repr=False)
+    _network: NetworkTracker = field(default_factory=NetworkTracker, repr=False)
+
+    @classmethod
+    async def launch(
+        cls,
+        base_url: str,
+        headless: bool = True,
+        cdp_url: str | None = None,
+        navigation_timeout_ms: int = 15000,
+        settle: SettlePolicy | None = None,
+        resource_blocker: ResourceBlocker | None = None,
+        extraction_engine: str = "js",
+        incremental_extraction: bool = False,
+    ) -> AsyncPlaywrightBrowserAdapter:
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError as exc:
+            raise RuntimeError(
+                "Playwright adapter selected, but Playwright is not installed. "
+                "Install with: python -m pip install -e '.[browser]' "
+                "and run: python -m playwright install chromium"
+            ) from exc
+
+        adapter = cls(
+            base_url=base_url,
+            headless=headless,
+            cdp_url=cdp_url,
+            navigation_timeout_ms=navigation_timeout_ms,
+            settle=settle or SettlePolicy(),
+            resource_blocker=resource_blocker,
+            extraction_engine=normalize_extraction_engine(extraction_engine),
+            incremental_extraction=incremental_extraction,
+        )
+        validate_incremental_extraction(
+            adapter.incremental_extraction, adapter.extraction_engine
+        )
+        adapter._playwright = await async_playwright().start()
+        if cdp_url:
+            adapter._browser = await adapter._playwright.chromium.connect_over_cdp(
+                cdp_url
+            )
+            if adapter._browser.contexts:
+                adapter._context = adapter._browser.contexts[0]
+            else:
+                adapter._context = await adapter._browser.new_context()
+            if adapter._context.pages:
+                adapter._page = adapter._context.pages[-1]
+                await adapter._page.bring_to_front()
+            else:
+                adapter._page = await adapter._context.new_page()
+        else:
+            adapter._browser = await adapter._playwright.chromium.launch(
+                headless=headless
+            )
+            adapter._context = await adapter._browser.new_context(
+                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+                viewport={"width": 1280, "height": 720},
+                locale="en-US",
+            )
+            adapter._page = await adapter._context.new_page()
+
+        adapter._current_url = adapter._page.url
+        if not adapter._current_url or adapter._current_url == "about:blank":
+            adapter._current_url = base_url
+        adapter._page.set_default_timeout(navigation_timeout_ms)
+        adapter._network.attach(adapter._page)
+        if adapter.settle.strategy == "adaptive":
+            await adapter._context.add_init_script(SETTLE_INIT_SCRIPT)
+        await adapter._install_route(adapter._page)
+        return adapter
+
+    async def goto(self, url: str) -> None:
+        self.last_status = self.last_retry_after_s = None
+        if self.incremental_extraction and await self._client_navigate(url):
+            self.last_settle_ms = await asettle_page(
+                self._page, self.settle, self._network
+            )
+            self._current_url = self._page.url
+            return
+        try:
+            response = await self._page.goto(
+                url, wait_until="domcontentloaded", timeout=self.navigation_timeout_ms
+            )
+            if response is not None:
+                self.last_status = response.status
+                self.last_retry_after_s = parse_retry_after(
+                    response.headers.get("retry-after")
+                )
+        except browser_errors():
+            # If navigation times out, we assume the page is at least partially loaded and proceed.
+            pass
+
+        self.last_settle_ms = await asettle_page(self._page, self.settle, self._network)
+        self._current_url = self._page.url
+
+    async def url(self) -> str:
+        page_url = self._page.url
+        if not page_url or page_url == "about:blank":
+            return self._current_url or self.base_url
+        return page_url
+
+    async def title(self) -> str:
+        return await self._page.title()
+
+    async def extract_interactive_dom_summary(self, max_nodes: int = 500) -> dict:
+        summary = await self._extract(max_nodes, with_visibility=False)
+        summary.pop("title", None)
+        summary.pop("visibility", None)
+        return summary
+
+    async def snapshot(self, max_nodes: int = 500) -> dict:
+        snapshot = await self._extract(max_nodes, with_visibility=True)
+        snapshot["url"] = await self.url()
+        return snapshot
+
+    async def _extract(self, max_nodes: int, with_visibility: bool) -> dict:
+        if self.extraction_engine == "cdp":
+            summary = await self._cdp_extract(max_nodes)
+            if summary is not None:
+                return summary
+        summary = await self._js_extract(max_nodes, with_visibility)
+        if self.extraction_engine == "compare":
+            candidate = await self._cdp_extract(max_nodes)
+            if candidate is not None:
+                self.extraction_timer.compare(summary, candidate)
+        return summary
+
+    async def _js_extract(self, max_nodes: int, with_visibility: bool) -> dict:
+        started = time.perf_counter()
+        script = (
+            INCREMENTAL_DOM_SCRIPT
+            if self.incremental_extraction
+            else INTERACTIVE_DOM_SCRIPT
+        )
+        try:
+            result = await self._page.evaluate(
+                script, {"maxNodes": max_nodes, "withVisibility": with_visibility}
+            )
+            summary = parse_dom_summary(result)
+        except browser_errors():
+            summary = {**empty_dom_summary(), "title": "", "visibility": {}}
+        self.extraction_timer.record("js", time.perf_counter() - started)
+        if "delta" in summary:
+            self.extraction_timer.record_scan(summary["delta"])
+        return summary
+
+    async def _client_navigate(self, url: str) -> bool:
+        try:
+            if not await self._page.evaluate(CLIENT_NAVIGATION_SCRIPT, url):
+                return False
+            await self._page.wait_for_url(
+                url, wait_until="commit", timeout=self.navigation_timeout_ms
+            )
+        except browser_errors():
+            return False
+        self.extraction_timer.record_client_navigation()
+        return True
+
+    async def _cdp_extract(self, max_nodes: int) -> dict | None:
+        started = time.perf_counter()
+        try:
+            if self._cdp_session is None:
+                self._cdp_session = await self._context.new_cdp_session(self._page)
+            capture = await self._cdp_session.send(
+                "DOMSnapshot.captureSnapshot", CAPTURE_SNAPSHOT_PARAMS
+            )
+        except browser_errors():
+            return None
+        summary = summarize_dom_snapshot(capture, max_nodes)
+        self.extraction_timer.record("cdp", time.perf_counter() - started)
+        return summary
+
+    async def capture_screenshot(self, scale: float = 0.4) -> str | None:
+        return None
+
+    async def is_visible(self, selector: str, timeout_ms: int = 1500) -> bool:
+        if not selector:
+            return False
+        try:
+            return await self._page.locator(selector).first.is_visible()
+        except browser_errors():
+            return False
+
+    async def are_visible(self, selectors: list[str]) -> list[bool]:
+        if not selectors:
+            return []
+        try:
+            results = await self._page.evaluate(VISIBILITY_SCRIPT, selectors)
+        except browser_errors():
+            results = [None] * len(selectors)
+        return [
+            await self.is_visible(selector) if visible is None else bool(visible)
+            for selector, visible in zip(selectors, results)
+        ]
+
+    async def click(self, selector: str) -> bool:
+        if not selector:
+            return False
+        try:
+            await self._page.locator(selector).first.click(
+                timeout=self.click_timeout_ms
+            )
+        except browser_errors():
+            return False
+        self.last_settle_ms = await asettle_page(self._page, self.settle, self._network)
+        self._current_url = self._page.url
+        return True
+
+    async def new_tab(self) -> AsyncPlaywrightBrowserAdapter:
+        page = await self._context.new_page()
+        page.set_default_timeout(self.navigation_timeout_ms)
+        tab = AsyncPlaywrightBrowserAdapter(
+            base_url=self.base_url,
+            headless=self.headless,
+            cdp_url=self.cdp_url,
+            navigation_timeout_ms=self.navigation_timeout_ms,
+            click_timeout_ms=self.click_timeout_ms,
+            settle=self.settle,
+            resource_blocker=self.resource_blocker,
+            extraction_engine=self.extraction_engine,
+            extraction_timer=self.extraction_timer,
+            incremental_extraction=self.incremental_extraction,
+            _playwright=self._playwright,
+            _browser=self._browser,
+            _context=self._context,
+            _page=page,
+            _current_url=self.base_url,
+            _owns_browser=False,
+        )
+        # The context-wide init script already covers the new page.
+        tab._network.attach(page)
+        await tab._install_route(page)
+        return tab
+
+    async def _install_route(self, page: object) -> None:
+        if self.resource_blocker is not None:
+            await page.route("**/*", self.resource_blocker.ahandle_route)
+
+    async def close(self) -> None:
+        try:
+            if not self._owns_browser:
+                await self._page.close()
+                return
+            await self._context.close()
+            await self._browser.close()
+            await self._playwright.stop()
+        except browser_errors():
+            # Best effort teardown to avoid masking crawl results.
+            return
+
+
+async def create_async_browser_adapter(
+    adapter_name: str,
+    base_url: str,
+    playwright_headless: bool = True,
+    cdp_url: str | None = None,
+    settle: SettlePolicy | None = None,
+    resource_blocker: ResourceBlocker | None = None,
+    extraction_engine: str = "js",
+    incremental_extraction: bool = False,
+    synthetic_site: SiteSpec | None = None,
+) -> AsyncBrowserAdapter:
+    normalized = normalize_browser_adapter(adapter_name)
+    if normalized in ("http", "replay"):
+        raise ValueError(
+            f"Unsupported browser adapter '{normalized}' for async crawls. "
+            "Use the threaded crawler or the playwright adapter."
+        )
+    if normalized == "playwright":
+        return await AsyncPlaywrightBrowserAdapter.launch(
+            base_url=base_url,
+            headless=playwright_headless,
+            cdp_url=cdp_url,
+            settle=settle,
+            resource_blocker=resource_blocker,
+            extraction_engine=extraction_engine,
+            incremental_extraction=incremental_extraction,
+        )
+    if synthetic_site is not None:
+        return AsyncMockBrowserUseAdapter(
+            base_url=base_url, site=SyntheticSite(synthetic_site, base_url)
+        )
+    return AsyncMockBrowserUseAdapter(base_url=base_url)
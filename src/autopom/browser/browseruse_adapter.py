@@ -2,22 +2,49 @@ from __future__ import annotations
 
 import os
 import platform
+import shutil
+import socket
+import tempfile
+import time
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Protocol
 from urllib.parse import urljoin, urlparse
 
+from autopom.browser.dom_snapshot import (
+    CAPTURE_SNAPSHOT_PARAMS,
+    ExtractionTimer,
+    normalize_extraction_engine,
+    summarize_dom_snapshot,
+    validate_incremental_extraction,
+)
+from autopom.browser.errors import browser_errors
+from autopom.browser.rate_limit import parse_retry_after
+from autopom.browser.resource_blocking import ResourceBlocker
+from autopom.browser.settle import (
+    SETTLE_INIT_SCRIPT,
+    NetworkTracker,
+    SettlePolicy,
+    settle_page,
+)
+from autopom.browser.synthetic_site import SiteSpec, SyntheticPage, SyntheticSite
+
 
 class BrowserAdapter(Protocol):
     def goto(self, url: str) -> None: ...
     def url(self) -> str: ...
     def title(self) -> str: ...
     def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict: ...
+    def snapshot(self, max_nodes: int = 120) -> dict: ...
     def capture_screenshot(self, scale: float = 0.4) -> str | None: ...
     def is_visible(self, selector: str, timeout_ms: int = 1500) -> bool: ...
+    def are_visible(self, selectors: list[str]) -> list[bool]: ...
+    def click(self, selector: str) -> bool: ...
+    def new_tab(self) -> BrowserAdapter: ...
     def close(self) -> None: ...
 
 
-SUPPORTED_BROWSER_ADAPTERS = ("mock", "playwright")
+SUPPORTED_BROWSER_ADAPTERS = ("mock", "playwright", "http", "replay")
 
 
 def normalize_browser_adapter(adapter_name: str) -> str:
@@ -34,22 +61,36 @@ def normalize_browser_adapter(adapter_name: str) -> str:
 
 @dataclass(slots=True)
 class MockBrowserUseAdapter:
-    """Local, deterministic adapter for initial scaffolding and tests."""
+    """
+    Local, deterministic adapter for initial scaffolding and tests. With a
+    `site`, it serves that generated site instead of its two fixed pages.
+    """
 
     base_url: str
     _current_url: str = ""
+    site: SyntheticSite | None = None
+    _page: SyntheticPage | None = field(default=None, repr=False)
 
     def goto(self, url: str) -> None:
         self._current_url = url
+        if self.site is not None:
+            self._page = self.site.page(url)
+            # Aliases redirect to the page's canonical URL.
+            self._current_url = self._page.url
 
     def url(self) -> str:
         return self._current_url or self.base_url
 
     def title(self) -> str:
+        if self._page is not None:
+            return self._page.title
         path = urlparse(self.url()).path or "/"
         return f"Mock Page {path}"
 
     def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+        if self._page is not None:
+            summary = self._page.summary
+            return {**summary, "elements": summary["elements"][:max_nodes]}
         path = urlparse(self.url()).path
         if path == "/login":
             elements = [
@@ -83,13 +124,28 @@ class MockBrowserUseAdapter:
             "links": links,
         }
 
+    def snapshot(self, max_nodes: int = 120) -> dict:
+        return compose_snapshot(self, max_nodes)
+
     def capture_screenshot(self, scale: float = 0.4) -> str | None:
         return None
 
     def is_visible(self, selector: str, timeout_ms: int = 1500) -> bool:
+        if self._page is not None and selector in self._page.hidden:
+            return False
         # Mock visibility assumes selectors extracted from summary are valid.
         return bool(selector)
 
+    def are_visible(self, selectors: list[str]) -> list[bool]:
+        return [self.is_visible(selector) for selector in selectors]
+
+    def click(self, selector: str) -> bool:
+        # Mock pages have no client-side state, so a click changes nothing.
+        return bool(selector)
+
+    def new_tab(self) -> MockBrowserUseAdapter:
+        return type(self)(base_url=self.base_url, site=self.site)
+
     def close(self) -> None:
         return None
 
@@ -104,6 +160,322 @@ def get_chrome_profile_path() -> str:
         return os.path.expanduser("~/.config/google-chrome")
 
 
+# In-page equivalent of locator(selector).first.is_visible() for CSS,
+# `text=` and `:has-text()` selectors; null for syntax only Playwright parses.
+_VISIBILITY_HELPERS = r"""
+    const cleanText = (txt) => (txt || '').replace(/\s+/g, ' ').trim();
+    // Same rule as Playwright: a non-empty box and no visibility:hidden
+    const isVisible = (el) => {
+        if (!el) return false;
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+    // text=Label: first element whose text contains the label, ignoring case
+    let textOwners = null;
+    const textVisible = (label) => {
+        if (textOwners === null) {
+            textOwners = [];
+            const owners = new Set();
+            const walker = document.createTreeWalker(document.body || document.documentElement, NodeFilter.SHOW_TEXT);
+            while (walker.nextNode() && textOwners.length < 5000) {
+                const owner = walker.currentNode.parentElement;
+                if (!owner || owners.has(owner) || !walker.currentNode.nodeValue.trim()) continue;
+                owners.add(owner);
+                textOwners.push([cleanText(owner.textContent).toLowerCase(), owner]);
+            }
+        }
+        const needle = cleanText(label).toLowerCase();
+        const match = textOwners.find(([text]) => text.includes(needle));
+        return match ? isVisible(match[1]) : false;
+    };
+    const selectorVisible = (selector) => {
+        if (selector.startsWith('text=')) return textVisible(selector.slice(5));
+        try {
+            const hasText = selector.match(/^(.*):has-text\("((?:[^"\\]|\\.)*)"\)$/);
+            if (!hasText) return isVisible(document.querySelector(selector));
+            const needle = cleanText(hasText[2].replace(/\\(.)/g, '$1')).toLowerCase();
+            const match = Array.from(document.querySelectorAll(hasText[1] || '*'))
+                .find(el => cleanText(el.textContent).toLowerCase().includes(needle));
+            return isVisible(match);
+        } catch (e) {
+            return null;
+        }
+    };
+"""
+
+# Role, label and selector of interactive elements and links, and the
+# summary built from them; `describe(node, kind)` lets a caller cache them.
+_EXTRACTION_HELPERS = r"""
+    const escapeSelector = (val) => val.replace(/"/g, '\\"');
+
+    // Expanded selector for comprehensive coverage
+    const interactiveSelector = `
+        input:not([type="hidden"]), select, textarea, button,
+        [role="button"], [role="menuitem"], [role="menuitemcheckbox"], [role="menuitemradio"],
+        [role="checkbox"], [role="radio"], [role="switch"],
+        [role="tab"], [role="combobox"], [role="listbox"], [role="option"],
+        [role="searchbox"], [role="spinbutton"], [role="slider"],
+        [contenteditable="true"], [tabindex]:not([tabindex="-1"])
+    `;
+
+    const describeElement = (el) => {
+        const tag = el.tagName.toLowerCase();
+        const roleAttr = el.getAttribute('role');
+        let role = roleAttr || 'generic';
+
+        // Refined role detection
+        if (tag === 'input' || tag === 'textarea' || tag === 'select') role = 'textbox';
+        if (tag === 'button') role = 'button';
+        if (el.getAttribute('contenteditable') === 'true') role = 'textbox';
+
+        // Label extraction hierarchy
+        let label = el.name || el.id || el.value || el.getAttribute('aria-label') || el.getAttribute('placeholder') || el.title;
+        if (role === 'button' || role === 'link' || role === 'menuitem' || !label) {
+            label = cleanText(el.innerText || el.textContent) || label;
+        }
+        label = (label || role).slice(0, 80);
+
+        // Robust Selector Construction
+        let selector = tag;
+        const id = el.id;
+        const name = el.name;
+        const testId = el.getAttribute('data-testid') || el.getAttribute('data-test');
+        const placeholder = el.getAttribute('placeholder');
+        const ariaLabel = el.getAttribute('aria-label');
+        const title = el.title;
+
+        if (testId) selector += `[data-testid="${escapeSelector(testId)}"]`;
+        else if (id) selector = `#${id}`; // IDs are strong
+        else if (name) selector += `[name="${escapeSelector(name)}"]`;
+        else if (placeholder) selector += `[placeholder="${escapeSelector(placeholder)}"]`;
+        else if (ariaLabel) selector += `[aria-label="${escapeSelector(ariaLabel)}"]`;
+        else if (title) selector += `[title="${escapeSelector(title)}"]`;
+        else if ((role === 'button' || role === 'link' || role === 'menuitem') && label) selector += `:has-text("${escapeSelector(label)}")`;
+        else if (roleAttr) selector += `[role="${roleAttr}"]`;
+
+        // Class fallback
+        if (selector === tag && el.className && typeof el.className === 'string') {
+            selector += `.${el.className.split(' ').filter(c => c).join('.')}`;
+        }
+        const record = { role, label: label.replace(/\|/g, ''), selector };
+        // Clicking a form's submit button posts the form
+        if (tag === 'button' && el.type === 'submit' && el.form) record.submits_form = true;
+        return record;
+    };
+
+    const describeLink = (link) => {
+        const label = cleanText(link.textContent).slice(0, 80) || 'link';
+        return { role: 'link', label: label.replace(/\|/g, ''), selector: `a[href="${escapeSelector(link.href)}"]` };
+    };
+    const describers = { element: describeElement, link: describeLink };
+
+    const buildSummary = (describe, maxNodes, withVisibility) => {
+        const records = [];
+        const seen = new Set();
+        const addRecord = (node, record) => {
+            const key = `${record.role}|${record.label}|${record.selector}`;
+            if (seen.has(key)) return;
+            seen.add(key);
+            records.push({ node, key, ...record, section: 'main' });
+        };
+
+        // 1. Process Interactive Elements (High Priority)
+        Array.from(document.querySelectorAll(interactiveSelector))
+            .slice(0, 500)
+            .forEach(el => addRecord(el, describe(el, 'element')));
+
+        // 2. Process Links (Navigation Coverage) and the frontier in one pass
+        const frontierLinks = [];
+        Array.from(document.links)
+            .slice(0, 300)
+            .forEach(link => {
+                const href = link.href;
+                if (!href || href.startsWith('javascript:')) return;
+                frontierLinks.push(href);
+                if (href.includes('#')) return;
+                addRecord(link, describe(link, 'link'));
+            });
+
+        // Interactive elements first, then links, deduplicated
+        const kept = records.slice(0, maxNodes);
+        const summary = {
+            fingerprint: `fast::${document.title}::${kept.length}`,
+            landmarks: ['main'],
+            elements: kept.map(({ node, key, ...element }) => element),
+            links: frontierLinks
+        };
+        if (!withVisibility) return [summary, kept];
+
+        const visibility = {};
+        const setVisibility = (selector, visible) => {
+            if (visible !== null && !(selector in visibility)) visibility[selector] = visible;
+        };
+        kept.forEach(({ node, label, selector }) => {
+            const own = selectorVisible(selector);
+            // Syntax the page cannot parse: judge the extracted node itself
+            setVisibility(selector, own === null ? isVisible(node) : own);
+            setVisibility(`text=${label}`, textVisible(label));
+            if (!selector.includes('data-testid')) {
+                const testIdSelector = `[data-testid='${label.toLowerCase().split(' ').join('-')}']`;
+                setVisibility(testIdSelector, selectorVisible(testIdSelector));
+            }
+        });
+        summary.title = document.title;
+        summary.visibility = visibility;
+        return [summary, kept];
+    };
+"""
+
+# One pass over the DOM, returning structured records. With `withVisibility`
+# it also reports the title and, per element, whether its selector and the
+# fallbacks of AutoPomOrchestrator._fallback_selectors() resolve to a visible
+# node, so the verifier needs no is_visible() round trips.
+INTERACTIVE_DOM_SCRIPT = (
+    "({ maxNodes, withVisibility }) => {"
+    + _VISIBILITY_HELPERS
+    + _EXTRACTION_HELPERS
+    + """
+    return buildSummary((node, kind) => describers[kind](node), maxNodes, withVisibility)[0];
+}
+"""
+)
+
+# INTERACTIVE_DOM_SCRIPT with element descriptions cached per document. A
+# MutationObserver, installed on the first call, drops the cached entries of
+# mutated nodes and their ancestors, so after a client-side route change
+# only what changed is described again. Selecting elements and checking their
+# visibility still covers the whole document. `delta` lists the elements added
+# and removed since the previous call; `mode` is `full` on a new document.
+INCREMENTAL_DOM_SCRIPT = (
+    "({ maxNodes, withVisibility }) => {"
+    + _VISIBILITY_HELPERS
+    + _EXTRACTION_HELPERS
+    + """
+    let state = window.__autopomDom;
+    const fresh = !state;
+    if (fresh) {
+        state = window.__autopomDom = { element: new WeakMap(), link: new WeakMap(), previous: new Map() };
+        const forget = (node) => {
+            state.element.delete(node);
+            state.link.delete(node);
+        };
+        state.invalidate = (mutations) => mutations.forEach(({ type, target }) => {
+            if (type === 'attributes') return forget(target);
+            // Text and children feed the labels of every enclosing element
+            for (let node = type === 'characterData' ? target.parentElement : target; node; node = node.parentElement) {
+                forget(node);
+            }
+        });
+        state.observer = new MutationObserver(state.invalidate);
+        state.observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+    }
+    // Mutations not yet delivered to the observer callback
+    state.invalidate(state.observer.takeRecords());
+
+    let described = 0;
+    const describe = (node, kind) => {
+        let record = state[kind].get(node);
+        if (!record) {
+            record = describers[kind](node);
+            state[kind].set(node, record);
+            described += 1;
+        }
+        return record;
+    };
+    const [summary, kept] = buildSummary(describe, maxNodes, withVisibility);
+    const current = new Map(kept.map(({ node, key, ...element }) => [key, element]));
+    summary.delta = {
+        mode: fresh ? 'full' : 'delta',
+        described,
+        added: Array.from(current).filter(([key]) => !state.previous.has(key)).map(([, record]) => record),
+        removed: Array.from(state.previous).filter(([key]) => !current.has(key)).map(([, record]) => record),
+    };
+    state.previous = current;
+    return summary;
+}
+"""
+)
+
+# Follows an in-page link to the URL, so a client-side router can handle the
+# route change in the same document. Only a click some handler cancels is a
+# same-document route; any other click is cancelled here and false returned,
+# so goto() loads the URL itself and sees its HTTP response.
+CLIENT_NAVIGATION_SCRIPT = """
+(url) => {
+    const link = Array.from(document.links).find(a =>
+        a.href === url && (!a.target || a.target === '_self') && !a.hasAttribute('download'));
+    if (!link) return false;
+    let routed = false;
+    let cancel = null;
+    const watch = event => {
+        cancel = event.preventDefault.bind(event);
+        event.preventDefault = () => { routed = true; cancel(); };
+    };
+    const fallBack = () => { if (!routed && cancel) cancel(); };
+    window.addEventListener('click', watch, true);
+    window.addEventListener('click', fallBack);
+    try {
+        link.click();
+    } finally {
+        window.removeEventListener('click', watch, true);
+        window.removeEventListener('click', fallBack);
+    }
+    return routed;
+}
+"""
+
+# Batch visibility for are_visible(): one result per selector, null where
+# the adapter has to fall back to a Playwright locator.
+VISIBILITY_SCRIPT = (
+    "(selectors) => {"
+    + _VISIBILITY_HELPERS
+    + """
+    return selectors.map(selector => (selector ? selectorVisible(selector) : false));
+}
+"""
+)
+
+
+def parse_dom_summary(result: dict) -> dict:
+    """Normalize the extraction script's element records."""
+    result["elements"] = [
+        {
+            "role": item.get("role") or "generic",
+            "label": item.get("label") or "",
+            "selector": item.get("selector") or "",
+            "section": item.get("section") or "main",
+            **({"submits_form": True} if item.get("submits_form") else {}),
+        }
+        for item in result.get("elements", [])
+    ]
+    result.setdefault("links", [])
+    return result
+
+
+def empty_dom_summary() -> dict:
+    return {
+        "fingerprint": "error",
+        "landmarks": [],
+        "elements": [],
+        "links": [],
+    }
+
+
+def compose_snapshot(browser: BrowserAdapter, max_nodes: int = 120) -> dict:
+    """
+    `snapshot()` from an adapter's separate calls, for adapters where those
+    are cheap. The empty visibility map leaves checks to `is_visible()`.
+    """
+    summary = browser.extract_interactive_dom_summary(max_nodes=max_nodes)
+    return {**summary, "url": browser.url(), "title": browser.title(), "visibility": {}}
+
+
+def _free_local_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
 @dataclass(slots=True)
 class PlaywrightBrowserAdapter:
     """Live browser adapter backed by Playwright (sync API)."""
@@ -113,14 +485,44 @@ class PlaywrightBrowserAdapter:
     cdp_url: str | None = None
     chrome_profile: bool = False
     navigation_timeout_ms: int = 15000
+    click_timeout_ms: int = 3000
+    # Exposes the launched browser over CDP so worker threads can attach tabs.
+    remote_debugging_port: int | None = None
+    # Attach to `cdp_url` as an extra worker tab instead of reusing the active one.
+    open_new_tab: bool = False
+    settle: SettlePolicy = field(default_factory=SettlePolicy)
+    # Aborts images/fonts/analytics etc.; shared with every tab of the crawl.
+    resource_blocker: ResourceBlocker | None = None
+    # `js` runs INTERACTIVE_DOM_SCRIPT in the page, `cdp` parses a CDP DOM
+    # snapshot in Python, `compare` runs both and returns the `js` result.
+    extraction_engine: str = "js"
+    extraction_timer: ExtractionTimer = field(default_factory=ExtractionTimer)
+    # Follow in-page links a client-side router handles in the same document
+    # and re-describe only mutated nodes (INCREMENTAL_DOM_SCRIPT); needs the
+    # `js` engine. Other URLs are loaded with page.goto().
+    incremental_extraction: bool = False
+    # How long the last goto() waited for the page to settle.
+    last_settle_ms: float = field(init=False, default=0.0)
+    # HTTP status and Retry-After of the last goto(), for the rate limiter.
+    last_status: int | None = field(init=False, default=None)
+    last_retry_after_s: float | None = field(init=False, default=None)
+    _cdp_session: object = field(init=False, repr=False, default=None)
     _sync_playwright: object = field(init=False, repr=False)
     _playwright: object = field(init=False, repr=False)
     _browser: object = field(init=False, repr=False)
     _context: object = field(init=False, repr=False)
     _page: object = field(init=False, repr=False)
     _current_url: str = field(init=False, repr=False)
+    _cdp_endpoint: str | None = field(init=False, repr=False, default=None)
+    # Throwaway profile of a browser launched for worker tabs; removed on close().
+    _profile_dir: str | None = field(init=False, repr=False, default=None)
+    _network: NetworkTracker = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
+        self.extraction_engine = normalize_extraction_engine(self.extraction_engine)
+        validate_incremental_extraction(
+            self.incremental_extraction, self.extraction_engine
+        )
         try:
             from playwright.sync_api import sync_playwright
         except ImportError as exc:
@@ -133,8 +535,15 @@ class PlaywrightBrowserAdapter:
         self._sync_playwright = sync_playwright
         self._playwright = self._sync_playwright().start()
 
+        launch_args = []
+        if self.remote_debugging_port is not None:
+            launch_args.append(f"--remote-debugging-port={self.remote_debugging_port}")
+            self._cdp_endpoint = f"http://127.0.0.1:{self.remote_debugging_port}"
+
         if self.cdp_url:
-            print(f"Connecting to existing browser at {self.cdp_url}...")
+            if not self.open_new_tab:
+                print(f"Connecting to existing browser at {self.cdp_url}...")
+            self._cdp_endpoint = self.cdp_url
             self._browser = self._playwright.chromium.connect_over_cdp(self.cdp_url)
             # Use existing context if available, else create new
             if self._browser.contexts:
@@ -143,7 +552,9 @@ class PlaywrightBrowserAdapter:
                 self._context = self._browser.new_context()
 
             # Use existing page if available
-            if self._context.pages:
+            if self.open_new_tab:
+                self._page = self._context.new_page()
+            elif self._context.pages:
                 self._page = self._context.pages[-1]
                 self._page.bring_to_front()
             else:
@@ -162,6 +573,7 @@ class PlaywrightBrowserAdapter:
                     headless=self.headless,
                     # Usually we want a non-headless browser to debug if we use profile
                     channel="chrome",  # requires actual Chrome installed
+                    args=launch_args,
                 )
                 self._browser = (
                     self._context.browser
@@ -182,16 +594,36 @@ class PlaywrightBrowserAdapter:
                     ) from e
                 raise e
         else:
-            self._browser = self._playwright.chromium.launch(headless=self.headless)
-            self._context = self._browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-                viewport={"width": 1280, "height": 720},
-                locale="en-US",
-            )
+            context_options = {
+                "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+                "viewport": {"width": 1280, "height": 720},
+                "locale": "en-US",
+            }
+            if launch_args:
+                # Worker tabs attach over CDP and only see the browser's default
+                # context, so crawl in a throwaway persistent profile to share
+                # cookies and storage with them.
+                self._profile_dir = tempfile.mkdtemp(prefix="autopom-profile-")
+                self._context = self._playwright.chromium.launch_persistent_context(
+                    user_data_dir=self._profile_dir,
+                    headless=self.headless,
+                    args=launch_args,
+                    **context_options,
+                )
+                self._browser = self._context.browser
+            else:
+                self._browser = self._playwright.chromium.launch(headless=self.headless)
+                self._context = self._browser.new_context(**context_options)
             self._page = self._context.new_page()
             self._current_url = self.base_url
 
         self._page.set_default_timeout(self.navigation_timeout_ms)
+        self._network = NetworkTracker()
+        self._network.attach(self._page)
+        if self.settle.strategy == "adaptive":
+            self._context.add_init_script(SETTLE_INIT_SCRIPT)
+        if self.resource_blocker is not None:
+            self._page.route("**/*", self.resource_blocker.handle_route)
 
     def goto(self, url: str) -> None:
         if self.cdp_url:
@@ -201,15 +633,25 @@ class PlaywrightBrowserAdapter:
             # For now, we follow standard behavior.
             pass
 
+        self.last_status = self.last_retry_after_s = None
+        if self.incremental_extraction and self._client_navigate(url):
+            self.last_settle_ms = settle_page(self._page, self.settle, self._network)
+            self._current_url = self._page.url
+            return
         try:
-            self._page.goto(
+            response = self._page.goto(
                 url, wait_until="domcontentloaded", timeout=self.navigation_timeout_ms
             )
+            if response is not None:
+                self.last_status = response.status
+                self.last_retry_after_s = parse_retry_after(
+                    response.headers.get("retry-after")
+                )
         except Exception:
             # If navigation times out, we assume the page is at least partially loaded and proceed.
             pass
 
-        self._page.wait_for_timeout(1000)
+        self.last_settle_ms = settle_page(self._page, self.settle, self._network)
         self._current_url = self._page.url
 
     def url(self) -> str:
@@ -222,151 +664,79 @@ class PlaywrightBrowserAdapter:
         return self._page.title()
 
     def extract_interactive_dom_summary(self, max_nodes: int = 500) -> dict:
+        summary = self._extract(max_nodes, with_visibility=False)
+        summary.pop("title", None)
+        summary.pop("visibility", None)
+        return summary
+
+    def snapshot(self, max_nodes: int = 500) -> dict:
+        """URL, title, DOM summary and selector visibility in one round trip."""
+        snapshot = self._extract(max_nodes, with_visibility=True)
+        # page.url is tracked client-side, so this adds no round trip.
+        snapshot["url"] = self.url()
+        return snapshot
+
+    def _extract(self, max_nodes: int, with_visibility: bool) -> dict:
+        if self.extraction_engine == "cdp":
+            summary = self._cdp_extract(max_nodes)
+            if summary is not None:
+                return summary
+        summary = self._js_extract(max_nodes, with_visibility)
+        if self.extraction_engine == "compare":
+            candidate = self._cdp_extract(max_nodes)
+            if candidate is not None:
+                self.extraction_timer.compare(summary, candidate)
+        return summary
+
+    def _js_extract(self, max_nodes: int, with_visibility: bool) -> dict:
+        started = time.perf_counter()
+        script = (
+            INCREMENTAL_DOM_SCRIPT
+            if self.incremental_extraction
+            else INTERACTIVE_DOM_SCRIPT
+        )
         try:
-            # Use functional map/filter approach which proved drastically faster than imperative loops
             result = self._page.evaluate(
-                """
-                ({ maxNodes }) => {
-                    // Helper to clean text
-                    const cleanText = (txt) => (txt || '').replace(/\\s+/g, ' ').trim();
-                    const escapeSelector = (val) => val.replace(/"/g, '\\\\"');
-
-                    // 1. Process Interactive Elements (High Priority)
-                    // Expanded selector for comprehensive coverage
-                    const interactiveSelector = `
-                        input:not([type="hidden"]), select, textarea, button,
-                        [role="button"], [role="menuitem"], [role="menuitemcheckbox"], [role="menuitemradio"],
-                        [role="checkbox"], [role="radio"], [role="switch"],
-                        [role="tab"], [role="combobox"], [role="listbox"], [role="option"],
-                        [role="searchbox"], [role="spinbutton"], [role="slider"],
-                        [contenteditable="true"], [tabindex]:not([tabindex="-1"])
-                    `;
-
-                    const formElements = Array.from(document.querySelectorAll(interactiveSelector))
-                        .slice(0, 500)
-                        .map(el => {
-                            const tag = el.tagName.toLowerCase();
-                            const roleAttr = el.getAttribute('role');
-                            let role = roleAttr || 'generic';
-
-                            // Refined role detection
-                            if (tag === 'input' || tag === 'textarea' || tag === 'select') role = 'textbox';
-                            if (tag === 'button') role = 'button';
-                            if (el.getAttribute('contenteditable') === 'true') role = 'textbox';
-
-                            // Label extraction hierarchy
-                            let label = el.name || el.id || el.value || el.getAttribute('aria-label') || el.getAttribute('placeholder') || el.title;
-                            if (role === 'button' || role === 'link' || role === 'menuitem' || !label) {
-                                label = cleanText(el.innerText || el.textContent) || label;
-                            }
-                            label = (label || role).slice(0, 80);
-
-                            // Robust Selector Construction
-                            let selector = tag;
-                            const id = el.id;
-                            const name = el.name;
-                            const testId = el.getAttribute('data-testid') || el.getAttribute('data-test');
-                            const placeholder = el.getAttribute('placeholder');
-                            const ariaLabel = el.getAttribute('aria-label');
-                            const title = el.title;
-
-                            if (testId) selector += `[data-testid="${escapeSelector(testId)}"]`;
-                            else if (id) selector = `#${id}`; // IDs are strong
-                            else if (name) selector += `[name="${escapeSelector(name)}"]`;
-                            else if (placeholder) selector += `[placeholder="${escapeSelector(placeholder)}"]`;
-                            else if (ariaLabel) selector += `[aria-label="${escapeSelector(ariaLabel)}"]`;
-                            else if (title) selector += `[title="${escapeSelector(title)}"]`;
-                            else if ((role === 'button' || role === 'link' || role === 'menuitem') && label) selector += `:has-text("${escapeSelector(label)}")`;
-                            else if (roleAttr) selector += `[role="${roleAttr}"]`;
-
-                            // Class fallback
-                            if (selector === tag && el.className && typeof el.className === 'string') {
-                                selector += `.${el.className.split(' ').filter(c => c).join('.')}`;
-                            }
-
-                            const safeLabel = label.replace(/\\|/g, '');
-                            return `${role}|${safeLabel}|${selector}|main`;
-                        })
-                        .filter(Boolean);
-
-                    // 2. Process Links (Navigation Coverage)
-                    const linkElements = Array.from(document.links)
-                        .slice(0, 300)
-                        .map(link => {
-                            const href = link.href;
-                            if (!href || href.startsWith('javascript:') || href.includes('#')) return null;
-
-                            const text = cleanText(link.textContent);
-                            const label = text.slice(0, 80) || 'link';
-                            const selector = `a[href="${escapeSelector(href)}"]`;
-
-                            const safeLabel = label.replace(/\\|/g, '');
-                            return `link|${safeLabel}|${selector}|main`;
-                        })
-                        .filter(Boolean);
-
-                    // Combine: Interactive elements first, then Links
-                    const allElements = formElements.concat(linkElements);
-
-                    // Deduplicate strings directly
-                    const uniqueElements = Array.from(new Set(allElements)).slice(0, maxNodes);
-
-                    // Extract frontier links
-                    const frontierLinks = Array.from(document.links)
-                        .slice(0, 300)
-                        .map(a => a.href)
-                        .filter(h => h && !h.startsWith('javascript:'));
-
-                    return {
-                        fingerprint: `fast::${document.title}::${uniqueElements.length}`,
-                        landmarks: ['main'],
-                        elements: uniqueElements,
-                        links: frontierLinks
-                    };
-                }
-                """,
-                {"maxNodes": max_nodes},
+                script, {"maxNodes": max_nodes, "withVisibility": with_visibility}
             )
-
-            # Parse the string elements back into dicts in Python
-            parsed_elements = []
-            raw_elements = result.get("elements", [])
-
-            for item in raw_elements:
-                parts = item.split("|")
-                # Handle cases where label/selector might have pipes or fewer parts
-                if len(parts) >= 2:
-                    role = parts[0]
-                    label = parts[1]
-                    # Join the rest as selector+section
-                    rest = "|".join(parts[2:])
-                    # Assume last part is section, everything before is selector
-                    if "|" in rest:
-                        selector, section = rest.rsplit("|", 1)
-                    else:
-                        selector = rest
-                        section = "main"
-
-                    parsed_elements.append(
-                        {
-                            "role": role,
-                            "label": label,
-                            "selector": selector,
-                            "section": section,
-                        }
-                    )
-
-            result["elements"] = parsed_elements
-            return result
-
+            summary = parse_dom_summary(result)
         except Exception:
-            # Fallback empty result
-            return {
-                "fingerprint": "error",
-                "landmarks": [],
-                "elements": [],
-                "links": [],
-            }
+            summary = {**empty_dom_summary(), "title": "", "visibility": {}}
+        self.extraction_timer.record("js", time.perf_counter() - started)
+        if "delta" in summary:
+            self.extraction_timer.record_scan(summary["delta"])
+        return summary
+
+    def _client_navigate(self, url: str) -> bool:
+        """
+        Follow an in-page link to `url` as a same-document route change; False
+        if there is no such link, no router handles it, or the route stalls.
+        """
+        try:
+            if not self._page.evaluate(CLIENT_NAVIGATION_SCRIPT, url):
+                return False
+            self._page.wait_for_url(
+                url, wait_until="commit", timeout=self.navigation_timeout_ms
+            )
+        except browser_errors():
+            return False
+        self.extraction_timer.record_client_navigation()
+        return True
+
+    def _cdp_extract(self, max_nodes: int) -> dict | None:
+        """The summary from a CDP DOM snapshot; None if CDP is unavailable."""
+        started = time.perf_counter()
+        try:
+            if self._cdp_session is None:
+                self._cdp_session = self._context.new_cdp_session(self._page)
+            capture = self._cdp_session.send(
+                "DOMSnapshot.captureSnapshot", CAPTURE_SNAPSHOT_PARAMS
+            )
+        except browser_errors():
+            return None
+        summary = summarize_dom_snapshot(capture, max_nodes)
+        self.extraction_timer.record("cdp", time.perf_counter() - started)
+        return summary
 
     def capture_screenshot(self, scale: float = 0.4) -> str | None:
         # Screenshot not yet persisted in this scaffold implementation.
@@ -381,14 +751,74 @@ class PlaywrightBrowserAdapter:
         except Exception:
             return False
 
+    def are_visible(self, selectors: list[str]) -> list[bool]:
+        """`is_visible()` for many selectors in one page round trip."""
+        if not selectors:
+            return []
+        try:
+            results = self._page.evaluate(VISIBILITY_SCRIPT, selectors)
+        except browser_errors():
+            results = [None] * len(selectors)
+        # Syntax the page cannot evaluate (role=, >> chains) goes to a locator.
+        return [
+            self.is_visible(selector) if visible is None else bool(visible)
+            for selector, visible in zip(selectors, results)
+        ]
+
+    def click(self, selector: str) -> bool:
+        """Click the first match and wait for the page to settle; False if it failed."""
+        if not selector:
+            return False
+        try:
+            self._page.locator(selector).first.click(timeout=self.click_timeout_ms)
+        except browser_errors():
+            return False
+        self.last_settle_ms = settle_page(self._page, self.settle, self._network)
+        self._current_url = self._page.url
+        return True
+
+    def new_tab(self) -> PlaywrightBrowserAdapter:
+        """
+        Open another tab in this adapter's browser context.
+        Playwright's sync API is thread-affine, so call this from the thread
+        that will drive the tab: it starts its own driver and attaches over CDP.
+        """
+        if not self._cdp_endpoint:
+            raise RuntimeError(
+                "Playwright adapter has no CDP endpoint for extra tabs. "
+                "Create it with create_browser_adapter(..., concurrency=N)."
+            )
+        return PlaywrightBrowserAdapter(
+            base_url=self.base_url,
+            headless=self.headless,
+            cdp_url=self._cdp_endpoint,
+            navigation_timeout_ms=self.navigation_timeout_ms,
+            click_timeout_ms=self.click_timeout_ms,
+            open_new_tab=True,
+            settle=self.settle,
+            resource_blocker=self.resource_blocker,
+            extraction_engine=self.extraction_engine,
+            extraction_timer=self.extraction_timer,
+            incremental_extraction=self.incremental_extraction,
+        )
+
     def close(self) -> None:
         try:
+            if self.open_new_tab:
+                # Worker tabs share the browser; only detach this tab's driver.
+                self._page.close()
+                self._playwright.stop()
+                return
             self._context.close()
-            self._browser.close()
+            if self._browser is not None:
+                self._browser.close()
             self._playwright.stop()
         except Exception:
             # Best effort teardown to avoid masking crawl results.
             return None
+        finally:
+            if self._profile_dir is not None:
+                shutil.rmtree(self._profile_dir, ignore_errors=True)
 
 
 def create_browser_adapter(
@@ -397,13 +827,84 @@ def create_browser_adapter(
     playwright_headless: bool = True,
     cdp_url: str | None = None,
     chrome_profile: bool = False,
+    concurrency: int = 1,
+    settle: SettlePolicy | None = None,
+    resource_blocker: ResourceBlocker | None = None,
+    browser_pool_size: int = 0,
+    extraction_engine: str = "js",
+    incremental_extraction: bool = False,
+    replay_archive: Path | None = None,
+    record_replay: Path | None = None,
+    synthetic_site: SiteSpec | None = None,
 ) -> BrowserAdapter:
+    """
+    `replay_archive` is the recording the `replay` adapter answers from;
+    `record_replay` wraps any other adapter to write one on close().
+    `synthetic_site` is the generated site the mock adapter serves.
+    """
+    if record_replay is not None:
+        from autopom.browser.replay_adapter import (
+            RecordingBrowserAdapter,
+            ReplayArchive,
+        )
+
+        return RecordingBrowserAdapter(
+            browser=create_browser_adapter(
+                adapter_name,
+                base_url,
+                playwright_headless=playwright_headless,
+                cdp_url=cdp_url,
+                chrome_profile=chrome_profile,
+                concurrency=concurrency,
+                settle=settle,
+                resource_blocker=resource_blocker,
+                browser_pool_size=browser_pool_size,
+                extraction_engine=extraction_engine,
+                incremental_extraction=incremental_extraction,
+                synthetic_site=synthetic_site,
+            ),
+            archive=ReplayArchive(base_url=base_url),
+            path=record_replay,
+        )
     normalized = normalize_browser_adapter(adapter_name)
-    if normalized == "playwright":
+    # Worker and pool tabs attach to the primary browser over CDP.
+    opens_tabs = concurrency > 1 or browser_pool_size > 0
+
+    def launch_playwright() -> PlaywrightBrowserAdapter:
+        needs_tab_endpoint = opens_tabs and not cdp_url
         return PlaywrightBrowserAdapter(
             base_url=base_url,
             headless=playwright_headless,
             cdp_url=cdp_url,
             chrome_profile=chrome_profile,
+            remote_debugging_port=_free_local_port() if needs_tab_endpoint else None,
+            settle=settle or SettlePolicy(),
+            resource_blocker=resource_blocker,
+            extraction_engine=extraction_engine,
+            incremental_extraction=incremental_extraction,
+        )
+
+    if normalized == "playwright":
+        return launch_playwright()
+    if normalized == "http":
+        from autopom.browser.http_adapter import HttpBrowserAdapter
+
+        # Worker tabs escalate through the primary browser, so it must exist
+        # before they start; a single worker launches it on first escalation.
+        if opens_tabs or cdp_url or chrome_profile:
+            return HttpBrowserAdapter(base_url=base_url, fallback=launch_playwright())
+        return HttpBrowserAdapter(base_url=base_url, fallback_factory=launch_playwright)
+    if normalized == "replay":
+        from autopom.browser.replay_adapter import ReplayBrowserAdapter
+
+        if replay_archive is None:
+            raise ValueError(
+                "Unsupported replay adapter without replay_archive. "
+                "Record one with --record-replay first."
+            )
+        return ReplayBrowserAdapter.from_path(base_url, replay_archive)
+    if synthetic_site is not None:
+        return MockBrowserUseAdapter(
+            base_url=base_url, site=SyntheticSite(synthetic_site, base_url)
         )
     return MockBrowserUseAdapter(base_url=base_url)
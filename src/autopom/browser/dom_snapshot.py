@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
+
+from autopom.stats import avg_ms, keys_with_prefix, sum_stats
+
+SUPPORTED_EXTRACTION_ENGINES = ("js", "cdp", "compare")
+# DOMSnapshot.captureSnapshot arguments; layout bounds are always included.
+CAPTURE_SNAPSHOT_PARAMS = {"computedStyles": ["visibility"]}
+
+# Mirrors the interactive selector of INTERACTIVE_DOM_SCRIPT.
+INTERACTIVE_ROLES = frozenset(
+    {
+        "button",
+        "menuitem",
+        "menuitemcheckbox",
+        "menuitemradio",
+        "checkbox",
+        "radio",
+        "switch",
+        "tab",
+        "combobox",
+        "listbox",
+        "option",
+        "searchbox",
+        "spinbutton",
+        "slider",
+    }
+)
+FORM_TAGS = ("input", "select", "textarea", "button")
+# Text the page never renders, left out of labels like innerText does.
+_HIDDEN_TEXT_TAGS = frozenset({"script", "style", "noscript", "template"})
+_ELEMENT_NODE = 1
+_TEXT_NODE = 3
+MAX_INTERACTIVE_NODES = 500
+MAX_LINK_NODES = 300
+
+
+def normalize_extraction_engine(engine: str) -> str:
+    normalized = engine.strip().lower()
+    aliases = {"javascript": "js", "domsnapshot": "cdp", "snapshot": "cdp"}
+    normalized = aliases.get(normalized, normalized)
+    if normalized not in SUPPORTED_EXTRACTION_ENGINES:
+        allowed = ", ".join(SUPPORTED_EXTRACTION_ENGINES)
+        raise ValueError(
+            f"Unsupported extraction engine '{engine}'. Allowed: {allowed}."
+        )
+    return normalized
+
+
+def validate_incremental_extraction(incremental: bool, engine: str) -> None:
+    if incremental and engine != "js":
+        raise ValueError(
+            f"Unsupported incremental extraction with extraction engine '{engine}'. "
+            "Incremental extraction caches the in-page `js` engine."
+        )
+
+
+def summarize_dom_snapshot(capture: dict, max_nodes: int = 500) -> dict:
+    """
+    The extraction script's snapshot (elements, links, title, visibility)
+    built from a `DOMSnapshot.captureSnapshot` result. Labels come from the
+    captured text nodes and visibility from the captured layout, so nothing
+    forces a layout in the page. `text=` fallbacks are left to `are_visible()`.
+    """
+    strings = capture["strings"]
+    document = capture["documents"][0]
+    nodes = document["nodes"]
+    base_url = _string(strings, document.get("baseURL", -1)) or _string(
+        strings, document.get("documentURL", -1)
+    )
+    title = _string(strings, document.get("title", -1))
+    parents = nodes["parentIndex"]
+    types = nodes["nodeType"]
+    names = nodes["nodeName"]
+    values = nodes.get("nodeValue", [])
+    attributes = nodes.get("attributes", [])
+    input_values = _rare_strings(strings, nodes.get("inputValue"))
+    visible_nodes = _visible_nodes(document.get("layout", {}), strings)
+
+    candidates: list[tuple[int, str, dict[str, str]]] = []
+    anchors: list[tuple[int, dict[str, str]]] = []
+    test_ids: dict[str, int] = {}
+    text_nodes: list[int] = []
+    for index, node_type in enumerate(types):
+        if node_type == _TEXT_NODE:
+            parent = parents[index]
+            if parent < 0 or _name(strings, names, parent) not in _HIDDEN_TEXT_TAGS:
+                text_nodes.append(index)
+            continue
+        if node_type != _ELEMENT_NODE:
+            continue
+        tag = _name(strings, names, index)
+        attrs = _attributes(strings, attributes[index] if attributes else [])
+        if "data-testid" in attrs:
+            test_ids.setdefault(attrs["data-testid"], index)
+        if len(candidates) < MAX_INTERACTIVE_NODES and _is_interactive(tag, attrs):
+            candidates.append((index, tag, attrs))
+        if tag in ("a", "area") and "href" in attrs and len(anchors) < MAX_LINK_NODES:
+            anchors.append((index, attrs))
+
+    text_of = _TextIndex(parents, text_nodes, values, strings)
+    records: list[tuple[int, str, str, str]] = []
+    seen: set[tuple[str, str, str]] = set()
+
+    def add_record(node: int, role: str, label: str, selector: str) -> None:
+        safe_label = label.replace("|", "")
+        key = (role, safe_label, selector)
+        if key not in seen:
+            seen.add(key)
+            records.append((node, role, safe_label, selector))
+
+    # Submit buttons of forms; clicking one posts the form.
+    submit_buttons: set[int] = set()
+    for index, tag, attrs in candidates:
+        role, label, selector = _describe_element(
+            tag, attrs, input_values.get(index), lambda index=index: text_of(index)
+        )
+        add_record(index, role, label, selector)
+        if (
+            tag == "button"
+            and attrs.get("type", "submit").lower() == "submit"
+            and ("form" in attrs or _in_form(strings, names, parents, index))
+        ):
+            submit_buttons.add(index)
+
+    links: list[str] = []
+    for index, attrs in anchors:
+        href = urljoin(base_url, attrs["href"].strip())
+        if not href or href.startswith("javascript:"):
+            continue
+        links.append(href)
+        if "#" in href:
+            continue
+        label = _clean_text(text_of(index))[:80] or "link"
+        add_record(index, "link", label, f'a[href="{_escape(href)}"]')
+
+    kept = records[:max_nodes]
+    visibility: dict[str, bool] = {}
+    for node, _role, label, selector in kept:
+        visibility.setdefault(selector, node in visible_nodes)
+        if "data-testid" not in selector:
+            slug = label.lower().replace(" ", "-")
+            visibility.setdefault(
+                f"[data-testid='{slug}']", test_ids.get(slug, -1) in visible_nodes
+            )
+    return {
+        "fingerprint": f"fast::{title}::{len(kept)}",
+        "landmarks": ["main"],
+        "elements": [
+            {
+                "role": role,
+                "label": label,
+                "selector": selector,
+                "section": "main",
+                **({"submits_form": True} if node in submit_buttons else {}),
+            }
+            for node, role, label, selector in kept
+        ],
+        "links": links,
+        "title": title,
+        "visibility": visibility,
+    }
+
+
+@dataclass(slots=True)
+class ExtractionTimer:
+    """
+    Time spent extracting pages, per engine. In `compare` mode both engines
+    read every page and pages whose elements or links differ are counted.
+    Incremental extraction adds full and delta scans, the elements each one
+    had to describe, and route changes followed inside the page.
+    Shared by every tab of a crawl.
+    """
+
+    _pages: dict[str, int] = field(init=False, default_factory=dict)
+    _seconds: dict[str, float] = field(init=False, default_factory=dict)
+    _compared: int = field(init=False, default=0)
+    _mismatched: int = field(init=False, default=0)
+    _scans: dict[str, int] = field(init=False, default_factory=dict)
+    _described: int = field(init=False, default=0)
+    _client_navigations: int = field(init=False, default=0)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    def record(self, engine: str, seconds: float) -> None:
+        with self._lock:
+            self._pages[engine] = self._pages.get(engine, 0) + 1
+            self._seconds[engine] = self._seconds.get(engine, 0.0) + seconds
+
+    def compare(self, reference: dict, candidate: dict) -> bool:
+        """Count one compared page; True if both engines agree."""
+        matches = _comparable(reference) == _comparable(candidate)
+        with self._lock:
+            self._compared += 1
+            self._mismatched += not matches
+        return matches
+
+    def record_scan(self, delta: dict) -> None:
+        """Count one INCREMENTAL_DOM_SCRIPT result by its `delta` entry."""
+        with self._lock:
+            mode = delta.get("mode", "full")
+            self._scans[mode] = self._scans.get(mode, 0) + 1
+            self._described += delta.get("described", 0)
+
+    def record_client_navigation(self) -> None:
+        with self._lock:
+            self._client_navigations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats: dict = {}
+            for engine in sorted(self._pages):
+                pages, seconds = self._pages[engine], self._seconds[engine]
+                stats[f"extract_{engine}_pages"] = pages
+                stats[f"extract_{engine}_seconds"] = round(seconds, 3)
+                stats[f"extract_{engine}_avg_ms"] = round(seconds * 1000 / pages, 1)
+            if self._compared:
+                stats["extract_compared_pages"] = self._compared
+                stats["extract_mismatched_pages"] = self._mismatched
+            if self._scans:
+                stats["extract_full_scans"] = self._scans.get("full", 0)
+                stats["extract_delta_scans"] = self._scans.get("delta", 0)
+                stats["extract_described_elements"] = self._described
+                stats["extract_client_navigations"] = self._client_navigations
+            return stats
+
+    @classmethod
+    def merge(cls, stats_list: list[dict]) -> dict:
+        """Combine the `stats()` of crawl shards."""
+        keys = keys_with_prefix(stats_list, ("extract_",))
+        stats = sum_stats(stats_list, [k for k in keys if not k.endswith("_avg_ms")])
+        for key in keys:
+            if key.endswith("_avg_ms"):
+                engine = key.removeprefix("extract_").removesuffix("_avg_ms")
+                stats[key] = avg_ms(
+                    stats[f"extract_{engine}_seconds"], stats[f"extract_{engine}_pages"]
+                )
+        return stats
+
+
+class _TextIndex:
+    """
+    Text content of an element from the captured text nodes. Nodes come in
+    document order, so a subtree is a contiguous index range.
+    """
+
+    def __init__(
+        self,
+        parents: list[int],
+        text_nodes: list[int],
+        values: list[int],
+        strings: list[str],
+    ) -> None:
+        sizes = [1] * len(parents)
+        for index in range(len(parents) - 1, 0, -1):
+            if parents[index] >= 0:
+                sizes[parents[index]] += sizes[index]
+        self._sizes = sizes
+        self._text_nodes = text_nodes
+        self._values = values
+        self._strings = strings
+
+    def __call__(self, index: int) -> str:
+        start = bisect_left(self._text_nodes, index)
+        end = bisect_left(self._text_nodes, index + self._sizes[index])
+        return "".join(
+            _string(self._strings, self._values[node])
+            for node in self._text_nodes[start:end]
+        )
+
+
+def _describe_element(
+    tag: str,
+    attrs: dict[str, str],
+    input_value: str | None,
+    text: Callable[[], str],
+) -> tuple[str, str, str]:
+    """Role, label and selector, following INTERACTIVE_DOM_SCRIPT."""
+    role_attr = attrs.get("role", "")
+    role = role_attr or "generic"
+    if tag in ("input", "textarea", "select"):
+        role = "textbox"
+    if tag == "button":
+        role = "button"
+    if attrs.get("contenteditable") == "true":
+        role = "textbox"
+
+    name = attrs.get("name", "") if tag in FORM_TAGS else ""
+    value = (input_value or attrs.get("value", "")) if tag in FORM_TAGS else ""
+    label = (
+        name
+        or attrs.get("id", "")
+        or value
+        or attrs.get("aria-label", "")
+        or attrs.get("placeholder", "")
+        or attrs.get("title", "")
+    )
+    if role in ("button", "link", "menuitem") or not label:
+        label = _clean_text(text()) or label
+    label = (label or role)[:80]
+
+    selector = tag
+    test_id = attrs.get("data-testid") or attrs.get("data-test")
+    if test_id:
+        selector += f'[data-testid="{_escape(test_id)}"]'
+    elif attrs.get("id"):
+        selector = f"#{attrs['id']}"
+    elif name:
+        selector += f'[name="{_escape(name)}"]'
+    elif attrs.get("placeholder"):
+        selector += f'[placeholder="{_escape(attrs["placeholder"])}"]'
+    elif attrs.get("aria-label"):
+        selector += f'[aria-label="{_escape(attrs["aria-label"])}"]'
+    elif attrs.get("title"):
+        selector += f'[title="{_escape(attrs["title"])}"]'
+    elif role in ("button", "link", "menuitem") and label:
+        selector += f':has-text("{_escape(label)}")'
+    elif role_attr:
+        selector += f'[role="{role_attr}"]'
+    if selector == tag and attrs.get("class"):
+        selector += "." + ".".join(c for c in attrs["class"].split(" ") if c)
+    return role, label, selector
+
+
+def _is_interactive(tag: str, attrs: dict[str, str]) -> bool:
+    if tag == "input":
+        return attrs.get("type", "").lower() != "hidden"
+    if tag in ("select", "textarea", "button"):
+        return True
+    if attrs.get("role") in INTERACTIVE_ROLES or attrs.get("contenteditable") == "true":
+        return True
+    return "tabindex" in attrs and attrs["tabindex"] != "-1"
+
+
+def _in_form(
+    strings: list[str], names: list[int], parents: list[int], index: int
+) -> bool:
+    parent = parents[index]
+    while parent >= 0:
+        if _name(strings, names, parent) == "form":
+            return True
+        parent = parents[parent]
+    return False
+
+
+def _visible_nodes(layout: dict, strings: list[str]) -> set[int]:
+    """Nodes with a non-empty box and no `visibility: hidden`, like Playwright."""
+    visible: set[int] = set()
+    for node, bounds, styles in zip(
+        layout.get("nodeIndex", []), layout.get("bounds", []), layout.get("styles", [])
+    ):
+        hidden = bool(styles) and _string(strings, styles[0]) == "hidden"
+        if len(bounds) == 4 and bounds[2] > 0 and bounds[3] > 0 and not hidden:
+            visible.add(node)
+    return visible
+
+
+def _rare_strings(strings: list[str], data: dict | None) -> dict[int, str]:
+    if not data:
+        return {}
+    return {
+        node: _string(strings, value)
+        for node, value in zip(data.get("index", []), data.get("value", []))
+    }
+
+
+def _attributes(strings: list[str], flat: list[int]) -> dict[str, str]:
+    return {
+        _string(strings, flat[offset]).lower(): _string(strings, flat[offset + 1])
+        for offset in range(0, len(flat) - 1, 2)
+    }
+
+
+def _name(strings: list[str], names: list[int], index: int) -> str:
+    return _string(strings, names[index]).lower()
+
+
+def _string(strings: list[str], index: int) -> str:
+    return strings[index] if 0 <= index < len(strings) else ""
+
+
+def _clean_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _escape(value: str) -> str:
+    return value.replace('"', '\\"')
+
+
+def _comparable(summary: dict) -> tuple:
+    elements = [
+        (element["role"], element["label"], element["selector"])
+        for element in summary.get("elements", [])
+    ]
+    return elements, summary.get("links", [])
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import functools
+
+
+@functools.cache
+def browser_errors() -> tuple[type[Exception], ...]:
+    """
+    What a browser raises for a page it could not drive: Playwright errors
+    (timeouts included) and socket errors from its transport. Resolved on
+    first use, so naming them in an `except` does not import Playwright.
+    """
+    try:
+        from playwright.sync_api import Error
+    except ImportError:
+        return (OSError,)
+    return (Error, OSError)
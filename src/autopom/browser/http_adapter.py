@@ -0,0 +1,636 @@
+from __future__ import annotations
+
+import gzip
+import http.client
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse
+
+from autopom.browser.browseruse_adapter import BrowserAdapter
+from autopom.browser.rate_limit import parse_retry_after
+from autopom.stats import keys_with_prefix, sum_stats
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+)
+# Mirrors the selector list of INTERACTIVE_DOM_SCRIPT.
+INTERACTIVE_ROLES = {
+    "button",
+    "menuitem",
+    "menuitemcheckbox",
+    "menuitemradio",
+    "checkbox",
+    "radio",
+    "switch",
+    "tab",
+    "combobox",
+    "listbox",
+    "option",
+    "searchbox",
+    "spinbutton",
+    "slider",
+}
+FORM_TAGS = {"input", "select", "textarea", "button"}
+VOID_TAGS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "source",
+    "track",
+    "wbr",
+}
+# Text inside these never renders, so it does not count as page content.
+HIDDEN_TEXT_TAGS = {"script", "style", "noscript", "template", "head", "title"}
+# Mount points of client-rendered apps (React, Vue, Next, Nuxt, Gatsby, Svelte).
+SPA_ROOT_IDS = {"root", "app", "__next", "__nuxt", "___gatsby", "svelte"}
+SPA_ROOT_ATTRS = {"ng-app", "ng-version", "data-reactroot", "data-v-app"}
+# A page with less visible text than this and no controls or links is a shell.
+MIN_STATIC_TEXT_CHARS = 200
+# A page with an SPA mount point needs at least this much to count as rendered.
+MIN_SPA_TEXT_CHARS = 500
+MIN_SPA_INTERACTIVE = 3
+MAX_FORM_ELEMENTS = 500
+MAX_LINKS = 300
+
+
+def redirect_target(response: HttpResponse) -> str | None:
+    """Absolute URL a redirect response points at; None for other responses."""
+    location = response.headers.get("location")
+    if response.status not in REDIRECT_STATUSES or not location:
+        return None
+    return urljoin(response.url, location)
+
+
+def _clean_text(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _escape_selector(value: str) -> str:
+    return value.replace('"', '\\"')
+
+
+@dataclass(slots=True)
+class HttpResponse:
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    @property
+    def is_html(self) -> bool:
+        content_type = self.headers.get("content-type", "text/html")
+        return "html" in content_type.lower()
+
+    def text(self) -> str:
+        match = re.search(r"charset=([\w-]+)", self.headers.get("content-type", ""))
+        encoding = match.group(1) if match else "utf-8"
+        try:
+            return self.body.decode(encoding, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+class HttpFetcher:
+    """
+    Keep-alive connection pool for the HTTP fast path, shared by every tab
+    of a crawl. Idle connections are kept per (scheme, host) and reused, so
+    a crawl of one site pays the TCP/TLS handshake once per worker.
+    """
+
+    def __init__(self, timeout_s: float = 15.0, max_redirects: int = 5) -> None:
+        self.timeout_s = timeout_s
+        self.max_redirects = max_redirects
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+        self._fetch_seconds = 0.0
+
+    def fetch(
+        self, url: str, follow: Callable[[str], bool] | None = None
+    ) -> HttpResponse:
+        """
+        GET `url`, following redirects; raises OSError/HTTPException on failure.
+        A redirect to a URL `follow` rejects is returned as is.
+        """
+        started = time.perf_counter()
+        try:
+            for _ in range(self.max_redirects + 1):
+                response = self._get(url)
+                target = redirect_target(response)
+                if target is None:
+                    return response
+                if follow is not None and not follow(target):
+                    self.record("http_blocked_redirects")
+                    return response
+                url = target
+            return response
+        finally:
+            with self._lock:
+                self._counts["http_fetches"] += 1
+                self._fetch_seconds += time.perf_counter() - started
+
+    def record(self, event: str) -> None:
+        with self._lock:
+            self._counts[event] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {
+                "http_fetches": self._counts["http_fetches"],
+                "http_fetch_seconds": round(self._fetch_seconds, 3),
+                "http_reused_connections": self._counts["http_reused_connections"],
+                "http_static_pages": self._counts["http_static_pages"],
+                "http_blocked_redirects": self._counts["http_blocked_redirects"],
+                "http_escalated_pages": 0,
+            }
+            # Per-reason counts, e.g. http_escalated_spa_root.
+            for event, count in sorted(self._counts.items()):
+                if event.startswith(("http_escalated_", "http_unrendered_")):
+                    stats[event] = count
+                if event.startswith("http_escalated_"):
+                    stats["http_escalated_pages"] += count
+            return stats
+
+    @classmethod
+    def merge(cls, stats_list: list[dict]) -> dict:
+        """Combine the `stats()` of crawl shards."""
+        return sum_stats(stats_list, keys_with_prefix(stats_list, ("http_",)))
+
+    def close(self) -> None:
+        with self._lock:
+            connections = [conn for idle in self._idle.values() for conn in idle]
+            self._idle.clear()
+        for conn in connections:
+            conn.close()
+
+    def _get(self, url: str) -> HttpResponse:
+        parsed = urlparse(url)
+        key = (parsed.scheme, parsed.netloc)
+        path = parsed.path or "/"
+        if parsed.query:
+            path += f"?{parsed.query}"
+        headers = {
+            "User-Agent": USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+        conn, reused = self._checkout(key)
+        try:
+            conn.request("GET", path, headers=headers)
+            raw = conn.getresponse()
+            body = raw.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped an idle keep-alive connection; retry fresh.
+            conn = self._connect(key)
+            conn.request("GET", path, headers=headers)
+            raw = conn.getresponse()
+            body = raw.read()
+        response_headers = {name.lower(): value for name, value in raw.getheaders()}
+        if raw.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        encoding = response_headers.get("content-encoding", "")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            try:
+                body = zlib.decompress(body)
+            except zlib.error:
+                # Servers often send raw deflate data without the zlib wrapper.
+                body = zlib.decompressobj(-zlib.MAX_WBITS).decompress(body)
+        return HttpResponse(
+            url=url, status=raw.status, headers=response_headers, body=body
+        )
+
+    def _checkout(
+        self, key: tuple[str, str]
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self._counts["http_reused_connections"] += 1
+                return idle.pop(), True
+        return self._connect(key), False
+
+    def _checkin(self, key: tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def _connect(self, key: tuple[str, str]) -> http.client.HTTPConnection:
+        scheme, netloc = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout_s)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout_s)
+
+
+@dataclass(slots=True)
+class _OpenElement:
+    tag: str
+    record: dict | None
+    hidden_text: bool
+    spa_root: bool
+
+
+class StaticDomParser(HTMLParser):
+    """
+    Server-rendered counterpart of INTERACTIVE_DOM_SCRIPT: the same element
+    selection, label hierarchy and selector construction, read from HTML.
+    Also measures visible text and SPA mount points to spot client rendering.
+    """
+
+    def __init__(self, page_url: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_href = page_url
+        self.title_parts: list[str] = []
+        self.form_records: list[dict] = []
+        self.links: list[tuple[str, list[str]]] = []
+        self.text_chars = 0
+        self.spa_root = False
+        self.spa_root_text_chars = 0
+        self._stack: list[_OpenElement] = []
+        self._in_title = False
+
+    @property
+    def title(self) -> str:
+        return _clean_text("".join(self.title_parts))
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = {name: value or "" for name, value in attrs}
+        if tag == "base" and attributes.get("href"):
+            self.base_href = urljoin(self.base_href, attributes["href"])
+        if tag == "title":
+            self._in_title = True
+        record = None
+        if tag in ("a", "area") and "href" in attributes:
+            record = {"kind": "link", "attrs": attributes, "text": []}
+            self.links.append((attributes["href"], record["text"]))
+        elif self._is_interactive(tag, attributes) and (
+            len(self.form_records) < MAX_FORM_ELEMENTS
+        ):
+            record = {
+                "kind": "form",
+                "tag": tag,
+                "attrs": attributes,
+                "text": [],
+                "in_form": "form" in attributes
+                or any(element.tag == "form" for element in self._stack),
+            }
+            self.form_records.append(record)
+        is_spa_root = attributes.get("id") in SPA_ROOT_IDS or any(
+            name in attributes for name in SPA_ROOT_ATTRS
+        )
+        self.spa_root = self.spa_root or is_spa_root
+        if tag not in VOID_TAGS:
+            self._stack.append(
+                _OpenElement(
+                    tag=tag,
+                    record=record,
+                    hidden_text=tag in HIDDEN_TEXT_TAGS,
+                    spa_root=is_spa_root,
+                )
+            )
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+        # Tolerate unclosed children, as browsers do.
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index].tag == tag:
+                del self._stack[index:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title_parts.append(data)
+        for element in self._stack:
+            if element.record is not None:
+                element.record["text"].append(data)
+        if any(element.hidden_text for element in self._stack):
+            return
+        visible = len(data.strip())
+        self.text_chars += visible
+        if any(element.spa_root for element in self._stack):
+            self.spa_root_text_chars += visible
+
+    def summary(self, max_nodes: int) -> dict:
+        """Same dict shape as `extract_interactive_dom_summary()`."""
+        form_elements = [self._form_element(record) for record in self.form_records]
+        hrefs = [urljoin(self.base_href, href.strip()) for href, _ in self.links]
+        link_elements = []
+        for href, (_, text) in list(zip(hrefs, self.links))[:MAX_LINKS]:
+            if not href or href.startswith("javascript:") or "#" in href:
+                continue
+            label = _clean_text("".join(text))[:80] or "link"
+            link_elements.append(
+                {
+                    "role": "link",
+                    "label": label.replace("|", ""),
+                    "selector": f'a[href="{_escape_selector(href)}"]',
+                    "section": "main",
+                }
+            )
+        unique: dict[tuple[str, str, str], dict] = {}
+        for element in form_elements + link_elements:
+            key = (element["role"], element["label"], element["selector"])
+            unique.setdefault(key, element)
+        elements = list(unique.values())[:max_nodes]
+        return {
+            "fingerprint": f"fast::{self.title}::{len(elements)}",
+            "landmarks": ["main"],
+            "elements": elements,
+            "links": [
+                href for href in hrefs[:MAX_LINKS] if not href.startswith("javascript:")
+            ],
+        }
+
+    def js_rendered_reason(self) -> str | None:
+        """Why the page looks client-rendered, or None if the HTML is enough."""
+        interactive = len(self.form_records) + len(self.links)
+        if interactive == 0 and self.text_chars < MIN_STATIC_TEXT_CHARS:
+            return "spa_root" if self.spa_root else "empty_body"
+        if (
+            self.spa_root
+            and interactive < MIN_SPA_INTERACTIVE
+            and self.spa_root_text_chars < MIN_SPA_TEXT_CHARS
+        ):
+            return "spa_root"
+        return None
+
+    @staticmethod
+    def _is_interactive(tag: str, attributes: dict[str, str]) -> bool:
+        if tag == "input":
+            return attributes.get("type", "").lower() != "hidden"
+        if tag in FORM_TAGS:
+            return True
+        if attributes.get("role") in INTERACTIVE_ROLES:
+            return True
+        if attributes.get("contenteditable") == "true":
+            return True
+        return "tabindex" in attributes and attributes["tabindex"] != "-1"
+
+    @staticmethod
+    def _form_element(record: dict) -> dict:
+        tag = record["tag"]
+        attrs = record["attrs"]
+        role_attr = attrs.get("role", "")
+        role = role_attr or "generic"
+        if tag in ("input", "textarea", "select"):
+            role = "textbox"
+        if tag == "button":
+            role = "button"
+        if attrs.get("contenteditable") == "true":
+            role = "textbox"
+
+        label = (
+            attrs.get("name")
+            or attrs.get("id")
+            or attrs.get("value")
+            or attrs.get("aria-label")
+            or attrs.get("placeholder")
+            or attrs.get("title")
+        )
+        if role in ("button", "link", "menuitem") or not label:
+            label = _clean_text("".join(record["text"])) or label
+        label = (label or role)[:80]
+
+        selector = tag
+        test_id = attrs.get("data-testid") or attrs.get("data-test")
+        if test_id:
+            selector += f'[data-testid="{_escape_selector(test_id)}"]'
+        elif attrs.get("id"):
+            selector = f"#{attrs['id']}"
+        elif attrs.get("name"):
+            selector += f'[name="{_escape_selector(attrs["name"])}"]'
+        elif attrs.get("placeholder"):
+            selector += f'[placeholder="{_escape_selector(attrs["placeholder"])}"]'
+        elif attrs.get("aria-label"):
+            selector += f'[aria-label="{_escape_selector(attrs["aria-label"])}"]'
+        elif attrs.get("title"):
+            selector += f'[title="{_escape_selector(attrs["title"])}"]'
+        elif role in ("button", "link", "menuitem") and label:
+            selector += f':has-text("{_escape_selector(label)}")'
+        elif role_attr:
+            selector += f'[role="{role_attr}"]'
+        if selector == tag and attrs.get("class"):
+            selector += "." + ".".join(attrs["class"].split())
+
+        element = {
+            "role": role,
+            "label": label.replace("|", ""),
+            "selector": selector,
+            "section": "main",
+        }
+        # Clicking a form's submit button posts the form.
+        if (
+            tag == "button"
+            and record["in_form"]
+            and attrs.get("type", "submit").lower() == "submit"
+        ):
+            element["submits_form"] = True
+        return element
+
+
+@dataclass(slots=True)
+class HttpBrowserAdapter:
+    """
+    Fetch-and-parse adapter for server-rendered pages. `goto()` fetches the
+    HTML over a pooled connection; pages that look client-rendered (an
+    empty body or an SPA mount point with no content) are handed to a real
+    browser instead: `fallback` if one was launched up front, otherwise
+    `fallback_factory()` on the first escalation, so a fully static crawl
+    never starts a browser. Worker tabs open their browser tab lazily too.
+    """
+
+    base_url: str
+    fetcher: HttpFetcher = field(default_factory=HttpFetcher)
+    fallback: BrowserAdapter | None = None
+    fallback_factory: Callable[[], BrowserAdapter] | None = None
+    # HTTP status and Retry-After of the last goto(), for the rate limiter.
+    last_status: int | None = field(init=False, default=None)
+    last_retry_after_s: float | None = field(init=False, default=None)
+    # Requests the last goto() sent: two when it escalated to the browser.
+    last_requests: int = field(init=False, default=1)
+    _escalated: bool = field(init=False, default=False, repr=False)
+    _current_url: str = field(init=False, default="", repr=False)
+    _parser: StaticDomParser | None = field(init=False, default=None, repr=False)
+    # Selectors extracted from `_parser`, built on the first visibility check.
+    _visible: frozenset[str] | None = field(init=False, default=None, repr=False)
+    _owns_fetcher: bool = field(default=True, repr=False)
+
+    @property
+    def last_settle_ms(self) -> float | None:
+        # Static pages have nothing to settle; only escalated loads report.
+        if self._escalated:
+            return getattr(self.fallback, "last_settle_ms", None)
+        return None
+
+    @property
+    def resource_blocker(self) -> object | None:
+        return getattr(self.fallback, "resource_blocker", None)
+
+    @property
+    def extraction_timer(self) -> object | None:
+        # Only escalated pages are extracted in the browser.
+        return getattr(self.fallback, "extraction_timer", None)
+
+    def goto(self, url: str) -> None:
+        self._escalated = False
+        self._parser = None
+        self._visible = None
+        self._current_url = url
+        self.last_status = self.last_retry_after_s = None
+        self.last_requests = 1
+        try:
+            response = self.fetcher.fetch(url, follow=self._same_origin)
+        except (http.client.HTTPException, OSError, ValueError, zlib.error):
+            self._escalate(url, "fetch_error")
+            return
+        self._current_url = response.url
+        self.last_status = response.status
+        self.last_retry_after_s = parse_retry_after(response.headers.get("retry-after"))
+        target = redirect_target(response)
+        if target is not None:
+            # Left unfollowed, so nothing off the crawled origin is fetched.
+            self._current_url = target
+            self._parser = StaticDomParser(target)
+            return
+        parser = StaticDomParser(response.url)
+        if response.is_html:
+            parser.feed(response.text())
+            parser.close()
+            reason = parser.js_rendered_reason()
+            if reason is not None and response.status < 400:
+                self._escalate(response.url, reason)
+                return
+        self._parser = parser
+        self.fetcher.record("http_static_pages")
+
+    def url(self) -> str:
+        if self._escalated:
+            return self.fallback.url()
+        return self._current_url or self.base_url
+
+    def title(self) -> str:
+        if self._escalated:
+            return self.fallback.title()
+        return self._parser.title if self._parser is not None else ""
+
+    def extract_interactive_dom_summary(self, max_nodes: int = 500) -> dict:
+        if self._escalated:
+            return self.fallback.extract_interactive_dom_summary(max_nodes=max_nodes)
+        if self._parser is None:
+            self._parser = StaticDomParser(self.url())
+        return self._parser.summary(max_nodes)
+
+    def snapshot(self, max_nodes: int = 500) -> dict:
+        if self._escalated:
+            return self.fallback.snapshot(max_nodes=max_nodes)
+        summary = self.extract_interactive_dom_summary(max_nodes=max_nodes)
+        return {
+            **summary,
+            "url": self.url(),
+            "title": self.title(),
+            # Same answer is_visible() would give for the extracted selectors.
+            "visibility": {
+                element["selector"]: True for element in summary["elements"]
+            },
+        }
+
+    def capture_screenshot(self, scale: float = 0.4) -> str | None:
+        if self._escalated:
+            return self.fallback.capture_screenshot(scale=scale)
+        return None
+
+    def is_visible(self, selector: str, timeout_ms: int = 1500) -> bool:
+        if self._escalated:
+            return self.fallback.is_visible(selector, timeout_ms=timeout_ms)
+        return self.are_visible([selector])[0]
+
+    def are_visible(self, selectors: list[str]) -> list[bool]:
+        if self._escalated:
+            return self.fallback.are_visible(selectors)
+        visible = self._visible_selectors()
+        return [bool(selector) and selector in visible for selector in selectors]
+
+    def click(self, selector: str) -> bool:
+        # Clicks need a live page: load the current URL in the browser first.
+        if not self._escalated:
+            if not self._has_fallback():
+                return False
+            self._escalate(self.url(), "click")
+        return self.fallback.click(selector)
+
+    def new_tab(self) -> HttpBrowserAdapter:
+        return HttpBrowserAdapter(
+            base_url=self.base_url,
+            fetcher=self.fetcher,
+            # Called from the tab's own thread, as Playwright's sync API needs.
+            fallback_factory=self.fallback.new_tab if self.fallback else None,
+            _owns_fetcher=False,
+        )
+
+    def close(self) -> None:
+        if self.fallback is not None:
+            self.fallback.close()
+        if self._owns_fetcher:
+            self.fetcher.close()
+
+    def _same_origin(self, url: str) -> bool:
+        return urlparse(url).netloc == urlparse(self.base_url).netloc
+
+    def _visible_selectors(self) -> frozenset[str]:
+        """
+        Without CSS, "visible" means "extracted from the served HTML". The
+        document only changes on goto(), so it is summarized once per page.
+        """
+        if self._parser is None:
+            return frozenset()
+        if self._visible is None:
+            summary = self._parser.summary(MAX_FORM_ELEMENTS + MAX_LINKS)
+            self._visible = frozenset(
+                element["selector"] for element in summary["elements"]
+            )
+        return self._visible
+
+    def _has_fallback(self) -> bool:
+        return self.fallback is not None or self.fallback_factory is not None
+
+    def _escalate(self, url: str, reason: str) -> None:
+        if not self._has_fallback():
+            # Nothing to escalate to: keep whatever the HTML gave us.
+            self._parser = self._parser or StaticDomParser(url)
+            self.fetcher.record(f"http_unrendered_{reason}")
+            return
+        if self.fallback is None:
+            self.fallback = self.fallback_factory()
+        self.fetcher.record(f"http_escalated_{reason}")
+        self.last_requests += 1
+        self.fallback.goto(url)
+        self._escalated = True
+        self.last_status = getattr(self.fallback, "last_status", self.last_status)
+        self.last_retry_after_s = getattr(self.fallback, "last_retry_after_s", None)
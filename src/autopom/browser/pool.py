@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from autopom.browser.errors import browser_errors
+from autopom.stats import avg_ms, keys_with_prefix, max_stats, sum_stats
+
+if TYPE_CHECKING:
+    from autopom.config import CrawlConfig
+
+
+@dataclass(slots=True)
+class PooledBrowser:
+    browser: object
+    uses: int = 0
+
+
+@dataclass(slots=True)
+class BrowserPool:
+    """
+    Warm browser tabs handed out page by page. `factory` opens a tab (for
+    async crawls it returns an awaitable); `warm()` opens `size` of them
+    before the first navigation. A tab retired after `max_uses` pages, a
+    failed page or a failed health check is closed; the next `acquire()`
+    opens its replacement, so returning a tab never launches one.
+
+    Playwright's sync API is thread-affine: a tab is only handed back to
+    the thread that opened it, and each worker thread warms its own tabs.
+    """
+
+    factory: Callable[[], object]
+    size: int = 1
+    # Pages a tab serves before it is recycled; 0 keeps it for the whole run.
+    max_uses: int = 0
+    _idle: dict[int, list[PooledBrowser]] = field(init=False, default_factory=dict)
+    _leased: dict[int, PooledBrowser] = field(init=False, default_factory=dict)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+    _launches: int = field(init=False, default=0)
+    _launch_seconds: float = field(init=False, default=0.0)
+    _launch_max_s: float = field(init=False, default=0.0)
+    _acquires: int = field(init=False, default=0)
+    _warm_acquires: int = field(init=False, default=0)
+    _acquire_seconds: float = field(init=False, default=0.0)
+    _acquire_max_s: float = field(init=False, default=0.0)
+    _recycled: int = field(init=False, default=0)
+    _unhealthy: int = field(init=False, default=0)
+    _failed_pages: int = field(init=False, default=0)
+
+    @classmethod
+    def from_config(
+        cls, config: CrawlConfig, factory: Callable[[], object]
+    ) -> BrowserPool:
+        return cls(
+            factory=factory,
+            size=config.browser_pool_size,
+            max_uses=config.browser_recycle_after,
+        )
+
+    def warm(self, count: int | None = None) -> None:
+        for _ in range(self.size if count is None else count):
+            self._put(self._launch())
+
+    async def awarm(self, count: int | None = None) -> None:
+        count = self.size if count is None else count
+        for slot in await asyncio.gather(*(self._alaunch() for _ in range(count))):
+            self._put(slot)
+
+    def acquire(self) -> object:
+        """A healthy tab for the calling thread; opens one if none is idle."""
+        started = time.perf_counter()
+        while (slot := self._take()) is not None:
+            try:
+                slot.browser.title()
+            except browser_errors():
+                self._record_unhealthy()
+                slot.browser.close()
+                continue
+            return self._lease(slot, started, warm=True)
+        return self._lease(self._launch(), started, warm=False)
+
+    async def aacquire(self) -> object:
+        started = time.perf_counter()
+        while (slot := self._take()) is not None:
+            try:
+                await slot.browser.title()
+            except browser_errors():
+                self._record_unhealthy()
+                await slot.browser.close()
+                continue
+            return self._lease(slot, started, warm=True)
+        return self._lease(await self._alaunch(), started, warm=False)
+
+    def release(self, browser: object, *, failed: bool = False) -> None:
+        """Return a tab; a failed or worn-out one is closed."""
+        slot = self._finish(browser, failed)
+        if slot is not None:
+            self._put(slot)
+            return
+        with contextlib.suppress(*browser_errors()):
+            browser.close()
+
+    async def arelease(self, browser: object, *, failed: bool = False) -> None:
+        slot = self._finish(browser, failed)
+        if slot is not None:
+            self._put(slot)
+            return
+        with contextlib.suppress(*browser_errors()):
+            await browser.close()
+
+    def close(self) -> None:
+        """Close the calling thread's idle tabs."""
+        for slot in self._drain():
+            slot.browser.close()
+
+    async def aclose(self) -> None:
+        for slot in self._drain():
+            await slot.browser.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pool_launches": self._launches,
+                "pool_launch_seconds": round(self._launch_seconds, 3),
+                "pool_launch_avg_ms": avg_ms(self._launch_seconds, self._launches),
+                "pool_launch_max_ms": round(self._launch_max_s * 1000, 1),
+                "pool_acquires": self._acquires,
+                "pool_warm_acquires": self._warm_acquires,
+                "pool_acquire_seconds": round(self._acquire_seconds, 3),
+                "pool_acquire_avg_ms": avg_ms(self._acquire_seconds, self._acquires),
+                "pool_acquire_max_ms": round(self._acquire_max_s * 1000, 1),
+                "pool_recycled": self._recycled,
+                "pool_unhealthy": self._unhealthy,
+                "pool_failed_pages": self._failed_pages,
+            }
+
+    @classmethod
+    def merge(cls, stats_list: list[dict]) -> dict:
+        """Combine the `stats()` of crawl shards."""
+        keys = keys_with_prefix(stats_list, ("pool_",))
+        stats = {
+            **sum_stats(stats_list, [k for k in keys if not k.endswith("_ms")]),
+            **max_stats(stats_list, [k for k in keys if k.endswith("_max_ms")]),
+        }
+        if stats:
+            stats["pool_launch_avg_ms"] = avg_ms(
+                stats["pool_launch_seconds"], stats["pool_launches"]
+            )
+            stats["pool_acquire_avg_ms"] = avg_ms(
+                stats["pool_acquire_seconds"], stats["pool_acquires"]
+            )
+        return stats
+
+    def _launch(self) -> PooledBrowser:
+        started = time.perf_counter()
+        browser = self.factory()
+        self._record_launch(time.perf_counter() - started)
+        return PooledBrowser(browser)
+
+    async def _alaunch(self) -> PooledBrowser:
+        started = time.perf_counter()
+        browser = await self.factory()
+        self._record_launch(time.perf_counter() - started)
+        return PooledBrowser(browser)
+
+    def _record_launch(self, seconds: float) -> None:
+        with self._lock:
+            self._launches += 1
+            self._launch_seconds += seconds
+            self._launch_max_s = max(self._launch_max_s, seconds)
+
+    def _put(self, slot: PooledBrowser) -> None:
+        with self._lock:
+            self._idle.setdefault(threading.get_ident(), []).append(slot)
+
+    def _take(self) -> PooledBrowser | None:
+        with self._lock:
+            idle = self._idle.get(threading.get_ident())
+            return idle.pop() if idle else None
+
+    def _drain(self) -> list[PooledBrowser]:
+        with self._lock:
+            return self._idle.pop(threading.get_ident(), [])
+
+    def _lease(self, slot: PooledBrowser, started: float, *, warm: bool) -> object:
+        seconds = time.perf_counter() - started
+        with self._lock:
+            self._leased[id(slot.browser)] = slot
+            self._acquires += 1
+            self._warm_acquires += warm
+            self._acquire_seconds += seconds
+            self._acquire_max_s = max(self._acquire_max_s, seconds)
+        return slot.browser
+
+    def _finish(self, browser: object, failed: bool) -> PooledBrowser | None:
+        """The slot to keep, or None if the tab must be closed."""
+        with self._lock:
+            slot = self._leased.pop(id(browser))
+            slot.uses += 1
+            self._failed_pages += failed
+            if failed or (self.max_uses and slot.uses >= self.max_uses):
+                self._recycled += 1
+                return None
+            return slot
+
+    def _record_unhealthy(self) -> None:
+        with self._lock:
+            self._recycled += 1
+            self._unhealthy += 1
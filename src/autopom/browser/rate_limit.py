@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+from autopom.stats import keys_with_prefix, sum_stats
+
+if TYPE_CHECKING:
+    from autopom.config import CrawlConfig
+
+# Responses that mean "slow down" rather than "page broken".
+THROTTLE_STATUSES = (429, 503)
+MAX_BACKOFF_S = 60.0
+# Floor of the adaptive rate, so a throttled host is still probed.
+MIN_RATE = 0.1
+# How long a waiter sleeps when only the concurrency cap holds it back.
+SLOT_POLL_S = 0.01
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds from a numeric `Retry-After` header; HTTP dates are ignored."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value.strip()))
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class HostBucket:
+    """Token bucket plus concurrency and backoff state for one host."""
+
+    rate: float | None
+    capacity: float
+    tokens: float
+    updated: float
+    active: int = 0
+    backoff_until: float = 0.0
+    strikes: int = 0
+
+
+@dataclass(slots=True)
+class HostRateLimiter:
+    """
+    Per-host politeness for navigations. Each host gets a token bucket
+    refilled at `rate` requests/second (bursts of up to `burst`), at most
+    `max_concurrency` navigations in flight, and a pause after a 429/503.
+    Throttling halves the host's rate; every success adds a tenth of the
+    configured rate back (AIMD), so the crawl settles near the highest rate
+    the host sustains. One limiter is shared by all workers of a crawl.
+    """
+
+    rate: float | None = None
+    burst: int = 1
+    max_concurrency: int | None = None
+    backoff_s: float = 1.0
+    _hosts: dict[str, HostBucket] = field(init=False, default_factory=dict)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+    _waits: int = field(init=False, default=0)
+    _wait_seconds: float = field(init=False, default=0.0)
+    _throttled: int = field(init=False, default=0)
+    _skipped: int = field(init=False, default=0)
+
+    @classmethod
+    def from_config(cls, config: CrawlConfig) -> HostRateLimiter:
+        # Every worker process runs its own limiter; split the host budget.
+        rate = config.rate_limit
+        concurrency = config.host_concurrency
+        return cls(
+            rate=rate / config.processes if rate else None,
+            burst=config.rate_limit_burst,
+            max_concurrency=concurrency // config.processes if concurrency else None,
+            backoff_s=config.throttle_backoff_s,
+        )
+
+    def acquire(self, url: str) -> None:
+        """Block until a navigation to `url` may start; pair with `release`."""
+        waited = 0.0
+        while True:
+            delay = self._try_acquire(url)
+            if delay == 0:
+                break
+            time.sleep(delay)
+            waited += delay
+        self._record_wait(waited)
+
+    async def aacquire(self, url: str) -> None:
+        waited = 0.0
+        while True:
+            delay = self._try_acquire(url)
+            if delay == 0:
+                break
+            await asyncio.sleep(delay)
+            waited += delay
+        self._record_wait(waited)
+
+    def release(
+        self, url: str, status: int | None, retry_after: float | None = None
+    ) -> bool:
+        """
+        Finish a navigation with its response status.
+        True if the host throttled it, so the caller should retry later.
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(_host(url), now)
+            bucket.active -= 1
+            if status not in THROTTLE_STATUSES:
+                bucket.strikes = 0
+                if bucket.rate is not None and self.rate is not None:
+                    bucket.rate = min(self.rate, bucket.rate + self.rate / 10)
+                return False
+            self._throttled += 1
+            bucket.strikes += 1
+            delay = self.backoff_s * 2 ** (bucket.strikes - 1)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            bucket.backoff_until = max(
+                bucket.backoff_until, now + min(delay, MAX_BACKOFF_S)
+            )
+            if bucket.rate is not None:
+                bucket.rate = max(MIN_RATE, bucket.rate / 2)
+            return True
+
+    def charge(self, url: str, requests: int) -> None:
+        """
+        Take tokens for requests a navigation sent beyond the one it acquired,
+        like a browser reload after an HTTP fetch. The host's next navigation
+        waits until the bucket has refilled them.
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(_host(url), now)
+            if bucket.rate is not None:
+                self._refill(bucket, now)
+                bucket.tokens -= requests
+
+    def give_up(self) -> None:
+        """Count a page skipped because its host kept throttling."""
+        with self._lock:
+            self._skipped += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {
+                "throttle_waits": self._waits,
+                "throttle_wait_seconds": round(self._wait_seconds, 3),
+                "throttled_responses": self._throttled,
+                "throttle_skipped_pages": self._skipped,
+            }
+            rates = [b.rate for b in self._hosts.values() if b.rate is not None]
+            if rates:
+                stats["throttle_min_rate"] = round(min(rates), 3)
+            return stats
+
+    @classmethod
+    def merge(cls, stats_list: list[dict]) -> dict:
+        """Combine the `stats()` of crawl shards."""
+        keys = keys_with_prefix(stats_list, ("throttle",))
+        stats = sum_stats(stats_list, [k for k in keys if k != "throttle_min_rate"])
+        rates = [s["throttle_min_rate"] for s in stats_list if "throttle_min_rate" in s]
+        if rates:
+            stats["throttle_min_rate"] = min(rates)
+        return stats
+
+    def _try_acquire(self, url: str) -> float:
+        """Take a slot and a token now (returns 0) or return seconds to wait."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(_host(url), now)
+            if now < bucket.backoff_until:
+                return bucket.backoff_until - now
+            if (
+                self.max_concurrency is not None
+                and bucket.active >= self.max_concurrency
+            ):
+                return SLOT_POLL_S
+            if bucket.rate is not None:
+                self._refill(bucket, now)
+                if bucket.tokens < 1:
+                    return (1 - bucket.tokens) / bucket.rate
+                bucket.tokens -= 1
+            bucket.active += 1
+            return 0.0
+
+    def _bucket(self, host: str, now: float) -> HostBucket:
+        bucket = self._hosts.get(host)
+        if bucket is None:
+            capacity = float(max(1, self.burst))
+            bucket = HostBucket(
+                rate=self.rate, capacity=capacity, tokens=capacity, updated=now
+            )
+            self._hosts[host] = bucket
+        return bucket
+
+    @staticmethod
+    def _refill(bucket: HostBucket, now: float) -> None:
+        bucket.tokens = min(
+            bucket.capacity, bucket.tokens + (now - bucket.updated) * bucket.rate
+        )
+        bucket.updated = now
+
+    def _record_wait(self, waited: float) -> None:
+        if not waited:
+            return
+        with self._lock:
+            self._waits += 1
+            self._wait_seconds += waited
+
+
+def _host(url: str) -> str:
+    return urlparse(url).netloc.lower()
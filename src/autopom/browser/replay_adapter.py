@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from autopom.browser.browseruse_adapter import BrowserAdapter, empty_dom_summary
+from autopom.stats import keys_with_prefix, sum_stats
+
+REPLAY_ARCHIVE_FORMAT = "autopom-replay"
+REPLAY_ARCHIVE_VERSION = 1
+
+# A page state: the URL passed to goto() plus the clicks that succeeded since.
+StateKey = tuple[str, tuple[str, ...]]
+
+
+@dataclass(slots=True)
+class ReplayPage:
+    """What the browser answered for one page state."""
+
+    url: str
+    title: str = ""
+    status: int | None = None
+    summary: dict = field(default_factory=empty_dom_summary)
+    # Nodes the summary was extracted with; a larger extraction replaces it.
+    max_nodes: int = 0
+    visibility: dict[str, bool] = field(default_factory=dict)
+    clicks: dict[str, bool] = field(default_factory=dict)
+
+    def extraction(self, max_nodes: int) -> dict:
+        return {**self.summary, "elements": self.summary["elements"][:max_nodes]}
+
+    def record_summary(self, summary: dict, max_nodes: int) -> None:
+        if max_nodes >= self.max_nodes:
+            self.summary = {
+                key: value
+                for key, value in summary.items()
+                if key not in ("url", "title", "visibility")
+            }
+            self.max_nodes = max_nodes
+
+
+@dataclass(slots=True)
+class ReplayArchive:
+    """
+    Recorded page states, stored as gzip-compressed JSON lines: a header line,
+    then one line per state. Keys repeat across states, so a crawl of a few
+    thousand pages compresses to a few MB.
+    """
+
+    base_url: str = ""
+    pages: dict[StateKey, ReplayPage] = field(default_factory=dict)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+    _hits: int = field(init=False, default=0)
+    _misses: int = field(init=False, default=0)
+
+    @classmethod
+    def load(cls, path: Path) -> ReplayArchive:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if (
+                header.get("format") != REPLAY_ARCHIVE_FORMAT
+                or header.get("version") != REPLAY_ARCHIVE_VERSION
+            ):
+                raise ValueError(
+                    f"Unsupported replay archive '{path}'. Expected "
+                    f"{REPLAY_ARCHIVE_FORMAT} version {REPLAY_ARCHIVE_VERSION}."
+                )
+            archive = cls(base_url=header.get("base_url", ""))
+            for line in f:
+                entry = json.loads(line)
+                key = (entry.pop("state_url"), tuple(entry.pop("state_clicks")))
+                archive.pages[key] = ReplayPage(**entry)
+        return archive
+
+    def save(self, path: Path) -> Path:
+        """Write atomically, like checkpoints, so an aborted run keeps the old archive."""
+        header = {
+            "format": REPLAY_ARCHIVE_FORMAT,
+            "version": REPLAY_ARCHIVE_VERSION,
+            "base_url": self.base_url,
+        }
+        with self._lock:
+            entries = sorted(self.pages.items())
+            lines = [json.dumps(header)]
+            for (url, clicks), page in entries:
+                lines.append(
+                    json.dumps(
+                        {
+                            "state_url": url,
+                            "state_clicks": list(clicks),
+                            "url": page.url,
+                            "title": page.title,
+                            "status": page.status,
+                            "summary": page.summary,
+                            "max_nodes": page.max_nodes,
+                            "visibility": page.visibility,
+                            "clicks": page.clicks,
+                        },
+                        separators=(",", ":"),
+                    )
+                )
+        data = gzip.compress(("\n".join(lines) + "\n").encode("utf-8"), mtime=0)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+    def record(self, key: StateKey, url: str) -> ReplayPage:
+        with self._lock:
+            page = self.pages.get(key)
+            if page is None:
+                page = self.pages[key] = ReplayPage(url=url)
+            return page
+
+    def lookup(self, key: StateKey) -> ReplayPage | None:
+        page = self.pages.get(key)
+        with self._lock:
+            if page is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return page
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"replay_hits": self._hits, "replay_misses": self._misses}
+
+    @classmethod
+    def merge(cls, stats_list: list[dict]) -> dict:
+        """Combine the `stats()` of crawl shards."""
+        return sum_stats(stats_list, keys_with_prefix(stats_list, ("replay_",)))
+
+
+@dataclass(slots=True)
+class RecordingBrowserAdapter:
+    """
+    Wraps a live adapter and records every answer it gives into `archive`:
+    the final URL, title and status of each navigation, the extraction
+    output, visibility answers and click results. The primary adapter
+    writes the archive to `path` on close(); worker tabs share it.
+    """
+
+    browser: BrowserAdapter
+    archive: ReplayArchive
+    path: Path | None = None
+    _key: StateKey = field(init=False, default=("", ()))
+    _page: ReplayPage | None = field(init=False, default=None)
+
+    @property
+    def last_settle_ms(self) -> float | None:
+        return getattr(self.browser, "last_settle_ms", None)
+
+    @property
+    def last_status(self) -> int | None:
+        return getattr(self.browser, "last_status", None)
+
+    @property
+    def last_retry_after_s(self) -> float | None:
+        return getattr(self.browser, "last_retry_after_s", None)
+
+    @property
+    def last_requests(self) -> int:
+        return getattr(self.browser, "last_requests", 1)
+
+    @property
+    def resource_blocker(self) -> object | None:
+        return getattr(self.browser, "resource_blocker", None)
+
+    @property
+    def extraction_timer(self) -> object | None:
+        return getattr(self.browser, "extraction_timer", None)
+
+    @property
+    def fetcher(self) -> object | None:
+        return getattr(self.browser, "fetcher", None)
+
+    def goto(self, url: str) -> None:
+        self.browser.goto(url)
+        self._key = (url, ())
+        self._page = page = self.archive.record(self._key, url)
+        page.url = self.browser.url()
+        page.status = self.last_status
+
+    def url(self) -> str:
+        return self.browser.url()
+
+    def title(self) -> str:
+        title = self.browser.title()
+        self._current().title = title
+        return title
+
+    def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+        summary = self.browser.extract_interactive_dom_summary(max_nodes=max_nodes)
+        self._current().record_summary(summary, max_nodes)
+        return summary
+
+    def snapshot(self, max_nodes: int = 120) -> dict:
+        snapshot = self.browser.snapshot(max_nodes=max_nodes)
+        page = self._current()
+        page.url = snapshot["url"]
+        page.title = snapshot["title"]
+        page.record_summary(snapshot, max_nodes)
+        page.visibility.update(snapshot.get("visibility") or {})
+        return snapshot
+
+    def capture_screenshot(self, scale: float = 0.4) -> str | None:
+        return self.browser.capture_screenshot(scale=scale)
+
+    def is_visible(self, selector: str, timeout_ms: int = 1500) -> bool:
+        visible = self.browser.is_visible(selector, timeout_ms=timeout_ms)
+        self._current().visibility[selector] = visible
+        return visible
+
+    def are_visible(self, selectors: list[str]) -> list[bool]:
+        answers = self.browser.are_visible(selectors)
+        self._current().visibility.update(zip(selectors, answers))
+        return answers
+
+    def click(self, selector: str) -> bool:
+        clicked = self.browser.click(selector)
+        self._current().clicks[selector] = clicked
+        if clicked:
+            url, clicks = self._key
+            self._key = (url, (*clicks, selector))
+            self._page = self.archive.record(self._key, self.browser.url())
+        return clicked
+
+    def new_tab(self) -> RecordingBrowserAdapter:
+        return RecordingBrowserAdapter(
+            browser=self.browser.new_tab(), archive=self.archive
+        )
+
+    def close(self) -> None:
+        try:
+            self.browser.close()
+        finally:
+            if self.path is not None:
+                self.archive.save(self.path)
+
+    def _current(self) -> ReplayPage:
+        # Calls before the first goto() describe the page the browser opened on.
+        if self._page is None:
+            url = self.browser.url()
+            self._key = (url, ())
+            self._page = self.archive.record(self._key, url)
+        return self._page
+
+
+@dataclass(slots=True)
+class ReplayBrowserAdapter:
+    """
+    Answers from a `ReplayArchive` instead of a browser, at memory speed, so
+    the Python side of a recorded crawl can be profiled and regression-tested
+    offline. A state missing from the archive (the crawl diverged from the
+    recording) reads as an empty page and counts as a replay miss.
+    """
+
+    base_url: str
+    archive: ReplayArchive
+    last_status: int | None = field(init=False, default=None)
+    last_retry_after_s: float | None = field(init=False, default=None)
+    _key: StateKey = field(init=False, default=("", ()))
+    _page: ReplayPage | None = field(init=False, default=None)
+
+    @classmethod
+    def from_path(cls, base_url: str, path: Path) -> ReplayBrowserAdapter:
+        return cls(base_url=base_url, archive=ReplayArchive.load(path))
+
+    @property
+    def replay_archive(self) -> ReplayArchive:
+        return self.archive
+
+    def goto(self, url: str) -> None:
+        self._key = (url, ())
+        self._page = self.archive.lookup(self._key)
+        self.last_status = self._page.status if self._page else 404
+
+    def url(self) -> str:
+        if self._page is not None:
+            return self._page.url
+        return self._key[0] or self.base_url
+
+    def title(self) -> str:
+        return self._page.title if self._page else ""
+
+    def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+        if self._page is None:
+            return empty_dom_summary()
+        return self._page.extraction(max_nodes)
+
+    def snapshot(self, max_nodes: int = 120) -> dict:
+        return {
+            **self.extract_interactive_dom_summary(max_nodes=max_nodes),
+            "url": self.url(),
+            "title": self.title(),
+            "visibility": dict(self._page.visibility) if self._page else {},
+        }
+
+    def capture_screenshot(self, scale: float = 0.4) -> str | None:
+        return None
+
+    def is_visible(self, selector: str, timeout_ms: int = 1500) -> bool:
+        return bool(self._page and self._page.visibility.get(selector, False))
+
+    def are_visible(self, selectors: list[str]) -> list[bool]:
+        return [self.is_visible(selector) for selector in selectors]
+
+    def click(self, selector: str) -> bool:
+        if self._page is None or not self._page.clicks.get(selector, False):
+            return False
+        url, clicks = self._key
+        self._key = (url, (*clicks, selector))
+        self._page = self.archive.lookup(self._key)
+        return True
+
+    def new_tab(self) -> ReplayBrowserAdapter:
+        return ReplayBrowserAdapter(base_url=self.base_url, archive=self.archive)
+
+    def close(self) -> None:
+        return None
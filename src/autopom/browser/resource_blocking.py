@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from typing import TYPE_CHECKING
+
+from autopom.stats import keys_with_prefix, sum_stats
+
+if TYPE_CHECKING:
+    from autopom.config import CrawlConfig
+
+# Playwright resource types that can be blocked; `document` never is, since the
+# crawler needs the page itself.
+BLOCKABLE_RESOURCE_TYPES = (
+    "stylesheet",
+    "image",
+    "media",
+    "font",
+    "script",
+    "texttrack",
+    "xhr",
+    "fetch",
+    "eventsource",
+    "websocket",
+    "manifest",
+    "other",
+)
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+DEFAULT_BLOCKED_URL_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*segment.io*",
+)
+
+
+def normalize_resource_types(resource_types: list[str] | tuple[str, ...]) -> list[str]:
+    normalized = []
+    for resource_type in resource_types:
+        value = resource_type.strip().lower()
+        if value not in BLOCKABLE_RESOURCE_TYPES:
+            allowed = ", ".join(BLOCKABLE_RESOURCE_TYPES)
+            raise ValueError(
+                f"Unsupported blocked resource type '{resource_type}'. Allowed: {allowed}."
+            )
+        if value not in normalized:
+            normalized.append(value)
+    return normalized
+
+
+@dataclass(slots=True)
+class ResourceBlocker:
+    """
+    Playwright route handler that aborts requests the DOM extraction does not
+    need. A request is blocked when its resource type is listed or its URL
+    matches one of the glob `url_patterns`. One blocker is shared by all tabs
+    of a crawl, so its counters are lock-protected.
+    """
+
+    resource_types: list[str] = field(
+        default_factory=lambda: list(DEFAULT_BLOCKED_RESOURCE_TYPES)
+    )
+    url_patterns: list[str] = field(
+        default_factory=lambda: list(DEFAULT_BLOCKED_URL_PATTERNS)
+    )
+    allowed_requests: int = field(init=False, default=0)
+    _blocked: Counter[str] = field(init=False, default_factory=Counter)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        self.resource_types = normalize_resource_types(self.resource_types)
+
+    @classmethod
+    def from_config(cls, config: CrawlConfig) -> ResourceBlocker:
+        return cls(
+            resource_types=list(config.blocked_resource_types),
+            url_patterns=list(config.blocked_url_patterns),
+        )
+
+    def block_reason(self, url: str, resource_type: str) -> str | None:
+        """`resource_type` or "url_pattern" if the request should be aborted."""
+        if resource_type == "document":
+            return None
+        if resource_type in self.resource_types:
+            return resource_type
+        if any(fnmatch(url, pattern) for pattern in self.url_patterns):
+            return "url_pattern"
+        return None
+
+    def handle_route(self, route: object) -> None:
+        if self._should_abort(route.request):
+            route.abort()
+        else:
+            route.continue_()
+
+    async def ahandle_route(self, route: object) -> None:
+        if self._should_abort(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _should_abort(self, request: object) -> bool:
+        reason = self.block_reason(request.url, request.resource_type)
+        with self._lock:
+            if reason is None:
+                self.allowed_requests += 1
+                return False
+            self._blocked[reason] += 1
+            return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "blocked_requests": sum(self._blocked.values()),
+                **{
+                    f"blocked_{reason}_requests": count
+                    for reason, count in sorted(self._blocked.items())
+                },
+                "allowed_requests": self.allowed_requests,
+            }
+
+    @classmethod
+    def merge(cls, stats_list: list[dict]) -> dict:
+        """Combine the `stats()` of crawl shards."""
+        return sum_stats(
+            stats_list,
+            keys_with_prefix(stats_list, ("blocked_", "allowed_requests")),
+        )
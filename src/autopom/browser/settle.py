@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from autopom.browser.errors import browser_errors
+
+if TYPE_CHECKING:
+    from autopom.config import CrawlConfig
+
+SUPPORTED_SETTLE_STRATEGIES = ("adaptive", "fixed", "none")
+# Long-lived streams never "finish" and would always run into the cap.
+IGNORED_RESOURCE_TYPES = ("eventsource", "websocket", "media")
+SETTLE_POLL_MS = 50
+
+_INSTALL_OBSERVER = """
+    window.__autopomLastMutation = performance.now();
+    new MutationObserver(() => {
+        window.__autopomLastMutation = performance.now();
+    }).observe(document, {
+        subtree: true, childList: true, attributes: true, characterData: true
+    });
+"""
+# Registered as an init script so mutations are timed from document start.
+SETTLE_INIT_SCRIPT = f"""
+(() => {{
+    if (window.__autopomLastMutation !== undefined) return;
+    {_INSTALL_OBSERVER}
+}})();
+"""
+# Milliseconds since the last DOM mutation; installs the observer if the
+# document predates the init script (e.g. a tab attached over CDP).
+SETTLE_PROBE_SCRIPT = f"""
+() => {{
+    if (window.__autopomLastMutation === undefined) {{
+        {_INSTALL_OBSERVER}
+        return 0;
+    }}
+    return performance.now() - window.__autopomLastMutation;
+}}
+"""
+
+
+def normalize_settle_strategy(strategy: str) -> str:
+    normalized = strategy.strip().lower()
+    aliases = {"auto": "adaptive", "sleep": "fixed", "off": "none"}
+    normalized = aliases.get(normalized, normalized)
+    if normalized not in SUPPORTED_SETTLE_STRATEGIES:
+        allowed = ", ".join(SUPPORTED_SETTLE_STRATEGIES)
+        raise ValueError(
+            f"Unsupported settle strategy '{strategy}'. Allowed: {allowed}."
+        )
+    return normalized
+
+
+@dataclass(slots=True)
+class SettlePolicy:
+    """
+    How long `goto()` waits after `domcontentloaded`.
+    `adaptive` returns once the DOM and the network were both quiet for
+    `quiet_ms`, `fixed` always sleeps `max_ms`, `none` does not wait;
+    `max_ms` caps every strategy.
+    """
+
+    strategy: str = "adaptive"
+    quiet_ms: int = 250
+    max_ms: int = 3000
+
+    def __post_init__(self) -> None:
+        self.strategy = normalize_settle_strategy(self.strategy)
+        if self.quiet_ms < 0 or self.max_ms < 0:
+            raise ValueError(
+                f"Unsupported settle timing quiet_ms={self.quiet_ms}, "
+                f"max_ms={self.max_ms}. Must be 0 or more."
+            )
+
+    @classmethod
+    def from_config(cls, config: CrawlConfig) -> SettlePolicy:
+        return cls(
+            strategy=config.settle_strategy,
+            quiet_ms=config.settle_quiet_ms,
+            max_ms=config.settle_max_ms,
+        )
+
+
+class NetworkTracker:
+    """Counts a page's in-flight requests from Playwright request events."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.last_change = time.perf_counter()
+
+    def attach(self, page: object) -> None:
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_done)
+        page.on("requestfailed", self._on_done)
+
+    def quiet_ms(self) -> float:
+        """Milliseconds since the last request started or ended, 0 while busy."""
+        if self.in_flight:
+            return 0.0
+        return (time.perf_counter() - self.last_change) * 1000
+
+    def _on_request(self, request: object) -> None:
+        if request.resource_type in IGNORED_RESOURCE_TYPES:
+            return
+        self.in_flight += 1
+        self.last_change = time.perf_counter()
+
+    def _on_done(self, request: object) -> None:
+        if request.resource_type in IGNORED_RESOURCE_TYPES:
+            return
+        self.in_flight = max(0, self.in_flight - 1)
+        self.last_change = time.perf_counter()
+
+
+def settle_page(page: object, policy: SettlePolicy, network: NetworkTracker) -> float:
+    """Wait for `page` to settle per `policy`; return the wait in milliseconds."""
+    started = time.perf_counter()
+    if policy.strategy == "fixed":
+        page.wait_for_timeout(policy.max_ms)
+    elif policy.strategy == "adaptive":
+        # Playwright dispatches request events while it waits, so every
+        # wait_for_timeout() also refreshes the network counters.
+        while _elapsed_ms(started) < policy.max_ms:
+            try:
+                dom_quiet_ms = float(page.evaluate(SETTLE_PROBE_SCRIPT))
+            except browser_errors():
+                # Mid-navigation contexts can reject evaluate(); rely on the network.
+                dom_quiet_ms = float("inf")
+            if min(dom_quiet_ms, network.quiet_ms()) >= policy.quiet_ms:
+                break
+            page.wait_for_timeout(_next_poll_ms(started, policy))
+    return round(_elapsed_ms(started), 1)
+
+
+async def asettle_page(
+    page: object, policy: SettlePolicy, network: NetworkTracker
+) -> float:
+    """Asyncio twin of `settle_page` for the async Playwright API."""
+    started = time.perf_counter()
+    if policy.strategy == "fixed":
+        await page.wait_for_timeout(policy.max_ms)
+    elif policy.strategy == "adaptive":
+        while _elapsed_ms(started) < policy.max_ms:
+            try:
+                dom_quiet_ms = float(await page.evaluate(SETTLE_PROBE_SCRIPT))
+            except browser_errors():
+                dom_quiet_ms = float("inf")
+            if min(dom_quiet_ms, network.quiet_ms()) >= policy.quiet_ms:
+                break
+            await page.wait_for_timeout(_next_poll_ms(started, policy))
+    return round(_elapsed_ms(started), 1)
+
+
+def settle_stats(settle_ms: dict[str, float]) -> dict:
+    """Crawl-level summary of per-page settle times."""
+    if not settle_ms:
+        return {}
+    times = list(settle_ms.values())
+    return {
+        "settle_ms_total": round(sum(times), 1),
+        "settle_ms_avg": round(sum(times) / len(times), 1),
+        "settle_ms_max": max(times),
+    }
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
+
+
+def _next_poll_ms(started: float, policy: SettlePolicy) -> float:
+    return max(1.0, min(SETTLE_POLL_MS, policy.max_ms - _elapsed_ms(started)))
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field, fields
+from urllib.parse import urlparse
+
+ELEMENT_ROLES = ("textbox", "button", "link", "tab", "checkbox", "combobox")
+LABEL_WORDS = (
+    "Search",
+    "Email",
+    "Save",
+    "Cancel",
+    "Details",
+    "Filter",
+    "Sort",
+    "Next",
+    "Share",
+    "Notes",
+    "Quantity",
+    "Coupon",
+    "Address",
+    "Reviews",
+    "Settings",
+)
+ALIAS_PREFIX = "/go/"
+TRACKING_SUFFIX = "?utm_source=synthetic"
+
+
+@dataclass(slots=True)
+class SiteSpec:
+    """
+    Shape of a generated site. Every page is derived from `seed` and its
+    index alone, so the same spec always yields the same site and pages are
+    built on demand; a 100k-page spec costs nothing until it is crawled.
+    """
+
+    pages: int = 100
+    # Links per page; the first ones form a tree, so every page is reachable.
+    fan_out: int = 5
+    min_elements: int = 8
+    max_elements: int = 24
+    # Share of links that point at another URL for an existing page: a
+    # redirecting `/go/<n>` alias or a tracking-parameter variant.
+    duplicate_ratio: float = 0.0
+    # Share of pages under template routes like `/product/<n>`; pages of one
+    # template share their element layout.
+    template_ratio: float = 0.5
+    templates: tuple[str, ...] = ("product", "category", "article")
+    # Share of elements whose primary selector is hidden, so they heal via
+    # their `text=` fallback.
+    hidden_ratio: float = 0.0
+    # Pathological pages with `large_page_elements` interactive nodes.
+    large_pages: int = 0
+    large_page_elements: int = 10_000
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        self.templates = tuple(self.templates)
+        if self.pages < 1:
+            raise ValueError(f"Unsupported pages '{self.pages}'. Must be at least 1.")
+        if self.fan_out < 1:
+            raise ValueError(
+                f"Unsupported fan_out '{self.fan_out}'. Must be at least 1."
+            )
+        if not 0 <= self.min_elements <= self.max_elements:
+            raise ValueError(
+                f"Unsupported element range '{self.min_elements}-{self.max_elements}'. "
+                "Need 0 <= min_elements <= max_elements."
+            )
+        for name in ("duplicate_ratio", "template_ratio", "hidden_ratio"):
+            value = getattr(self, name)
+            if not 0 <= value <= 1:
+                raise ValueError(
+                    f"Unsupported {name} '{value}'. Must be between 0 and 1."
+                )
+        if self.template_ratio and not self.templates:
+            raise ValueError(
+                "Unsupported template_ratio without templates. Name at least one."
+            )
+        if not 0 <= self.large_pages < self.pages:
+            raise ValueError(
+                f"Unsupported large_pages '{self.large_pages}'. "
+                f"Must be between 0 and pages - 1 ({self.pages - 1})."
+            )
+
+    @classmethod
+    def parse(cls, text: str) -> SiteSpec:
+        """
+        `"pages=100000,fan_out=8,duplicate_ratio=0.1,templates=product|blog,seed=7"`;
+        omitted fields keep their defaults.
+        """
+        types = {item.name: item.type for item in fields(cls)}
+        values: dict[str, object] = {}
+        for part in filter(None, (part.strip() for part in text.split(","))):
+            name, _, raw = part.partition("=")
+            name = name.strip()
+            if name not in types or not raw:
+                allowed = ", ".join(types)
+                raise ValueError(
+                    f"Unsupported site spec entry '{part}'. Use name=value with: "
+                    f"{allowed}."
+                )
+            kind = types[name]
+            try:
+                if kind.startswith("tuple"):
+                    values[name] = tuple(v.strip() for v in raw.split("|") if v.strip())
+                elif kind == "float":
+                    values[name] = float(raw)
+                else:
+                    values[name] = int(raw)
+            except ValueError:
+                raise ValueError(
+                    f"Unsupported site spec entry '{part}'. Expected a {kind}."
+                ) from None
+        return cls(**values)
+
+    def to_spec(self) -> str:
+        """The `parse()` form of this spec."""
+        return ",".join(
+            f"{item.name}={'|'.join(value) if isinstance(value, tuple) else value}"
+            for item in fields(self)
+            for value in (getattr(self, item.name),)
+        )
+
+
+@dataclass(slots=True)
+class SyntheticPage:
+    url: str
+    title: str
+    summary: dict
+    hidden: frozenset[str] = frozenset()
+
+
+@dataclass(slots=True)
+class SyntheticSite:
+    """The site a `SiteSpec` describes, served under `base_url`."""
+
+    spec: SiteSpec
+    base_url: str
+    _large: frozenset[int] = field(init=False)
+    # Paths are absolute, so URLs are the origin plus the path; urljoin per
+    # link would dominate generation time.
+    _origin: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        parsed = urlparse(self.base_url)
+        self._origin = f"{parsed.scheme}://{parsed.netloc}"
+        self._large = frozenset(
+            random.Random(self.spec.seed).sample(
+                range(1, self.spec.pages), self.spec.large_pages
+            )
+        )
+
+    def page_url(self, index: int) -> str:
+        return self._origin + self._path(index)
+
+    def resolve(self, url: str) -> int | None:
+        """Page index behind `url`, following aliases; None outside the site."""
+        path = urlparse(url).path or "/"
+        if path == "/":
+            return 0
+        segments = path.strip("/").split("/")
+        if len(segments) == 2 and segments[1].isdigit():
+            index = int(segments[1])
+            if f"/{segments[0]}/" == ALIAS_PREFIX:
+                return index if 0 <= index < self.spec.pages else None
+        elif len(segments) == 1 and segments[0].startswith("section-"):
+            index = _letters_to_index(segments[0].removeprefix("section-"))
+        else:
+            return None
+        if 0 < index < self.spec.pages and self._path(index) == path:
+            return index
+        return None
+
+    def page(self, url: str) -> SyntheticPage:
+        index = self.resolve(url)
+        if index is None:
+            return SyntheticPage(
+                url=url,
+                title="Not Found",
+                summary={
+                    "fingerprint": "synthetic::missing",
+                    "landmarks": [],
+                    "elements": [],
+                    "links": [],
+                },
+            )
+        path = self._path(index)
+        rng = self._rng(index)
+        template = self._template(index)
+        elements, hidden = self._elements(index, template)
+        return SyntheticPage(
+            url=self.page_url(index),
+            title=f"{(template or 'Section').title()} {index} | Synthetic",
+            summary={
+                "fingerprint": f"synthetic::{template or path}::{len(elements)}",
+                "landmarks": ["header", "main", "footer"],
+                "elements": elements,
+                "links": self._links(index, rng),
+            },
+            hidden=hidden,
+        )
+
+    def _rng(self, index: int, salt: int = 0) -> random.Random:
+        return random.Random((self.spec.seed * 1_000_003 + index) * 31 + salt)
+
+    def _template(self, index: int) -> str | None:
+        spec = self.spec
+        # Links resolve their target's path, so this runs per link: hash, not RNG.
+        if index == 0 or _unit(spec.seed, index) >= spec.template_ratio:
+            return None
+        return spec.templates[index % len(spec.templates)]
+
+    def _path(self, index: int) -> str:
+        if index == 0:
+            return "/"
+        template = self._template(index)
+        if template is not None:
+            return f"/{template}/{index}"
+        return f"/section-{_index_to_letters(index)}"
+
+    def _elements(
+        self, index: int, template: str | None
+    ) -> tuple[list[dict], frozenset[str]]:
+        spec = self.spec
+        # Pages of one template share a layout, as on real sites.
+        rng = self._rng(-1 - spec.templates.index(template) if template else index, 2)
+        if index in self._large:
+            count = spec.large_page_elements
+        else:
+            count = rng.randint(spec.min_elements, spec.max_elements)
+        hidden_rng = self._rng(index, 3)
+        elements = []
+        hidden = set()
+        for number in range(count):
+            role = rng.choice(ELEMENT_ROLES)
+            label = f"{rng.choice(LABEL_WORDS)} {number + 1}"
+            slug = label.lower().replace(" ", "-")
+            if role == "textbox":
+                selector = f"input[name='{slug}']"
+            elif role == "button":
+                selector = f"button:has-text('{label}')"
+            elif role == "link":
+                selector = f"a#{slug}"
+            else:
+                selector = f"#el-{number + 1}"
+            elements.append({"role": role, "label": label, "selector": selector})
+            if hidden_rng.random() < spec.hidden_ratio:
+                hidden.add(selector)
+        return elements, frozenset(hidden)
+
+    def _links(self, index: int, rng: random.Random) -> list[str]:
+        spec = self.spec
+        first_child = index * spec.fan_out + 1
+        targets = list(range(first_child, min(first_child + spec.fan_out, spec.pages)))
+        while len(targets) < spec.fan_out:
+            targets.append(rng.randrange(spec.pages))
+        links = []
+        for target in targets:
+            if rng.random() >= spec.duplicate_ratio:
+                links.append(self.page_url(target))
+            elif rng.random() < 0.5:
+                links.append(f"{self._origin}{ALIAS_PREFIX}{target}")
+            else:
+                links.append(self.page_url(target) + TRACKING_SUFFIX)
+        return links
+
+
+def _unit(seed: int, index: int) -> float:
+    """A uniform float in [0, 1) for `(seed, index)` (splitmix64 finalizer)."""
+    value = (seed * 0x9E3779B97F4A7C15 + index + 1) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return ((value ^ (value >> 31)) >> 11) / (1 << 53)
+
+
+def _index_to_letters(index: int) -> str:
+    letters = ""
+    while True:
+        index, remainder = divmod(index, 26)
+        letters = chr(ord("a") + remainder) + letters
+        if index == 0:
+            return letters
+
+
+def _letters_to_index(letters: str) -> int:
+    index = 0
+    for letter in letters:
+        if not "a" <= letter <= "z":
+            return -1
+        index = index * 26 + ord(letter) - ord("a")
+    return index
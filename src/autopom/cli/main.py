@@ -6,11 +6,25 @@ from pathlib import Path
 import time
 from datetime import datetime, timezone
 
-from autopom.agent.orchestrator import AutoPomOrchestrator
+from autopom.agent.budget import parse_duration
+from autopom.agent.orchestrator import AutoPomOrchestrator, CrawlResult
+from autopom.agent.sharding import run_sharded
+from autopom.agent.state_store import (
+    SUPPORTED_FRONTIER_STRATEGIES,
+    SUPPORTED_SEEN_SETS,
+)
 from autopom.browser.browseruse_adapter import (
     SUPPORTED_BROWSER_ADAPTERS,
     create_browser_adapter,
 )
+from autopom.browser.dom_snapshot import SUPPORTED_EXTRACTION_ENGINES
+from autopom.browser.resource_blocking import (
+    DEFAULT_BLOCKED_RESOURCE_TYPES,
+    DEFAULT_BLOCKED_URL_PATTERNS,
+    ResourceBlocker,
+)
+from autopom.browser.settle import SUPPORTED_SETTLE_STRATEGIES, SettlePolicy
+from autopom.browser.synthetic_site import SiteSpec
 from autopom.config import CrawlConfig
 from autopom.generation.java_generator import (
     SUPPORTED_LOCATOR_STORAGE,
@@ -29,6 +43,7 @@ def _write_execution_summary(
     pages: list,
     model_paths: list[Path],
     pom_paths: list[Path],
+    crawl_stats: dict | None = None,
 ) -> tuple[Path, Path]:
     reports_dir = config.output_dir / "reports"
     reports_dir.mkdir(parents=True, exist_ok=True)
@@ -52,9 +67,41 @@ def _write_execution_summary(
             "locator_storage": config.locator_storage,
             "browser_adapter": config.browser_adapter,
             "playwright_headless": config.playwright_headless,
+            "replay_archive": str(config.replay_archive)
+            if config.replay_archive
+            else None,
+            "record_replay": str(config.record_replay)
+            if config.record_replay
+            else None,
+            "synthetic_site": config.synthetic_site.to_spec()
+            if config.synthetic_site
+            else None,
+            "settle_strategy": config.settle_strategy,
+            "extraction_engine": config.extraction_engine,
+            "incremental_extraction": config.incremental_extraction,
+            "block_resources": config.block_resources,
+            "rate_limit": config.rate_limit,
+            "host_concurrency": config.host_concurrency,
             "max_depth": config.max_depth,
             "max_pages": config.max_pages,
+            "max_pages_per_template": config.max_pages_per_template,
+            "seed_sources": config.seed_sources,
+            "max_nodes": config.max_nodes,
+            "explore_actions": config.explore_actions,
+            "explore_depth": config.explore_depth,
+            "time_budget_s": config.time_budget_s,
+            "page_latency_target_ms": config.page_latency_target_ms,
             "same_origin_only": config.same_origin_only,
+            "concurrency": config.concurrency,
+            "browser_pool_size": config.browser_pool_size,
+            "browser_recycle_after": config.browser_recycle_after,
+            "output_workers": config.output_workers,
+            "processes": config.processes,
+            "seen_set": config.seen_set,
+            "frontier_strategy": config.frontier_strategy,
+            "checkpoint_interval": config.checkpoint_interval,
+            "resume": config.resume,
+            "incremental": config.incremental,
         },
         "metrics": {
             "pages_modeled": len(pages),
@@ -66,6 +113,7 @@ def _write_execution_summary(
             "page_object_files_generated": max(0, len(pom_paths) - 1),
             "base_page_files_generated": 1 if pom_paths else 0,
         },
+        "crawl_stats": crawl_stats or {},
         "artifacts": {
             "crawl_summary_report": str(crawl_report_path),
             "json_model_paths": [str(p) for p in model_paths],
@@ -84,9 +132,35 @@ def _write_execution_summary(
         f"- Locator storage: `{payload['configuration']['locator_storage']}`",
         f"- Browser adapter: `{payload['configuration']['browser_adapter']}`",
         f"- Playwright headless: `{payload['configuration']['playwright_headless']}`",
+        f"- Replay archive: `{payload['configuration']['replay_archive']}`",
+        f"- Recorded replay archive: `{payload['configuration']['record_replay']}`",
+        f"- Synthetic site: `{payload['configuration']['synthetic_site']}`",
+        f"- Settle strategy: `{payload['configuration']['settle_strategy']}`",
+        f"- Extraction engine: `{payload['configuration']['extraction_engine']}`",
+        f"- Incremental extraction: `{payload['configuration']['incremental_extraction']}`",
+        f"- Block resources: `{payload['configuration']['block_resources']}`",
+        f"- Rate limit (navigations/s per host): `{payload['configuration']['rate_limit']}`",
+        f"- Max navigations in flight per host: `{payload['configuration']['host_concurrency']}`",
         f"- Max depth: `{payload['configuration']['max_depth']}`",
         f"- Max pages: `{payload['configuration']['max_pages']}`",
+        f"- Max pages per route template: `{payload['configuration']['max_pages_per_template']}`",
+        f"- Seed sources: `{payload['configuration']['seed_sources']}`",
+        f"- Max nodes per page: `{payload['configuration']['max_nodes']}`",
+        f"- Explored clicks per state: `{payload['configuration']['explore_actions']}`",
+        f"- Explore depth (clicks): `{payload['configuration']['explore_depth']}`",
+        f"- Time budget (seconds): `{payload['configuration']['time_budget_s']}`",
+        f"- Page latency target (ms): `{payload['configuration']['page_latency_target_ms']}`",
         f"- Same-origin only: `{payload['configuration']['same_origin_only']}`",
+        f"- Concurrent workers: `{payload['configuration']['concurrency']}`",
+        f"- Warm tabs per worker: `{payload['configuration']['browser_pool_size']}`",
+        f"- Recycle tabs after (pages): `{payload['configuration']['browser_recycle_after']}`",
+        f"- Output pipeline threads: `{payload['configuration']['output_workers']}`",
+        f"- Worker processes: `{payload['configuration']['processes']}`",
+        f"- Seen-set backend: `{payload['configuration']['seen_set']}`",
+        f"- Frontier strategy: `{payload['configuration']['frontier_strategy']}`",
+        f"- Checkpoint interval (pages): `{payload['configuration']['checkpoint_interval']}`",
+        f"- Resumed: `{payload['configuration']['resume']}`",
+        f"- Incremental: `{payload['configuration']['incremental']}`",
         "",
         "## Metrics",
         "",
@@ -98,6 +172,10 @@ def _write_execution_summary(
         f"- JSON models saved: `{payload['metrics']['json_models_saved']}`",
         f"- POM files generated: `{payload['metrics']['pom_files_generated']}`",
         "",
+        "## Crawl Statistics",
+        "",
+        *(f"- {key}: `{value}`" for key, value in payload["crawl_stats"].items()),
+        "",
         "## Outputs",
         "",
         f"- Crawl summary report: `{payload['artifacts']['crawl_summary_report']}`",
@@ -116,6 +194,32 @@ def _write_execution_summary(
     return markdown_path, json_path
 
 
+def _print_progress(event: str, payload: dict) -> None:
+    # Module-level so it can be pickled into --processes worker processes.
+    if event == "dequeue":
+        print(
+            "[CRAWL] Visiting "
+            f"{payload['url']} | depth={payload['depth']} "
+            f"| modeled={payload['modeled_pages']} "
+            f"| queue={payload['frontier_remaining']}"
+        )
+    elif event == "modeled":
+        print(
+            "[MAP] "
+            f"{payload['page_name']} "
+            f"| elements={payload['elements']} "
+            f"| actions={payload['actions']} "
+            f"| new_links={payload['links_enqueued']} "
+            f"| deduped_links={payload['links_deduped']} "
+            f"| total_modeled={payload['modeled_pages']}"
+        )
+    elif event == "skip":
+        reason = payload.get("reason", "unknown")
+        print(f"[SKIP] {payload.get('url', '<unknown>')} | reason={reason}")
+    elif event == "checkpoint":
+        print(f"[CHECKPOINT] {payload['path']} | modeled={payload['modeled_pages']}")
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="AutoPOM-Agent CLI")
     parser.add_argument("--base-url", help="Base URL to crawl")
@@ -150,6 +254,133 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--output-dir", default="output", help="Output directory")
     parser.add_argument("--max-depth", type=int, default=3, help="Max link depth")
     parser.add_argument("--max-pages", type=int, default=20, help="Max pages to model")
+    parser.add_argument(
+        "--max-pages-per-template",
+        type=int,
+        default=None,
+        help="Max URLs to visit per route template (e.g. /product/{id})",
+    )
+    parser.add_argument(
+        "--sitemap",
+        dest="seed_sources",
+        action="append",
+        default=[],
+        help="sitemap.xml file or URL (indexes are followed) whose URLs seed the frontier (repeatable)",
+    )
+    parser.add_argument(
+        "--url-list",
+        dest="seed_sources",
+        action="append",
+        help="Text file with one URL per line to seed the frontier (repeatable)",
+    )
+    parser.add_argument(
+        "--max-nodes",
+        type=int,
+        default=500,
+        help="Max interactive nodes extracted per page",
+    )
+    parser.add_argument(
+        "--explore-actions",
+        type=int,
+        default=0,
+        help="Buttons/tabs to click per page state to model modals, tabs and wizard steps (0 disables)",
+    )
+    parser.add_argument(
+        "--explore-depth",
+        type=int,
+        default=1,
+        help="How many clicks deep --explore-actions chains from each page",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=_duration,
+        default=None,
+        help="Wall-clock crawl deadline, e.g. 90s, 20m or 1h; pages degrade when behind",
+    )
+    parser.add_argument(
+        "--page-latency-target-ms",
+        type=float,
+        default=None,
+        help="Per-page latency target; slower pages degrade the following ones",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Concurrent crawl workers, each driving its own browser tab",
+    )
+    parser.add_argument(
+        "--browser-pool",
+        type=int,
+        default=0,
+        help="Warm browser tabs per worker, health-checked and handed out per page "
+        "(0 keeps one tab per worker for the whole run)",
+    )
+    parser.add_argument(
+        "--recycle-after",
+        type=int,
+        default=0,
+        help="Pages a pooled tab serves before it is closed and replaced "
+        "(0 never recycles; needs --browser-pool)",
+    )
+    parser.add_argument(
+        "--output-workers",
+        type=int,
+        default=1,
+        help="Background threads writing models and POMs (0 writes inline)",
+    )
+    parser.add_argument(
+        "--output-queue-size",
+        type=int,
+        default=16,
+        help="Pages that may wait for the output threads before crawling pauses",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Worker processes, each with its own browser, sharing one frontier",
+    )
+    parser.add_argument(
+        "--seen-set",
+        default="exact",
+        choices=SUPPORTED_SEEN_SETS,
+        help="Visited URL/signature store: exact sets or a memory-compact bloom filter",
+    )
+    parser.add_argument(
+        "--seen-set-capacity",
+        type=int,
+        default=1_000_000,
+        help="Expected distinct URLs/signatures when --seen-set bloom is used",
+    )
+    parser.add_argument(
+        "--seen-set-fp-rate",
+        type=float,
+        default=0.001,
+        help="Target false-positive rate when --seen-set bloom is used",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=int,
+        default=0,
+        help="Write a resumable checkpoint every N modeled pages (0, the default, disables)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the checkpoint and models in --output-dir",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-model pages whose fingerprint changed since the last run",
+    )
+    parser.add_argument(
+        "--frontier",
+        default="fifo",
+        choices=SUPPORTED_FRONTIER_STRATEGIES,
+        help="Frontier order: fifo (breadth-first) or priority (novel routes first)",
+    )
     parser.add_argument(
         "--pom-language",
         default="java",
@@ -166,7 +397,105 @@ def build_parser() -> argparse.ArgumentParser:
         "--browser-adapter",
         default="mock",
         choices=SUPPORTED_BROWSER_ADAPTERS,
-        help="Browser adapter: mock or playwright",
+        help="Browser adapter: mock, playwright, http (fetch static pages, escalate JS-rendered ones to Playwright), or replay (answer from --replay-archive)",
+    )
+    parser.add_argument(
+        "--synthetic-site",
+        type=_site_spec,
+        default=None,
+        metavar="SPEC",
+        help="Serve a generated site from the mock adapter, e.g. "
+        "'pages=100000,fan_out=8,duplicate_ratio=0.1,large_pages=2,seed=7'",
+    )
+    parser.add_argument(
+        "--replay-archive",
+        type=Path,
+        default=None,
+        help="Recording the replay adapter answers from (see --record-replay)",
+    )
+    parser.add_argument(
+        "--record-replay",
+        type=Path,
+        default=None,
+        help="Record every page the browser adapter reads into this archive, "
+        "for offline runs with --browser-adapter replay",
+    )
+    parser.add_argument(
+        "--settle",
+        default="adaptive",
+        choices=SUPPORTED_SETTLE_STRATEGIES,
+        help="Wait after navigation: adaptive (DOM and network quiet), fixed, or none",
+    )
+    parser.add_argument(
+        "--settle-quiet-ms",
+        type=int,
+        default=250,
+        help="Quiet window the adaptive settle waits for",
+    )
+    parser.add_argument(
+        "--settle-max-ms",
+        type=int,
+        default=3000,
+        help="Upper bound on the settle wait (the sleep for --settle fixed)",
+    )
+    parser.add_argument(
+        "--extraction-engine",
+        default="js",
+        choices=SUPPORTED_EXTRACTION_ENGINES,
+        help="DOM extraction: js (in-page script), cdp (DOMSnapshot parsed in Python), "
+        "or compare (run both per page and report timings)",
+    )
+    parser.add_argument(
+        "--incremental-extraction",
+        action="store_true",
+        help="Follow in-page links so SPA routers keep the document, and only "
+        "re-describe DOM nodes that changed (js engine only)",
+    )
+    parser.add_argument(
+        "--block-resources",
+        action="store_true",
+        help="Abort requests the DOM extraction does not need (Playwright only)",
+    )
+    parser.add_argument(
+        "--block-resource-types",
+        default=",".join(DEFAULT_BLOCKED_RESOURCE_TYPES),
+        help="Comma-separated Playwright resource types to block",
+    )
+    parser.add_argument(
+        "--block-url-pattern",
+        action="append",
+        default=None,
+        help="URL glob to block, e.g. '*analytics*' (repeatable; replaces the defaults)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="Max navigations per second per host; backs off further on 429/503",
+    )
+    parser.add_argument(
+        "--rate-limit-burst",
+        type=int,
+        default=1,
+        help="Navigations a host may receive back to back before --rate-limit applies",
+    )
+    parser.add_argument(
+        "--host-concurrency",
+        type=int,
+        default=None,
+        help="Max navigations in flight per host across all workers",
+    )
+    parser.add_argument(
+        "--throttle-retries",
+        type=int,
+        default=3,
+        help="Retries of a page answered with 429/503 before it is skipped",
+    )
+    parser.add_argument(
+        "--throttle-backoff",
+        type=float,
+        default=1.0,
+        help="First backoff in seconds after a 429/503; doubles per repeat (Retry-After wins)",
     )
     parser.add_argument(
         "--headed",
@@ -176,37 +505,118 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> None:
-    parser = build_parser()
-    args = parser.parse_args()
+def _duration(value: str) -> float:
+    try:
+        return parse_duration(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
 
-    if not any([args.base_url, args.capture, args.chrome_profile, args.interactive]):
-        parser.error(
-            "At least one of --base-url, --capture/-c, --chrome-profile, or --interactive must be provided. Use --help for more info."
-        )
 
-    started_at = time.perf_counter()
+def _site_spec(value: str) -> SiteSpec:
+    try:
+        return SiteSpec.parse(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
 
-    cdp_url = args.capture
-    browser_adapter_name = args.browser_adapter
 
-    if cdp_url or args.chrome_profile or args.interactive:
-        browser_adapter_name = "playwright"
-        initial_base_url = args.base_url if args.base_url else "http://detecting-url"
-    else:
-        initial_base_url = args.base_url
+def _blocked_resource_types(args: argparse.Namespace) -> list[str]:
+    return [value for value in args.block_resource_types.split(",") if value.strip()]
+
+
+def _blocked_url_patterns(args: argparse.Namespace) -> list[str]:
+    if args.block_url_pattern is None:
+        return list(DEFAULT_BLOCKED_URL_PATTERNS)
+    return args.block_url_pattern
 
-    # Force headed mode if interactive is used, so the user can actually see the browser
-    is_headless = not args.headed
-    if args.interactive:
-        is_headless = False
 
+def _build_config(
+    args: argparse.Namespace,
+    base_url: str,
+    browser_adapter_name: str,
+    is_headless: bool,
+) -> CrawlConfig:
+    return CrawlConfig(
+        base_url=base_url,
+        output_dir=Path(args.output_dir),
+        max_depth=args.max_depth,
+        max_pages=args.max_pages,
+        max_pages_per_template=args.max_pages_per_template,
+        seed_sources=args.seed_sources,
+        max_nodes=args.max_nodes,
+        explore_actions=args.explore_actions,
+        explore_depth=args.explore_depth,
+        time_budget_s=args.time_budget,
+        page_latency_target_ms=args.page_latency_target_ms,
+        pom_language=args.pom_language,
+        locator_storage=args.locator_storage,
+        browser_adapter=browser_adapter_name,
+        playwright_headless=is_headless,
+        replay_archive=args.replay_archive,
+        record_replay=args.record_replay,
+        synthetic_site=args.synthetic_site,
+        settle_strategy=args.settle,
+        settle_quiet_ms=args.settle_quiet_ms,
+        settle_max_ms=args.settle_max_ms,
+        extraction_engine=args.extraction_engine,
+        incremental_extraction=args.incremental_extraction,
+        block_resources=args.block_resources,
+        blocked_resource_types=_blocked_resource_types(args),
+        blocked_url_patterns=_blocked_url_patterns(args),
+        rate_limit=args.rate_limit,
+        rate_limit_burst=args.rate_limit_burst,
+        host_concurrency=args.host_concurrency,
+        throttle_retries=args.throttle_retries,
+        throttle_backoff_s=args.throttle_backoff,
+        cdp_url=args.capture,
+        chrome_profile=args.chrome_profile,
+        interactive_pause=args.interactive,
+        concurrency=args.workers,
+        browser_pool_size=args.browser_pool,
+        browser_recycle_after=args.recycle_after,
+        output_workers=args.output_workers,
+        output_queue_size=args.output_queue_size,
+        processes=args.processes,
+        seen_set=args.seen_set,
+        seen_set_capacity=args.seen_set_capacity,
+        seen_set_fp_rate=args.seen_set_fp_rate,
+        frontier_strategy=args.frontier,
+        checkpoint_interval=args.checkpoint_interval,
+        resume=args.resume,
+        incremental=args.incremental,
+    )
+
+
+def _run_single_process(
+    args: argparse.Namespace,
+    initial_base_url: str,
+    browser_adapter_name: str,
+    is_headless: bool,
+) -> tuple[CrawlConfig, CrawlResult]:
+    cdp_url = args.capture
     browser = create_browser_adapter(
         adapter_name=browser_adapter_name,
         base_url=initial_base_url,
         playwright_headless=is_headless,
         cdp_url=cdp_url,
         chrome_profile=args.chrome_profile,
+        concurrency=args.workers,
+        browser_pool_size=args.browser_pool,
+        extraction_engine=args.extraction_engine,
+        incremental_extraction=args.incremental_extraction,
+        replay_archive=args.replay_archive,
+        record_replay=args.record_replay,
+        synthetic_site=args.synthetic_site,
+        settle=SettlePolicy(
+            strategy=args.settle,
+            quiet_ms=args.settle_quiet_ms,
+            max_ms=args.settle_max_ms,
+        ),
+        resource_blocker=ResourceBlocker(
+            resource_types=_blocked_resource_types(args),
+            url_patterns=_blocked_url_patterns(args),
+        )
+        if args.block_resources
+        else None,
     )
 
     try:
@@ -231,46 +641,62 @@ def main() -> None:
         else:
             actual_base_url = initial_base_url
 
-        config = CrawlConfig(
-            base_url=actual_base_url,
-            output_dir=Path(args.output_dir),
-            max_depth=args.max_depth,
-            max_pages=args.max_pages,
-            pom_language=args.pom_language,
-            locator_storage=args.locator_storage,
-            browser_adapter=browser_adapter_name,
-            playwright_headless=is_headless,
-            cdp_url=cdp_url,
-            chrome_profile=args.chrome_profile,
-            interactive_pause=args.interactive,
-        )
-
-        def progress_printer(event: str, payload: dict) -> None:
-            if event == "dequeue":
-                print(
-                    "[CRAWL] Visiting "
-                    f"{payload['url']} | depth={payload['depth']} "
-                    f"| modeled={payload['modeled_pages']} "
-                    f"| queue={payload['frontier_remaining']}"
-                )
-            elif event == "modeled":
-                print(
-                    "[MAP] "
-                    f"{payload['page_name']} "
-                    f"| elements={payload['elements']} "
-                    f"| actions={payload['actions']} "
-                    f"| total_modeled={payload['modeled_pages']}"
-                )
-            elif event == "skip":
-                reason = payload.get("reason", "unknown")
-                print(f"[SKIP] {payload.get('url', '<unknown>')} | reason={reason}")
-
+        config = _build_config(args, actual_base_url, browser_adapter_name, is_headless)
         orchestrator = AutoPomOrchestrator(
-            config=config, browser=browser, progress_hook=progress_printer
+            config=config, browser=browser, progress_hook=_print_progress
         )
         result = orchestrator.run()
     finally:
         browser.close()
+    return config, result
+
+
+def main() -> None:
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if not any([args.base_url, args.capture, args.chrome_profile, args.interactive]):
+        parser.error(
+            "At least one of --base-url, --capture/-c, --chrome-profile, or --interactive must be provided. Use --help for more info."
+        )
+    if args.processes > 1 and any(
+        [args.capture, args.chrome_profile, args.interactive]
+    ):
+        parser.error(
+            "--processes launches one browser per worker and cannot be combined with --capture/-c, --chrome-profile, or --interactive."
+        )
+
+    if args.processes > 1 and args.record_replay:
+        parser.error(
+            "--record-replay writes one archive and cannot be combined with --processes."
+        )
+    if args.browser_adapter == "replay" and not args.replay_archive:
+        parser.error("--browser-adapter replay needs --replay-archive.")
+
+    started_at = time.perf_counter()
+
+    browser_adapter_name = args.browser_adapter
+
+    if args.capture or args.chrome_profile or args.interactive:
+        browser_adapter_name = "playwright"
+        initial_base_url = args.base_url if args.base_url else "http://detecting-url"
+    else:
+        initial_base_url = args.base_url
+
+    # Force headed mode if interactive is used, so the user can actually see the browser
+    is_headless = not args.headed
+    if args.interactive:
+        is_headless = False
+
+    if args.processes > 1:
+        config = _build_config(
+            args, initial_base_url, browser_adapter_name, is_headless
+        )
+        result = run_sharded(config, progress_hook=_print_progress)
+    else:
+        config, result = _run_single_process(
+            args, initial_base_url, browser_adapter_name, is_headless
+        )
 
     duration_seconds = time.perf_counter() - started_at
     summary_md_path, summary_json_path = _write_execution_summary(
@@ -280,6 +706,7 @@ def main() -> None:
         pages=result.pages,
         model_paths=result.model_paths,
         pom_paths=result.pom_paths,
+        crawl_stats=result.stats,
     )
 
     print(f"Modeled pages: {len(result.pages)}")
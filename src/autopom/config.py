@@ -3,7 +3,23 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from autopom.agent.state_store import (
+    FrontierScorer,
+    normalize_frontier_strategy,
+    normalize_seen_set,
+)
 from autopom.browser.browseruse_adapter import normalize_browser_adapter
+from autopom.browser.dom_snapshot import (
+    normalize_extraction_engine,
+    validate_incremental_extraction,
+)
+from autopom.browser.resource_blocking import (
+    DEFAULT_BLOCKED_RESOURCE_TYPES,
+    DEFAULT_BLOCKED_URL_PATTERNS,
+    normalize_resource_types,
+)
+from autopom.browser.settle import normalize_settle_strategy
+from autopom.browser.synthetic_site import SiteSpec
 from autopom.generation.java_generator import (
     normalize_locator_storage,
     normalize_pom_language,
@@ -16,7 +32,22 @@ class CrawlConfig:
     output_dir: Path = Path("output")
     max_depth: int = 3
     max_pages: int = 80
+    # Navigations per route template (`/product/{id}`); None samples every URL.
+    max_pages_per_template: int | None = None
     max_actions_per_page: int = 12
+    # sitemap.xml files/URLs (indexes followed) or one-URL-per-line lists
+    # whose URLs are queued as seeds before the crawl starts.
+    seed_sources: list[str] = field(default_factory=list)
+    # Buttons/tabs clicked per page state (0 follows links only) and how many
+    # clicks deep the explorer chains from the loaded page.
+    explore_actions: int = 0
+    explore_depth: int = 1
+    # Interactive nodes extracted per page (fewer when behind the time budget).
+    max_nodes: int = 500
+    # Wall-clock crawl deadline in seconds and per-page latency target; when
+    # behind either, pages degrade (fewer nodes, no healing, no deep links).
+    time_budget_s: float | None = None
+    page_latency_target_ms: float | None = None
     same_origin_only: bool = True
     denied_domains: list[str] = field(
         default_factory=lambda: ["facebook.com", "twitter.com", "linkedin.com"]
@@ -30,11 +61,188 @@ class CrawlConfig:
     locator_storage: str = "inline"
     browser_adapter: str = "mock"
     playwright_headless: bool = True
+    # Recording the `replay` adapter answers from, and where to record one
+    # of this run (any other adapter; written when the crawl ends).
+    replay_archive: Path | None = None
+    record_replay: Path | None = None
+    # Generated site the mock adapter serves instead of its fixed pages.
+    synthetic_site: SiteSpec | None = None
+    # Post-navigation wait: `adaptive` (DOM + network quiet), `fixed`, `none`.
+    settle_strategy: str = "adaptive"
+    settle_quiet_ms: int = 250
+    settle_max_ms: int = 3000
+    # DOM extraction (Playwright only): `js` in-page script, `cdp` DOMSnapshot
+    # parsed in Python, or `compare` to time both on every page.
+    extraction_engine: str = "js"
+    # Cache element descriptions per document and follow in-page links on
+    # SPA route changes, so extraction re-describes only mutated nodes.
+    incremental_extraction: bool = False
+    # Abort requests for these resource types / URL globs (Playwright only).
+    block_resources: bool = False
+    blocked_resource_types: list[str] = field(
+        default_factory=lambda: list(DEFAULT_BLOCKED_RESOURCE_TYPES)
+    )
+    blocked_url_patterns: list[str] = field(
+        default_factory=lambda: list(DEFAULT_BLOCKED_URL_PATTERNS)
+    )
+    # Per-host politeness: navigations/second (bursts of rate_limit_burst),
+    # navigations in flight, and retries after a 429/503 with exponential backoff.
+    rate_limit: float | None = None
+    rate_limit_burst: int = 1
+    host_concurrency: int | None = None
+    throttle_retries: int = 3
+    throttle_backoff_s: float = 1.0
     cdp_url: str | None = None
     chrome_profile: bool = False
     interactive_pause: bool = False
+    concurrency: int = 1
+    # Warm tabs kept per worker (0 drives one tab per worker for the whole
+    # run) and pages a pooled tab serves before it is recycled (0: never).
+    browser_pool_size: int = 0
+    browser_recycle_after: int = 0
+    # Background threads writing models/POMs (0 writes inline) and how many
+    # pages may wait for them before crawl workers block.
+    output_workers: int = 1
+    output_queue_size: int = 16
+    processes: int = 1
+    seen_set: str = "exact"
+    seen_set_capacity: int = 1_000_000
+    seen_set_fp_rate: float = 0.001
+    frontier_strategy: str = "fifo"
+    # Custom priority scorer; must be a module-level function with --processes.
+    frontier_scorer: FrontierScorer | None = None
+    # Modeled pages between checkpoints in output_dir; 0 disables them.
+    checkpoint_interval: int = 0
+    resume: bool = False
+    # Skip modeling/healing/codegen for pages whose signature matches last run.
+    incremental: bool = False
 
     def __post_init__(self) -> None:
         self.pom_language = normalize_pom_language(self.pom_language)
         self.locator_storage = normalize_locator_storage(self.locator_storage)
         self.browser_adapter = normalize_browser_adapter(self.browser_adapter)
+        self.settle_strategy = normalize_settle_strategy(self.settle_strategy)
+        self.extraction_engine = normalize_extraction_engine(self.extraction_engine)
+        validate_incremental_extraction(
+            self.incremental_extraction, self.extraction_engine
+        )
+        self.blocked_resource_types = normalize_resource_types(
+            self.blocked_resource_types
+        )
+        self.seen_set = normalize_seen_set(self.seen_set)
+        self.frontier_strategy = normalize_frontier_strategy(self.frontier_strategy)
+        if self.concurrency < 1:
+            raise ValueError(
+                f"Unsupported concurrency '{self.concurrency}'. Must be at least 1."
+            )
+        if self.browser_pool_size < 0:
+            raise ValueError(
+                f"Unsupported browser_pool_size '{self.browser_pool_size}'. "
+                "Must be 0 (disabled) or more."
+            )
+        if self.browser_recycle_after < 0:
+            raise ValueError(
+                f"Unsupported browser_recycle_after '{self.browser_recycle_after}'. "
+                "Must be 0 (never) or more."
+            )
+        if self.browser_recycle_after and not self.browser_pool_size:
+            raise ValueError(
+                "Unsupported browser_recycle_after without browser_pool_size. "
+                "Recycling needs a browser pool."
+            )
+        if self.max_pages_per_template is not None and self.max_pages_per_template < 1:
+            raise ValueError(
+                "Unsupported max_pages_per_template "
+                f"'{self.max_pages_per_template}'. Must be at least 1."
+            )
+        if self.rate_limit is not None and self.rate_limit <= 0:
+            raise ValueError(
+                f"Unsupported rate_limit '{self.rate_limit}'. Must be positive."
+            )
+        if self.rate_limit_burst < 1:
+            raise ValueError(
+                f"Unsupported rate_limit_burst '{self.rate_limit_burst}'. "
+                "Must be at least 1."
+            )
+        if self.host_concurrency is not None and self.host_concurrency < 1:
+            raise ValueError(
+                f"Unsupported host_concurrency '{self.host_concurrency}'. "
+                "Must be at least 1."
+            )
+        if self.throttle_retries < 0:
+            raise ValueError(
+                f"Unsupported throttle_retries '{self.throttle_retries}'. "
+                "Must be 0 or more."
+            )
+        if self.throttle_backoff_s < 0:
+            raise ValueError(
+                f"Unsupported throttle_backoff_s '{self.throttle_backoff_s}'. "
+                "Must be 0 or more."
+            )
+        if self.explore_actions < 0:
+            raise ValueError(
+                f"Unsupported explore_actions '{self.explore_actions}'. "
+                "Must be 0 (disabled) or more."
+            )
+        if self.explore_depth < 1:
+            raise ValueError(
+                f"Unsupported explore_depth '{self.explore_depth}'. Must be at least 1."
+            )
+        if self.max_nodes < 1:
+            raise ValueError(
+                f"Unsupported max_nodes '{self.max_nodes}'. Must be at least 1."
+            )
+        if self.time_budget_s is not None and self.time_budget_s <= 0:
+            raise ValueError(
+                f"Unsupported time_budget_s '{self.time_budget_s}'. Must be positive."
+            )
+        if self.page_latency_target_ms is not None and self.page_latency_target_ms <= 0:
+            raise ValueError(
+                "Unsupported page_latency_target_ms "
+                f"'{self.page_latency_target_ms}'. Must be positive."
+            )
+        if self.checkpoint_interval < 0:
+            raise ValueError(
+                f"Unsupported checkpoint_interval '{self.checkpoint_interval}'. "
+                "Must be 0 (disabled) or more."
+            )
+        if self.output_workers < 0:
+            raise ValueError(
+                f"Unsupported output_workers '{self.output_workers}'. "
+                "Must be 0 (inline) or more."
+            )
+        if self.output_queue_size < 1:
+            raise ValueError(
+                f"Unsupported output_queue_size '{self.output_queue_size}'. "
+                "Must be at least 1."
+            )
+        if self.processes < 1:
+            raise ValueError(
+                f"Unsupported processes '{self.processes}'. Must be at least 1."
+            )
+        if self.host_concurrency is not None and self.host_concurrency < self.processes:
+            raise ValueError(
+                f"Unsupported host_concurrency '{self.host_concurrency}' with "
+                f"processes '{self.processes}'. Each process needs at least one "
+                "navigation slot per host."
+            )
+        if self.browser_adapter == "replay" and self.replay_archive is None:
+            raise ValueError(
+                "Unsupported replay adapter without replay_archive. "
+                "Record one with record_replay first."
+            )
+        if self.record_replay is not None and self.browser_adapter == "replay":
+            raise ValueError(
+                "Unsupported record_replay with the replay adapter. "
+                "Record a live adapter instead."
+            )
+        if self.synthetic_site is not None and self.browser_adapter != "mock":
+            raise ValueError(
+                "Unsupported synthetic_site with the "
+                f"'{self.browser_adapter}' adapter. Generated sites need the mock adapter."
+            )
+        if self.record_replay is not None and self.processes > 1:
+            raise ValueError(
+                "Unsupported record_replay with processes > 1. "
+                "Record with a single process."
+            )
@@ -51,3 +51,30 @@ class PageModel:
 
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PageModel:
+        sections = [
+            SectionModel(
+                name=section["name"],
+                elements=[
+                    ElementModel(
+                        **{
+                            **element,
+                            "source": SourceEvidence(**element.get("source", {})),
+                        }
+                    )
+                    for element in section.get("elements", [])
+                ],
+            )
+            for section in data.get("sections", [])
+        ]
+        return cls(
+            **{
+                **data,
+                "sections": sections,
+                "actions": [
+                    ActionModel(**action) for action in data.get("actions", [])
+                ],
+            }
+        )
@@ -1,27 +1,95 @@
 from __future__ import annotations
 
+from autopom.browser.async_adapter import AsyncBrowserAdapter
 from autopom.browser.browseruse_adapter import BrowserAdapter
-from autopom.extraction.schema import PageModel
+from autopom.extraction.schema import ElementModel, PageModel
 
 
 class SelectorVerifier:
-    def __init__(self, browser: BrowserAdapter) -> None:
+    """
+    Checks each element's selector, then its fallbacks, and adjusts its
+    confidence. A `visibility` map from `snapshot()` answers checks without
+    a browser round trip; the rest go to `are_visible()` in at most two
+    batches, one for primary selectors and one for the fallbacks of those
+    that failed.
+    """
+
+    def __init__(self, browser: BrowserAdapter | AsyncBrowserAdapter) -> None:
         self.browser = browser
 
-    def verify_and_heal(self, page_model: PageModel) -> None:
-        for section in page_model.sections:
-            for element in section.elements:
-                if self.browser.is_visible(element.selector):
-                    element.confidence = min(0.99, element.confidence + 0.05)
-                    continue
-
-                healed = False
-                for candidate in element.fallback_selectors:
-                    if self.browser.is_visible(candidate):
-                        element.selector = candidate
-                        element.confidence = min(0.95, element.confidence + 0.02)
-                        healed = True
-                        break
-
-                if not healed:
-                    element.confidence = max(0.3, element.confidence - 0.2)
+    def verify_and_heal(
+        self, page_model: PageModel, visibility: dict[str, bool] | None = None
+    ) -> None:
+        elements = _elements(page_model)
+        known = dict(visibility or {})
+        self._resolve([element.selector for element in elements], known)
+        self._resolve(_fallbacks_to_check(elements, known), known)
+        for element in elements:
+            _heal(element, known)
+
+    async def averify_and_heal(
+        self, page_model: PageModel, visibility: dict[str, bool] | None = None
+    ) -> None:
+        elements = _elements(page_model)
+        known = dict(visibility or {})
+        await self._aresolve([element.selector for element in elements], known)
+        await self._aresolve(_fallbacks_to_check(elements, known), known)
+        for element in elements:
+            _heal(element, known)
+
+    def _resolve(self, selectors: list[str], known: dict[str, bool]) -> None:
+        pending = _unknown(selectors, known)
+        if pending:
+            known.update(zip(pending, self.browser.are_visible(pending)))
+
+    async def _aresolve(self, selectors: list[str], known: dict[str, bool]) -> None:
+        pending = _unknown(selectors, known)
+        if pending:
+            known.update(zip(pending, await self.browser.are_visible(pending)))
+
+
+def _elements(page_model: PageModel) -> list[ElementModel]:
+    return [element for section in page_model.sections for element in section.elements]
+
+
+def _unknown(selectors: list[str], known: dict[str, bool]) -> list[str]:
+    return [selector for selector in dict.fromkeys(selectors) if selector not in known]
+
+
+def _fallbacks_to_check(
+    elements: list[ElementModel], known: dict[str, bool]
+) -> list[str]:
+    """Fallbacks of failed primaries, up to one already known to be visible."""
+    candidates: list[str] = []
+    for element in elements:
+        if known[element.selector]:
+            continue
+        for candidate in element.fallback_selectors:
+            if known.get(candidate):
+                break
+            candidates.append(candidate)
+    return candidates
+
+
+def _heal(element: ElementModel, known: dict[str, bool]) -> None:
+    if known[element.selector]:
+        _promote_primary(element)
+        return
+    for candidate in element.fallback_selectors:
+        if known[candidate]:
+            _promote_fallback(element, candidate)
+            return
+    _demote(element)
+
+
+def _promote_primary(element: ElementModel) -> None:
+    element.confidence = min(0.99, element.confidence + 0.05)
+
+
+def _promote_fallback(element: ElementModel, candidate: str) -> None:
+    element.selector = candidate
+    element.confidence = min(0.95, element.confidence + 0.02)
+
+
+def _demote(element: ElementModel) -> None:
+    element.confidence = max(0.3, element.confidence - 0.2)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+CHECKPOINT_FILENAME = "crawl_checkpoint.json"
+CHECKPOINT_VERSION = 1
+
+
+def write_json_atomic(path: Path, payload: dict) -> Path:
+    """
+    Write a sibling temp file and rename it over `path`, so a crash mid-write
+    never leaves a truncated file behind.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.stem}-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return path
+
+
+class CheckpointStore:
+    """Atomic on-disk copy of `CrawlState.snapshot()` for `--resume`."""
+
+    def __init__(self, output_dir: Path) -> None:
+        self.output_dir = output_dir
+        self.path = output_dir / CHECKPOINT_FILENAME
+
+    def write(self, base_url: str, snapshot: dict) -> Path:
+        payload = {
+            "version": CHECKPOINT_VERSION,
+            "base_url": base_url,
+            "state": snapshot,
+        }
+        return write_json_atomic(self.path, payload)
+
+    def load(self, base_url: str) -> dict | None:
+        """Return the saved state snapshot, or None when there is no checkpoint."""
+        if not self.path.exists():
+            return None
+        with self.path.open(encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported checkpoint version '{payload.get('version')}' "
+                f"in {self.path}. Expected: {CHECKPOINT_VERSION}."
+            )
+        if payload["base_url"] != base_url:
+            raise ValueError(
+                f"Checkpoint {self.path} was written for '{payload['base_url']}', "
+                f"not '{base_url}'. Use another --output-dir or drop --resume."
+            )
+        return payload["state"]
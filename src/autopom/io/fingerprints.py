@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+from autopom.io.checkpoint import write_json_atomic
+
+FINGERPRINTS_FILENAME = "page_fingerprints.json"
+PAGE_CHANGE_KINDS = ("changed", "added", "removed", "unchanged")
+
+
+class FingerprintManifest:
+    """
+    Per-page content hashes of the last run, keyed by normalized URL:
+    `{url: {"content_hash": ..., "page_name": ...}}`. `--incremental`
+    compares against it to skip pages whose DOM did not change.
+    """
+
+    def __init__(self, output_dir: Path) -> None:
+        self.output_dir = output_dir
+        self.path = output_dir / FINGERPRINTS_FILENAME
+
+    def load(self) -> dict[str, dict]:
+        if not self.path.exists():
+            return {}
+        with self.path.open(encoding="utf-8") as f:
+            return json.load(f)
+
+    def write(self, fingerprints: dict[str, dict]) -> Path:
+        return write_json_atomic(self.path, fingerprints)
+
+
+def page_content_hash(dom_summary: dict) -> str:
+    """
+    Hash of what a page model is built from: the (role, label, selector) of
+    every element, in any order, and the page's links. Unlike the dedupe
+    signature it changes when a label does, even if the element count holds.
+    """
+    elements = sorted(
+        (element.get("role", ""), element.get("label", ""), element.get("selector", ""))
+        for element in dom_summary.get("elements", [])
+    )
+    payload = json.dumps(
+        [elements, sorted(dom_summary.get("links", []))], separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def diff_page_fingerprints(
+    previous: dict[str, dict],
+    current: dict[str, dict],
+    *,
+    complete: bool,
+) -> dict[str, list[dict]]:
+    """
+    Classify pages against the previous run. A page only counts as removed
+    when the crawl drained its frontier; a budget-capped crawl may simply not
+    have reached it.
+    """
+    changes: dict[str, list[dict]] = {kind: [] for kind in PAGE_CHANGE_KINDS}
+    for url, entry in sorted(current.items()):
+        before = previous.get(url)
+        if before is None:
+            kind = "added"
+        elif before.get("content_hash") == entry["content_hash"]:
+            kind = "unchanged"
+        else:
+            kind = "changed"
+        changes[kind].append({"url": url, "page_name": entry["page_name"]})
+    if complete:
+        changes["removed"] = [
+            {"url": url, "page_name": entry["page_name"]}
+            for url, entry in sorted(previous.items())
+            if url not in current
+        ]
+    return changes
+
+
+def merge_page_fingerprints(
+    previous: dict[str, dict],
+    current: dict[str, dict],
+    *,
+    complete: bool,
+) -> dict[str, dict]:
+    """Next run's baseline; pages an incomplete crawl did not reach are kept."""
+    if complete:
+        return dict(current)
+    return {**previous, **current}
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from autopom.stats import max_stats, sum_stats
+
+
+class OutputPipeline:
+    """
+    Bounded background executor for page persistence and code generation.
+    `submit` blocks once `max_pending` tasks are queued or running, so the
+    crawl never runs more than that many pages ahead of the disk.
+    With `workers=0` tasks run inline on the caller's thread.
+    """
+
+    def __init__(self, workers: int = 1, max_pending: int = 16) -> None:
+        self.workers = workers
+        self._executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="autopom-output")
+            if workers
+            else None
+        )
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._idle = threading.Condition()
+        self._pending = 0
+        self._errors: list[BaseException] = []
+        self.tasks = 0
+        self.peak_pending = 0
+        self.busy_seconds = 0.0
+        self.backpressure_seconds = 0.0
+
+    @property
+    def error(self) -> BaseException | None:
+        with self._idle:
+            return self._errors[0] if self._errors else None
+
+    def submit(self, task: Callable[..., object], *args: object) -> None:
+        started = time.perf_counter()
+        self._slots.acquire()
+        waited = time.perf_counter() - started
+        with self._idle:
+            self._pending += 1
+            self.tasks += 1
+            self.peak_pending = max(self.peak_pending, self._pending)
+            self.backpressure_seconds += waited
+        if self._executor is None:
+            self._run(task, args)
+        else:
+            self._executor.submit(self._run, task, args)
+
+    def _run(self, task: Callable[..., object], args: tuple) -> None:
+        started = time.perf_counter()
+        try:
+            task(*args)
+        except BaseException as exc:
+            with self._idle:
+                self._errors.append(exc)
+            # Inline tasks fail the caller; a worker thread's future drops it.
+            raise
+        finally:
+            with self._idle:
+                self._pending -= 1
+                self.busy_seconds += time.perf_counter() - started
+                self._idle.notify_all()
+            self._slots.release()
+
+    def wait_idle(self) -> None:
+        """Block until every submitted task has finished."""
+        with self._idle:
+            while self._pending:
+                self._idle.wait()
+
+    def close(self) -> dict:
+        """Flush outstanding work, stop the workers and return pipeline stats."""
+        started = time.perf_counter()
+        self.wait_idle()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        return {
+            "output_tasks": self.tasks,
+            "output_peak_pending": self.peak_pending,
+            "output_busy_seconds": round(self.busy_seconds, 3),
+            "output_backpressure_seconds": round(self.backpressure_seconds, 3),
+            "output_flush_seconds": round(time.perf_counter() - started, 3),
+        }
+
+    @classmethod
+    def merge(cls, stats_list: list[dict]) -> dict:
+        """Combine the `close()` stats of crawl shards' pipelines."""
+        return {
+            **sum_stats(
+                stats_list,
+                ["output_tasks", "output_busy_seconds", "output_backpressure_seconds"],
+            ),
+            **max_stats(stats_list, ["output_peak_pending", "output_flush_seconds"]),
+        }
@@ -17,3 +17,11 @@ class Persistence:
         with target.open("w", encoding="utf-8") as f:
             json.dump(page.to_dict(), f, indent=2)
         return target
+
+    def load_page_models(self) -> list[tuple[PageModel, Path]]:
+        """Read back every model already in `models_json`, e.g. when resuming."""
+        models = []
+        for path in sorted(self.models_dir.glob("*.json")):
+            with path.open(encoding="utf-8") as f:
+                models.append((PageModel.from_dict(json.load(f)), path))
+        return models
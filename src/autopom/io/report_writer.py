@@ -10,8 +10,13 @@ class ReportWriter:
         self.output_dir = output_dir
         self.report_dir = output_dir / "reports"
         self.report_dir.mkdir(parents=True, exist_ok=True)
+        self.summary_path = self.report_dir / "crawl_summary.md"
 
-    def write_summary(self, pages: list[PageModel]) -> Path:
+    def write_summary(
+        self,
+        pages: list[PageModel],
+        changes: dict[str, list[dict]] | None = None,
+    ) -> Path:
         total_elements = sum(
             len(section.elements) for p in pages for section in p.sections
         )
@@ -28,6 +33,20 @@ class ReportWriter:
             f"- Elements mapped: {total_elements}",
             f"- Average selector confidence: {avg_confidence:.2f}",
         ]
-        target = self.report_dir / "crawl_summary.md"
-        target.write_text("\n".join(lines), encoding="utf-8")
-        return target
+        if changes is not None:
+            lines.extend(
+                [
+                    f"- Unchanged pages skipped: {len(changes['unchanged'])}",
+                    "",
+                    "## Changes Since Previous Run",
+                ]
+            )
+            for kind in ("changed", "added", "removed"):
+                lines.extend(
+                    ["", f"### {kind.capitalize()} ({len(changes[kind])})", ""]
+                )
+                lines.extend(
+                    f"- {page['page_name']}: {page['url']}" for page in changes[kind]
+                )
+        self.summary_path.write_text("\n".join(lines), encoding="utf-8")
+        return self.summary_path
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+from urllib.request import Request, urlopen
+from xml.etree import ElementTree
+
+SEED_FETCH_TIMEOUT_S = 30
+# Sitemap indexes may nest; deeper chains are almost certainly loops.
+MAX_SITEMAP_DEPTH = 3
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def load_seed_urls(source: str, base_url: str) -> list[str]:
+    """
+    URLs listed by a seed source: a `sitemap.xml` (file path or http(s) URL,
+    gzipped or not, sitemap indexes followed) or a plain text list with one
+    URL per line (`#` comments allowed). Relative URLs resolve against
+    `base_url`. Duplicates are dropped; order is kept.
+    """
+    urls: list[str] = []
+    _collect(source, base_url, urls, set(), depth=0)
+    return list(dict.fromkeys(urls))
+
+
+def _collect(
+    source: str, base_url: str, urls: list[str], visited: set[str], depth: int
+) -> None:
+    if source in visited or depth > MAX_SITEMAP_DEPTH:
+        return
+    visited.add(source)
+    text = _read(source)
+    if not text.lstrip().startswith("<"):
+        for line in text.splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                urls.append(urljoin(base_url, line))
+        return
+    try:
+        root = ElementTree.fromstring(text)
+    except ElementTree.ParseError as exc:
+        raise ValueError(f"Unsupported seed source '{source}': {exc}.") from None
+    kind = _local_name(root.tag)
+    if kind not in ("urlset", "sitemapindex"):
+        raise ValueError(
+            f"Unsupported seed source '{source}'. "
+            "Allowed: <urlset> or <sitemapindex> sitemaps, or one URL per line."
+        )
+    for loc in root.iter():
+        if _local_name(loc.tag) != "loc" or not (loc.text or "").strip():
+            continue
+        location = loc.text.strip()
+        if kind == "urlset":
+            urls.append(urljoin(base_url, location))
+        else:
+            _collect(
+                _resolve_child(source, location), base_url, urls, visited, depth + 1
+            )
+
+
+def _read(source: str) -> str:
+    try:
+        if urlparse(source).scheme in ("http", "https"):
+            request = Request(source, headers={"User-Agent": "AutoPOM-Agent"})
+            with urlopen(request, timeout=SEED_FETCH_TIMEOUT_S) as response:
+                data = response.read()
+        else:
+            data = Path(source).read_bytes()
+    except OSError as exc:
+        raise ValueError(f"Could not load seed source '{source}': {exc}.") from None
+    if data.startswith(GZIP_MAGIC):
+        data = gzip.decompress(data)
+    return data.decode("utf-8-sig", errors="replace")
+
+
+def _resolve_child(parent: str, location: str) -> str:
+    """Child sitemaps of a local index may be paths relative to the index."""
+    if urlparse(location).scheme in ("http", "https"):
+        return location
+    if urlparse(parent).scheme in ("http", "https"):
+        return urljoin(parent, location)
+    return str(Path(parent).parent / location.removeprefix("file://"))
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
@@ -0,0 +1,33 @@
+"""
+Building blocks for the `merge()` classmethods of stats providers, which
+combine the stats of crawl shards into totals for the whole crawl.
+"""
+
+from __future__ import annotations
+
+
+def keys_with_prefix(stats_list: list[dict], prefixes: tuple[str, ...]) -> list[str]:
+    """Keys starting with one of `prefixes` in any of `stats_list`, sorted."""
+    return sorted(
+        {key for stats in stats_list for key in stats if key.startswith(prefixes)}
+    )
+
+
+def sum_stats(stats_list: list[dict], keys: list[str], digits: int = 3) -> dict:
+    return {
+        key: round(sum(stats.get(key, 0) for stats in stats_list), digits)
+        for key in keys
+    }
+
+
+def max_stats(stats_list: list[dict], keys: list[str]) -> dict:
+    """Maximum of each key over the shards that report it."""
+    return {
+        key: max(stats[key] for stats in stats_list if key in stats)
+        for key in keys
+        if any(key in stats for stats in stats_list)
+    }
+
+
+def avg_ms(seconds: float, count: int, digits: int = 1) -> float:
+    return round(seconds * 1000 / count, digits) if count else 0.0
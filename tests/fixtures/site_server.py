@@ -0,0 +1,265 @@
+"""
+Localhost fixture site for end-to-end crawl benchmarks.
+
+Serves a `SyntheticSite` as static HTML, plus a small client-rendered app
+under `/app/` whose router swaps views with `history.pushState`. Every
+response can be delayed by `latency_ms`, and the app renders each view
+`render_delay_ms` after navigation, so settle logic has something to wait
+for. Run it standalone to point the CLI at it:
+
+    PYTHONPATH=src python -m tests.fixtures.site_server --site pages=500 --latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from autopom.browser.synthetic_site import SiteSpec, SyntheticSite
+
+APP_PREFIX = "/app/"
+APP_SCRIPT_PATH = "/static/app.js"
+BENCHMARK_STAT_PREFIXES = ("stage_", "settle_", "extract_")
+
+APP_SCRIPT = """
+(() => {
+  const root = document.getElementById("root");
+  const render = () => {
+    const view = VIEWS[location.pathname] || VIEWS["/app/"];
+    setTimeout(() => {
+      document.title = view.title;
+      root.innerHTML = view.html;
+    }, RENDER_DELAY_MS);
+  };
+  document.addEventListener("click", (event) => {
+    const link = event.target.closest("a[href^='/app/']");
+    if (!link) return;
+    event.preventDefault();
+    history.pushState(null, "", link.getAttribute("href"));
+    render();
+  });
+  window.addEventListener("popstate", render);
+  render();
+})();
+"""
+
+
+def render_elements(elements: list[dict], hidden: frozenset[str]) -> str:
+    """HTML for generated elements; the extraction script derives its own selectors."""
+    parts = []
+    for number, element in enumerate(elements, start=1):
+        label = escape(element["label"])
+        slug = escape(element["label"].lower().replace(" ", "-"))
+        attrs = " hidden" if element["selector"] in hidden else ""
+        role = element["role"]
+        if role == "textbox":
+            parts.append(f'<input name="{slug}" placeholder="{label}"{attrs}>')
+        elif role == "button":
+            parts.append(f"<button{attrs}>{label}</button>")
+        elif role == "link":
+            parts.append(f'<a id="{slug}" href="#{slug}"{attrs}>{label}</a>')
+        elif role == "checkbox":
+            parts.append(
+                f'<label{attrs}><input type="checkbox" id="el-{number}"> {label}</label>'
+            )
+        elif role == "combobox":
+            parts.append(
+                f'<select id="el-{number}" aria-label="{label}"{attrs}>'
+                "<option>One</option><option>Two</option></select>"
+            )
+        else:
+            parts.append(
+                f'<div role="{role}" id="el-{number}" tabindex="0"{attrs}>{label}</div>'
+            )
+    return "\n".join(parts)
+
+
+@dataclass(slots=True)
+class FixtureSiteServer:
+    """`with FixtureSiteServer(spec) as base_url:` serves the site on a free port."""
+
+    spec: SiteSpec = field(default_factory=lambda: SiteSpec(pages=50))
+    # Client-rendered views under /app/ (0 serves no app).
+    app_views: int = 5
+    latency_ms: float = 0.0
+    render_delay_ms: float = 0.0
+    host: str = "127.0.0.1"
+    port: int = 0
+    requests: int = field(init=False, default=0)
+    _server: ThreadingHTTPServer | None = field(init=False, default=None)
+    _site: SyntheticSite | None = field(init=False, default=None)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def page_count(self) -> int:
+        """Distinct pages a complete crawl models: static pages plus app views."""
+        return self.spec.pages + (self.app_views + 1 if self.app_views else 0)
+
+    def start(self) -> str:
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                fixture._serve(self)
+
+            def log_message(self, format: str, *args: object) -> None:
+                return None
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self._site = SyntheticSite(self.spec, self.base_url)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.base_url
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> str:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _serve(self, handler: BaseHTTPRequestHandler) -> None:
+        with self._lock:
+            self.requests += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        path = urlparse(handler.path).path
+        status, content_type = 200, "text/html; charset=utf-8"
+        if path == APP_SCRIPT_PATH and self.app_views:
+            content_type = "text/javascript; charset=utf-8"
+            body = self._app_script()
+        elif path.startswith(APP_PREFIX) and self.app_views:
+            body = (
+                "<!doctype html><html><head><title>App</title></head><body>"
+                f'<div id="root"></div><script src="{APP_SCRIPT_PATH}"></script>'
+                "</body></html>"
+            )
+        elif (index := self._site.resolve(path)) is not None and path == urlparse(
+            self._site.page_url(index)
+        ).path:
+            body = self._page_html(index)
+        elif index is not None:
+            # `/go/<n>` aliases redirect to the page's canonical URL.
+            handler.send_response(302)
+            handler.send_header("Location", self._site.page_url(index))
+            handler.send_header("Content-Length", "0")
+            handler.end_headers()
+            return
+        else:
+            status, body = (
+                404,
+                "<!doctype html><title>Not Found</title><h1>Not Found</h1>",
+            )
+        data = body.encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _page_html(self, index: int) -> str:
+        page = self._site.page(self._site.page_url(index))
+        links = [urlparse(link) for link in page.summary["links"]]
+        nav = [
+            f'<a href="{escape(link.path + ("?" + link.query if link.query else ""))}">'
+            f"Page {position}</a>"
+            for position, link in enumerate(links, start=1)
+        ]
+        if index == 0 and self.app_views:
+            nav.append(f'<a href="{APP_PREFIX}">App</a>')
+        return (
+            f"<!doctype html><html><head><title>{escape(page.title)}</title></head>"
+            f"<body><header><nav>{''.join(nav)}</nav></header><main>"
+            f"{render_elements(page.summary['elements'], page.hidden)}"
+            "</main><footer>Synthetic fixture</footer></body></html>"
+        )
+
+    def _app_script(self) -> str:
+        views = {}
+        for number in range(self.app_views + 1):
+            path = APP_PREFIX if number == 0 else f"{APP_PREFIX}view/{number}"
+            nav = "".join(
+                f'<a href="{APP_PREFIX}view/{target}">View {target}</a>'
+                for target in range(1, self.app_views + 1)
+                if target != number
+            )
+            elements = [
+                {"role": role, "label": f"{word} {number}", "selector": ""}
+                for role, word in (
+                    ("textbox", "Search"),
+                    ("button", "Apply"),
+                    ("tab", "Overview"),
+                    ("checkbox", "Subscribe"),
+                )
+            ]
+            views[path] = {
+                "title": "App Home" if number == 0 else f"App View {number}",
+                "html": f"<nav>{nav}<a href='/'>Home</a></nav><main>"
+                f"{render_elements(elements, frozenset())}</main>",
+            }
+        return (
+            f"const VIEWS = {json.dumps(views)};\n"
+            f"const RENDER_DELAY_MS = {self.render_delay_ms};\n{APP_SCRIPT}"
+        )
+
+
+def benchmark_summary(stats: dict) -> dict:
+    """Throughput and per-stage latency from a crawl's stats, for result files."""
+    return {
+        "pages_per_second": stats.get("pages_per_second"),
+        "crawl_seconds": stats.get("crawl_seconds"),
+        **{
+            key: value
+            for key, value in sorted(stats.items())
+            if key.startswith(BENCHMARK_STAT_PREFIXES)
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--site",
+        type=SiteSpec.parse,
+        default=SiteSpec(pages=50),
+        help="Synthetic site spec, as for --synthetic-site",
+    )
+    parser.add_argument("--app-views", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--render-delay-ms", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    server = FixtureSiteServer(
+        spec=args.site,
+        app_views=args.app_views,
+        latency_ms=args.latency_ms,
+        render_delay_ms=args.render_delay_ms,
+        port=args.port,
+    )
+    print(f"Serving fixture site at {server.start()} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from autopom.agent.orchestrator import AutoPomOrchestrator
+from autopom.browser.browseruse_adapter import create_browser_adapter
+from autopom.browser.http_adapter import HttpBrowserAdapter
+from autopom.browser.synthetic_site import SiteSpec
+from autopom.config import CrawlConfig
+from tests.fixtures.site_server import FixtureSiteServer, benchmark_summary
+
+# Set to a file path to keep the Playwright benchmark results as JSON.
+RESULTS_ENV = "AUTOPOM_BENCHMARK_RESULTS"
+# (extraction_engine, incremental_extraction) pairs the benchmark compares.
+BENCHMARK_VARIANTS = (("js", False), ("js", True), ("cdp", False))
+
+
+def _chromium_unavailable_reason() -> str | None:
+    try:
+        from playwright.sync_api import Error, sync_playwright
+    except ImportError:
+        return "playwright is not installed"
+    try:
+        with sync_playwright() as playwright:
+            playwright.chromium.launch().close()
+    except Error as exc:
+        return f"chromium cannot launch: {str(exc).splitlines()[0]}"
+    return None
+
+
+class TestFixtureSiteBenchmark(unittest.TestCase):
+    def test_http_adapter_crawls_the_fixture_site(self) -> None:
+        server = FixtureSiteServer(
+            spec=SiteSpec(pages=40, fan_out=3, duplicate_ratio=0.3, seed=5),
+            app_views=3,
+            latency_ms=5,
+        )
+        with server as base_url, tempfile.TemporaryDirectory() as tmp_dir:
+            browser = HttpBrowserAdapter(base_url=base_url)
+            config = CrawlConfig(
+                base_url=base_url,
+                output_dir=Path(tmp_dir),
+                max_depth=20,
+                max_pages=200,
+            )
+            try:
+                result = AutoPomOrchestrator(config=config, browser=browser).run()
+            finally:
+                browser.close()
+
+            # Without a browser to escalate to, the app shell is modeled as served.
+            self.assertEqual(len(result.pages), 41)
+            self.assertEqual(result.stats["http_unrendered_spa_root"], 1)
+            self.assertGreater(result.stats["duplicate_hits"], 0)
+            summary = benchmark_summary(result.stats)
+            self.assertGreater(summary["pages_per_second"], 0)
+            self.assertGreaterEqual(summary["stage_navigate_avg_ms"], 5)
+            # Alias redirects are navigated and read, then deduped by signature.
+            self.assertEqual(
+                summary["stage_snapshot_calls"], summary["stage_navigate_calls"]
+            )
+            self.assertEqual(summary["stage_model_calls"], 41)
+
+    def test_playwright_end_to_end_benchmark(self) -> None:
+        reason = _chromium_unavailable_reason()
+        if reason is not None:
+            self.skipTest(reason)
+        server = FixtureSiteServer(
+            spec=SiteSpec(pages=60, fan_out=4, duplicate_ratio=0.1, seed=3),
+            app_views=5,
+            latency_ms=10,
+            render_delay_ms=50,
+        )
+        results = {}
+        with server as base_url, tempfile.TemporaryDirectory() as tmp_dir:
+            for engine, incremental in BENCHMARK_VARIANTS:
+                name = f"{engine}{'-incremental' if incremental else ''}"
+                config = CrawlConfig(
+                    base_url=base_url,
+                    output_dir=Path(tmp_dir) / name,
+                    max_depth=20,
+                    max_pages=500,
+                    browser_adapter="playwright",
+                    extraction_engine=engine,
+                    incremental_extraction=incremental,
+                )
+                browser = create_browser_adapter(
+                    "playwright",
+                    base_url,
+                    extraction_engine=engine,
+                    incremental_extraction=incremental,
+                )
+                try:
+                    result = AutoPomOrchestrator(config=config, browser=browser).run()
+                finally:
+                    browser.close()
+
+                self.assertEqual(len(result.pages), server.page_count, name)
+                results[name] = benchmark_summary(result.stats)
+
+        results_path = os.environ.get(RESULTS_ENV)
+        if results_path:
+            Path(results_path).write_text(json.dumps(results, indent=2), "utf-8")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,48 +1,1139 @@
+import asyncio
+import functools
 import json
-from pathlib import Path
 import tempfile
+import threading
+import time
 import unittest
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+from urllib.parse import urlparse
+
+from autopom.agent.orchestrator import AutoPomOrchestrator, initial_crawl_state
+from autopom.agent.sharding import run_sharded
+from autopom.browser.async_adapter import AsyncMockBrowserUseAdapter
+from autopom.browser.browseruse_adapter import MockBrowserUseAdapter
+from autopom.browser.http_adapter import HttpBrowserAdapter
+from autopom.browser.replay_adapter import (
+    RecordingBrowserAdapter,
+    ReplayArchive,
+    ReplayBrowserAdapter,
+)
+from autopom.browser.resource_blocking import ResourceBlocker
+from autopom.browser.synthetic_site import SiteSpec, SyntheticSite
+from autopom.config import CrawlConfig
+from autopom.io.persistence import Persistence
+
+
+class TestOrchestratorIntegration(unittest.TestCase):
+    def test_end_to_end_run_generates_expected_artifacts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = Path(tmp_dir)
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=output_dir,
+                max_depth=2,
+                max_pages=5,
+            )
+            orchestrator = AutoPomOrchestrator(
+                config=config,
+                browser=MockBrowserUseAdapter(base_url=config.base_url),
+            )
+
+            result = orchestrator.run()
+
+            self.assertEqual(len(result.pages), 3)
+            self.assertTrue(result.report_path.exists())
+            self.assertTrue((output_dir / "java" / "base" / "BasePage.java").exists())
+            self.assertTrue((output_dir / "java" / "pages" / "LoginPage.java").exists())
+            self.assertTrue((output_dir / "models_json" / "LoginPage.json").exists())
+
+            login_page_json = json.loads(
+                (output_dir / "models_json" / "LoginPage.json").read_text(
+                    encoding="utf-8"
+                )
+            )
+            self.assertEqual(login_page_json["page_name"], "LoginPage")
+            self.assertEqual(len(login_page_json["actions"]), 1)
+            self.assertEqual(login_page_json["actions"][0]["name"], "login")
+
+            report_content = result.report_path.read_text(encoding="utf-8")
+            self.assertIn("Pages modeled: 3", report_content)
+            self.assertIn("Elements mapped:", report_content)
+
+    def test_revisited_links_are_skipped_before_navigation(self) -> None:
+        class CountingBrowser(MockBrowserUseAdapter):
+            navigations: ClassVar[list[str]] = []
+
+            def goto(self, url: str) -> None:
+                self.navigations.append(url)
+                super().goto(url)
+
+        events: list[tuple[str, dict]] = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                max_pages=10,
+            )
+            orchestrator = AutoPomOrchestrator(
+                config=config,
+                browser=CountingBrowser(base_url=config.base_url),
+                progress_hook=lambda event, payload: events.append((event, payload)),
+            )
+
+            result = orchestrator.run()
+
+            self.assertEqual(len(result.pages), 3)
+            self.assertEqual(
+                CountingBrowser.navigations.count("https://example.com/login"), 1
+            )
+            self.assertEqual(orchestrator.state.duplicate_hits, 0)
+            deduped = sum(p["links_deduped"] for e, p in events if e == "modeled")
+            self.assertEqual(deduped, 1)
+
+    def test_pages_are_read_with_one_snapshot_call(self) -> None:
+        class SnapshotBrowser(MockBrowserUseAdapter):
+            calls: ClassVar[list[str]] = []
+
+            def snapshot(self, max_nodes: int = 120) -> dict:
+                self.calls.append("snapshot")
+                summary = MockBrowserUseAdapter.extract_interactive_dom_summary(
+                    self, max_nodes
+                )
+                visibility = {
+                    element["selector"]: True for element in summary["elements"]
+                }
+                return {
+                    **summary,
+                    "url": super().url(),
+                    "title": "",
+                    "visibility": visibility,
+                }
+
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                self.calls.append("extract")
+                return super().extract_interactive_dom_summary(max_nodes)
+
+            def is_visible(self, selector: str, timeout_ms: int = 1500) -> bool:
+                self.calls.append("is_visible")
+                return True
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                max_pages=10,
+            )
+            result = AutoPomOrchestrator(
+                config=config, browser=SnapshotBrowser(base_url=config.base_url)
+            ).run()
+
+            self.assertEqual(len(result.pages), 3)
+            self.assertEqual(SnapshotBrowser.calls, ["snapshot"] * 3)
+            self.assertTrue(
+                all(
+                    element.confidence > 0.8
+                    for page in result.pages
+                    for section in page.sections
+                    for element in section.elements
+                )
+            )
+
+    def test_bloom_seen_set_crawl_reports_state_stats(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                max_pages=10,
+                seen_set="bloom",
+                seen_set_capacity=1_000,
+            )
+            orchestrator = AutoPomOrchestrator(
+                config=config,
+                browser=MockBrowserUseAdapter(base_url=config.base_url),
+            )
+
+            result = orchestrator.run()
+
+            self.assertEqual(len(result.pages), 3)
+            self.assertEqual(result.stats["seen_set"], "bloom")
+            self.assertEqual(result.stats["visited_signatures"], 3)
+
+    def test_priority_frontier_spends_budget_on_novel_pages(self) -> None:
+        class CatalogBrowser(MockBrowserUseAdapter):
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                summary = super().extract_interactive_dom_summary(max_nodes=max_nodes)
+                summary["fingerprint"] = f"catalog::{self.url()}"
+                summary["links"] = [
+                    *(f"https://example.com/list/{index}" for index in range(1, 20)),
+                    "https://example.com/signup",
+                ]
+                return summary
+
+        def crawl(frontier_strategy: str) -> list[str]:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                config = CrawlConfig(
+                    base_url="https://example.com",
+                    output_dir=Path(tmp_dir),
+                    max_depth=3,
+                    max_pages=3,
+                    frontier_strategy=frontier_strategy,
+                )
+                orchestrator = AutoPomOrchestrator(
+                    config=config,
+                    browser=CatalogBrowser(base_url=config.base_url),
+                )
+                return [page.route for page in orchestrator.run().pages]
+
+        self.assertNotIn("/signup", crawl("fifo"))
+        self.assertEqual(crawl("priority"), ["/", "/list/1", "/signup"])
+
+    def test_links_past_max_depth_do_not_hide_shallower_routes(self) -> None:
+        graph = {"/": ["/a", "/b"], "/a": ["/c"], "/c": ["/d"], "/b": ["/d"]}
+
+        class GraphBrowser(MockBrowserUseAdapter):
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                summary = super().extract_interactive_dom_summary(max_nodes=max_nodes)
+                path = urlparse(self.url()).path or "/"
+                summary["fingerprint"] = f"graph::{path}"
+                summary["links"] = [
+                    f"https://example.com{target}" for target in graph.get(path, [])
+                ]
+                return summary
+
+        def crawl(frontier_strategy: str) -> list[str]:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                config = CrawlConfig(
+                    base_url="https://example.com",
+                    output_dir=Path(tmp_dir),
+                    max_depth=2,
+                    frontier_strategy=frontier_strategy,
+                    # Deepest first: /c is visited before /b finds /d at depth 2.
+                    frontier_scorer=lambda item, signals: float(item.depth),
+                )
+                orchestrator = AutoPomOrchestrator(
+                    config=config, browser=GraphBrowser(base_url=config.base_url)
+                )
+                return sorted(page.route for page in orchestrator.run().pages)
+
+        for strategy in ("fifo", "priority"):
+            with self.subTest(strategy=strategy):
+                self.assertEqual(crawl(strategy), ["/", "/a", "/b", "/c", "/d"])
+
+    def test_template_instances_keep_their_own_models_without_a_limit(self) -> None:
+        class ProductCatalogBrowser(MockBrowserUseAdapter):
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                summary = super().extract_interactive_dom_summary(max_nodes=max_nodes)
+                summary["fingerprint"] = f"catalog::{self.url()}"
+                summary["links"] = ["https://example.com/product/1"]
+                if self.url().endswith("/product/1"):
+                    summary["links"] = ["https://example.com/product/2"]
+                return summary
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=2,
+            )
+            result = AutoPomOrchestrator(
+                config=config,
+                browser=ProductCatalogBrowser(base_url=config.base_url),
+            ).run()
+
+            self.assertEqual(
+                [page.page_name for page in result.pages],
+                ["HomePage", "Product1Page", "Product2Page"],
+            )
+            self.assertEqual(len(result.model_paths), 3)
+            self.assertEqual(len(result.pom_paths), 4)
+
+    def test_route_template_limit_models_one_page_per_template(self) -> None:
+        class ProductCatalogBrowser(MockBrowserUseAdapter):
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                summary = super().extract_interactive_dom_summary(max_nodes=max_nodes)
+                summary["fingerprint"] = f"catalog::{self.url()}"
+                summary["links"] = [
+                    f"https://example.com/product/{index}" for index in range(1, 30)
+                ]
+                return summary
+
+        events: list[tuple[str, dict]] = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=2,
+                max_pages=50,
+                max_pages_per_template=2,
+            )
+            orchestrator = AutoPomOrchestrator(
+                config=config,
+                browser=ProductCatalogBrowser(base_url=config.base_url),
+                progress_hook=lambda event, payload: events.append((event, payload)),
+            )
+            result = orchestrator.run()
+
+            self.assertEqual(
+                [page.route for page in result.pages],
+                ["/", "/product/1", "/product/2"],
+            )
+            self.assertEqual(
+                [page.page_name for page in result.pages[1:]],
+                ["ProductDetailPage", "ProductDetailPage"],
+            )
+            self.assertEqual(len(result.model_paths), 2)
+            self.assertEqual(len(result.pom_paths), 3)
+            self.assertEqual(result.stats["template_limit_hits"], 27)
+            self.assertTrue(
+                any(
+                    event == "skip" and payload["reason"] == "template_limit"
+                    for event, payload in events
+                )
+            )
+
+    def test_resume_continues_from_checkpoint_after_crash(self) -> None:
+        class CrashingBrowser(MockBrowserUseAdapter):
+            def goto(self, url: str) -> None:
+                if url.endswith("/forgot-password"):
+                    raise RuntimeError("browser crashed")
+                super().goto(url)
+
+        visited: list[str] = []
+
+        class RecordingBrowser(MockBrowserUseAdapter):
+            def goto(self, url: str) -> None:
+                visited.append(url)
+                super().goto(url)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                max_pages=10,
+                checkpoint_interval=1,
+            )
+            with self.assertRaises(RuntimeError):
+                AutoPomOrchestrator(
+                    config=config, browser=CrashingBrowser(base_url=config.base_url)
+                ).run()
+            self.assertTrue((Path(tmp_dir) / "crawl_checkpoint.json").exists())
+
+            config.resume = True
+            result = AutoPomOrchestrator(
+                config=config, browser=RecordingBrowser(base_url=config.base_url)
+            ).run()
+
+            self.assertEqual(visited, ["https://example.com/forgot-password"])
+            self.assertEqual(result.resumed_pages, 2)
+            self.assertEqual(
+                sorted(page.page_name for page in result.pages),
+                ["Forgot-passwordPage", "HomePage", "LoginPage"],
+            )
+            self.assertEqual(result.stats["resumed_pages"], 2)
+
+    def test_resume_without_checkpoint_replays_existing_models(self) -> None:
+        visited: list[str] = []
+
+        class RecordingBrowser(MockBrowserUseAdapter):
+            def goto(self, url: str) -> None:
+                visited.append(url)
+                super().goto(url)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                max_pages=2,
+                checkpoint_interval=0,
+            )
+            AutoPomOrchestrator(
+                config=config, browser=MockBrowserUseAdapter(base_url=config.base_url)
+            ).run()
+            self.assertFalse((Path(tmp_dir) / "crawl_checkpoint.json").exists())
+
+            config.max_pages = 10
+            config.resume = True
+            result = AutoPomOrchestrator(
+                config=config, browser=RecordingBrowser(base_url=config.base_url)
+            ).run()
+
+            self.assertEqual(visited, ["https://example.com/forgot-password"])
+            self.assertEqual(len(result.pages), 3)
+
+    def test_resume_replays_links_of_click_revealed_states(self) -> None:
+        class HelpPanelBrowser(MockBrowserUseAdapter):
+            """Home page whose Help button opens a panel linking to /help."""
+
+            panel = ""
+
+            def goto(self, url: str) -> None:
+                self.panel = ""
+                super().goto(url)
+
+            def click(self, selector: str) -> bool:
+                if selector != "#help":
+                    return False
+                self.panel = "help"
+                return True
+
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                summary = super().extract_interactive_dom_summary(max_nodes)
+                if urlparse(self.url()).path in ("", "/"):
+                    summary["elements"] = [
+                        *summary["elements"],
+                        {"role": "button", "label": "Help", "selector": "#help"},
+                    ]
+                    if self.panel:
+                        summary["links"] = [*summary["links"], f"{self.base_url}/help"]
+                summary["fingerprint"] += f"::{self.panel}"
+                return summary
+
+        visited: list[str] = []
+
+        class RecordingBrowser(HelpPanelBrowser):
+            def goto(self, url: str) -> None:
+                visited.append(url)
+                super().goto(url)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=1,
+                max_pages=2,
+                explore_actions=5,
+                checkpoint_interval=0,
+            )
+            AutoPomOrchestrator(
+                config=config, browser=HelpPanelBrowser(base_url=config.base_url)
+            ).run()
+
+            config.max_pages = 4
+            config.resume = True
+            result = AutoPomOrchestrator(
+                config=config, browser=RecordingBrowser(base_url=config.base_url)
+            ).run()
+
+            # The home page and its panel count once each, so two pages remain.
+            self.assertEqual(
+                visited, ["https://example.com/login", "https://example.com/help"]
+            )
+            self.assertEqual(
+                sorted(page.page_name for page in result.pages),
+                ["HelpPage", "HomeHelpViewPage", "HomePage", "LoginPage"],
+            )
+
+    def test_incremental_recrawl_only_models_changed_pages(self) -> None:
+        class RedesignedLoginBrowser(MockBrowserUseAdapter):
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                summary = super().extract_interactive_dom_summary(max_nodes=max_nodes)
+                if self.url().endswith("/login"):
+                    summary["fingerprint"] = "mock::/login::redesigned"
+                    summary["links"] = []
+                return summary
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                max_pages=10,
+            )
+            AutoPomOrchestrator(
+                config=config, browser=MockBrowserUseAdapter(base_url=config.base_url)
+            ).run()
+
+            config.incremental = True
+            result = AutoPomOrchestrator(
+                config=config,
+                browser=RedesignedLoginBrowser(base_url=config.base_url),
+            ).run()
+
+            self.assertEqual([page.page_name for page in result.pages], ["LoginPage"])
+            self.assertEqual(len(result.pom_paths), 2)
+            self.assertEqual(
+                {
+                    kind: [page["page_name"] for page in pages]
+                    for kind, pages in result.changes.items()
+                },
+                {
+                    "changed": ["LoginPage"],
+                    "added": [],
+                    "removed": ["Forgot-passwordPage"],
+                    "unchanged": ["HomePage"],
+                },
+            )
+            self.assertEqual(result.stats["unchanged_pages"], 1)
+            report = result.report_path.read_text(encoding="utf-8")
+            self.assertIn("### Removed (1)", report)
+            self.assertIn("- LoginPage: https://example.com/login", report)
+
+    def test_incremental_recrawl_detects_relabeled_elements(self) -> None:
+        class RelabeledLoginBrowser(MockBrowserUseAdapter):
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                summary = super().extract_interactive_dom_summary(max_nodes=max_nodes)
+                if self.url().endswith("/login"):
+                    # Same element count, hence the same fingerprint.
+                    summary["elements"][0] = {
+                        **summary["elements"][0],
+                        "label": "Sign in now",
+                    }
+                return summary
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                max_pages=10,
+            )
+            AutoPomOrchestrator(
+                config=config, browser=MockBrowserUseAdapter(base_url=config.base_url)
+            ).run()
+
+            config.incremental = True
+            result = AutoPomOrchestrator(
+                config=config,
+                browser=RelabeledLoginBrowser(base_url=config.base_url),
+            ).run()
+
+            self.assertEqual([page.page_name for page in result.pages], ["LoginPage"])
+            self.assertEqual(
+                [page["page_name"] for page in result.changes["changed"]],
+                ["LoginPage"],
+            )
+            self.assertEqual(result.stats["unchanged_pages"], 2)
+
+    def test_output_pipeline_flushes_all_pages_before_returning(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                max_pages=10,
+                output_workers=2,
+                output_queue_size=1,
+            )
+            result = AutoPomOrchestrator(
+                config=config, browser=MockBrowserUseAdapter(base_url=config.base_url)
+            ).run()
+
+            self.assertEqual(result.stats["output_tasks"], 3)
+            self.assertIn("output_flush_seconds", result.stats)
+            self.assertEqual(len(result.model_paths), 3)
+            self.assertTrue(all(path.exists() for path in result.model_paths))
+            self.assertTrue(all(path.exists() for path in result.pom_paths))
+
+    def test_output_pipeline_failure_fails_the_run(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                max_pages=10,
+            )
+            orchestrator = AutoPomOrchestrator(
+                config=config, browser=MockBrowserUseAdapter(base_url=config.base_url)
+            )
+
+            def fail_write(page_model):
+                raise OSError("disk full")
+
+            orchestrator.persistence.write_page_model = fail_write
+            with self.assertRaises(OSError):
+                orchestrator.run()
+
+    def test_settle_time_is_recorded_per_page(self) -> None:
+        class SettlingBrowser(MockBrowserUseAdapter):
+            last_settle_ms = 0.0
+
+            def goto(self, url: str) -> None:
+                super().goto(url)
+                self.last_settle_ms = 120.0 if url.endswith("/login") else 40.0
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                max_pages=10,
+            )
+            result = AutoPomOrchestrator(
+                config=config, browser=SettlingBrowser(base_url=config.base_url)
+            ).run()
+
+            self.assertEqual(result.settle_ms["https://example.com/login"], 120.0)
+            self.assertEqual(len(result.settle_ms), 3)
+            self.assertEqual(result.stats["settle_ms_max"], 120.0)
+            self.assertEqual(result.stats["settle_ms_total"], 200.0)
+
+    def test_slow_pages_degrade_extraction_to_meet_latency_target(self) -> None:
+        class SlowBrowser(MockBrowserUseAdapter):
+            node_limits: ClassVar[list[int]] = []
+            visibility_checks = 0
+
+            def goto(self, url: str) -> None:
+                time.sleep(0.03)
+                super().goto(url)
+
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                self.node_limits.append(max_nodes)
+                return super().extract_interactive_dom_summary(max_nodes=max_nodes)
+
+            def is_visible(self, selector: str, timeout_ms: int = 1500) -> bool:
+                SlowBrowser.visibility_checks += 1
+                return super().is_visible(selector, timeout_ms=timeout_ms)
+
+        events: list[tuple[str, dict]] = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                page_latency_target_ms=5,
+            )
+            browser = SlowBrowser(base_url=config.base_url)
+            result = AutoPomOrchestrator(
+                config=config,
+                browser=browser,
+                progress_hook=lambda event, payload: events.append((event, payload)),
+            ).run()
+
+            # Home is modeled in full; /login is then far over the target, so
+            # it is extracted shallowly without healing and depth 2 is dropped.
+            self.assertEqual(
+                [page.page_name for page in result.pages], ["HomePage", "LoginPage"]
+            )
+            self.assertEqual(browser.node_limits, [500, 120])
+            self.assertEqual(result.stats["budget_reduced_nodes_pages"], 1)
+            self.assertEqual(result.stats["budget_skipped_healing_pages"], 1)
+            self.assertEqual(result.stats["budget_skipped_deep_links"], 1)
+            self.assertIn(
+                (
+                    "skip",
+                    {
+                        "url": "https://example.com/forgot-password",
+                        "reason": "time_budget",
+                        "depth": 2,
+                    },
+                ),
+                events,
+            )
+
+    def test_time_budget_deadline_stops_claiming_new_pages(self) -> None:
+        class SlowBrowser(MockBrowserUseAdapter):
+            def goto(self, url: str) -> None:
+                time.sleep(0.05)
+                super().goto(url)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                time_budget_s=0.01,
+                checkpoint_interval=25,
+            )
+            result = AutoPomOrchestrator(
+                config=config, browser=SlowBrowser(base_url=config.base_url)
+            ).run()
+
+            self.assertEqual(len(result.pages), 1)
+            self.assertTrue(result.stats["budget_deadline_hit"])
+            # The unvisited frontier stays in the checkpoint for --resume.
+            checkpoint = json.loads(
+                (Path(tmp_dir) / "crawl_checkpoint.json").read_text(encoding="utf-8")
+            )
+            self.assertEqual(len(checkpoint["state"]["frontier"]), 1)
+
+    def test_explorer_models_click_revealed_states_and_prunes_known_ones(
+        self,
+    ) -> None:
+        class PanelBrowser(MockBrowserUseAdapter):
+            """Home page whose Filters button and Reviews tab open panels."""
+
+            panel = ""
+            goto_count = 0
+            clicks: ClassVar[list[str]] = []
+
+            def goto(self, url: str) -> None:
+                PanelBrowser.goto_count += 1
+                self.panel = ""
+                super().goto(url)
+
+            def click(self, selector: str) -> bool:
+                self.clicks.append(selector)
+                self.panel = {"#filters": "filters", "#reviews": "reviews"}.get(
+                    selector, ""
+                )
+                return True
+
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                summary = super().extract_interactive_dom_summary(max_nodes)
+                summary["elements"] = [
+                    *summary["elements"],
+                    {"role": "button", "label": "Filters", "selector": "#filters"},
+                    {"role": "tab", "label": "Reviews", "selector": "#reviews"},
+                ]
+                if self.panel == "filters":
+                    summary["elements"].append(
+                        {"role": "button", "label": "Close", "selector": "#close"}
+                    )
+                summary["fingerprint"] += f"::{self.panel}"
+                return summary
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=0,
+                explore_actions=5,
+                explore_depth=2,
+            )
+            result = AutoPomOrchestrator(
+                config=config, browser=PanelBrowser(base_url=config.base_url)
+            ).run()
+
+            self.assertEqual(
+                [page.page_name for page in result.pages],
+                ["HomePage", "HomeFiltersViewPage", "HomeReviewsViewPage"],
+            )
+            home = result.pages[0]
+            self.assertEqual(
+                [(action.name, action.post_condition) for action in home.actions],
+                [
+                    ("openFilters", "HomeFiltersViewPage"),
+                    ("openReviews", "HomeReviewsViewPage"),
+                ],
+            )
+            self.assertTrue(
+                (Path(tmp_dir) / "models_json" / "HomeFiltersViewPage.json").exists()
+            )
+            # Every click from a panel lands on an already-known state.
+            self.assertEqual(result.stats["explore_states"], 2)
+            self.assertEqual(result.stats["pruned_actions"], 5)
+            self.assertEqual(result.stats["action_edges"], 7)
+            # States are restored by replaying one click, never from the seed.
+            self.assertEqual(
+                result.stats["explore_restores"], PanelBrowser.goto_count - 1
+            )
+            self.assertEqual(
+                result.stats["explore_clicks"]
+                + result.stats["explore_replayed_clicks"],
+                len(PanelBrowser.clicks),
+            )
+
+    def test_throttled_reload_ends_exploration(self) -> None:
+        class ThrottledPanelBrowser(MockBrowserUseAdapter):
+            """Two tabs; every reload after the first load is throttled."""
+
+            panel = ""
+            last_retry_after_s = None
+            gotos = 0
+            clicks: ClassVar[list[str]] = []
+
+            @property
+            def last_status(self) -> int:
+                return 429 if self.gotos > 1 else 200
+
+            def goto(self, url: str) -> None:
+                self.gotos += 1
+                self.panel = ""
+                super().goto(url)
+
+            def click(self, selector: str) -> bool:
+                self.clicks.append(selector)
+                self.panel = selector
+                return True
+
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                summary = super().extract_interactive_dom_summary(max_nodes)
+                summary["elements"] = [
+                    *summary["elements"],
+                    {"role": "tab", "label": "Specs", "selector": "#specs"},
+                    {"role": "tab", "label": "Reviews", "selector": "#reviews"},
+                ]
+                summary["fingerprint"] += f"::{self.panel}"
+                return summary
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=0,
+                explore_actions=5,
+                rate_limit=100,
+                throttle_retries=0,
+            )
+            result = AutoPomOrchestrator(
+                config=config,
+                browser=ThrottledPanelBrowser(base_url=config.base_url),
+            ).run()
 
-from autopom.agent.orchestrator import AutoPomOrchestrator
-from autopom.browser.browseruse_adapter import MockBrowserUseAdapter
-from autopom.config import CrawlConfig
+            # Restoring the home page for the second tab was throttled, so
+            # nothing is clicked on whatever the browser is showing instead.
+            self.assertEqual(
+                [page.page_name for page in result.pages],
+                ["HomePage", "HomeSpecsViewPage"],
+            )
+            self.assertEqual(ThrottledPanelBrowser.clicks, ["#specs"])
 
+    def test_explored_states_count_against_max_pages(self) -> None:
+        class TabsBrowser(MockBrowserUseAdapter):
+            """Home page with three tabs, each opening its own panel."""
+
+            panel = ""
+
+            def goto(self, url: str) -> None:
+                self.panel = ""
+                super().goto(url)
+
+            def click(self, selector: str) -> bool:
+                self.panel = selector
+                return True
+
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                summary = super().extract_interactive_dom_summary(max_nodes)
+                summary["elements"] = [
+                    *summary["elements"],
+                    *(
+                        {"role": "tab", "label": name, "selector": f"#{name}"}
+                        for name in ("specs", "reviews", "faq")
+                    ),
+                ]
+                summary["fingerprint"] += f"::{self.panel}"
+                return summary
 
-class TestOrchestratorIntegration(unittest.TestCase):
-    def test_end_to_end_run_generates_expected_artifacts(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
-            output_dir = Path(tmp_dir)
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=1,
+                max_pages=3,
+                explore_actions=5,
+            )
+            result = AutoPomOrchestrator(
+                config=config, browser=TabsBrowser(base_url=config.base_url)
+            ).run()
+
+            self.assertEqual(
+                [page.page_name for page in result.pages],
+                ["HomePage", "HomeSpecsViewPage", "HomeReviewsViewPage"],
+            )
+
+    def test_synthetic_site_crawl_dedupes_aliases_and_heals_hidden_selectors(
+        self,
+    ) -> None:
+        spec = SiteSpec(
+            pages=150,
+            fan_out=4,
+            duplicate_ratio=0.3,
+            hidden_ratio=0.2,
+            large_pages=1,
+            large_page_elements=2_000,
+            seed=11,
+        )
+
+        def crawl(output_dir: Path) -> object:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=output_dir,
+                max_depth=10,
+                max_pages=500,
+                max_nodes=5_000,
+                synthetic_site=spec,
+            )
+            site = SyntheticSite(spec, config.base_url)
+            return AutoPomOrchestrator(
+                config=config,
+                browser=MockBrowserUseAdapter(base_url=config.base_url, site=site),
+            ).run()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = crawl(Path(tmp_dir) / "first")
+            again = crawl(Path(tmp_dir) / "second")
+
+            self.assertEqual(len(result.pages), 150)
+            self.assertEqual(
+                [page.url for page in again.pages], [page.url for page in result.pages]
+            )
+            # `/go/<n>` aliases redirect to pages that were already modeled.
+            self.assertGreater(result.stats["duplicate_hits"], 0)
+            self.assertNotIn("/go/", "".join(page.url for page in result.pages))
+            elements = [
+                element
+                for page in result.pages
+                for section in page.sections
+                for element in section.elements
+            ]
+            self.assertEqual(
+                max(len(page.sections[0].elements) for page in result.pages), 2_000
+            )
+            healed = [e for e in elements if e.selector.startswith("text=")]
+            self.assertAlmostEqual(len(healed) / len(elements), 0.2, delta=0.03)
+
+    def test_replayed_crawl_matches_the_recorded_one(self) -> None:
+        class TabsBrowser(MockBrowserUseAdapter):
+            """Pages with a Details tab that reveals one more field."""
+
+            details = False
+
+            def goto(self, url: str) -> None:
+                self.details = False
+                super().goto(url)
+
+            def click(self, selector: str) -> bool:
+                self.details = selector == "#details"
+                return self.details
+
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                summary = super().extract_interactive_dom_summary(max_nodes)
+                summary["elements"].append(
+                    {"role": "tab", "label": "Details", "selector": "#details"}
+                )
+                if self.details:
+                    summary["elements"].append(
+                        {"role": "textbox", "label": "Notes", "selector": "#notes"}
+                    )
+                summary["fingerprint"] += f"::{self.details}"
+                return summary
+
+        def crawl(output_dir: Path, browser: object) -> object:
             config = CrawlConfig(
                 base_url="https://example.com",
                 output_dir=output_dir,
                 max_depth=2,
-                max_pages=5,
+                explore_actions=2,
             )
-            orchestrator = AutoPomOrchestrator(
+            try:
+                return AutoPomOrchestrator(config=config, browser=browser).run()
+            finally:
+                browser.close()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            archive_path = root / "site.replay.gz"
+            recorded = crawl(
+                root / "recorded",
+                RecordingBrowserAdapter(
+                    browser=TabsBrowser(base_url="https://example.com"),
+                    archive=ReplayArchive(base_url="https://example.com"),
+                    path=archive_path,
+                ),
+            )
+            replayed = crawl(
+                root / "replayed",
+                ReplayBrowserAdapter.from_path("https://example.com", archive_path),
+            )
+
+            self.assertEqual(
+                [page.page_name for page in replayed.pages],
+                [page.page_name for page in recorded.pages],
+            )
+            self.assertIn("LoginDetailsViewPage", [p.page_name for p in recorded.pages])
+            for path in recorded.model_paths:
+                self.assertEqual(
+                    (root / "replayed" / "models_json" / path.name).read_text(),
+                    path.read_text(),
+                )
+            self.assertEqual(replayed.stats["replay_misses"], 0)
+            self.assertGreater(replayed.stats["replay_hits"], 0)
+            self.assertNotIn("replay_hits", recorded.stats)
+
+    def test_throttled_navigations_back_off_and_retry(self) -> None:
+        class ThrottlingBrowser(MockBrowserUseAdapter):
+            """Answers 429 to the first request for each page."""
+
+            last_status = None
+            last_retry_after_s = None
+            requests: ClassVar[list[str]] = []
+
+            def goto(self, url: str) -> None:
+                self.last_status = 429 if url not in self.requests else 200
+                self.requests.append(url)
+                super().goto(url)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                host_concurrency=2,
+                throttle_backoff_s=0.01,
+            )
+            result = AutoPomOrchestrator(
+                config=config, browser=ThrottlingBrowser(base_url=config.base_url)
+            ).run()
+
+            self.assertEqual(len(result.pages), 3)
+            self.assertEqual(len(ThrottlingBrowser.requests), 6)
+            self.assertEqual(result.stats["throttled_responses"], 3)
+            self.assertEqual(result.stats["throttle_skipped_pages"], 0)
+            self.assertGreater(result.stats["throttle_wait_seconds"], 0)
+
+    def test_pages_are_skipped_when_host_keeps_throttling(self) -> None:
+        class OverloadedBrowser(MockBrowserUseAdapter):
+            last_retry_after_s = None
+
+            @property
+            def last_status(self) -> int:
+                return 503 if self.url().endswith("/login") else 200
+
+        events: list[tuple[str, dict]] = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                rate_limit=100,
+                throttle_retries=1,
+                throttle_backoff_s=0.01,
+            )
+            result = AutoPomOrchestrator(
                 config=config,
-                browser=MockBrowserUseAdapter(base_url=config.base_url),
+                browser=OverloadedBrowser(base_url=config.base_url),
+                progress_hook=lambda event, payload: events.append((event, payload)),
+            ).run()
+
+            self.assertEqual([page.page_name for page in result.pages], ["HomePage"])
+            self.assertEqual(result.stats["throttled_responses"], 2)
+            self.assertEqual(result.stats["throttle_skipped_pages"], 1)
+            self.assertEqual(result.stats["throttle_min_rate"], 25.0)
+            self.assertIn(
+                ("skip", {"url": "https://example.com/login", "reason": "throttled"}),
+                events,
             )
 
-            result = orchestrator.run()
+    def test_url_list_seeds_pages_without_discovery_navigations(self) -> None:
+        class CountingBrowser(MockBrowserUseAdapter):
+            navigations: ClassVar[list[str]] = []
+
+            def goto(self, url: str) -> None:
+                self.navigations.append(url)
+                super().goto(url)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            url_list = Path(tmp_dir) / "urls.txt"
+            url_list.write_text(
+                "/forgot-password\nhttps://partner.example.org/login\n",
+                encoding="utf-8",
+            )
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir) / "output",
+                max_depth=0,
+                seed_sources=[str(url_list)],
+            )
+            result = AutoPomOrchestrator(
+                config=config, browser=CountingBrowser(base_url=config.base_url)
+            ).run()
+
+            # Depth 0 follows no links, yet the seeded page is still modeled.
+            self.assertEqual(
+                CountingBrowser.navigations,
+                ["https://example.com", "https://example.com/forgot-password"],
+            )
+            self.assertEqual(
+                [page.page_name for page in result.pages],
+                ["HomePage", "Forgot-passwordPage"],
+            )
+            self.assertEqual(result.stats["seeded_urls"], 1)
+            self.assertEqual(result.stats["seed_filtered_urls"], 1)
+
+    def test_http_adapter_fetches_static_pages_and_escalates_spa_shells(
+        self,
+    ) -> None:
+        class QuietHandler(SimpleHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: object) -> None:
+                return None
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            site = Path(tmp_dir) / "site"
+            site.mkdir()
+            (site / "index.html").write_text(
+                "<title>Home</title><a href='/about.html'>About</a>"
+                "<a href='/app.html'>App</a>",
+                encoding="utf-8",
+            )
+            (site / "about.html").write_text(
+                "<title>About</title><input name='q'><a href='/'>Home</a>",
+                encoding="utf-8",
+            )
+            (site / "app.html").write_text(
+                "<title>App</title><div id='root'></div>", encoding="utf-8"
+            )
+            server = ThreadingHTTPServer(
+                ("127.0.0.1", 0), functools.partial(QuietHandler, directory=str(site))
+            )
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.addCleanup(server.server_close)
+            self.addCleanup(server.shutdown)
+            base_url = f"http://127.0.0.1:{server.server_port}"
+            escalated: list[str] = []
+
+            class RenderingBrowser(MockBrowserUseAdapter):
+                def goto(self, url: str) -> None:
+                    escalated.append(url)
+                    super().goto(url)
+
+            browser = HttpBrowserAdapter(
+                base_url=base_url,
+                fallback_factory=lambda: RenderingBrowser(base_url=base_url),
+            )
+            config = CrawlConfig(
+                base_url=base_url, output_dir=Path(tmp_dir) / "output", max_depth=1
+            )
+            try:
+                result = AutoPomOrchestrator(config=config, browser=browser).run()
+            finally:
+                browser.close()
 
             self.assertEqual(len(result.pages), 3)
-            self.assertTrue(result.report_path.exists())
-            self.assertTrue((output_dir / "java" / "base" / "BasePage.java").exists())
-            self.assertTrue((output_dir / "java" / "pages" / "LoginPage.java").exists())
-            self.assertTrue((output_dir / "models_json" / "LoginPage.json").exists())
+            self.assertEqual(escalated, [f"{base_url}/app.html"])
+            self.assertEqual(result.stats["http_static_pages"], 2)
+            self.assertEqual(result.stats["http_escalated_spa_root"], 1)
+            self.assertGreaterEqual(result.stats["http_reused_connections"], 1)
 
-            login_page_json = json.loads(
-                (output_dir / "models_json" / "LoginPage.json").read_text(
-                    encoding="utf-8"
-                )
+    def test_blocked_request_counts_reach_crawl_stats(self) -> None:
+        class ImageRoute:
+            def __init__(self, url: str) -> None:
+                self.request = type(
+                    "Request", (), {"url": url, "resource_type": "image"}
+                )()
+
+            def abort(self) -> None:
+                return None
+
+        class BlockingBrowser(MockBrowserUseAdapter):
+            resource_blocker = ResourceBlocker()
+
+            def goto(self, url: str) -> None:
+                super().goto(url)
+                self.resource_blocker.handle_route(ImageRoute(f"{url}/hero.png"))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                block_resources=True,
             )
-            self.assertEqual(login_page_json["page_name"], "LoginPage")
-            self.assertEqual(len(login_page_json["actions"]), 1)
-            self.assertEqual(login_page_json["actions"][0]["name"], "login")
+            result = AutoPomOrchestrator(
+                config=config, browser=BlockingBrowser(base_url=config.base_url)
+            ).run()
 
-            report_content = result.report_path.read_text(encoding="utf-8")
-            self.assertIn("Pages modeled: 3", report_content)
-            self.assertIn("Elements mapped:", report_content)
+            self.assertEqual(result.stats["blocked_requests"], 3)
+            self.assertEqual(result.stats["blocked_image_requests"], 3)
 
     def test_same_origin_policy_blocks_external_links(self) -> None:
         class ExternalLinkBrowser(MockBrowserUseAdapter):
@@ -149,6 +1240,330 @@ class TestOrchestratorIntegration(unittest.TestCase):
                 (output_dir / "typescript" / "base" / "LocatorFinder.ts").exists()
             )
 
+    def test_concurrent_workers_model_same_pages_as_sequential_run(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = Path(tmp_dir)
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=output_dir,
+                max_depth=2,
+                max_pages=5,
+                concurrency=4,
+            )
+            orchestrator = AutoPomOrchestrator(
+                config=config,
+                browser=MockBrowserUseAdapter(base_url=config.base_url),
+            )
+
+            result = orchestrator.run()
+
+            self.assertEqual(
+                sorted(p.page_name for p in result.pages),
+                ["Forgot-passwordPage", "HomePage", "LoginPage"],
+            )
+            self.assertEqual(orchestrator.state.in_flight, 0)
+            self.assertTrue((output_dir / "models_json" / "LoginPage.json").exists())
+
+    def test_concurrent_workers_respect_max_pages(self) -> None:
+        class FanOutBrowser(MockBrowserUseAdapter):
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                summary = super().extract_interactive_dom_summary(max_nodes=max_nodes)
+                summary["fingerprint"] = f"fanout::{self.url()}"
+                summary["links"] = [
+                    f"{self.url().rstrip('/')}/child-{index}" for index in range(5)
+                ]
+                return summary
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=5,
+                max_pages=7,
+                concurrency=3,
+            )
+            orchestrator = AutoPomOrchestrator(
+                config=config,
+                browser=FanOutBrowser(base_url=config.base_url),
+            )
+
+            result = orchestrator.run()
+
+            self.assertEqual(len(result.pages), 7)
+            self.assertEqual(orchestrator.state.page_count, 7)
+            self.assertEqual(len(orchestrator.state.visited_signatures), 7)
+
+    def test_async_run_generates_expected_artifacts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = Path(tmp_dir)
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=output_dir,
+                max_depth=2,
+                max_pages=5,
+                concurrency=3,
+            )
+            orchestrator = AutoPomOrchestrator(
+                config=config,
+                browser=AsyncMockBrowserUseAdapter(
+                    base_url=config.base_url, navigation_latency_s=0.01
+                ),
+            )
+
+            result = asyncio.run(orchestrator.arun())
+
+            self.assertEqual(
+                sorted(p.page_name for p in result.pages),
+                ["Forgot-passwordPage", "HomePage", "LoginPage"],
+            )
+            self.assertEqual(orchestrator.state.in_flight, 0)
+            self.assertTrue((output_dir / "models_json" / "LoginPage.json").exists())
+            self.assertIn(
+                "Pages modeled: 3", result.report_path.read_text(encoding="utf-8")
+            )
+
+    def test_async_run_models_the_synthetic_site_like_the_sync_run(self) -> None:
+        spec = SiteSpec(pages=40, fan_out=3, duplicate_ratio=0.3, hidden_ratio=0.2)
+
+        def config(output_dir: Path) -> CrawlConfig:
+            return CrawlConfig(
+                base_url="https://example.com",
+                output_dir=output_dir,
+                max_depth=10,
+                max_pages=100,
+                explore_actions=2,
+                synthetic_site=spec,
+            )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sync_config = config(Path(tmp_dir) / "sync")
+            sync_result = AutoPomOrchestrator(
+                config=sync_config,
+                browser=MockBrowserUseAdapter(
+                    base_url=sync_config.base_url,
+                    site=SyntheticSite(spec, sync_config.base_url),
+                ),
+            ).run()
+            async_config = config(Path(tmp_dir) / "async")
+            async_result = asyncio.run(
+                AutoPomOrchestrator(
+                    config=async_config,
+                    browser=AsyncMockBrowserUseAdapter(
+                        base_url=async_config.base_url,
+                        site=SyntheticSite(spec, async_config.base_url),
+                    ),
+                ).arun()
+            )
+
+            self.assertEqual(
+                [page.to_dict() for page in async_result.pages],
+                [page.to_dict() for page in sync_result.pages],
+            )
+            self.assertGreater(sync_result.stats["explore_clicks"], 0)
+            for stat in ("duplicate_hits", "pruned_actions", "explore_clicks"):
+                self.assertEqual(async_result.stats[stat], sync_result.stats[stat])
+
+    def test_pooled_tabs_survive_a_crashed_page(self) -> None:
+        class CrashingTab(MockBrowserUseAdapter):
+            crash_on_login = False
+            tabs_opened = 0
+
+            def new_tab(self) -> MockBrowserUseAdapter:
+                tab = super().new_tab()
+                CrashingTab.tabs_opened += 1
+                tab.crash_on_login = CrashingTab.tabs_opened == 1
+                return tab
+
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                if self.crash_on_login and self.url().endswith("/login"):
+                    raise ConnectionResetError("Target crashed")
+                return super().extract_interactive_dom_summary(max_nodes)
+
+        events: list[tuple[str, dict]] = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=2,
+                browser_pool_size=1,
+                browser_recycle_after=10,
+            )
+            result = AutoPomOrchestrator(
+                config=config,
+                browser=CrashingTab(base_url=config.base_url),
+                progress_hook=lambda event, payload: events.append((event, payload)),
+            ).run()
+
+            # The primary adapter only opens tabs; the first tab crashes on
+            # /login and is retired, and the crawl carries on without it. Nothing
+            # is left to crawl, so no replacement tab is ever launched.
+            self.assertEqual([page.page_name for page in result.pages], ["HomePage"])
+            self.assertIn(
+                "browser_failed",
+                [payload.get("reason") for event, payload in events if event == "skip"],
+            )
+            self.assertEqual(result.stats["pool_failed_pages"], 1)
+            self.assertEqual(result.stats["pool_recycled"], 1)
+            self.assertEqual(result.stats["pool_launches"], 1)
+            self.assertEqual(result.stats["pool_warm_acquires"], 2)
+
+    def test_pooled_run_fails_on_errors_that_are_not_the_browsers(self) -> None:
+        class BuggyTab(MockBrowserUseAdapter):
+            def extract_interactive_dom_summary(self, max_nodes: int = 120) -> dict:
+                if self.url().endswith("/login"):
+                    raise KeyError("elements")
+                return super().extract_interactive_dom_summary(max_nodes)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=2,
+                browser_pool_size=1,
+            )
+            orchestrator = AutoPomOrchestrator(
+                config=config, browser=BuggyTab(base_url=config.base_url)
+            )
+
+            with self.assertRaises(KeyError):
+                orchestrator.run()
+            # The tab that raised still went back to the pool, and was retired.
+            self.assertEqual(orchestrator.browser_pool.stats()["pool_failed_pages"], 1)
+
+    def test_async_pooled_run_leases_warm_tabs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=2,
+                concurrency=2,
+                browser_pool_size=1,
+            )
+            result = asyncio.run(
+                AutoPomOrchestrator(
+                    config=config,
+                    browser=AsyncMockBrowserUseAdapter(base_url=config.base_url),
+                ).arun()
+            )
+
+            self.assertEqual(
+                sorted(page.page_name for page in result.pages),
+                ["Forgot-passwordPage", "HomePage", "LoginPage"],
+            )
+            self.assertEqual(result.stats["pool_launches"], 2)
+            self.assertEqual(result.stats["pool_acquires"], 3)
+            self.assertEqual(result.stats["pool_warm_acquires"], 3)
+
+    def test_sharded_run_merges_worker_outputs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = Path(tmp_dir)
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=output_dir,
+                max_depth=2,
+                max_pages=5,
+                processes=2,
+                checkpoint_interval=1,
+            )
+
+            result = run_sharded(config)
+
+            self.assertEqual(
+                sorted(p.page_name for p in result.pages),
+                ["Forgot-passwordPage", "HomePage", "LoginPage"],
+            )
+            self.assertEqual(len(result.model_paths), 3)
+            self.assertEqual(len(result.pom_paths), 4)
+            self.assertIn(
+                "Pages modeled: 3", result.report_path.read_text(encoding="utf-8")
+            )
+            self.assertEqual(result.stats["crawl_pages"], 3)
+            self.assertEqual(result.stats["stage_navigate_calls"], 3)
+            # Written once by the parent, after every shard has stopped.
+            checkpoint = json.loads(
+                (output_dir / "crawl_checkpoint.json").read_text(encoding="utf-8")
+            )
+            self.assertEqual(checkpoint["state"]["frontier"], [])
+
+    def test_shard_orchestrator_never_checkpoints_or_reports(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=2,
+                checkpoint_interval=1,
+            )
+            AutoPomOrchestrator(
+                config=config,
+                browser=MockBrowserUseAdapter(base_url=config.base_url),
+                state=initial_crawl_state(config),
+            ).run()
+
+            self.assertFalse((Path(tmp_dir) / "crawl_checkpoint.json").exists())
+            self.assertFalse((Path(tmp_dir) / "reports" / "crawl_summary.md").exists())
+
+    def test_shard_replays_resumed_pages_without_regenerating_them(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                max_pages=2,
+                checkpoint_interval=0,
+            )
+            first = AutoPomOrchestrator(
+                config=config, browser=MockBrowserUseAdapter(base_url=config.base_url)
+            ).run()
+            for path in first.pom_paths[1:]:
+                path.unlink()
+
+            config.max_pages = 10
+            config.resume = True
+            resumed_pages = [
+                page for page, _ in Persistence(config.output_dir).load_page_models()
+            ]
+            result = AutoPomOrchestrator(
+                config=config,
+                browser=MockBrowserUseAdapter(base_url=config.base_url),
+                state=initial_crawl_state(config),
+                resumed_pages=resumed_pages,
+            ).run()
+
+            # run_sharded() owns the resumed pages; the shard adds only its own.
+            self.assertEqual(
+                [page.page_name for page in result.pages], ["Forgot-passwordPage"]
+            )
+            self.assertEqual(result.resumed_pages, 0)
+            self.assertFalse(any(path.exists() for path in first.pom_paths[1:]))
+
+    def test_sharded_resume_merges_resumed_pages_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = CrawlConfig(
+                base_url="https://example.com",
+                output_dir=Path(tmp_dir),
+                max_depth=3,
+                max_pages=2,
+                checkpoint_interval=0,
+            )
+            AutoPomOrchestrator(
+                config=config, browser=MockBrowserUseAdapter(base_url=config.base_url)
+            ).run()
+
+            config.max_pages = 10
+            config.processes = 2
+            config.resume = True
+            result = run_sharded(config)
+
+            self.assertEqual(
+                sorted(page.page_name for page in result.pages),
+                ["Forgot-passwordPage", "HomePage", "LoginPage"],
+            )
+            self.assertEqual(result.resumed_pages, 2)
+            self.assertEqual(len(result.pom_paths), 4)
+            self.assertIn(
+                "Pages modeled: 3", result.report_path.read_text(encoding="utf-8")
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
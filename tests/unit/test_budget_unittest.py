@@ -0,0 +1,84 @@
+import unittest
+
+from autopom.agent.budget import (
+    LEVEL_REDUCE_NODES,
+    LEVEL_SKIP_DEEP_LINKS,
+    LEVEL_SKIP_HEALING,
+    CrawlBudget,
+    parse_duration,
+)
+from autopom.config import CrawlConfig
+
+
+class TestCrawlBudget(unittest.TestCase):
+    def test_parse_duration_accepts_unit_suffixes(self) -> None:
+        self.assertEqual(parse_duration("90"), 90.0)
+        self.assertEqual(parse_duration("45s"), 45.0)
+        self.assertEqual(parse_duration("20m"), 1200.0)
+        self.assertEqual(parse_duration("1.5h"), 5400.0)
+        with self.assertRaises(ValueError):
+            parse_duration("soon")
+        with self.assertRaises(ValueError):
+            parse_duration("0m")
+
+    def test_without_budget_pages_are_never_degraded(self) -> None:
+        budget = CrawlBudget()
+        budget.record_page(60_000)
+
+        self.assertFalse(budget.enabled)
+        self.assertEqual(budget.level(pages_remaining=1000), 0)
+        self.assertFalse(budget.expired())
+        self.assertEqual(budget.stats(), {})
+
+    def test_latency_over_target_degrades_step_by_step(self) -> None:
+        self.assertEqual(
+            CrawlBudget(page_latency_target_ms=100).level(pages_remaining=10), 0
+        )
+        for latency_ms, level in (
+            (90, 0),
+            (140, LEVEL_REDUCE_NODES),
+            (180, LEVEL_SKIP_HEALING),
+            (500, LEVEL_SKIP_DEEP_LINKS),
+        ):
+            budget = CrawlBudget(page_latency_target_ms=100)
+            budget.record_page(latency_ms)
+            self.assertEqual(budget.level(pages_remaining=10), level)
+
+    def test_projected_overrun_of_the_deadline_degrades(self) -> None:
+        budget = CrawlBudget(time_budget_s=60, concurrency=2)
+        budget.record_page(1000)
+
+        # 60 pages at 1s over 2 workers fit in the minute; 240 do not.
+        self.assertEqual(budget.level(pages_remaining=60), 0)
+        self.assertEqual(budget.level(pages_remaining=240), LEVEL_SKIP_DEEP_LINKS)
+
+    def test_degradations_are_counted_per_kind(self) -> None:
+        budget = CrawlBudget(page_latency_target_ms=100, max_nodes=500)
+
+        self.assertEqual(budget.node_limit(0), 500)
+        self.assertEqual(budget.node_limit(LEVEL_REDUCE_NODES), 120)
+        self.assertFalse(budget.skip_healing(LEVEL_REDUCE_NODES))
+        self.assertTrue(budget.skip_healing(LEVEL_SKIP_HEALING))
+        self.assertFalse(budget.skip_deep_link(LEVEL_SKIP_DEEP_LINKS, depth=1))
+        self.assertTrue(budget.skip_deep_link(LEVEL_SKIP_DEEP_LINKS, depth=2))
+
+        stats = budget.stats()
+        self.assertEqual(stats["budget_reduced_nodes_pages"], 1)
+        self.assertEqual(stats["budget_skipped_healing_pages"], 1)
+        self.assertEqual(stats["budget_skipped_deep_links"], 1)
+        self.assertFalse(stats["budget_deadline_hit"])
+
+    def test_config_validates_budget_fields(self) -> None:
+        with self.assertRaises(ValueError):
+            CrawlConfig(base_url="https://example.com", time_budget_s=0)
+        with self.assertRaises(ValueError):
+            CrawlConfig(base_url="https://example.com", page_latency_target_ms=-5)
+        with self.assertRaises(ValueError):
+            CrawlConfig(base_url="https://example.com", max_nodes=0)
+
+        config = CrawlConfig(base_url="https://example.com", max_nodes=80)
+        self.assertEqual(CrawlBudget.from_config(config).reduced_max_nodes, 80)
+
+
+if __name__ == "__main__":
+    unittest.main()
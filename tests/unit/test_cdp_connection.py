@@ -1,9 +1,15 @@
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from autopom.browser.async_adapter import AsyncPlaywrightBrowserAdapter
 from autopom.browser.browseruse_adapter import (
+    CLIENT_NAVIGATION_SCRIPT,
     PlaywrightBrowserAdapter,
     create_browser_adapter,
 )
+from autopom.browser.resource_blocking import ResourceBlocker
+from autopom.browser.settle import SettlePolicy
 
 
 class TestPlaywrightCDPConnection(unittest.TestCase):
@@ -89,6 +95,188 @@ class TestPlaywrightCDPConnection(unittest.TestCase):
             "http://localhost:1234"
         )
 
+    @patch("playwright.sync_api.sync_playwright")
+    def test_new_tab_attaches_over_cdp_with_fresh_page(self, mock_sync_playwright):
+        mock_playwright_instance = MagicMock()
+        mock_sync_playwright.return_value.start.return_value = mock_playwright_instance
+        mock_browser = MagicMock()
+        mock_playwright_instance.chromium.connect_over_cdp.return_value = mock_browser
+        mock_context = MagicMock()
+        mock_browser.contexts = [mock_context]
+        mock_context.pages = [MagicMock(url="http://existing-session.com")]
+        mock_context.new_page.return_value = MagicMock(url="about:blank")
+
+        adapter = PlaywrightBrowserAdapter(
+            base_url="http://dummy", cdp_url="http://localhost:9222"
+        )
+        tab = adapter.new_tab()
+
+        self.assertTrue(tab.open_new_tab)
+        self.assertEqual(tab.cdp_url, "http://localhost:9222")
+        mock_context.new_page.assert_called_once()
+        self.assertEqual(tab.url(), "http://dummy")
+
+        tab.close()
+        mock_context.close.assert_not_called()
+
+    @patch("playwright.sync_api.sync_playwright")
+    def test_launch_with_debug_port_uses_shared_profile(self, mock_sync_playwright):
+        mock_playwright_instance = MagicMock()
+        mock_sync_playwright.return_value.start.return_value = mock_playwright_instance
+
+        adapter = create_browser_adapter(
+            adapter_name="playwright", base_url="http://test.com", concurrency=2
+        )
+
+        mock_playwright_instance.chromium.launch.assert_not_called()
+        launch_kwargs = (
+            mock_playwright_instance.chromium.launch_persistent_context.call_args.kwargs
+        )
+        self.assertTrue(launch_kwargs["args"][0].startswith("--remote-debugging-port="))
+        self.assertEqual(adapter.new_tab().cdp_url, adapter._cdp_endpoint)
+
+    @patch("playwright.sync_api.sync_playwright")
+    def test_resource_blocker_routes_main_page_and_tabs(self, mock_sync_playwright):
+        mock_playwright_instance = MagicMock()
+        mock_sync_playwright.return_value.start.return_value = mock_playwright_instance
+        mock_browser = MagicMock()
+        mock_playwright_instance.chromium.connect_over_cdp.return_value = mock_browser
+        mock_context = MagicMock()
+        mock_browser.contexts = [mock_context]
+        main_page = MagicMock(url="http://existing-session.com")
+        tab_page = MagicMock(url="about:blank")
+        mock_context.pages = [main_page]
+        mock_context.new_page.return_value = tab_page
+        blocker = ResourceBlocker()
+
+        adapter = create_browser_adapter(
+            adapter_name="playwright",
+            base_url="http://dummy",
+            cdp_url="http://localhost:9222",
+            resource_blocker=blocker,
+        )
+        tab = adapter.new_tab()
+
+        main_page.route.assert_called_once_with("**/*", blocker.handle_route)
+        tab_page.route.assert_called_once_with("**/*", blocker.handle_route)
+        self.assertIs(tab.resource_blocker, blocker)
+
+    @patch("playwright.async_api.async_playwright")
+    def test_async_adapter_tabs_share_context(self, mock_async_playwright):
+        mock_playwright_instance = MagicMock()
+        mock_async_playwright.return_value.start = AsyncMock(
+            return_value=mock_playwright_instance
+        )
+        mock_browser = MagicMock()
+        mock_playwright_instance.chromium.connect_over_cdp = AsyncMock(
+            return_value=mock_browser
+        )
+        mock_context = MagicMock()
+        mock_browser.contexts = [mock_context]
+        mock_context.pages = []
+        mock_context.add_init_script = AsyncMock()
+        mock_context.new_page = AsyncMock(
+            side_effect=[MagicMock(url="about:blank"), MagicMock(url="about:blank")]
+        )
+
+        async def scenario() -> AsyncPlaywrightBrowserAdapter:
+            adapter = await AsyncPlaywrightBrowserAdapter.launch(
+                base_url="http://dummy", cdp_url="http://localhost:9222"
+            )
+            return await adapter.new_tab()
+
+        tab = asyncio.run(scenario())
+
+        self.assertIs(tab._context, mock_context)
+        self.assertEqual(mock_context.new_page.await_count, 2)
+        self.assertEqual(asyncio.run(tab.url()), "http://dummy")
+
+    @patch("playwright.sync_api.sync_playwright")
+    def test_unrouted_link_loads_page_and_reports_throttling(
+        self, mock_sync_playwright
+    ):
+        mock_playwright_instance = MagicMock()
+        mock_sync_playwright.return_value.start.return_value = mock_playwright_instance
+        mock_browser = mock_playwright_instance.chromium.connect_over_cdp.return_value
+        mock_page = MagicMock(url="http://dummy/")
+        mock_browser.contexts = [MagicMock(pages=[mock_page])]
+        # The page links to the URL, but no client-side router takes the click.
+        mock_page.evaluate.return_value = False
+        mock_page.goto.return_value = MagicMock(
+            status=429, headers={"retry-after": "7"}
+        )
+
+        adapter = PlaywrightBrowserAdapter(
+            base_url="http://dummy",
+            cdp_url="http://localhost:9222",
+            incremental_extraction=True,
+            settle=SettlePolicy(strategy="none"),
+        )
+        adapter.goto("http://dummy/pricing")
+
+        mock_page.evaluate.assert_called_once_with(
+            CLIENT_NAVIGATION_SCRIPT, "http://dummy/pricing"
+        )
+        mock_page.goto.assert_called_once()
+        self.assertEqual(adapter.last_status, 429)
+        self.assertEqual(adapter.last_retry_after_s, 7.0)
+
+    @patch("playwright.sync_api.sync_playwright")
+    def test_routed_link_stays_in_the_document(self, mock_sync_playwright):
+        mock_playwright_instance = MagicMock()
+        mock_sync_playwright.return_value.start.return_value = mock_playwright_instance
+        mock_browser = mock_playwright_instance.chromium.connect_over_cdp.return_value
+        mock_page = MagicMock(url="http://dummy/")
+        mock_browser.contexts = [MagicMock(pages=[mock_page])]
+        mock_page.evaluate.return_value = True
+
+        adapter = PlaywrightBrowserAdapter(
+            base_url="http://dummy",
+            cdp_url="http://localhost:9222",
+            incremental_extraction=True,
+            settle=SettlePolicy(strategy="none"),
+        )
+        adapter.goto("http://dummy/app/settings")
+
+        mock_page.goto.assert_not_called()
+        mock_page.wait_for_url.assert_called_once()
+        self.assertIsNone(adapter.last_status)
+
+    @patch("playwright.async_api.async_playwright")
+    def test_async_unrouted_link_reports_throttling(self, mock_async_playwright):
+        mock_playwright_instance = MagicMock()
+        mock_async_playwright.return_value.start = AsyncMock(
+            return_value=mock_playwright_instance
+        )
+        mock_browser = MagicMock()
+        mock_playwright_instance.chromium.connect_over_cdp = AsyncMock(
+            return_value=mock_browser
+        )
+        mock_page = AsyncMock(url="http://dummy/")
+        mock_page.set_default_timeout = MagicMock()
+        mock_page.on = MagicMock()
+        mock_page.evaluate.return_value = False
+        mock_page.goto.return_value = MagicMock(
+            status=503, headers={"retry-after": "3"}
+        )
+        mock_browser.contexts = [MagicMock(pages=[mock_page])]
+
+        async def scenario() -> AsyncPlaywrightBrowserAdapter:
+            adapter = await AsyncPlaywrightBrowserAdapter.launch(
+                base_url="http://dummy",
+                cdp_url="http://localhost:9222",
+                incremental_extraction=True,
+                settle=SettlePolicy(strategy="none"),
+            )
+            await adapter.goto("http://dummy/pricing")
+            return adapter
+
+        adapter = asyncio.run(scenario())
+
+        mock_page.goto.assert_awaited_once()
+        self.assertEqual(adapter.last_status, 503)
+        self.assertEqual(adapter.last_retry_after_s, 3.0)
+
 
 if __name__ == "__main__":
     unittest.main()
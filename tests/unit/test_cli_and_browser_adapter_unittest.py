@@ -4,6 +4,7 @@ from autopom.browser.browseruse_adapter import (
     MockBrowserUseAdapter,
     create_browser_adapter,
     normalize_browser_adapter,
+    parse_dom_summary,
 )
 from autopom.cli.main import build_parser
 from autopom.config import CrawlConfig
@@ -34,16 +35,138 @@ class TestCliAndBrowserAdapter(unittest.TestCase):
                 "--browser-adapter",
                 "playwright",
                 "--headed",
+                "--extraction-engine",
+                "compare",
+                "--incremental-extraction",
             ]
         )
         self.assertEqual(args.locator_storage, "external")
         self.assertEqual(args.browser_adapter, "playwright")
         self.assertTrue(args.headed)
+        self.assertEqual(args.extraction_engine, "compare")
+        self.assertTrue(args.incremental_extraction)
 
     def test_crawl_config_normalizes_browser_adapter(self) -> None:
         cfg = CrawlConfig(base_url="https://example.com", browser_adapter="pw")
         self.assertEqual(cfg.browser_adapter, "playwright")
 
+    def test_cli_parser_supports_workers_and_processes(self) -> None:
+        args = build_parser().parse_args(
+            ["--base-url", "https://example.com", "--workers", "4", "--processes", "2"]
+        )
+        self.assertEqual(args.workers, 4)
+        self.assertEqual(args.processes, 2)
+
+    def test_cli_parser_supports_route_template_limit(self) -> None:
+        args = build_parser().parse_args(
+            ["--base-url", "https://example.com", "--max-pages-per-template", "2"]
+        )
+        self.assertEqual(args.max_pages_per_template, 2)
+        self.assertIsNone(
+            build_parser()
+            .parse_args(["--base-url", "https://example.com"])
+            .max_pages_per_template
+        )
+
+    def test_cli_parser_supports_resume_and_checkpoint_interval(self) -> None:
+        args = build_parser().parse_args(
+            [
+                "--base-url",
+                "https://example.com",
+                "--resume",
+                "--checkpoint-interval",
+                "10",
+                "--incremental",
+            ]
+        )
+        self.assertTrue(args.resume)
+        self.assertTrue(args.incremental)
+        self.assertEqual(args.checkpoint_interval, 10)
+
+    def test_cli_parser_supports_rate_limit_flags(self) -> None:
+        args = build_parser().parse_args(
+            [
+                "--base-url",
+                "https://example.com",
+                "--rate-limit",
+                "2.5",
+                "--host-concurrency",
+                "3",
+                "--throttle-retries",
+                "1",
+            ]
+        )
+        self.assertEqual(args.rate_limit, 2.5)
+        self.assertEqual(args.host_concurrency, 3)
+        self.assertEqual(args.throttle_retries, 1)
+        self.assertEqual(args.throttle_backoff, 1.0)
+
+    def test_cli_parser_collects_sitemaps_and_url_lists_as_seeds(self) -> None:
+        args = build_parser().parse_args(
+            [
+                "--base-url",
+                "https://example.com",
+                "--sitemap",
+                "https://example.com/sitemap.xml",
+                "--url-list",
+                "urls.txt",
+            ]
+        )
+        self.assertEqual(
+            args.seed_sources, ["https://example.com/sitemap.xml", "urls.txt"]
+        )
+
+    def test_crawl_config_rejects_non_positive_template_limit(self) -> None:
+        with self.assertRaises(ValueError):
+            CrawlConfig(base_url="https://example.com", max_pages_per_template=0)
+
+    def test_crawl_config_rejects_non_positive_concurrency(self) -> None:
+        with self.assertRaises(ValueError):
+            CrawlConfig(base_url="https://example.com", concurrency=0)
+
+    def test_mock_adapter_new_tab_is_independent(self) -> None:
+        adapter = MockBrowserUseAdapter(base_url="https://example.com")
+        tab = adapter.new_tab()
+        tab.goto("https://example.com/login")
+        self.assertIsInstance(tab, MockBrowserUseAdapter)
+        self.assertEqual(adapter.url(), "https://example.com")
+
+    def test_mock_adapter_snapshot_bundles_page_state(self) -> None:
+        adapter = MockBrowserUseAdapter(base_url="https://example.com")
+        adapter.goto("https://example.com/login")
+        snapshot = adapter.snapshot(max_nodes=50)
+
+        self.assertEqual(snapshot["url"], "https://example.com/login")
+        self.assertEqual(snapshot["title"], "Mock Page /login")
+        self.assertEqual(snapshot["visibility"], {})
+        self.assertEqual(
+            snapshot["elements"], adapter.extract_interactive_dom_summary()["elements"]
+        )
+
+    def test_parse_dom_summary_normalizes_element_records(self) -> None:
+        summary = parse_dom_summary(
+            {
+                "fingerprint": "fast::Login::2",
+                "elements": [
+                    {"role": "button", "label": "Go", "selector": "#go"},
+                    {"label": "a|b", "selector": 'div[title="x|y"]', "section": None},
+                ],
+            }
+        )
+        self.assertEqual(
+            summary["elements"],
+            [
+                {"role": "button", "label": "Go", "selector": "#go", "section": "main"},
+                {
+                    "role": "generic",
+                    "label": "a|b",
+                    "selector": 'div[title="x|y"]',
+                    "section": "main",
+                },
+            ],
+        )
+        self.assertEqual(summary["links"], [])
+
     def test_crawl_config_normalizes_locator_storage_alias(self) -> None:
         cfg = CrawlConfig(base_url="https://example.com", locator_storage="ext")
         self.assertEqual(cfg.locator_storage, "external")
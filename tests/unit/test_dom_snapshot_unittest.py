@@ -0,0 +1,222 @@
+import unittest
+
+from autopom.browser.dom_snapshot import (
+    ExtractionTimer,
+    normalize_extraction_engine,
+    summarize_dom_snapshot,
+)
+from autopom.config import CrawlConfig
+
+VISIBLE_BOX = [0, 0, 120, 24]
+
+
+def el(tag: str, attrs: dict | None = None, *children, **layout) -> dict:
+    return {"tag": tag, "attrs": attrs or {}, "children": children, **layout}
+
+
+def capture(*body: object, title: str = "Sign in | Shop") -> dict:
+    """A DOMSnapshot.captureSnapshot result for `<html><body>...</body></html>`."""
+    strings: list[str] = []
+    nodes = {
+        "parentIndex": [],
+        "nodeType": [],
+        "nodeName": [],
+        "nodeValue": [],
+        "attributes": [],
+    }
+    layout = {"nodeIndex": [], "bounds": [], "styles": []}
+
+    def string(value: str) -> int:
+        if value not in strings:
+            strings.append(value)
+        return strings.index(value)
+
+    def add(node: object, parent: int) -> None:
+        index = len(nodes["parentIndex"])
+        nodes["parentIndex"].append(parent)
+        if isinstance(node, str):
+            nodes["nodeType"].append(3)
+            nodes["nodeName"].append(string("#text"))
+            nodes["nodeValue"].append(string(node))
+            nodes["attributes"].append([])
+            return
+        nodes["nodeType"].append(1)
+        nodes["nodeName"].append(string(node["tag"].upper()))
+        nodes["nodeValue"].append(-1)
+        nodes["attributes"].append(
+            [string(part) for pair in node["attrs"].items() for part in pair]
+        )
+        # `box=None` is display:none, which has no layout object.
+        box = node.get("box", VISIBLE_BOX)
+        if box is not None:
+            layout["nodeIndex"].append(index)
+            layout["bounds"].append(box)
+            layout["styles"].append([string(node.get("visibility", "visible"))])
+        for child in node["children"]:
+            add(child, index)
+
+    add(el("html", None, el("body", None, *body)), -1)
+    return {
+        "documents": [
+            {
+                "documentURL": string("https://shop.test/login"),
+                "baseURL": string("https://shop.test/login"),
+                "title": string(title),
+                "nodes": nodes,
+                "layout": layout,
+            }
+        ],
+        "strings": strings,
+    }
+
+
+class TestSummarizeDomSnapshot(unittest.TestCase):
+    def test_builds_the_extraction_script_summary(self) -> None:
+        summary = summarize_dom_snapshot(
+            capture(
+                el("input", {"type": "hidden", "name": "csrf"}),
+                el("input", {"name": "email", "placeholder": "Email"}),
+                el("input", {"type": "password", "id": "password"}),
+                el("button", {"data-testid": "submit"}, "Sign ", el("b", None, "in")),
+                el("div", {"role": "tab", "aria-label": "Phone"}, "Phone"),
+                el("span", {"tabindex": "0", "class": "chip  active"}, "New"),
+                el("script", None, "var x = 1;"),
+                el("a", {"href": "/"}, " Home "),
+                el("a", {"href": "javascript:void(0)"}, "Noop"),
+                el("a", {"href": "#top"}, "Top"),
+            )
+        )
+
+        self.assertEqual(summary["fingerprint"], "fast::Sign in | Shop::6")
+        self.assertEqual(summary["title"], "Sign in | Shop")
+        self.assertEqual(
+            [
+                (element["role"], element["label"], element["selector"])
+                for element in summary["elements"]
+            ],
+            [
+                ("textbox", "email", 'input[name="email"]'),
+                ("textbox", "password", "#password"),
+                ("button", "Sign in", 'button[data-testid="submit"]'),
+                ("tab", "Phone", 'div[aria-label="Phone"]'),
+                ("generic", "New", "span.chip.active"),
+                ("link", "Home", 'a[href="https://shop.test/"]'),
+            ],
+        )
+        self.assertEqual(
+            summary["links"], ["https://shop.test/", "https://shop.test/login#top"]
+        )
+
+    def test_visibility_comes_from_layout_and_computed_style(self) -> None:
+        summary = summarize_dom_snapshot(
+            capture(
+                el("button", {"id": "shown"}, "Shown"),
+                el("button", {"id": "collapsed"}, "Collapsed", box=None),
+                el("button", {"id": "hidden"}, "Hidden", visibility="hidden"),
+                el("button", {"id": "empty"}, "Empty", box=[0, 0, 0, 0]),
+                el("span", {"data-testid": "shown"}),
+            )
+        )
+
+        visibility = summary["visibility"]
+        self.assertTrue(visibility["#shown"])
+        self.assertFalse(visibility["#collapsed"])
+        self.assertFalse(visibility["#hidden"])
+        self.assertFalse(visibility["#empty"])
+        self.assertTrue(visibility["[data-testid='shown']"])
+        self.assertFalse(visibility["[data-testid='hidden']"])
+        self.assertNotIn("text=Shown", visibility)
+
+    def test_flags_submit_buttons_of_forms(self) -> None:
+        summary = summarize_dom_snapshot(
+            capture(
+                el(
+                    "form",
+                    None,
+                    el("div", None, el("button", {"id": "send"}, "Send")),
+                    el("button", {"id": "reset", "type": "reset"}, "Reset"),
+                ),
+                el("button", {"id": "outside", "form": "signup"}, "Outside"),
+                el("button", {"id": "alone"}, "Alone"),
+            )
+        )
+
+        self.assertEqual(
+            [e["selector"] for e in summary["elements"] if e.get("submits_form")],
+            ["#send", "#outside"],
+        )
+
+    def test_max_nodes_and_duplicates(self) -> None:
+        summary = summarize_dom_snapshot(
+            capture(
+                *(el("button", {"name": "buy"}, "Buy") for _ in range(3)),
+                *(el("a", {"href": f"/p/{index}"}, f"P{index}") for index in range(5)),
+            ),
+            max_nodes=3,
+        )
+
+        self.assertEqual(
+            [element["label"] for element in summary["elements"]], ["Buy", "P0", "P1"]
+        )
+        self.assertEqual(len(summary["links"]), 5)
+
+
+class TestExtractionTimer(unittest.TestCase):
+    def test_reports_per_engine_timings_and_mismatches(self) -> None:
+        timer = ExtractionTimer()
+        reference = {"elements": [{"role": "button", "label": "Go", "selector": "#go"}]}
+        timer.record("js", 0.030)
+        timer.record("cdp", 0.010)
+        timer.record("js", 0.010)
+        self.assertTrue(timer.compare(reference, {**reference, "title": "T"}))
+        self.assertFalse(timer.compare(reference, {"elements": []}))
+
+        self.assertEqual(
+            timer.stats(),
+            {
+                "extract_cdp_pages": 1,
+                "extract_cdp_seconds": 0.01,
+                "extract_cdp_avg_ms": 10.0,
+                "extract_js_pages": 2,
+                "extract_js_seconds": 0.04,
+                "extract_js_avg_ms": 20.0,
+                "extract_compared_pages": 2,
+                "extract_mismatched_pages": 1,
+            },
+        )
+
+    def test_reports_incremental_scans(self) -> None:
+        timer = ExtractionTimer()
+        timer.record_scan({"mode": "full", "described": 120})
+        timer.record_client_navigation()
+        timer.record_scan({"mode": "delta", "described": 6, "added": [], "removed": []})
+
+        stats = timer.stats()
+        self.assertEqual(stats["extract_full_scans"], 1)
+        self.assertEqual(stats["extract_delta_scans"], 1)
+        self.assertEqual(stats["extract_described_elements"], 126)
+        self.assertEqual(stats["extract_client_navigations"], 1)
+        self.assertNotIn("extract_full_scans", ExtractionTimer().stats())
+
+    def test_incremental_extraction_needs_the_js_engine(self) -> None:
+        config = CrawlConfig(
+            base_url="https://example.com", incremental_extraction=True
+        )
+        self.assertTrue(config.incremental_extraction)
+        with self.assertRaises(ValueError):
+            CrawlConfig(
+                base_url="https://example.com",
+                extraction_engine="cdp",
+                incremental_extraction=True,
+            )
+
+    def test_engine_names_are_validated(self) -> None:
+        self.assertEqual(normalize_extraction_engine(" DOMSnapshot "), "cdp")
+        with self.assertRaises(ValueError):
+            normalize_extraction_engine("xpath")
+        config = CrawlConfig(base_url="https://example.com", extraction_engine="JS")
+        self.assertEqual(config.extraction_engine, "js")
+
+
+if __name__ == "__main__":
+    unittest.main()
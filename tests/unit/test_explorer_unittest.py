@@ -0,0 +1,53 @@
+import unittest
+
+from autopom.agent.explorer import (
+    action_key,
+    action_selector,
+    candidate_actions,
+    state_page_name,
+)
+
+
+class TestActionExplorer(unittest.TestCase):
+    def test_candidate_actions_are_safe_buttons_and_tabs(self) -> None:
+        summary = {
+            "elements": [
+                {"role": "link", "label": "Home", "selector": "a[href='/']"},
+                {"role": "button", "label": "Filters", "selector": "#filters"},
+                {"role": "button", "label": "Filters", "selector": "#filters"},
+                {"role": "tab", "label": "Reviews", "selector": "#reviews"},
+                {"role": "button", "label": "Delete account", "selector": "#delete"},
+                {"role": "button", "label": "Log out", "selector": "#logout"},
+                {"role": "textbox", "label": "Search", "selector": "#q"},
+                {"role": "button", "label": "Share", "selector": "#share"},
+                {"role": "button", "label": "Save changes", "selector": "#save"},
+                {"role": "button", "label": "Confirm", "selector": "#confirm"},
+                {
+                    "role": "button",
+                    "label": "Next",
+                    "selector": "#next",
+                    "submits_form": True,
+                },
+            ]
+        }
+
+        self.assertEqual(
+            [element["selector"] for element in candidate_actions(summary, 10)],
+            ["#filters", "#reviews", "#share"],
+        )
+        self.assertEqual(len(candidate_actions(summary, 2)), 2)
+
+    def test_action_keys_and_state_page_names(self) -> None:
+        self.assertEqual(action_selector(action_key("#filters")), "#filters")
+        self.assertEqual(
+            state_page_name("SettingsPage", "billing details"),
+            "SettingsBillingDetailsViewPage",
+        )
+        self.assertEqual(
+            state_page_name("SettingsBillingViewPage", "Edit"),
+            "SettingsBillingEditViewPage",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
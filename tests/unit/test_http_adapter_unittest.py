@@ -0,0 +1,282 @@
+import functools
+import gzip
+import tempfile
+import threading
+import unittest
+import zlib
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+from unittest.mock import patch
+
+from autopom.browser.browseruse_adapter import (
+    MockBrowserUseAdapter,
+    create_browser_adapter,
+)
+from autopom.browser.http_adapter import HttpBrowserAdapter, StaticDomParser
+
+LOGIN_PAGE = """<!doctype html>
+<html><head><title>Sign in | Shop</title></head>
+<body>
+  <nav><a href="/">Home</a> <a href="/help?topic=login">Help &amp; FAQ</a></nav>
+  <main>
+    <h1>Welcome back</h1>
+    <form>
+      <input type="hidden" name="csrf" value="x">
+      <input name="email" placeholder="Email">
+      <input type="password" id="password">
+      <select name="country"><option>PT</option></select>
+      <button data-testid="submit">Sign <b>in</b></button>
+      <div role="tab" aria-label="Phone">Phone</div>
+    </form>
+    <a href="javascript:void(0)">Noop</a>
+    <a href="#top">Top</a>
+  </main>
+</body></html>
+"""
+
+SPA_SHELL = """<!doctype html>
+<html><head><title>App</title><script src="/bundle.js"></script></head>
+<body><div id="root"></div><noscript>You need to enable JavaScript.</noscript></body>
+</html>
+"""
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    # Keep-alive, so the fetcher's connection reuse is observable.
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        redirects = {"/old-login": "/login.html", "/offsite": "https://shop.test/"}
+        if self.path in redirects:
+            self.send_response(301)
+            self.send_header("Location", redirects[self.path])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/deflated":
+            # Raw deflate, without the zlib header some servers omit.
+            compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+            body = compressor.compress(LOGIN_PAGE.encode()) + compressor.flush()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Encoding", "deflate")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.path == "/zipped":
+            body = gzip.compress(LOGIN_PAGE.encode())
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        super().do_GET()
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+
+class RecordingFallback(MockBrowserUseAdapter):
+    navigations: ClassVar[list[str]] = []
+
+    def goto(self, url: str) -> None:
+        self.navigations.append(url)
+        super().goto(url)
+
+
+class TestHttpBrowserAdapter(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        (root / "login.html").write_text(LOGIN_PAGE, encoding="utf-8")
+        (root / "app.html").write_text(SPA_SHELL, encoding="utf-8")
+        handler = functools.partial(FixtureHandler, directory=str(root))
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        RecordingFallback.navigations = []
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self._tmp.cleanup()
+
+    def adapter(self, **kwargs: object) -> HttpBrowserAdapter:
+        adapter = HttpBrowserAdapter(base_url=self.base_url, **kwargs)
+        self.addCleanup(adapter.close)
+        return adapter
+
+    def test_static_page_summary_matches_browser_extraction_shape(self) -> None:
+        adapter = self.adapter()
+        adapter.goto(f"{self.base_url}/login.html")
+        summary = adapter.extract_interactive_dom_summary()
+
+        self.assertEqual(adapter.title(), "Sign in | Shop")
+        self.assertEqual(
+            set(summary), {"fingerprint", "landmarks", "elements", "links"}
+        )
+        self.assertEqual(summary["fingerprint"], "fast::Sign in | Shop::7")
+        self.assertEqual(
+            [
+                (element["role"], element["label"], element["selector"])
+                for element in summary["elements"]
+            ],
+            [
+                ("textbox", "email", 'input[name="email"]'),
+                ("textbox", "password", "#password"),
+                ("textbox", "country", 'select[name="country"]'),
+                ("button", "Sign in", 'button[data-testid="submit"]'),
+                ("tab", "Phone", 'div[aria-label="Phone"]'),
+                ("link", "Home", f'a[href="{self.base_url}/"]'),
+                ("link", "Help & FAQ", f'a[href="{self.base_url}/help?topic=login"]'),
+            ],
+        )
+        self.assertEqual(
+            [e["label"] for e in summary["elements"] if e.get("submits_form")],
+            ["Sign in"],
+        )
+        self.assertEqual(
+            summary["links"],
+            [
+                f"{self.base_url}/",
+                f"{self.base_url}/help?topic=login",
+                f"{self.base_url}/login.html#top",
+            ],
+        )
+        self.assertTrue(adapter.is_visible('input[name="email"]'))
+        self.assertFalse(adapter.is_visible("#missing"))
+        self.assertEqual(
+            adapter.are_visible(['input[name="email"]', "#missing", ""]),
+            [True, False, False],
+        )
+        self.assertEqual(adapter.fetcher.stats()["http_static_pages"], 1)
+
+    def test_visibility_checks_summarize_each_page_once(self) -> None:
+        adapter = self.adapter()
+        with patch.object(
+            StaticDomParser,
+            "summary",
+            autospec=True,
+            side_effect=StaticDomParser.summary,
+        ) as summary:
+            adapter.goto(f"{self.base_url}/login.html")
+            for selector in ('input[name="email"]', "#password", "#missing"):
+                adapter.is_visible(selector)
+            adapter.are_visible(['input[name="email"]', "#missing"])
+            self.assertEqual(summary.call_count, 1)
+
+            adapter.goto(f"{self.base_url}/app.html")
+            self.assertFalse(adapter.is_visible('input[name="email"]'))
+            self.assertEqual(summary.call_count, 2)
+
+    def test_snapshot_reports_page_state_from_one_fetch(self) -> None:
+        adapter = self.adapter()
+        adapter.goto(f"{self.base_url}/login.html")
+        snapshot = adapter.snapshot()
+
+        self.assertEqual(snapshot["url"], f"{self.base_url}/login.html")
+        self.assertEqual(snapshot["title"], "Sign in | Shop")
+        self.assertTrue(snapshot["visibility"]['input[name="email"]'])
+        self.assertEqual(len(snapshot["visibility"]), 7)
+        self.assertEqual(adapter.fetcher.stats()["http_fetches"], 1)
+
+    def test_connections_are_reused_and_redirects_followed(self) -> None:
+        adapter = self.adapter()
+        adapter.goto(f"{self.base_url}/old-login")
+        self.assertEqual(adapter.url(), f"{self.base_url}/login.html")
+        self.assertEqual(adapter.title(), "Sign in | Shop")
+        adapter.goto(f"{self.base_url}/zipped")
+        self.assertEqual(adapter.title(), "Sign in | Shop")
+        adapter.goto(f"{self.base_url}/deflated")
+        self.assertEqual(adapter.title(), "Sign in | Shop")
+
+        stats = adapter.fetcher.stats()
+        self.assertEqual(stats["http_fetches"], 3)
+        self.assertEqual(stats["http_reused_connections"], 3)
+
+    def test_redirects_off_the_origin_are_not_followed(self) -> None:
+        adapter = self.adapter(
+            fallback_factory=lambda: RecordingFallback(base_url=self.base_url)
+        )
+        adapter.goto(f"{self.base_url}/offsite")
+
+        self.assertEqual(adapter.url(), "https://shop.test/")
+        self.assertEqual(adapter.last_status, 301)
+        self.assertEqual(adapter.extract_interactive_dom_summary()["elements"], [])
+        self.assertEqual(RecordingFallback.navigations, [])
+        self.assertEqual(adapter.fetcher.stats()["http_blocked_redirects"], 1)
+
+    def test_spa_shell_escalates_to_browser_fallback(self) -> None:
+        adapter = self.adapter(
+            fallback_factory=lambda: RecordingFallback(base_url=self.base_url)
+        )
+        adapter.goto(f"{self.base_url}/login.html")
+        adapter.goto(f"{self.base_url}/app.html")
+
+        self.assertEqual(RecordingFallback.navigations, [f"{self.base_url}/app.html"])
+        # Everything now comes from the browser, not the fetched shell.
+        self.assertEqual(adapter.title(), "Mock Page /app.html")
+        self.assertEqual(
+            adapter.extract_interactive_dom_summary()["fingerprint"],
+            "mock::/app.html::1",
+        )
+        stats = adapter.fetcher.stats()
+        self.assertEqual(stats["http_escalated_pages"], 1)
+        self.assertEqual(stats["http_escalated_spa_root"], 1)
+        # The fetch and the browser load both hit the host.
+        self.assertEqual(adapter.last_requests, 2)
+
+    def test_click_loads_current_page_in_browser(self) -> None:
+        adapter = self.adapter(
+            fallback_factory=lambda: RecordingFallback(base_url=self.base_url)
+        )
+        adapter.goto(f"{self.base_url}/login.html")
+
+        self.assertTrue(adapter.click('button[data-testid="submit"]'))
+        self.assertEqual(RecordingFallback.navigations, [f"{self.base_url}/login.html"])
+        self.assertEqual(adapter.fetcher.stats()["http_escalated_click"], 1)
+
+    def test_without_fallback_spa_shell_yields_empty_summary(self) -> None:
+        adapter = self.adapter()
+        adapter.goto(f"{self.base_url}/app.html")
+
+        self.assertFalse(adapter.click("#root"))
+        self.assertEqual(adapter.extract_interactive_dom_summary()["elements"], [])
+        self.assertEqual(adapter.fetcher.stats()["http_unrendered_spa_root"], 1)
+
+    def test_worker_tabs_share_the_connection_pool(self) -> None:
+        fallback = RecordingFallback(base_url=self.base_url)
+        adapter = self.adapter(fallback=fallback)
+        tab = adapter.new_tab()
+        tab.goto(f"{self.base_url}/app.html")
+        tab.close()
+
+        self.assertIs(tab.fetcher, adapter.fetcher)
+        self.assertEqual(RecordingFallback.navigations, [f"{self.base_url}/app.html"])
+        self.assertEqual(adapter.fetcher.stats()["http_escalated_pages"], 1)
+
+    def test_factory_builds_http_adapter(self) -> None:
+        adapter = create_browser_adapter("HTTP", base_url=self.base_url)
+        self.assertIsInstance(adapter, HttpBrowserAdapter)
+        self.assertIsNone(adapter.fallback)
+
+
+class TestJsRenderedHeuristic(unittest.TestCase):
+    def reason(self, html: str) -> str | None:
+        parser = StaticDomParser("https://example.com/")
+        parser.feed(html)
+        return parser.js_rendered_reason()
+
+    def test_empty_body_is_js_rendered(self) -> None:
+        self.assertEqual(self.reason("<html><body></body></html>"), "empty_body")
+
+    def test_server_rendered_spa_root_is_static(self) -> None:
+        links = "".join(f'<a href="/p/{index}">Item {index}</a>' for index in range(5))
+        self.assertIsNone(self.reason(f'<div id="__next">{links}</div>'))
+
+    def test_article_without_controls_is_static(self) -> None:
+        self.assertIsNone(self.reason(f"<main><p>{'text ' * 80}</p></main>"))
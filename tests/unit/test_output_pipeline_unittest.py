@@ -0,0 +1,69 @@
+import threading
+import time
+import unittest
+
+from autopom.io.output_pipeline import OutputPipeline
+
+
+class TestOutputPipeline(unittest.TestCase):
+    def test_submit_blocks_when_pipeline_is_full(self) -> None:
+        release = threading.Event()
+        pipeline = OutputPipeline(workers=1, max_pending=1)
+        pipeline.submit(release.wait)
+
+        submitted = threading.Event()
+        producer = threading.Thread(
+            target=lambda: (pipeline.submit(lambda: None), submitted.set())
+        )
+        producer.start()
+        self.assertFalse(submitted.wait(0.1))
+
+        release.set()
+        producer.join(timeout=2)
+        stats = pipeline.close()
+
+        self.assertTrue(submitted.is_set())
+        self.assertEqual(stats["output_tasks"], 2)
+        self.assertEqual(stats["output_peak_pending"], 1)
+        self.assertGreater(stats["output_backpressure_seconds"], 0)
+
+    def test_close_flushes_pending_tasks_and_keeps_first_error(self) -> None:
+        written: list[int] = []
+
+        def write(index: int) -> None:
+            time.sleep(0.01)
+            if index == 1:
+                raise OSError("disk full")
+            written.append(index)
+
+        pipeline = OutputPipeline(workers=2, max_pending=4)
+        for index in range(4):
+            pipeline.submit(write, index)
+        pipeline.close()
+
+        self.assertEqual(sorted(written), [0, 2, 3])
+        self.assertIsInstance(pipeline.error, OSError)
+
+    def test_zero_workers_runs_tasks_inline(self) -> None:
+        caller = threading.get_ident()
+        threads: list[int] = []
+        pipeline = OutputPipeline(workers=0)
+        pipeline.submit(lambda: threads.append(threading.get_ident()))
+
+        self.assertEqual(threads, [caller])
+        self.assertEqual(pipeline.close()["output_tasks"], 1)
+
+    def test_inline_task_error_reaches_the_caller(self) -> None:
+        def write() -> None:
+            raise OSError("disk full")
+
+        pipeline = OutputPipeline(workers=0)
+        with self.assertRaises(OSError):
+            pipeline.submit(write)
+
+        self.assertIsInstance(pipeline.error, OSError)
+        self.assertEqual(pipeline.close()["output_tasks"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,22 @@
+import tempfile
 import unittest
+from pathlib import Path
 
-from autopom.agent.policies import is_denied_domain, normalize_url, same_origin
-from autopom.agent.state_store import CrawlState
+from autopom.agent.policies import (
+    is_denied_domain,
+    normalize_url,
+    route_template,
+    same_origin,
+)
+from autopom.agent.state_store import (
+    BloomSeenSet,
+    CrawlState,
+    FrontierItem,
+    PriorityFrontier,
+)
+from autopom.config import CrawlConfig
+from autopom.io.checkpoint import CheckpointStore
+from autopom.io.fingerprints import diff_page_fingerprints, merge_page_fingerprints
 
 
 class TestPoliciesAndState(unittest.TestCase):
@@ -42,6 +57,286 @@ class TestPoliciesAndState(unittest.TestCase):
         self.assertEqual(signature_a, signature_b)
         self.assertNotEqual(signature_a, signature_c)
 
+    def test_claim_counts_in_flight_items_against_page_budget(self) -> None:
+        state = CrawlState()
+        for index in range(3):
+            state.enqueue(FrontierItem(f"https://example.com/{index}", 0))
+
+        first = state.claim(max_pages=2)
+        second = state.claim(max_pages=2)
+
+        self.assertIsNotNone(first)
+        self.assertIsNotNone(second)
+        self.assertIsNone(state.claim(max_pages=2))
+        self.assertFalse(state.is_exhausted(max_pages=2))
+
+        state.release(modeled=False)
+        self.assertIsNotNone(state.claim(max_pages=2))
+        state.release(modeled=True)
+        state.release(modeled=True)
+        self.assertEqual(state.in_flight, 0)
+        self.assertTrue(state.is_exhausted(max_pages=2))
+
+    def test_pages_remaining_is_capped_by_queued_and_in_flight_work(self) -> None:
+        state = CrawlState()
+        for index in range(3):
+            state.enqueue(FrontierItem(f"https://example.com/{index}", 0))
+        state.claim(max_pages=1000)
+
+        self.assertEqual(state.pages_remaining(max_pages=1000), 3)
+        self.assertEqual(state.pages_remaining(max_pages=2), 2)
+        state.release(modeled=True)
+        self.assertEqual(state.pages_remaining(max_pages=1), 0)
+
+    def test_enqueue_skips_urls_already_queued_or_visited(self) -> None:
+        state = CrawlState()
+        self.assertTrue(state.enqueue(FrontierItem("https://example.com/a?x=1", 0)))
+        self.assertFalse(
+            state.enqueue(
+                FrontierItem("https://example.com/a?x=1&utm_source=nav#top", 1)
+            )
+        )
+        state.mark_url_seen("https://example.com/redirected")
+        self.assertFalse(
+            state.enqueue(FrontierItem("https://example.com/redirected", 1))
+        )
+
+        self.assertEqual(state.frontier_size(), 1)
+        self.assertEqual(state.url_dedupe_hits, 2)
+
+    def test_record_signature_counts_duplicates(self) -> None:
+        state = CrawlState()
+        self.assertTrue(state.record_signature("sig-a"))
+        self.assertFalse(state.record_signature("sig-a"))
+        self.assertEqual(state.duplicate_hits, 1)
+
+    def test_bloom_seen_set_has_no_false_negatives_and_bounded_fp_rate(self) -> None:
+        seen = BloomSeenSet(capacity=5_000, false_positive_rate=0.01)
+        for index in range(5_000):
+            seen.add(f"https://example.com/product/{index}")
+
+        self.assertTrue(
+            all(
+                f"https://example.com/product/{index}" in seen for index in range(5_000)
+            )
+        )
+        false_positives = sum(
+            f"https://example.com/other/{index}" in seen for index in range(5_000)
+        )
+        self.assertLess(false_positives / 5_000, 0.03)
+        # ~9.6 bits per item at a 1% false positive rate.
+        self.assertLess(seen.size_bytes, 5_000 * 2)
+
+    def test_bloom_backed_state_dedupes_urls_and_signatures(self) -> None:
+        state = CrawlState.create("bloom", seen_set_capacity=100)
+        self.assertTrue(state.enqueue(FrontierItem("https://example.com/a", 0)))
+        self.assertFalse(state.enqueue(FrontierItem("https://example.com/a#x", 0)))
+        self.assertTrue(state.record_signature("sig-a"))
+        self.assertFalse(state.record_signature("sig-a"))
+
+        stats = state.stats()
+        self.assertEqual(stats["seen_set"], "bloom")
+        self.assertEqual(stats["seen_urls"], 1)
+        self.assertGreater(stats["seen_set_bytes"], 0)
+
+    def test_invalid_seen_set_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            CrawlState.create("cuckoo")
+
+    def test_route_template_collapses_id_segments(self) -> None:
+        self.assertEqual(
+            route_template("https://example.com/product/123?color=red"),
+            "/product/{id}",
+        )
+        self.assertEqual(
+            route_template(
+                "https://example.com/orders/3f2b9c1e-8a4d-4e5f-9b6a-1c2d3e4f5a6b/items"
+            ),
+            "/orders/{id}/items",
+        )
+        self.assertEqual(route_template("https://example.com/login"), "/login")
+
+    def test_route_template_collapses_slugs_below_first_segment(self) -> None:
+        self.assertEqual(
+            route_template("https://example.com/blog/my-first-blog-post"),
+            "/blog/{slug}",
+        )
+        self.assertEqual(
+            route_template("https://example.com/shop/blue-widget-42"), "/shop/{slug}"
+        )
+        self.assertEqual(
+            route_template("https://example.com/forgot-password"), "/forgot-password"
+        )
+        self.assertEqual(
+            route_template("https://example.com/account/reset-password"),
+            "/account/reset-password",
+        )
+
+    def test_admit_template_caps_samples_per_route_template(self) -> None:
+        state = CrawlState()
+        admitted = [
+            state.admit_template(f"https://example.com/product/{index}", 2)
+            for index in range(5)
+        ]
+
+        self.assertEqual(admitted, [True, True, False, False, False])
+        self.assertTrue(state.admit_template("https://example.com/cart", 2))
+        self.assertTrue(state.admit_template("https://example.com/product/9", None))
+        self.assertEqual(state.stats()["route_templates"], 2)
+        self.assertEqual(state.stats()["template_limit_hits"], 3)
+
+    def test_cross_origin_crawl_caps_templates_per_host(self) -> None:
+        config = CrawlConfig(base_url="https://example.com", same_origin_only=False)
+        state = CrawlState.from_config(config)
+
+        admitted = [
+            state.admit_template(f"https://{host}/product/{index}", 1)
+            for host in ("example.com", "shop.example.com")
+            for index in range(2)
+        ]
+
+        self.assertEqual(admitted, [True, False, True, False])
+        self.assertEqual(
+            state.route_template("https://Shop.example.com/product/7"),
+            "shop.example.com/product/{id}",
+        )
+        self.assertEqual(
+            CrawlState().route_template("https://shop.example.com/product/7"),
+            "/product/{id}",
+        )
+
+    def test_priority_frontier_prefers_novel_route_templates(self) -> None:
+        frontier = PriorityFrontier()
+        for index in range(1, 4):
+            frontier.push(FrontierItem(f"https://example.com/list/{index}", 1))
+        frontier.push(FrontierItem("https://example.com/signup", 1))
+
+        order = [frontier.pop().url for _ in range(4)]
+
+        self.assertEqual(order[0], "https://example.com/list/1")
+        self.assertEqual(order[1], "https://example.com/signup")
+        self.assertIsNone(frontier.pop())
+
+    def test_priority_frontier_boosts_urls_with_more_inlinks(self) -> None:
+        state = CrawlState.create(frontier_strategy="priority")
+        state.enqueue(FrontierItem("https://example.com/about", 1))
+        state.enqueue(FrontierItem("https://example.com/pricing", 1))
+        state.enqueue(FrontierItem("https://example.com/pricing", 2))
+
+        self.assertEqual(state.dequeue().url, "https://example.com/pricing")
+        self.assertEqual(state.frontier_size(), 1)
+
+    def test_priority_frontier_accepts_custom_scorer(self) -> None:
+        frontier = PriorityFrontier(scorer=lambda item, signals: float(item.depth))
+        frontier.push(FrontierItem("https://example.com/shallow", 1))
+        frontier.push(FrontierItem("https://example.com/deep", 3))
+
+        self.assertEqual(frontier.pop().url, "https://example.com/deep")
+
+    def test_record_edge_prunes_actions_reaching_known_states(self) -> None:
+        state = CrawlState()
+        state.record_signature("page")
+
+        self.assertTrue(state.record_edge("page", "click:#filters", "filters"))
+        self.assertTrue(state.record_edge("filters", "click:#sort", "sorted"))
+        self.assertFalse(state.record_edge("filters", "click:#close", "page"))
+        self.assertEqual(state.transition("filters", "click:#close"), "page")
+        self.assertIsNone(state.transition("page", "click:#sort"))
+        self.assertEqual(state.pruned_actions, 1)
+        self.assertEqual(state.duplicate_hits, 0)
+
+    def test_shortest_path_uses_fewest_recorded_actions(self) -> None:
+        state = CrawlState()
+        state.record_edge("page", "click:#step-1", "step-1")
+        state.record_edge("step-1", "click:#step-2", "step-2")
+        state.record_edge("step-2", "click:#step-3", "step-3")
+        state.record_edge("page", "click:#skip", "step-3")
+
+        self.assertEqual(state.shortest_path("page", "step-3"), ["click:#skip"])
+        self.assertEqual(
+            state.shortest_path("page", "step-2"), ["click:#step-1", "click:#step-2"]
+        )
+        self.assertEqual(state.shortest_path("page", "page"), [])
+        self.assertIsNone(state.shortest_path("step-3", "page"))
+
+        restored = CrawlState.from_checkpoint(state.snapshot())
+        self.assertEqual(restored.shortest_path("page", "step-3"), ["click:#skip"])
+        self.assertEqual(restored.edge_history, state.edge_history)
+
+    def test_snapshot_round_trip_requeues_claimed_items(self) -> None:
+        state = CrawlState.create(seen_set="bloom", seen_set_capacity=100)
+        state.enqueue(FrontierItem("https://example.com/", 0))
+        state.enqueue(FrontierItem("https://example.com/login", 1))
+        state.claim(max_pages=10)
+        state.record_signature("sig-home")
+        state.admit_template("https://example.com/", None)
+
+        restored = CrawlState.from_checkpoint(state.snapshot())
+
+        self.assertEqual(
+            [item.url for item in restored.frontier],
+            ["https://example.com/", "https://example.com/login"],
+        )
+        self.assertIn("sig-home", restored.visited_signatures)
+        self.assertFalse(restored.enqueue(FrontierItem("https://example.com/login", 2)))
+        self.assertEqual(restored.template_samples["/"], 1)
+        self.assertEqual(restored.in_flight, 0)
+
+    def test_snapshot_leaves_out_states_of_claimed_items(self) -> None:
+        state = CrawlState()
+        state.enqueue(FrontierItem("https://example.com/", 0))
+        state.enqueue(FrontierItem("https://example.com/login", 1))
+        home = state.claim(max_pages=10)
+        login = state.claim(max_pages=10)
+        self.assertTrue(state.charge_page(max_pages=10, item=home))
+        self.assertTrue(state.charge_page(max_pages=10, item=login))
+        state.release(home, modeled=True)
+
+        # Login and its state are replayed on resume, so neither is counted yet.
+        self.assertEqual(state.page_count, 3)
+        self.assertEqual(state.snapshot()["page_count"], 2)
+
+    def test_checkpoint_store_writes_atomically_and_checks_base_url(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = CheckpointStore(Path(tmp_dir))
+            self.assertIsNone(store.load("https://example.com"))
+
+            store.write("https://example.com", CrawlState().snapshot())
+
+            self.assertEqual(store.load("https://example.com")["page_count"], 0)
+            self.assertEqual(
+                [path.name for path in Path(tmp_dir).iterdir()],
+                ["crawl_checkpoint.json"],
+            )
+            with self.assertRaises(ValueError):
+                store.load("https://other.example.com")
+
+    def test_diff_page_fingerprints_reports_removed_only_when_complete(self) -> None:
+        previous = {
+            "https://example.com/": {"content_hash": "a", "page_name": "HomePage"},
+            "https://example.com/old": {"content_hash": "b", "page_name": "OldPage"},
+        }
+        current = {
+            "https://example.com/": {"content_hash": "a2", "page_name": "HomePage"},
+            "https://example.com/new": {"content_hash": "c", "page_name": "NewPage"},
+        }
+
+        changes = diff_page_fingerprints(previous, current, complete=True)
+        partial = diff_page_fingerprints(previous, current, complete=False)
+
+        self.assertEqual(
+            [page["page_name"] for page in changes["changed"]], ["HomePage"]
+        )
+        self.assertEqual([page["page_name"] for page in changes["added"]], ["NewPage"])
+        self.assertEqual(
+            [page["page_name"] for page in changes["removed"]], ["OldPage"]
+        )
+        self.assertEqual(partial["removed"], [])
+        self.assertIn(
+            "https://example.com/old",
+            merge_page_fingerprints(previous, current, complete=False),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
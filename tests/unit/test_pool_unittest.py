@@ -0,0 +1,169 @@
+import asyncio
+import threading
+import unittest
+
+from autopom.browser.async_adapter import AsyncMockBrowserUseAdapter
+from autopom.browser.browseruse_adapter import MockBrowserUseAdapter
+from autopom.browser.pool import BrowserPool
+from autopom.config import CrawlConfig
+
+
+class Tab(MockBrowserUseAdapter):
+    crashed: bool = False
+    closed: bool = False
+
+    def title(self) -> str:
+        if self.crashed:
+            raise ConnectionResetError(
+                "Target page, context or browser has been closed"
+            )
+        return super().title()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestBrowserPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.opened: list[Tab] = []
+
+    def open_tab(self) -> Tab:
+        tab = Tab(base_url="https://example.com")
+        self.opened.append(tab)
+        return tab
+
+    def test_warm_tabs_are_reused_without_new_launches(self) -> None:
+        pool = BrowserPool(self.open_tab, size=2)
+        pool.warm()
+
+        for _ in range(5):
+            pool.release(pool.acquire())
+
+        stats = pool.stats()
+        self.assertEqual(len(self.opened), 2)
+        self.assertEqual(stats["pool_launches"], 2)
+        self.assertEqual(stats["pool_acquires"], 5)
+        self.assertEqual(stats["pool_warm_acquires"], 5)
+        self.assertIn("pool_acquire_avg_ms", stats)
+        self.assertIn("pool_launch_max_ms", stats)
+
+    def test_worn_out_tab_is_closed_and_replaced_on_next_acquire(self) -> None:
+        pool = BrowserPool(self.open_tab, size=1, max_uses=2)
+        pool.warm()
+
+        first = pool.acquire()
+        pool.release(first)
+        self.assertIs(pool.acquire(), first)
+        pool.release(first)
+
+        self.assertTrue(first.closed)
+        self.assertEqual(len(self.opened), 1)
+        self.assertIsNot(pool.acquire(), first)
+        self.assertEqual(len(self.opened), 2)
+        self.assertEqual(pool.stats()["pool_recycled"], 1)
+
+    def test_failed_page_recycles_its_tab(self) -> None:
+        pool = BrowserPool(self.open_tab, size=1)
+        pool.warm()
+
+        tab = pool.acquire()
+        pool.release(tab, failed=True)
+
+        self.assertTrue(tab.closed)
+        self.assertEqual(pool.stats()["pool_failed_pages"], 1)
+        self.assertEqual(pool.stats()["pool_warm_acquires"], 1)
+        self.assertIsNot(pool.acquire(), tab)
+
+    def test_unhealthy_tab_is_skipped_on_acquire(self) -> None:
+        pool = BrowserPool(self.open_tab, size=2)
+        pool.warm()
+        self.opened[1].crashed = True
+
+        tab = pool.acquire()
+
+        self.assertIs(tab, self.opened[0])
+        self.assertTrue(self.opened[1].closed)
+        self.assertEqual(pool.stats()["pool_unhealthy"], 1)
+
+    def test_cold_acquire_launches_a_tab(self) -> None:
+        pool = BrowserPool(self.open_tab, size=1)
+
+        pool.acquire()
+
+        self.assertEqual(pool.stats()["pool_launches"], 1)
+        self.assertEqual(pool.stats()["pool_warm_acquires"], 0)
+
+    def test_tabs_stay_with_the_thread_that_opened_them(self) -> None:
+        pool = BrowserPool(self.open_tab, size=1)
+        pool.warm()
+        leased: list[Tab] = []
+
+        worker = threading.Thread(target=lambda: leased.append(pool.acquire()))
+        worker.start()
+        worker.join()
+
+        self.assertIsNot(leased[0], self.opened[0])
+        self.assertIs(pool.acquire(), self.opened[0])
+
+    def test_close_closes_idle_tabs(self) -> None:
+        pool = BrowserPool(self.open_tab, size=2)
+        pool.warm()
+
+        pool.close()
+
+        self.assertTrue(all(tab.closed for tab in self.opened))
+
+    def test_async_pool_warms_and_recycles(self) -> None:
+        async def scenario() -> dict:
+            source = AsyncMockBrowserUseAdapter(base_url="https://example.com")
+            pool = BrowserPool(source.new_tab, size=2, max_uses=1)
+            await pool.awarm()
+            tab = await pool.aacquire()
+            await pool.arelease(tab)
+            await pool.aclose()
+            return pool.stats()
+
+        stats = asyncio.run(scenario())
+
+        self.assertEqual(stats["pool_launches"], 2)
+        self.assertEqual(stats["pool_warm_acquires"], 1)
+        self.assertEqual(stats["pool_recycled"], 1)
+
+    def test_merge_sums_counters_and_recomputes_averages(self) -> None:
+        first, second = BrowserPool(self.open_tab), BrowserPool(self.open_tab)
+        first.warm()
+        second.warm()
+        second.acquire()
+        second.acquire()
+
+        merged = BrowserPool.merge([first.stats(), second.stats()])
+
+        self.assertEqual(merged["pool_launches"], 3)
+        self.assertEqual(merged["pool_acquires"], 2)
+        self.assertEqual(
+            merged["pool_launch_max_ms"],
+            max(
+                first.stats()["pool_launch_max_ms"],
+                second.stats()["pool_launch_max_ms"],
+            ),
+        )
+        self.assertEqual(
+            merged["pool_acquire_avg_ms"],
+            round(merged["pool_acquire_seconds"] * 1000 / 2, 1),
+        )
+        self.assertEqual(BrowserPool.merge([{}, {}]), {})
+
+    def test_config_validates_pool_options(self) -> None:
+        with self.assertRaises(ValueError):
+            CrawlConfig(base_url="https://example.com", browser_pool_size=-1)
+        with self.assertRaises(ValueError):
+            CrawlConfig(base_url="https://example.com", browser_recycle_after=5)
+        pool = BrowserPool.from_config(
+            CrawlConfig(
+                base_url="https://example.com",
+                browser_pool_size=2,
+                browser_recycle_after=50,
+            ),
+            self.open_tab,
+        )
+        self.assertEqual((pool.size, pool.max_uses), (2, 50))
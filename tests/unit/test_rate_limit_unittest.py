@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from autopom.browser.rate_limit import HostRateLimiter, parse_retry_after
+from autopom.config import CrawlConfig
+
+
+class TestHostRateLimiter(unittest.TestCase):
+    def test_token_bucket_paces_navigations_per_host(self) -> None:
+        limiter = HostRateLimiter(rate=20, burst=1)
+
+        started = time.monotonic()
+        for _ in range(3):
+            limiter.acquire("https://example.com/page")
+            limiter.release("https://example.com/page", 200)
+        elapsed = time.monotonic() - started
+
+        # The first request uses the burst token; two more wait 50ms each.
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertEqual(limiter.stats()["throttle_waits"], 2)
+
+    def test_charged_requests_delay_the_next_navigation(self) -> None:
+        limiter = HostRateLimiter(rate=20, burst=1)
+
+        started = time.monotonic()
+        limiter.acquire("https://example.com/page")
+        limiter.release("https://example.com/page", 200)
+        limiter.charge("https://example.com/page", 1)
+        limiter.acquire("https://example.com/next")
+        elapsed = time.monotonic() - started
+
+        # The charged request is paid for before the next navigation starts.
+        self.assertGreaterEqual(elapsed, 0.09)
+
+    def test_hosts_have_independent_buckets(self) -> None:
+        limiter = HostRateLimiter(rate=1, burst=1)
+
+        started = time.monotonic()
+        limiter.acquire("https://a.example.com/")
+        limiter.acquire("https://b.example.com/")
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(limiter.stats()["throttle_waits"], 0)
+
+    def test_concurrency_cap_holds_navigations_until_release(self) -> None:
+        limiter = HostRateLimiter(max_concurrency=1)
+        limiter.acquire("https://example.com/a")
+        acquired = threading.Event()
+        worker = threading.Thread(
+            target=lambda: (limiter.acquire("https://example.com/b"), acquired.set())
+        )
+        worker.start()
+
+        self.assertFalse(acquired.wait(0.05))
+        limiter.release("https://example.com/a", 200)
+        self.assertTrue(acquired.wait(1))
+        worker.join()
+
+    def test_throttle_backs_off_and_halves_rate_then_recovers(self) -> None:
+        limiter = HostRateLimiter(rate=10, burst=5, backoff_s=0.05)
+        url = "https://example.com/"
+
+        limiter.acquire(url)
+        self.assertTrue(limiter.release(url, 429))
+        self.assertEqual(limiter.stats()["throttle_min_rate"], 5.0)
+        started = time.monotonic()
+        limiter.acquire(url)
+        self.assertGreaterEqual(time.monotonic() - started, 0.04)
+        self.assertFalse(limiter.release(url, 200))
+        self.assertEqual(limiter.stats()["throttle_min_rate"], 6.0)
+        self.assertEqual(limiter.stats()["throttled_responses"], 1)
+
+    def test_retry_after_extends_the_backoff(self) -> None:
+        limiter = HostRateLimiter(backoff_s=0.01, max_concurrency=4)
+        url = "https://example.com/"
+
+        limiter.acquire(url)
+        limiter.release(url, 503, retry_after=0.1)
+        started = time.monotonic()
+        asyncio.run(limiter.aacquire(url))
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+    def test_parse_retry_after_ignores_http_dates(self) -> None:
+        self.assertEqual(parse_retry_after("2"), 2.0)
+        self.assertIsNone(parse_retry_after("Wed, 21 Oct 2026 07:28:00 GMT"))
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_from_config_splits_host_budget_across_processes(self) -> None:
+        config = CrawlConfig(
+            base_url="https://example.com",
+            rate_limit=8,
+            host_concurrency=4,
+            processes=2,
+        )
+        limiter = HostRateLimiter.from_config(config)
+
+        self.assertEqual(limiter.rate, 4)
+        self.assertEqual(limiter.max_concurrency, 2)
+        with self.assertRaises(ValueError):
+            CrawlConfig(base_url="https://example.com", rate_limit=0)
+
+    def test_host_concurrency_below_processes_is_rejected(self) -> None:
+        # One slot per process would put 4 navigations on a host capped at 2.
+        with self.assertRaisesRegex(ValueError, "host_concurrency '2'"):
+            CrawlConfig(base_url="https://example.com", host_concurrency=2, processes=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
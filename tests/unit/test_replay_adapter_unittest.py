@@ -0,0 +1,94 @@
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+from autopom.browser.browseruse_adapter import (
+    MockBrowserUseAdapter,
+    create_browser_adapter,
+)
+from autopom.browser.replay_adapter import (
+    RecordingBrowserAdapter,
+    ReplayArchive,
+    ReplayBrowserAdapter,
+)
+from autopom.config import CrawlConfig
+
+
+class TestReplayBrowserAdapter(unittest.TestCase):
+    def test_replays_recorded_answers_after_a_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "shop.replay.gz"
+            recorder = RecordingBrowserAdapter(
+                browser=MockBrowserUseAdapter(base_url="https://shop.test"),
+                archive=ReplayArchive(base_url="https://shop.test"),
+                path=path,
+            )
+            recorder.goto("https://shop.test/login")
+            recorded = recorder.snapshot(max_nodes=2)
+            recorder.snapshot(max_nodes=1)
+            recorder.are_visible(["#missing", "input[name='username']"])
+            recorder.click("button:has-text('Sign In')")
+            recorder.close()
+
+            replay = ReplayBrowserAdapter.from_path("https://shop.test", path)
+            replay.goto("https://shop.test/login")
+
+            snapshot = replay.snapshot(max_nodes=2)
+            self.assertEqual(snapshot["elements"], recorded["elements"])
+            self.assertEqual(snapshot["title"], "Mock Page /login")
+            self.assertEqual(len(replay.snapshot(max_nodes=1)["elements"]), 1)
+            self.assertEqual(
+                replay.are_visible(["#missing", "input[name='username']", "#new"]),
+                [True, True, False],
+            )
+            self.assertTrue(replay.click("button:has-text('Sign In')"))
+            self.assertFalse(replay.click("#never-clicked"))
+            self.assertEqual(
+                replay.archive.stats(), {"replay_hits": 2, "replay_misses": 0}
+            )
+
+    def test_unrecorded_pages_read_as_empty(self) -> None:
+        replay = ReplayBrowserAdapter(
+            base_url="https://shop.test", archive=ReplayArchive()
+        )
+        replay.goto("https://shop.test/cart")
+
+        self.assertEqual(replay.url(), "https://shop.test/cart")
+        self.assertEqual(replay.last_status, 404)
+        self.assertEqual(replay.snapshot()["elements"], [])
+        self.assertEqual(replay.archive.stats()["replay_misses"], 1)
+
+    def test_rejects_files_that_are_not_replay_archives(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "other.gz"
+            path.write_bytes(gzip.compress(b'{"format": "other"}\n'))
+            with self.assertRaises(ValueError):
+                ReplayArchive.load(path)
+
+    def test_factory_and_config_wiring(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "site.replay.gz"
+            recorder = create_browser_adapter(
+                "mock", "https://example.com", record_replay=path
+            )
+            self.assertIsInstance(recorder, RecordingBrowserAdapter)
+            recorder.close()
+
+            replay = create_browser_adapter(
+                "replay", "https://example.com", replay_archive=path
+            )
+            self.assertIsInstance(replay, ReplayBrowserAdapter)
+
+        with self.assertRaises(ValueError):
+            CrawlConfig(base_url="https://example.com", browser_adapter="replay")
+        with self.assertRaises(ValueError):
+            CrawlConfig(
+                base_url="https://example.com",
+                record_replay=Path("site.replay.gz"),
+                processes=2,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from autopom.browser.resource_blocking import ResourceBlocker
+from autopom.cli.main import build_parser
+from autopom.config import CrawlConfig
+
+
+class FakeRequest:
+    def __init__(self, url: str, resource_type: str) -> None:
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self, url: str, resource_type: str) -> None:
+        self.request = FakeRequest(url, resource_type)
+        self.outcome = ""
+
+    def abort(self) -> None:
+        self.outcome = "aborted"
+
+    def continue_(self) -> None:
+        self.outcome = "continued"
+
+
+class TestResourceBlocking(unittest.TestCase):
+    def test_blocks_listed_types_and_url_patterns_but_never_documents(self) -> None:
+        blocker = ResourceBlocker(
+            resource_types=["image", "font"], url_patterns=["*analytics*"]
+        )
+        routes = [
+            FakeRoute("https://example.com/logo.png", "image"),
+            FakeRoute("https://example.com/app.js", "script"),
+            FakeRoute("https://cdn.analytics.io/tag.js", "script"),
+            FakeRoute("https://example.com/analytics", "document"),
+        ]
+        for route in routes:
+            blocker.handle_route(route)
+
+        self.assertEqual(
+            [route.outcome for route in routes],
+            ["aborted", "continued", "aborted", "continued"],
+        )
+        self.assertEqual(
+            blocker.stats(),
+            {
+                "blocked_requests": 2,
+                "blocked_image_requests": 1,
+                "blocked_url_pattern_requests": 1,
+                "allowed_requests": 2,
+            },
+        )
+
+    def test_invalid_resource_type_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            ResourceBlocker(resource_types=["document"])
+        with self.assertRaises(ValueError):
+            CrawlConfig(base_url="https://example.com", blocked_resource_types=["gif"])
+
+    def test_cli_parser_supports_block_resources(self) -> None:
+        args = build_parser().parse_args(
+            [
+                "--base-url",
+                "https://example.com",
+                "--block-resources",
+                "--block-resource-types",
+                "image,stylesheet",
+                "--block-url-pattern",
+                "*ads*",
+            ]
+        )
+        self.assertTrue(args.block_resources)
+        self.assertEqual(args.block_resource_types, "image,stylesheet")
+        self.assertEqual(args.block_url_pattern, ["*ads*"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import functools
+import gzip
+import tempfile
+import threading
+import unittest
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from autopom.agent.orchestrator import initial_crawl_state
+from autopom.config import CrawlConfig
+from autopom.io.seeds import load_seed_urls
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def urlset(*locs: str) -> str:
+    entries = "".join(f"<url><loc>{loc}</loc></url>" for loc in locs)
+    return f'<?xml version="1.0"?><urlset xmlns="{SITEMAP_NS}">{entries}</urlset>'
+
+
+def sitemap_index(*locs: str) -> str:
+    entries = "".join(f"<sitemap><loc>{loc}</loc></sitemap>" for loc in locs)
+    return f'<sitemapindex xmlns="{SITEMAP_NS}">{entries}</sitemapindex>'
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+
+class TestSeedSources(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_sitemap_urls_are_read_in_order_without_duplicates(self) -> None:
+        path = self.tmp / "sitemap.xml"
+        path.write_text(
+            urlset(
+                "https://example.com/a",
+                "https://example.com/b",
+                "https://example.com/a",
+            ),
+            encoding="utf-8",
+        )
+
+        self.assertEqual(
+            load_seed_urls(str(path), "https://example.com"),
+            ["https://example.com/a", "https://example.com/b"],
+        )
+
+    def test_url_list_skips_comments_and_resolves_relative_paths(self) -> None:
+        path = self.tmp / "urls.txt"
+        path.write_text(
+            "# checkout flow\nhttps://example.com/cart\n\n/checkout\n", encoding="utf-8"
+        )
+
+        self.assertEqual(
+            load_seed_urls(str(path), "https://example.com"),
+            ["https://example.com/cart", "https://example.com/checkout"],
+        )
+
+    def test_local_sitemap_index_follows_gzipped_children(self) -> None:
+        (self.tmp / "products.xml.gz").write_bytes(
+            gzip.compress(urlset("https://example.com/product/1").encode())
+        )
+        (self.tmp / "pages.xml").write_text(
+            urlset("https://example.com/about"), encoding="utf-8"
+        )
+        index = self.tmp / "sitemap_index.xml"
+        index.write_text(
+            sitemap_index("products.xml.gz", "pages.xml", "sitemap_index.xml"),
+            encoding="utf-8",
+        )
+
+        self.assertEqual(
+            load_seed_urls(str(index), "https://example.com"),
+            ["https://example.com/product/1", "https://example.com/about"],
+        )
+
+    def test_remote_sitemap_index_is_fetched_over_http(self) -> None:
+        server = ThreadingHTTPServer(
+            ("127.0.0.1", 0),
+            functools.partial(QuietHandler, directory=str(self.tmp)),
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        root = f"http://127.0.0.1:{server.server_address[1]}"
+        (self.tmp / "child.xml").write_text(
+            urlset("https://example.com/blog"), encoding="utf-8"
+        )
+        (self.tmp / "sitemap.xml").write_text(
+            sitemap_index(f"{root}/child.xml"), encoding="utf-8"
+        )
+
+        self.assertEqual(
+            load_seed_urls(f"{root}/sitemap.xml", "https://example.com"),
+            ["https://example.com/blog"],
+        )
+        with self.assertRaises(ValueError):
+            load_seed_urls(f"{root}/missing.xml", "https://example.com")
+
+    def test_unknown_xml_document_is_rejected(self) -> None:
+        path = self.tmp / "feed.xml"
+        path.write_text("<rss><channel/></rss>", encoding="utf-8")
+
+        with self.assertRaises(ValueError):
+            load_seed_urls(str(path), "https://example.com")
+
+    def test_seeds_are_policy_filtered_before_reaching_the_frontier(self) -> None:
+        path = self.tmp / "sitemap.xml"
+        path.write_text(
+            urlset(
+                "https://example.com/product/1",
+                "https://example.com/product/2",
+                "https://example.com/product/3",
+                "https://other.example.org/pricing",
+                "https://www.facebook.com/example",
+                "mailto:sales@example.com",
+                "https://example.com/about",
+            ),
+            encoding="utf-8",
+        )
+        config = CrawlConfig(
+            base_url="https://example.com",
+            seed_sources=[str(path)],
+            max_pages_per_template=2,
+        )
+
+        state = initial_crawl_state(config)
+
+        self.assertEqual(
+            [item.url for item in state.frontier],
+            [
+                "https://example.com",
+                "https://example.com/product/1",
+                "https://example.com/product/2",
+                "https://example.com/about",
+            ],
+        )
+        self.assertEqual(state.seeded_urls, 3)
+        self.assertEqual(state.seed_filtered_urls, 4)
+        self.assertTrue(all(item.depth == 0 for item in state.frontier))
+
+    def test_seeds_other_than_web_pages_are_dropped(self) -> None:
+        path = self.tmp / "urls.txt"
+        path.write_text(
+            "mailto:sales@example.com\nftp://files.example.com/a\n/pricing\n",
+            encoding="utf-8",
+        )
+        config = CrawlConfig(
+            base_url="https://example.com",
+            seed_sources=[str(path)],
+            same_origin_only=False,
+        )
+
+        state = initial_crawl_state(config)
+
+        self.assertEqual(
+            [item.url for item in state.frontier],
+            ["https://example.com", "https://example.com/pricing"],
+        )
+        self.assertEqual(state.seed_filtered_urls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
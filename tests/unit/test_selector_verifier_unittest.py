@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 
 from autopom.extraction.schema import ElementModel, PageModel, SectionModel
@@ -7,9 +8,16 @@ from autopom.healing.selector_verifier import SelectorVerifier
 class FakeVisibilityBrowser:
     def __init__(self, visible_selectors: set[str]) -> None:
         self.visible_selectors = visible_selectors
+        self.batches: list[list[str]] = []
 
-    def is_visible(self, selector: str, timeout_ms: int = 1500) -> bool:
-        return selector in self.visible_selectors
+    def are_visible(self, selectors: list[str]) -> list[bool]:
+        self.batches.append(selectors)
+        return [selector in self.visible_selectors for selector in selectors]
+
+
+class FakeAsyncVisibilityBrowser(FakeVisibilityBrowser):
+    async def are_visible(self, selectors: list[str]) -> list[bool]:
+        return FakeVisibilityBrowser.are_visible(self, selectors)
 
 
 class TestSelectorVerifier(unittest.TestCase):
@@ -66,6 +74,84 @@ class TestSelectorVerifier(unittest.TestCase):
         self.assertEqual(element.selector, "button.missing")
         self.assertEqual(element.confidence, 0.3)
 
+    def test_async_verification_promotes_first_visible_fallback(self) -> None:
+        page = self._build_page(
+            "button.missing", ["text=Example", "[data-testid='example']"]
+        )
+        verifier = SelectorVerifier(
+            FakeAsyncVisibilityBrowser({"[data-testid='example']"})
+        )
+
+        asyncio.run(verifier.averify_and_heal(page))
+
+        element = page.sections[0].elements[0]
+        self.assertEqual(element.selector, "[data-testid='example']")
+        self.assertAlmostEqual(element.confidence, 0.82, places=6)
+
+    def test_snapshot_visibility_answers_without_browser_checks(self) -> None:
+        page = self._build_page(
+            "button.missing", ["text=Example", "[data-testid='example']"]
+        )
+        browser = FakeVisibilityBrowser(set())
+        verifier = SelectorVerifier(browser)
+
+        verifier.verify_and_heal(page, {"button.missing": False, "text=Example": True})
+
+        self.assertEqual(page.sections[0].elements[0].selector, "text=Example")
+        self.assertEqual(browser.batches, [])
+
+    def test_selectors_missing_from_snapshot_fall_back_to_is_visible(self) -> None:
+        page = self._build_page(
+            "button.missing", ["text=Example", "[data-testid='example']"]
+        )
+        browser = FakeAsyncVisibilityBrowser({"[data-testid='example']"})
+        verifier = SelectorVerifier(browser)
+
+        asyncio.run(
+            verifier.averify_and_heal(
+                page, {"button.missing": False, "text=Example": False}
+            )
+        )
+
+        self.assertEqual(
+            page.sections[0].elements[0].selector, "[data-testid='example']"
+        )
+        self.assertEqual(browser.batches, [["[data-testid='example']"]])
+
+    def test_whole_page_is_verified_in_two_batches(self) -> None:
+        elements = [
+            ElementModel(
+                element_id=f"field{index}",
+                type="input",
+                role="textbox",
+                semantic_label=f"Field {index}",
+                selector=f"#field{index}",
+                fallback_selectors=[f"text=Field {index}", "text=Shared"],
+                confidence=0.8,
+                section="mainContent",
+            )
+            for index in range(50)
+        ]
+        page = PageModel(
+            page_id="form",
+            page_name="FormPage",
+            url="https://example.com/form",
+            route="/form",
+            sections=[SectionModel(name="mainContent", elements=elements)],
+        )
+        visible = {f"#field{index}" for index in range(0, 50, 2)} | {"text=Field 1"}
+        browser = FakeVisibilityBrowser(visible)
+
+        SelectorVerifier(browser).verify_and_heal(page)
+
+        self.assertEqual(len(browser.batches), 2)
+        self.assertEqual(len(browser.batches[0]), 50)
+        # Fallbacks of the 25 hidden primaries, with the shared one sent once.
+        self.assertEqual(len(browser.batches[1]), 26)
+        self.assertEqual(elements[1].selector, "text=Field 1")
+        self.assertEqual(elements[2].selector, "#field2")
+        self.assertAlmostEqual(elements[3].confidence, 0.6, places=6)
+
 
 if __name__ == "__main__":
     unittest.main()
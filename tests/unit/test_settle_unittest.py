@@ -0,0 +1,91 @@
+import time
+import unittest
+
+from autopom.browser.settle import (
+    NetworkTracker,
+    SettlePolicy,
+    normalize_settle_strategy,
+    settle_page,
+)
+
+
+class FakeRequest:
+    def __init__(self, resource_type: str = "fetch") -> None:
+        self.resource_type = resource_type
+
+
+class FakePage:
+    """Reports a fixed DOM quiet time and records the waits it was asked for."""
+
+    def __init__(self, dom_quiet_ms: float) -> None:
+        self.dom_quiet_ms = dom_quiet_ms
+        self.waits: list[float] = []
+        self.handlers: dict[str, object] = {}
+
+    def evaluate(self, script: str) -> float:
+        return self.dom_quiet_ms
+
+    def wait_for_timeout(self, timeout_ms: float) -> None:
+        self.waits.append(timeout_ms)
+        time.sleep(timeout_ms / 1000)
+
+    def on(self, event: str, handler: object) -> None:
+        self.handlers[event] = handler
+
+
+def quiet_network(page: FakePage) -> NetworkTracker:
+    network = NetworkTracker()
+    network.attach(page)
+    network.last_change -= 10
+    return network
+
+
+class TestSettle(unittest.TestCase):
+    def test_adaptive_returns_immediately_on_quiet_page(self) -> None:
+        page = FakePage(dom_quiet_ms=5000)
+
+        settle_ms = settle_page(page, SettlePolicy(), quiet_network(page))
+
+        self.assertEqual(page.waits, [])
+        self.assertLess(settle_ms, 50)
+
+    def test_adaptive_waits_for_requests_until_cap(self) -> None:
+        page = FakePage(dom_quiet_ms=5000)
+        network = quiet_network(page)
+        page.handlers["request"](FakeRequest())
+        page.handlers["request"](FakeRequest("websocket"))
+
+        settle_ms = settle_page(page, SettlePolicy(quiet_ms=50, max_ms=120), network)
+
+        self.assertEqual(network.in_flight, 1)
+        self.assertGreaterEqual(settle_ms, 120)
+        self.assertLess(settle_ms, 400)
+
+    def test_adaptive_waits_for_finished_request_quiet_window(self) -> None:
+        page = FakePage(dom_quiet_ms=5000)
+        network = quiet_network(page)
+        page.handlers["request"](FakeRequest())
+        page.handlers["requestfinished"](FakeRequest())
+
+        settle_ms = settle_page(page, SettlePolicy(quiet_ms=60, max_ms=1000), network)
+
+        self.assertGreaterEqual(settle_ms, 60)
+        self.assertLess(settle_ms, 500)
+
+    def test_fixed_and_none_strategies(self) -> None:
+        page = FakePage(dom_quiet_ms=0)
+        network = quiet_network(page)
+
+        settle_page(page, SettlePolicy(strategy="fixed", max_ms=20), network)
+        settle_page(page, SettlePolicy(strategy="none"), network)
+
+        self.assertEqual(page.waits, [20])
+
+    def test_invalid_settle_strategy_raises_value_error(self) -> None:
+        self.assertEqual(normalize_settle_strategy("auto"), "adaptive")
+        with self.assertRaises(ValueError):
+            normalize_settle_strategy("networkidle")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from autopom.browser.browseruse_adapter import MockBrowserUseAdapter
+from autopom.browser.synthetic_site import SiteSpec, SyntheticSite
+from autopom.config import CrawlConfig
+
+
+class TestSyntheticSite(unittest.TestCase):
+    def test_same_spec_and_seed_generate_the_same_site(self) -> None:
+        spec = SiteSpec(pages=50, duplicate_ratio=0.3, hidden_ratio=0.2, seed=7)
+        first = SyntheticSite(spec, "https://shop.test")
+        second = SyntheticSite(SiteSpec.parse(spec.to_spec()), "https://shop.test")
+        reseeded = SyntheticSite(
+            SiteSpec(pages=50, duplicate_ratio=0.3, hidden_ratio=0.2, seed=8),
+            "https://shop.test",
+        )
+
+        urls = [first.page_url(index) for index in range(50)]
+        self.assertEqual(
+            [first.page(url) for url in urls], [second.page(url) for url in urls]
+        )
+        self.assertNotEqual(
+            [first.page(url).summary for url in urls],
+            [reseeded.page(url).summary for url in urls],
+        )
+
+    def test_every_page_is_reachable_from_home(self) -> None:
+        site = SyntheticSite(
+            SiteSpec(pages=200, fan_out=3, duplicate_ratio=0.5, seed=1),
+            "https://shop.test",
+        )
+        seen = {0}
+        pending = [0]
+        while pending:
+            page = site.page(site.page_url(pending.pop()))
+            self.assertEqual(len(page.summary["links"]), 3)
+            for link in page.summary["links"]:
+                index = site.resolve(link)
+                if index not in seen:
+                    seen.add(index)
+                    pending.append(index)
+
+        self.assertEqual(seen, set(range(200)))
+
+    def test_duplicate_urls_land_on_the_canonical_page(self) -> None:
+        site = SyntheticSite(
+            SiteSpec(pages=20, template_ratio=1.0, templates=("product",)),
+            "https://shop.test",
+        )
+        browser = MockBrowserUseAdapter(base_url="https://shop.test", site=site)
+
+        browser.goto("https://shop.test/go/4")
+        self.assertEqual(browser.url(), "https://shop.test/product/4")
+        self.assertEqual(browser.title(), "Product 4 | Synthetic")
+        self.assertEqual(
+            site.resolve("https://shop.test/product/4?utm_source=synthetic"), 4
+        )
+        # Pages of one template share their layout.
+        layout = browser.extract_interactive_dom_summary()["elements"]
+        browser.goto("https://shop.test/product/5")
+        self.assertEqual(browser.extract_interactive_dom_summary()["elements"], layout)
+        browser.goto("https://shop.test/product/99")
+        self.assertEqual(browser.extract_interactive_dom_summary()["elements"], [])
+
+    def test_large_pages_and_hidden_selectors(self) -> None:
+        spec = SiteSpec(
+            pages=30, large_pages=2, large_page_elements=10_000, hidden_ratio=0.25
+        )
+        site = SyntheticSite(spec, "https://shop.test")
+        browser = MockBrowserUseAdapter(base_url="https://shop.test", site=site)
+
+        sizes = []
+        hidden = 0
+        for index in range(30):
+            browser.goto(site.page_url(index))
+            elements = browser.extract_interactive_dom_summary(max_nodes=20_000)[
+                "elements"
+            ]
+            sizes.append(len(elements))
+            visible = browser.are_visible([e["selector"] for e in elements])
+            hidden += visible.count(False)
+            self.assertTrue(browser.is_visible(f"text={elements[0]['label']}"))
+        self.assertEqual(sizes.count(10_000), 2)
+        self.assertTrue(all(8 <= size <= 24 for size in sizes if size != 10_000))
+        self.assertAlmostEqual(hidden / sum(sizes), 0.25, delta=0.02)
+
+    def test_spec_parsing_and_validation(self) -> None:
+        spec = SiteSpec.parse("pages=1000, fan_out=8, templates=blog|docs, seed=3")
+        self.assertEqual((spec.pages, spec.fan_out, spec.seed), (1000, 8, 3))
+        self.assertEqual(spec.templates, ("blog", "docs"))
+        for text in ("pages=0", "colour=red", "pages=many", "duplicate_ratio=2"):
+            with self.assertRaises(ValueError):
+                SiteSpec.parse(text)
+        with self.assertRaises(ValueError):
+            CrawlConfig(
+                base_url="https://example.com",
+                browser_adapter="playwright",
+                synthetic_site=spec,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()